@@ -13,6 +13,7 @@ from epic_app.models.epic_answers import (
     SingleChoiceAnswer,
     YesNoAnswer,
 )
+from epic_app.models.epic_jobs import ReportJob
 from epic_app.models.epic_questions import (
     EvolutionQuestion,
     KeyAgencyActionsQuestion,
@@ -29,6 +30,7 @@ admin.site.register(Area, AreaAdmin)
 admin.site.register(Agency, AgencyAdmin)
 admin.site.register(Group)
 admin.site.register(Program)
+admin.site.register(ReportJob)
 admin.site.register(NationalFrameworkQuestion, NfqAdmin)
 admin.site.register(KeyAgencyActionsQuestion, KaaAdmin)
 admin.site.register(EvolutionQuestion, EvoAdmin)
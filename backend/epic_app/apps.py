@@ -7,3 +7,11 @@ class EpicAppConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "epic_app"
     verbose_name = "An Epic App"
+
+    def ready(self):
+        # Connect the signal receivers.
+        from epic_app import signals  # noqa: F401
+        from epic_app.submodel_registry import build_registry
+
+        # Resolve the question / answer subtypes (and their serializers) only once.
+        build_registry()
@@ -0,0 +1,153 @@
+import hashlib
+import json
+import threading
+from calendar import timegm
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+from django.conf import settings
+from django.http import HttpResponse
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import http_date, quote_etag
+from rest_framework.request import Request
+
+from epic_app.models.epic_questions import Question
+from epic_app.models.epic_versions import EpicDataVersion
+from epic_app.models.models import Agency, Area, Group, Program
+
+# Fields of each program in the catalogue.
+_program_fields = (
+    "id",
+    "name",
+    "description",
+    "reference_description",
+    "reference_link",
+)
+
+
+@dataclass(frozen=True)
+class CatalogueSnapshot:
+    """
+    Catalogue of the EPIC domain (areas, groups, programs, agencies and question ids) compiled for a version of said domain, encoded once as JSON.
+    """
+
+    key: str
+    etag: str
+    last_modified: Optional[int]
+    content: bytes
+
+    def get_response(self, request: Request) -> HttpResponse:
+        """
+        Gets the response serving this snapshot, `304 Not Modified` when the request is conditional (`If-None-Match` / `If-Modified-Since`) and the catalogue did not change.
+        Clients may keep it for `EPIC_CATALOGUE_MAX_AGE` seconds before revalidating it.
+
+        Args:
+            request (Request): Catalogue request.
+
+        Returns:
+            HttpResponse: Response with the `ETag`, `Last-Modified` and `Cache-Control` headers.
+        """
+        response = get_conditional_response(
+            request, etag=self.etag, last_modified=self.last_modified
+        )
+        if response is None:
+            response = HttpResponse(self.content, content_type="application/json")
+        response["ETag"] = self.etag
+        if self.last_modified:
+            response["Last-Modified"] = http_date(self.last_modified)
+        patch_cache_control(
+            response,
+            private=True,
+            max_age=getattr(settings, "EPIC_CATALOGUE_MAX_AGE", 60 * 60),
+        )
+        return response
+
+
+def compile_catalogue() -> Dict[str, List[Dict[str, Any]]]:
+    """
+    Compiles the catalogue of the EPIC domain, with one query per entity. Areas, groups, programs and agencies are sorted by id.
+
+    Returns:
+        Dict[str, List[Dict[str, Any]]]: Areas (with their groups, programs and question ids) and agencies (with their programs).
+    """
+    question_ids: Dict[int, List[int]] = {}
+    for q_id, p_id in Question.objects.order_by("pk").values_list("pk", "program_id"):
+        question_ids.setdefault(p_id, []).append(q_id)
+    programs: Dict[int, Dict[str, Any]] = {}
+    group_programs: Dict[int, List[Dict[str, Any]]] = {}
+    for program in Program.objects.order_by("pk").values("group_id", *_program_fields):
+        group_id = program.pop("group_id")
+        programs[program["id"]] = program
+        group_programs.setdefault(group_id, []).append(
+            dict(program, questions=question_ids.get(program["id"], []))
+        )
+    area_groups: Dict[int, List[Dict[str, Any]]] = {}
+    for group in Group.objects.order_by("pk").values("id", "name", "area_id"):
+        area_groups.setdefault(group["area_id"], []).append(
+            dict(
+                id=group["id"],
+                name=group["name"],
+                area=group["area_id"],
+                programs=group_programs.get(group["id"], []),
+            )
+        )
+    agency_programs: Dict[int, List[Dict[str, Any]]] = {}
+    for agency_id, program_id in (
+        Program.agencies.through.objects.order_by("program_id")
+        .values_list("agency_id", "program_id")
+        .iterator()
+    ):
+        agency_programs.setdefault(agency_id, []).append(programs[program_id])
+    return {
+        "areas": [
+            dict(area, groups=area_groups.get(area["id"], []))
+            for area in Area.objects.order_by("pk").values("id", "name")
+        ],
+        "agencies": [
+            dict(agency, programs=agency_programs.get(agency["id"], []))
+            for agency in Agency.objects.order_by("pk").values("id", "name")
+        ],
+    }
+
+
+_snapshot: Optional[CatalogueSnapshot] = None
+_snapshot_lock = threading.Lock()
+
+
+def get_catalogue_snapshot() -> CatalogueSnapshot:
+    """
+    Gets the catalogue snapshot of the current catalogue version, with one query to read said version.
+    Each process keeps the last compiled snapshot in memory, it is only compiled again once the catalogue changes (f.e. after importing the domain).
+
+    Returns:
+        CatalogueSnapshot: Current catalogue.
+    """
+    global _snapshot
+    version, last_modified = EpicDataVersion.get_versions(EpicDataVersion.CATALOGUE)[
+        EpicDataVersion.CATALOGUE
+    ]
+    # The modification time prevents reusing keys when versions get reset (f.e. restored databases).
+    key = f"{version}-{last_modified.timestamp() if last_modified else 0}"
+    snapshot = _snapshot
+    if snapshot is not None and snapshot.key == key:
+        return snapshot
+    with _snapshot_lock:
+        if _snapshot is None or _snapshot.key != key:
+            _snapshot = CatalogueSnapshot(
+                key=key,
+                etag=quote_etag(hashlib.sha1(f"catalogue:{key}".encode()).hexdigest()),
+                last_modified=(
+                    timegm(last_modified.utctimetuple()) if last_modified else None
+                ),
+                content=json.dumps(compile_catalogue(), separators=(",", ":")).encode(),
+            )
+        return _snapshot
+
+
+def clear_catalogue_snapshot():
+    """
+    Drops the catalogue snapshot kept by this process (f.e. between tests).
+    """
+    global _snapshot
+    with _snapshot_lock:
+        _snapshot = None
@@ -0,0 +1,52 @@
+from typing import Any, Optional, Type
+
+from django.core.management.base import BaseCommand
+from django.db import models, transaction
+
+from epic_app.models.epic_answers import Answer
+from epic_app.models.epic_questions import Question
+from epic_app.utils import clear_submodel_type_cache, get_submodel_type_list
+
+
+class Command(BaseCommand):
+    help = "Fills in the `submodel_type` discriminator of all the existing `Question` and `Answer` entries (f.e. after migrating a database created before said column existed)."
+
+    def _backfill_model(self, model_type: Type[models.Model]):
+        """
+        Sets the `submodel_type` of all the base entries based on the submodel table they have a row in.
+
+        Args:
+            model_type (Type[models.Model]): Base model containing the `submodel_type` field.
+        """
+        for sm_type in get_submodel_type_list(model_type):
+            sm_name = sm_type._meta.model_name
+            n_updated = (
+                model_type.objects.filter(pk__in=sm_type.objects.values("pk"))
+                .exclude(submodel_type=sm_name)
+                .update(submodel_type=sm_name)
+            )
+            self.stdout.write(
+                self.style.SUCCESS(
+                    f"Backfilled {n_updated} `{model_type.__name__}` entries as `{sm_type.__name__}`."
+                )
+            )
+        n_unknown = model_type.objects.filter(submodel_type="").count()
+        if n_unknown:
+            self.stdout.write(
+                self.style.WARNING(
+                    f"There are {n_unknown} `{model_type.__name__}` entries without a known subtype."
+                )
+            )
+
+    def handle(self, *args: Any, **options: Any) -> Optional[str]:
+        try:
+            with transaction.atomic():
+                self._backfill_model(Question)
+                self._backfill_model(Answer)
+            clear_submodel_type_cache()
+        except Exception as e_info:
+            self.stdout.write(
+                self.style.ERROR(
+                    f"Error backfilling the subtype discriminators. Detailed info: {str(e_info)}"
+                )
+            )
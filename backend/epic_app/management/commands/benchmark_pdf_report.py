@@ -0,0 +1,101 @@
+import io
+import time
+from typing import Any, Dict, List, Optional
+
+from django.core.management.base import BaseCommand, CommandParser
+
+from epic_app.serializers.report_data import ProgramReportData, QuestionReportData
+from epic_app.serializers.report_pdf import EpicPdfReport
+
+
+def _get_synthetic_report(
+    n_programs: int, n_questions: int, n_justifications: int
+) -> List[ProgramReportData]:
+    """
+    Generates report data with the given size, without any database access.
+
+    Args:
+        n_programs (int): Number of programs.
+        n_questions (int): Number of (answered) questions per program.
+        n_justifications (int): Number of justifications per answer choice.
+
+    Returns:
+        List[ProgramReportData]: Synthetic report data.
+    """
+
+    def get_summary(q_idx: int) -> Dict[str, Any]:
+        return {
+            "Yes": q_idx % 7,
+            "Yes_justify": [
+                f"Justification {j_idx} of a positive answer, lorem ipsum dolor sit amet."
+                for j_idx in range(n_justifications)
+            ],
+            "No": q_idx % 5,
+            "No_justify": [
+                f"Justification {j_idx} of a negative answer, lorem ipsum dolor sit amet."
+                for j_idx in range(n_justifications)
+            ],
+            "no_valid_response": q_idx % 3,
+        }
+
+    return [
+        ProgramReportData(
+            id=p_idx,
+            name=f"Program {p_idx}",
+            questions=tuple(
+                QuestionReportData(
+                    id=p_idx * n_questions + q_idx,
+                    title=f"Is this question {q_idx} of program {p_idx}?",
+                    n_answers=1,
+                    summary=get_summary(q_idx),
+                )
+                for q_idx in range(n_questions)
+            ),
+        )
+        for p_idx in range(n_programs)
+    ]
+
+
+class Command(BaseCommand):
+    help = "Measures the time needed to build a (synthetic) PDF answers report with each table of contents mode."
+
+    def add_arguments(self, parser: CommandParser):
+        parser.add_argument("--programs", type=int, default=50)
+        parser.add_argument("--questions", type=int, default=10)
+        parser.add_argument("--justifications", type=int, default=5)
+        parser.add_argument(
+            "--repeat",
+            type=int,
+            default=3,
+            help="Times each report is built, the fastest one is reported.",
+        )
+
+    def _get_build_time(self, report_data: List[ProgramReportData], toc: str) -> float:
+        pdf_report = EpicPdfReport()
+        pdf_report.report_author = "benchmark"
+        pdf_report.toc = toc
+        start_time = time.perf_counter()
+        pdf_report.generate_report(io.BytesIO(), report_data)
+        return time.perf_counter() - start_time
+
+    def handle(self, *args: Any, **options: Any) -> Optional[str]:
+        report_data = _get_synthetic_report(
+            options["programs"], options["questions"], options["justifications"]
+        )
+        self.stdout.write(
+            f"Report with {options['programs']} programs of {options['questions']} questions ({options['justifications']} justifications per choice)."
+        )
+        build_times = {
+            toc: min(
+                self._get_build_time(report_data, toc)
+                for _ in range(max(options["repeat"], 1))
+            )
+            for toc in EpicPdfReport.toc_modes
+        }
+        reference_time = build_times[EpicPdfReport.TOC_MULTIPASS]
+        for toc, build_time in build_times.items():
+            self.stdout.write(
+                self.style.SUCCESS(
+                    f"toc={toc}: {build_time:.3f}s ({reference_time / build_time:.2f}x)"
+                )
+            )
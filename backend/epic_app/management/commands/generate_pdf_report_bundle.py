@@ -0,0 +1,84 @@
+import time
+from pathlib import Path
+from typing import Any, Optional
+
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+from django.http import QueryDict
+
+from epic_app.models.epic_user import EpicOrganization
+from epic_app.report_builder import (
+    BUNDLE_SPLIT_PROGRAM,
+    bundle_splits,
+    get_bundle_workers,
+    get_pdf_report_bundle,
+)
+from epic_app.serializers.report_data import ReportFilters
+from epic_app.serializers.report_pdf import EpicPdfReport
+
+
+class Command(BaseCommand):
+    help = "Generates the answers report as a ZIP file with one PDF document per program (or per area), laid out in parallel by a pool of processes."
+
+    def add_arguments(self, parser: CommandParser):
+        parser.add_argument("output", type=Path, help="Path of the ZIP file.")
+        parser.add_argument(
+            "--split", choices=bundle_splits, default=BUNDLE_SPLIT_PROGRAM
+        )
+        parser.add_argument(
+            "--toc",
+            choices=EpicPdfReport.toc_modes,
+            default=EpicPdfReport.TOC_MULTIPASS,
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=None,
+            help="Number of processes, `EPIC_REPORT_BUNDLE_WORKERS` (or one per CPU core) when not given.",
+        )
+        parser.add_argument(
+            "--organization",
+            type=str,
+            default=None,
+            help="Name of the reported organization, all of them when not given.",
+        )
+        parser.add_argument("--author", type=str, default="admin")
+        parser.add_argument(
+            "--filters",
+            type=str,
+            default="",
+            help="Scope of the report as a query string, f.e. `area=1&question_type=evolutionquestion`.",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> Optional[str]:
+        organization = None
+        if options["organization"]:
+            organization = EpicOrganization.objects.filter(
+                name=options["organization"]
+            ).first()
+            if not organization:
+                raise CommandError(
+                    f"Organization `{options['organization']}` not found."
+                )
+        try:
+            report_filters = ReportFilters.from_query_params(
+                QueryDict(options["filters"])
+            )
+        except ValueError as e_info:
+            raise CommandError(str(e_info))
+
+        start_time = time.perf_counter()
+        bundle = get_pdf_report_bundle(
+            organization,
+            options["author"],
+            options["split"],
+            toc=options["toc"],
+            filters=report_filters,
+            max_workers=options["workers"],
+        )
+        output: Path = options["output"]
+        output.write_bytes(bundle)
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Generated {output} with {get_bundle_workers(options['workers'])} workers in {time.perf_counter() - start_time:.3f}s."
+            )
+        )
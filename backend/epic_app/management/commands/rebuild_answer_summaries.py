@@ -0,0 +1,44 @@
+from typing import Any, Optional
+
+from django.core.management.base import BaseCommand, CommandParser
+
+from epic_app.models.epic_summaries import AnswerSummary
+
+
+class Command(BaseCommand):
+    help = "Recomputes the `AnswerSummary` counters from the stored answers (f.e. after bulk updates or restoring a database), or only checks whether they are consistent with `--check`."
+
+    def add_arguments(self, parser: CommandParser):
+        parser.add_argument(
+            "--check",
+            action="store_true",
+            help="Only reports the inconsistent (or duplicated) counters, without rebuilding them.",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> Optional[str]:
+        try:
+            if options["check"]:
+                inconsistencies = AnswerSummary.get_inconsistencies()
+                if not inconsistencies:
+                    self.stdout.write(
+                        self.style.SUCCESS("Answer summaries are consistent.")
+                    )
+                    return
+                self.stdout.write(
+                    self.style.WARNING(
+                        "Inconsistent answer summaries (question, organization, choice, program): {}.".format(
+                            ", ".join(map(str, inconsistencies))
+                        )
+                    )
+                )
+                return
+            n_summaries = AnswerSummary.rebuild()
+            self.stdout.write(
+                self.style.SUCCESS(f"Rebuilt {n_summaries} answer summary counters.")
+            )
+        except Exception as e_info:
+            self.stdout.write(
+                self.style.ERROR(
+                    f"Error rebuilding the answer summaries. Detailed info: {str(e_info)}"
+                )
+            )
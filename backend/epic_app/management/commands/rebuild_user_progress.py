@@ -0,0 +1,44 @@
+from typing import Any, Optional
+
+from django.core.management.base import BaseCommand, CommandParser
+
+from epic_app.models.epic_summaries import UserProgress
+
+
+class Command(BaseCommand):
+    help = "Recomputes the `UserProgress` rows from the stored questions and answers (f.e. after bulk updates or restoring a database), or only checks whether they are consistent with `--check`."
+
+    def add_arguments(self, parser: CommandParser):
+        parser.add_argument(
+            "--check",
+            action="store_true",
+            help="Only reports the inconsistent rows, without rebuilding them.",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> Optional[str]:
+        try:
+            if options["check"]:
+                inconsistencies = UserProgress.get_inconsistencies()
+                if not inconsistencies:
+                    self.stdout.write(
+                        self.style.SUCCESS("User progress is consistent.")
+                    )
+                    return
+                self.stdout.write(
+                    self.style.WARNING(
+                        "Inconsistent user progress (user, program): {}.".format(
+                            ", ".join(map(str, inconsistencies))
+                        )
+                    )
+                )
+                return
+            n_rows = UserProgress.rebuild()
+            self.stdout.write(
+                self.style.SUCCESS(f"Rebuilt {n_rows} user progress rows.")
+            )
+        except Exception as e_info:
+            self.stdout.write(
+                self.style.ERROR(
+                    f"Error rebuilding the user progress. Detailed info: {str(e_info)}"
+                )
+            )
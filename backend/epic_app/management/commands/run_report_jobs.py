@@ -0,0 +1,118 @@
+import time
+from datetime import timedelta
+from typing import Any, Optional
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandParser
+
+from epic_app.models.epic_jobs import ReportJob
+from epic_app.report_builder import (
+    get_pdf_report,
+    get_program_reports,
+    get_report_users,
+)
+from epic_app.serializers.report_data import ReportFilters, SummaryOptions
+
+
+class Command(BaseCommand):
+    help = "Processes the background report jobs (`ReportJob`) in the database, until stopped (or until there are no pending jobs with `--once`)."
+    # Share of the job progress taken by building the report data, the rest is updated after laying out each program chapter.
+    data_progress = 0.1
+
+    def add_arguments(self, parser: CommandParser):
+        parser.add_argument(
+            "--once",
+            action="store_true",
+            help="Exits once there are no pending jobs left.",
+        )
+        parser.add_argument(
+            "--poll-interval",
+            type=float,
+            default=5,
+            help="Seconds to wait before looking for new jobs. Defaults to 5.",
+        )
+
+    def _run_job(self, job: ReportJob):
+        """
+        Generates the report of a claimed job and stores it (or the reason it could not be generated).
+
+        Args:
+            job (ReportJob): Running job.
+        """
+        try:
+            if job.report_format != "pdf":
+                raise ValueError(f"Report format `{job.report_format}` not supported.")
+            report_options = dict(job.options)
+            report_filters = ReportFilters.from_query_params(
+                report_options.pop("filters", {})
+            )
+            report_summary_options = SummaryOptions.from_query_params(
+                report_options.pop("summary", {})
+            )
+            report_data = get_program_reports(
+                get_report_users(job.organization),
+                include_answers=False,
+                filters=report_filters,
+                summary_options=report_summary_options,
+            )
+            job.set_progress(self.data_progress)
+            artifact = get_pdf_report(
+                job.organization,
+                job.requested_by.username,
+                report_data,
+                on_progress=lambda layout_progress: job.set_progress(
+                    self.data_progress + (1 - self.data_progress) * layout_progress
+                ),
+                **report_options,
+            )
+        except Exception as e_info:
+            if job.finish(error=str(e_info)):
+                self.stdout.write(
+                    self.style.ERROR(
+                        f"Error generating the report of job {job.pk}. Detailed info: {str(e_info)}"
+                    )
+                )
+            else:
+                self._write_not_running(job)
+            return
+        if not job.finish(artifact):
+            self._write_not_running(job)
+            return
+        self.stdout.write(self.style.SUCCESS(f"Generated the report of job {job.pk}."))
+
+    def _write_not_running(self, job: ReportJob):
+        self.stdout.write(
+            self.style.WARNING(
+                f"Discarded the report of job {job.pk}, it was already {job.status}."
+            )
+        )
+
+    def _clean_up_jobs(self):
+        """
+        Fails the jobs abandoned by stopped workers and removes the expired ones.
+        """
+        timeout = timedelta(
+            seconds=getattr(settings, "EPIC_REPORT_JOB_TIMEOUT", 60 * 60)
+        )
+        n_stale = ReportJob.fail_stale(timeout)
+        if n_stale:
+            self.stdout.write(self.style.WARNING(f"Timed out {n_stale} report jobs."))
+        n_expired = ReportJob.purge_expired()
+        if n_expired:
+            self.stdout.write(
+                self.style.SUCCESS(f"Removed {n_expired} expired report jobs.")
+            )
+
+    def handle(self, *args: Any, **options: Any) -> Optional[str]:
+        try:
+            while True:
+                self._clean_up_jobs()
+                job = ReportJob.claim_next()
+                while job:
+                    self._run_job(job)
+                    job = ReportJob.claim_next()
+                if options["once"]:
+                    break
+                time.sleep(options["poll_interval"])
+        except KeyboardInterrupt:
+            self.stdout.write(self.style.WARNING("Report worker stopped."))
@@ -0,0 +1,623 @@
+# Generated by Django 4.0.10 on 2026-10-17 04:30
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+import django.utils.timezone
+import epic_app.models.epic_user
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ("auth", "0012_alter_user_first_name_max_length"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="Agency",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("name", models.CharField(max_length=50)),
+            ],
+            options={
+                "verbose_name_plural": "Agencies",
+            },
+        ),
+        migrations.CreateModel(
+            name="Answer",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "submodel_type",
+                    models.CharField(
+                        blank=True, db_index=True, editable=False, max_length=50
+                    ),
+                ),
+            ],
+        ),
+        migrations.CreateModel(
+            name="Area",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("name", models.CharField(max_length=50)),
+            ],
+            options={
+                "abstract": False,
+            },
+        ),
+        migrations.CreateModel(
+            name="EpicDataVersion",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("name", models.CharField(max_length=50, unique=True)),
+                ("version", models.BigIntegerField(default=0)),
+                (
+                    "last_modified",
+                    models.DateTimeField(default=django.utils.timezone.now),
+                ),
+            ],
+        ),
+        migrations.CreateModel(
+            name="EpicOrganization",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("name", models.CharField(max_length=50)),
+            ],
+            options={
+                "abstract": False,
+            },
+        ),
+        migrations.CreateModel(
+            name="EpicUser",
+            fields=[
+                (
+                    "user_ptr",
+                    models.OneToOneField(
+                        auto_created=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        parent_link=True,
+                        primary_key=True,
+                        serialize=False,
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+                ("is_advisor", models.BooleanField(default=False)),
+                (
+                    "organization",
+                    models.ForeignKey(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="organization_users",
+                        to="epic_app.epicorganization",
+                    ),
+                ),
+            ],
+            options={
+                "abstract": False,
+            },
+            bases=("auth.user", models.Model),
+            managers=[
+                ("objects", epic_app.models.epic_user.EpicUserManager()),
+            ],
+        ),
+        migrations.CreateModel(
+            name="Group",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("name", models.CharField(max_length=50)),
+                (
+                    "area",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="groups",
+                        to="epic_app.area",
+                    ),
+                ),
+            ],
+            options={
+                "abstract": False,
+            },
+        ),
+        migrations.CreateModel(
+            name="Program",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("name", models.CharField(max_length=50, unique=True)),
+                ("description", models.TextField(max_length=250)),
+                (
+                    "reference_description",
+                    models.TextField(blank=True, max_length=258, null=True),
+                ),
+                ("reference_link", models.URLField(blank=True, max_length=128)),
+                (
+                    "agencies",
+                    models.ManyToManyField(
+                        blank=True, related_name="programs", to="epic_app.agency"
+                    ),
+                ),
+                (
+                    "group",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="programs",
+                        to="epic_app.group",
+                    ),
+                ),
+            ],
+            options={
+                "abstract": False,
+            },
+        ),
+        migrations.CreateModel(
+            name="Question",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("title", models.CharField(max_length=512)),
+                (
+                    "submodel_type",
+                    models.CharField(
+                        blank=True, db_index=True, editable=False, max_length=50
+                    ),
+                ),
+                (
+                    "program",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="questions",
+                        to="epic_app.program",
+                    ),
+                ),
+            ],
+            options={
+                "unique_together": {("title", "program")},
+            },
+        ),
+        migrations.CreateModel(
+            name="EvolutionQuestion",
+            fields=[
+                (
+                    "question_ptr",
+                    models.OneToOneField(
+                        auto_created=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        parent_link=True,
+                        primary_key=True,
+                        serialize=False,
+                        to="epic_app.question",
+                    ),
+                ),
+                (
+                    "nascent_description",
+                    models.TextField(blank=True, null=True, verbose_name="NASCENT"),
+                ),
+                (
+                    "engaged_description",
+                    models.TextField(blank=True, null=True, verbose_name="ENGAGED"),
+                ),
+                (
+                    "capable_description",
+                    models.TextField(blank=True, null=True, verbose_name="CAPABLE"),
+                ),
+                (
+                    "effective_description",
+                    models.TextField(blank=True, null=True, verbose_name="EFFECTIVE"),
+                ),
+            ],
+            options={
+                "abstract": False,
+            },
+            bases=("epic_app.question",),
+        ),
+        migrations.CreateModel(
+            name="KeyAgencyActionsQuestion",
+            fields=[
+                (
+                    "question_ptr",
+                    models.OneToOneField(
+                        auto_created=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        parent_link=True,
+                        primary_key=True,
+                        serialize=False,
+                        to="epic_app.question",
+                    ),
+                ),
+                ("description", models.TextField()),
+            ],
+            options={
+                "abstract": False,
+            },
+            bases=("epic_app.question",),
+        ),
+        migrations.CreateModel(
+            name="LinkagesQuestion",
+            fields=[
+                (
+                    "question_ptr",
+                    models.OneToOneField(
+                        auto_created=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        parent_link=True,
+                        primary_key=True,
+                        serialize=False,
+                        to="epic_app.question",
+                    ),
+                ),
+            ],
+            options={
+                "abstract": False,
+            },
+            bases=("epic_app.question",),
+        ),
+        migrations.CreateModel(
+            name="NationalFrameworkQuestion",
+            fields=[
+                (
+                    "question_ptr",
+                    models.OneToOneField(
+                        auto_created=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        parent_link=True,
+                        primary_key=True,
+                        serialize=False,
+                        to="epic_app.question",
+                    ),
+                ),
+                ("description", models.TextField()),
+            ],
+            options={
+                "abstract": False,
+            },
+            bases=("epic_app.question",),
+        ),
+        migrations.CreateModel(
+            name="SingleChoiceAnswer",
+            fields=[
+                (
+                    "answer_ptr",
+                    models.OneToOneField(
+                        auto_created=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        parent_link=True,
+                        primary_key=True,
+                        serialize=False,
+                        to="epic_app.answer",
+                    ),
+                ),
+                (
+                    "selected_choice",
+                    models.CharField(
+                        blank=True,
+                        max_length=50,
+                        verbose_name=[
+                            ("NASCENT", "Nascent"),
+                            ("ENGAGED", "Engaged"),
+                            ("CAPABLE", "Capable"),
+                            ("EFFECTIVE", "Effective"),
+                        ],
+                    ),
+                ),
+                ("justify_answer", models.TextField(blank=True)),
+            ],
+            bases=("epic_app.answer",),
+        ),
+        migrations.CreateModel(
+            name="YesNoAnswer",
+            fields=[
+                (
+                    "answer_ptr",
+                    models.OneToOneField(
+                        auto_created=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        parent_link=True,
+                        primary_key=True,
+                        serialize=False,
+                        to="epic_app.answer",
+                    ),
+                ),
+                (
+                    "short_answer",
+                    models.CharField(
+                        blank=True,
+                        max_length=50,
+                        verbose_name=[("Y", "Yes"), ("N", "No")],
+                    ),
+                ),
+                ("justify_answer", models.TextField(blank=True)),
+            ],
+            bases=("epic_app.answer",),
+        ),
+        migrations.CreateModel(
+            name="ReportJob",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("report_format", models.CharField(default="pdf", max_length=10)),
+                ("options", models.JSONField(blank=True, default=dict)),
+                ("report_key", models.CharField(db_index=True, max_length=255)),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[
+                            ("PENDING", "Pending"),
+                            ("RUNNING", "Running"),
+                            ("DONE", "Done"),
+                            ("FAILED", "Failed"),
+                        ],
+                        db_index=True,
+                        default="PENDING",
+                        max_length=10,
+                    ),
+                ),
+                ("progress", models.FloatField(default=0)),
+                ("artifact", models.BinaryField(blank=True, null=True)),
+                ("error", models.TextField(blank=True)),
+                ("created_at", models.DateTimeField(default=django.utils.timezone.now)),
+                ("started_at", models.DateTimeField(blank=True, null=True)),
+                ("finished_at", models.DateTimeField(blank=True, null=True)),
+                ("expires_at", models.DateTimeField(blank=True, null=True)),
+                (
+                    "organization",
+                    models.ForeignKey(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="report_jobs",
+                        to="epic_app.epicorganization",
+                    ),
+                ),
+                (
+                    "requested_by",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="report_jobs",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+        ),
+        migrations.CreateModel(
+            name="AnswerSummary",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("choice", models.CharField(blank=True, max_length=50)),
+                ("n_answers", models.IntegerField(default=0)),
+                ("first_answer", models.IntegerField(blank=True, null=True)),
+                (
+                    "organization",
+                    models.ForeignKey(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="answer_summaries",
+                        to="epic_app.epicorganization",
+                    ),
+                ),
+                (
+                    "program",
+                    models.ForeignKey(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="answer_summaries",
+                        to="epic_app.program",
+                    ),
+                ),
+                (
+                    "question",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="answer_summaries",
+                        to="epic_app.question",
+                    ),
+                ),
+            ],
+        ),
+        migrations.AddField(
+            model_name="answer",
+            name="question",
+            field=models.ForeignKey(
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="question_answers",
+                to="epic_app.question",
+            ),
+        ),
+        migrations.AddField(
+            model_name="answer",
+            name="user",
+            field=models.ForeignKey(
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="user_answers",
+                to="epic_app.epicuser",
+            ),
+        ),
+        migrations.CreateModel(
+            name="UserProgress",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("n_questions", models.IntegerField(default=0)),
+                ("n_answered", models.IntegerField(default=0)),
+                ("n_valid", models.IntegerField(default=0)),
+                (
+                    "program",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="user_progress",
+                        to="epic_app.program",
+                    ),
+                ),
+                (
+                    "user",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="user_progress",
+                        to="epic_app.epicuser",
+                    ),
+                ),
+            ],
+            options={
+                "unique_together": {("user", "program")},
+            },
+        ),
+        migrations.CreateModel(
+            name="MultipleChoiceAnswer",
+            fields=[
+                (
+                    "answer_ptr",
+                    models.OneToOneField(
+                        auto_created=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        parent_link=True,
+                        primary_key=True,
+                        serialize=False,
+                        to="epic_app.answer",
+                    ),
+                ),
+                (
+                    "selected_programs",
+                    models.ManyToManyField(
+                        blank=True,
+                        related_name="selected_answers",
+                        to="epic_app.program",
+                    ),
+                ),
+            ],
+            bases=("epic_app.answer",),
+        ),
+        migrations.AddConstraint(
+            model_name="answersummary",
+            constraint=models.UniqueConstraint(
+                condition=models.Q(
+                    ("organization__isnull", False), ("program__isnull", False)
+                ),
+                fields=("question", "organization", "choice", "program"),
+                name="unique_answersummary_question_organization_choice_program",
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="answersummary",
+            constraint=models.UniqueConstraint(
+                condition=models.Q(
+                    ("organization__isnull", False), ("program__isnull", True)
+                ),
+                fields=("question", "organization", "choice"),
+                name="unique_answersummary_question_organization_choice",
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="answersummary",
+            constraint=models.UniqueConstraint(
+                condition=models.Q(
+                    ("organization__isnull", True), ("program__isnull", False)
+                ),
+                fields=("question", "choice", "program"),
+                name="unique_answersummary_question_choice_program",
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="answersummary",
+            constraint=models.UniqueConstraint(
+                condition=models.Q(
+                    ("organization__isnull", True), ("program__isnull", True)
+                ),
+                fields=("question", "choice"),
+                name="unique_answersummary_question_choice",
+            ),
+        ),
+        migrations.AlterUniqueTogether(
+            name="answer",
+            unique_together={("user", "question")},
+        ),
+    ]
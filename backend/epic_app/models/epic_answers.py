@@ -1,10 +1,10 @@
 from __future__ import annotations
 
-import itertools
-from collections import Counter
-from typing import Any, Dict, List, Union
+from collections import Counter, defaultdict
+from typing import Any, Dict, Iterable, List, Optional, Set, Type
 
-from django.db import IntegrityError, models
+from django.db import IntegrityError, connection, models, transaction
+from django.db.models.functions import Left
 
 from epic_app.models import models as base_models
 from epic_app.models.epic_questions import (
@@ -15,7 +15,20 @@ from epic_app.models.epic_questions import (
     NationalFrameworkQuestion,
     Question,
 )
+from epic_app.models.epic_summaries import (
+    AnswerSummary,
+    SummaryCounters,
+    UserProgress,
+)
 from epic_app.models.epic_user import EpicUser
+from epic_app.models.epic_versions import EpicDataVersion
+from epic_app.utils import (
+    get_instance_submodel_type,
+    get_submodel_type,
+    get_submodel_type_list,
+    get_submodel_types,
+    update_submodel_type_cache,
+)
 
 
 class YesNoAnswerType(models.TextChoices):
@@ -23,6 +36,167 @@ class YesNoAnswerType(models.TextChoices):
     NO = "N", ("No")
 
 
+def _get_justifications(
+    answers_list: models.QuerySet,
+    choice_field: str,
+    group_by: Optional[str],
+    max_justifications: Optional[int] = None,
+    max_justification_length: Optional[int] = None,
+) -> Dict[Any, Dict[str, List[str]]]:
+    """
+    Gets the (non empty) justifications of the given answers per selected choice, with a single query.
+
+    Args:
+        answers_list (models.QuerySet): Answers with a `justify_answer` field.
+        choice_field (str): Name of the field containing the selected choice.
+        group_by (Optional[str]): Field to group the justifications by (f.e. `question_id`), when `None` all are grouped under the key `None`.
+        max_justifications (Optional[int], optional): Justifications kept per selected choice (the first ones given), no query is done when `0`. Defaults to None.
+        max_justification_length (Optional[int], optional): Characters kept per justification, longer ones are truncated (in the database) and end with an ellipsis. Defaults to None.
+
+    Returns:
+        Dict[Any, Dict[str, List[str]]]: Justifications per selected choice, per `group_by` value.
+    """
+    group_fields = [group_by] if group_by else []
+    justifications: Dict[Any, Dict[str, List[str]]] = defaultdict(
+        lambda: defaultdict(list)
+    )
+    if max_justifications == 0:
+        return justifications
+
+    justify_field = "justify_answer"
+    answers_list = answers_list.exclude(justify_answer="").order_by("pk")
+    if max_justification_length is not None:
+        # One more character than kept, to know which ones are truncated.
+        answers_list = answers_list.annotate(
+            short_justify_answer=Left("justify_answer", max_justification_length + 1)
+        )
+        justify_field = "short_justify_answer"
+    for *group_value, choice, justify in answers_list.values_list(
+        *group_fields, choice_field, justify_field
+    ).iterator():
+        choice_justifications = justifications[next(iter(group_value), None)][choice]
+        if (
+            max_justifications is not None
+            and len(choice_justifications) >= max_justifications
+        ):
+            continue
+        if max_justification_length is not None and (
+            len(justify) > max_justification_length
+        ):
+            justify = justify[: max_justification_length - 1] + "…"
+        choice_justifications.append(justify)
+    return justifications
+
+
+def _format_choice_summary(
+    choice_counts: Dict[str, int],
+    justifications: Dict[str, List[str]],
+    choice_types: List[models.TextChoices],
+) -> Dict[str, Any]:
+    """
+    Formats the summary of answers with a choice (and a justification) field.
+
+    Args:
+        choice_counts (Dict[str, int]): Number of answers per selected choice (including not valid ones).
+        justifications (Dict[str, List[str]]): Justifications per selected choice.
+        choice_types (List[models.TextChoices]): Valid choices, in the order they are summarized.
+
+    Returns:
+        Dict[str, Any]: Number of answers and justifications per valid choice, and number of not valid answers.
+    """
+    summary = {}
+    for choice_type in choice_types:
+        label = str(choice_type.label)
+        summary[label] = choice_counts.get(choice_type.value, 0)
+        summary[f"{label}_justify"] = list(justifications.get(choice_type.value, []))
+    summary["no_valid_response"] = sum(choice_counts.values()) - sum(
+        choice_counts.get(ct.value, 0) for ct in choice_types
+    )
+    return summary
+
+
+def _get_choice_label(choice: str, choice_type: Type[models.TextChoices]) -> str:
+    """
+    Gets the label of a selected choice, the stored value when it is not a valid choice.
+    """
+    if choice in choice_type:
+        return str(choice_type(choice).label)
+    return choice
+
+
+def _get_choice_summaries(
+    answers_list: models.QuerySet,
+    choice_field: str,
+    choice_types: List[models.TextChoices],
+    group_by: Optional[str],
+    **justification_limits: Optional[int],
+) -> Dict[Any, Dict[str, Any]]:
+    """
+    Summarizes answers with a choice (and a justification) field with one grouped count query (`GROUP BY group_by, choice_field`) and one query for the justifications.
+
+    Args:
+        answers_list (models.QuerySet): Answers to summarize.
+        choice_field (str): Name of the field containing the selected choice.
+        choice_types (List[models.TextChoices]): Valid choices, in the order they are summarized.
+        group_by (Optional[str]): Field to group the summaries by (f.e. `question_id`), when `None` all answers are summarized together.
+        justification_limits (Optional[int]): Limits of the justifications (see `_get_justifications`).
+
+    Returns:
+        Dict[Any, Dict[str, Any]]: Summary per `group_by` value, or a single summary with key `None`.
+    """
+    group_fields = [group_by] if group_by else []
+    choice_counts: Dict[Any, Counter] = defaultdict(Counter)
+    if not group_by:
+        choice_counts[None] = Counter()
+    for row in (
+        answers_list.order_by()
+        .values(*group_fields, choice_field)
+        .annotate(n_answers=models.Count("pk"))
+    ):
+        choice_counts[row.get(group_by, None)][row[choice_field]] += row["n_answers"]
+
+    justifications = _get_justifications(
+        answers_list, choice_field, group_by, **justification_limits
+    )
+    return {
+        group_value: _format_choice_summary(
+            counts, justifications[group_value], choice_types
+        )
+        for group_value, counts in choice_counts.items()
+    }
+
+
+class AnswerQuerySet(models.QuerySet):
+    """
+    Queryset of `Answer` (or any of its subtypes) able to evaluate the validity of the answers in the database (see `Answer.get_valid_answer_filter`).
+    """
+
+    def _get_validity(self) -> models.Case:
+        return models.Case(
+            models.When(self.model.get_valid_answer_filter(), then=True),
+            default=False,
+            output_field=models.BooleanField(),
+        )
+
+    def with_validity(self) -> AnswerQuerySet:
+        """
+        Annotates whether each answer is valid (as `is_valid`), as `is_valid_answer` would do.
+        """
+        return self.annotate(is_valid=self._get_validity())
+
+    def valid(self) -> AnswerQuerySet:
+        """
+        Filters the valid answers.
+        """
+        return self.filter(self.model.get_valid_answer_filter())
+
+    def invalid(self) -> AnswerQuerySet:
+        """
+        Filters the answers which are not valid.
+        """
+        return self.alias(is_valid=self._get_validity()).filter(is_valid=False)
+
+
 class Answer(models.Model):
     """
     Cross reference table to define the bounding relationship between a User and the answers they give to each question.
@@ -37,6 +211,14 @@ class Answer(models.Model):
     question = models.ForeignKey(
         to=Question, on_delete=models.CASCADE, related_name="question_answers"
     )
+    # Discriminator with the `model_name` of the concrete `Answer` subtype.
+    submodel_type: str = models.CharField(
+        max_length=50, blank=True, editable=False, db_index=True
+    )
+    # Field with the choice counted in the `AnswerSummary` table.
+    summary_choice_field: Optional[str] = None
+
+    objects = AnswerQuerySet.as_manager()
 
     class Meta:
         unique_together = ["user", "question"]
@@ -44,6 +226,19 @@ class Answer(models.Model):
     def __str__(self) -> str:
         return f"[{self.user}] {self.question}"
 
+    def _get_question_type(self) -> Optional[Type[Question]]:
+        """
+        Gets the concrete type of the assigned `question`. No query is done when the question is already loaded (its discriminator is stored) or its type was already resolved.
+
+        Returns:
+            Optional[Type[Question]]: Concrete `Question` subtype.
+        """
+        if self._meta.get_field("question").is_cached(self):
+            return get_instance_submodel_type(self.question)
+        if self.question_id is None:
+            return None
+        return get_submodel_type(Question, self.question_id)
+
     def _check_question_integrity(self) -> bool:
         """
         Auxiliar method to be defined in concrete classes which verify the assigned `question` is suitable for this `answer`.
@@ -51,12 +246,154 @@ class Answer(models.Model):
         Returns:
             bool: Whether the given `Question` type can be assigned to this `Answer` type.
         """
-        return any(
-            [
-                sq.objects.filter(id=self.question.id).exists()
-                for sq in self._get_supported_questions()
-            ]
+        return self._get_question_type() in self._get_supported_questions()
+
+    @staticmethod
+    def validate_many(answers: Iterable[Answer]):
+        """
+        Verifies the assigned `question` of each of the given answers is suitable for their `answer` type, so that answers can be validated in bulk (f.e. before a `bulk_create`).
+        Questions types are resolved at once, requiring at most one query.
+
+        Args:
+            answers (Iterable[Answer]): Concrete `Answer` instances to validate.
+
+        Raises:
+            IntegrityError: When at least one `question` is not supported for its `answer` subtype.
+        """
+        answers = list(answers)
+        question_types = get_submodel_types(
+            Question, {a.question_id for a in answers if a.question_id is not None}
         )
+        invalid_answers = [
+            a
+            for a in answers
+            if question_types.get(a.question_id, None)
+            not in a._get_supported_questions()
+        ]
+        if invalid_answers:
+            raise IntegrityError(
+                "Question type not allowed for answers: [{}].".format(
+                    ", ".join(
+                        [
+                            "`{}` (question {}: `{}`)".format(
+                                type(a).__name__,
+                                a.question_id,
+                                getattr(
+                                    question_types.get(a.question_id, None),
+                                    "__name__",
+                                    None,
+                                ),
+                            )
+                            for a in invalid_answers
+                        ]
+                    )
+                )
+            )
+
+    @staticmethod
+    def create_missing(epic_user: EpicUser, questions: Iterable[Question]) -> int:
+        """
+        Creates (empty) answers of the user to the given questions it did not answer yet, with a number of queries that does not depend on the number of questions.
+        Django does not support `bulk_create` on multi-table inherited models, so the `Answer` rows are bulk created first (skipping the ones that already exist, f.e. created by a concurrent request) and the missing rows of each subtype are then inserted in bulk.
+        The `AnswerSummary` and `UserProgress` counters and the submodel type cache are updated as `save` would do.
+
+        Args:
+            epic_user (EpicUser): User answering the questions.
+            questions (Iterable[Question]): Questions (of their concrete subtype) to answer.
+
+        Returns:
+            int: Number of created answers.
+        """
+        questions = {q.pk: q for q in questions}
+        user_answers = Answer.objects.filter(user=epic_user, question__in=questions)
+        if user_answers.count() == len(questions):
+            return 0
+        answer_types = {
+            question_type: answer_type
+            for answer_type in get_submodel_type_list(Answer)
+            for question_type in answer_type._get_supported_questions()
+        }
+        question_answer_types = {
+            q_id: answer_types[get_instance_submodel_type(question)]
+            for q_id, question in questions.items()
+        }
+
+        with transaction.atomic():
+            Answer.objects.bulk_create(
+                [
+                    Answer(
+                        user=epic_user,
+                        question_id=q_id,
+                        submodel_type=answer_type._meta.model_name,
+                    )
+                    for q_id, answer_type in question_answer_types.items()
+                ],
+                ignore_conflicts=True,
+            )
+            # Only the rows inserted above lack their subtype row, concurrent requests insert both at once.
+            new_answers: List[Answer] = [
+                question_answer_types[q_id](
+                    answer_ptr_id=a_id, user=epic_user, question_id=q_id
+                )
+                for a_id, q_id in user_answers.filter(
+                    **{
+                        f"{answer_type._meta.model_name}__isnull": True
+                        for answer_type in get_submodel_type_list(Answer)
+                    }
+                ).values_list("pk", "question_id")
+            ]
+            if not new_answers:
+                return 0
+            for answer_type in {type(answer) for answer in new_answers}:
+                Answer._insert_subtype_rows(
+                    answer_type, [a for a in new_answers if type(a) is answer_type]
+                )
+
+            # New answers have no choice (nor selection) and are not valid.
+            summary_deltas = Counter()
+            program_deltas = Counter()
+            for answer in new_answers:
+                for choice in [AnswerSummary.TOTAL_CHOICE, ""]:
+                    summary_deltas[
+                        (answer.question_id, epic_user.organization_id, choice)
+                    ] += 1
+                program_deltas[questions[answer.question_id].program_id] += 1
+            AnswerSummary.add_many_answers(summary_deltas)
+            for program_id, n_answered in program_deltas.items():
+                UserProgress.add_answers(epic_user.pk, program_id, n_answered, 0)
+            EpicDataVersion.increase(EpicDataVersion.ANSWERS)
+        for answer in new_answers:
+            update_submodel_type_cache(type(answer), answer.pk)
+        return len(new_answers)
+
+    @staticmethod
+    def _insert_subtype_rows(answer_type: Type[Answer], answers: List[Answer]):
+        """
+        Inserts the subtype table rows of the given answers, whose base `Answer` rows already exist, with a single statement.
+
+        Args:
+            answer_type (Type[Answer]): `Answer` subtype of the answers.
+            answers (List[Answer]): Answers referencing their stored `Answer` row (`answer_ptr_id`).
+        """
+        fields = answer_type._meta.local_concrete_fields
+        quote_name = connection.ops.quote_name
+        with connection.cursor() as cursor:
+            cursor.executemany(
+                "INSERT INTO {} ({}) VALUES ({})".format(
+                    quote_name(answer_type._meta.db_table),
+                    ", ".join(quote_name(field.column) for field in fields),
+                    ", ".join(["%s"] * len(fields)),
+                ),
+                [
+                    [
+                        field.get_db_prep_save(
+                            getattr(answer, field.attname), connection=connection
+                        )
+                        for field in fields
+                    ]
+                    for answer in answers
+                ],
+            )
 
     @staticmethod
     def _get_supported_questions() -> List[Question]:
@@ -72,10 +409,13 @@ class Answer(models.Model):
         """
         Overriding of the save method to ensure only supported questions are assigned to related answers.
         This is just a way to preserve the question as a base field property to answer without explicitely defining its concrete question.
+        It also stores the concrete subtype of this `Answer` in the base table and updates the `AnswerSummary` and `UserProgress` counters, only when a counted field changed.
 
         Raises:
             IntegrityError: When the `question` field is not supported for this `answer` subtype.
         """
+        if self._meta.parents:
+            self.submodel_type = self._meta.model_name
         if not self._check_question_integrity():
             raise IntegrityError(
                 "Question type `{}` not allowed. Supported types: [{}].".format(
@@ -86,25 +426,191 @@ class Answer(models.Model):
                 )
             )
 
-        return super(Answer, self).save(*args, **kwargs)
+        if not self._meta.parents:
+            return super(Answer, self).save(*args, **kwargs)
+        with transaction.atomic():
+            changed_fields = self._get_changed_fields()
+            if not changed_fields:
+                return super(Answer, self).save(*args, **kwargs)
+            if not changed_fields & self._get_counted_fields():
+                # F.e. only the justification changed, which is only part of the reports.
+                super(Answer, self).save(*args, **kwargs)
+                EpicDataVersion.increase(EpicDataVersion.ANSWERS)
+                return
+            previous_counters = (
+                None if self._state.adding else self.get_summary_counters()
+            )
+            previous_progress = (
+                None
+                if self._state.adding
+                else UserProgress.get_counters([self.pk]).get(self.pk, None)
+            )
+            super(Answer, self).save(*args, **kwargs)
+            AnswerSummary.replace_counters(
+                previous_counters, self.get_summary_counters(), self.pk
+            )
+            UserProgress.replace_counters(
+                previous_progress, UserProgress.get_counters([self.pk])[self.pk]
+            )
+            EpicDataVersion.increase(EpicDataVersion.ANSWERS)
+
+    def _get_counted_fields(self) -> Set[str]:
+        """
+        Gets the fields (attribute names) determining the `AnswerSummary` and `UserProgress` counters of this answer, besides its selections.
+        """
+        return {"question_id", "user_id", self.summary_choice_field} - {None}
+
+    def _get_changed_fields(self) -> Set[str]:
+        """
+        Gets the fields (attribute names) whose value differs from the stored one, with one query. All of them for answers not stored yet.
+        """
+        attnames = [field.attname for field in self._meta.concrete_fields]
+        stored_values = (
+            None
+            if self._state.adding
+            else type(self).objects.filter(pk=self.pk).values(*attnames).first()
+        )
+        if stored_values is None:
+            return set(attnames)
+        return {
+            attname
+            for attname in attnames
+            if getattr(self, attname) != stored_values[attname]
+        }
+
+    def get_summary_counters(self) -> Optional[SummaryCounters]:
+        """
+        Gets the `AnswerSummary` counters this answer is counted in, based on its stored values.
+
+        Returns:
+            Optional[SummaryCounters]: Question, organization and (choice, program) counters. `None` when the answer is not stored.
+        """
+        stored_answer = (
+            type(self)
+            .objects.filter(pk=self.pk)
+            .values_list(
+                "question_id", "user__organization_id", self.summary_choice_field
+            )
+            .first()
+        )
+        if not stored_answer:
+            return None
+        question_id, organization_id, choice = stored_answer
+        return (
+            question_id,
+            organization_id,
+            [(AnswerSummary.TOTAL_CHOICE, None), (choice, None)],
+        )
 
     def is_valid_answer(self) -> bool:
         raise NotImplementedError(
             "Validation only supported on inherited Answer classes."
         )
 
+    @staticmethod
+    def get_valid_answer_filter(prefix: str = "") -> models.Q:
+        """
+        Gets the filter, evaluated by the database, of the answers `is_valid_answer` considers valid.
+        To be overriden in concrete classes, the base `Answer` filter combines the ones of all its subtypes.
+
+        Args:
+            prefix (str, optional): Lookup path to the answer, f.e. `question_answers__`. Defaults to "".
+
+        Returns:
+            models.Q: Filter of the valid answers.
+        """
+        valid_filter = models.Q(pk__in=[])
+        for answer_type in get_submodel_type_list(Answer):
+            valid_filter |= answer_type.get_valid_answer_filter(
+                f"{prefix}{answer_type._meta.model_name}__"
+            )
+        return valid_filter
+
+    def get_answer_text(self) -> str:
+        """
+        Gets the answer as (human readable) text, f.e. for the spreadsheet exports of the report.
+
+        Returns:
+            str: Selected choice(s), empty when not answered.
+        """
+        raise NotImplementedError(
+            "Answer text only supported on inherited Answer classes."
+        )
+
     @staticmethod
     def get_detailed_summary(answers_list: List[Answer]) -> Dict[str, Any]:
         raise NotImplementedError(
             "Detailed summary only supported on inherited Answer classes."
         )
 
+    @staticmethod
+    def get_detailed_summaries(
+        answers_list: models.QuerySet,
+        group_by: Optional[str] = None,
+        max_choices: Optional[int] = None,
+        **justification_limits: Optional[int],
+    ) -> Dict[Any, Dict[str, Any]]:
+        """
+        Method to be overriden in concrete classes. Computes the detailed summaries of the given answers with grouped aggregate queries, so the number of queries does not depend on the number of answers or groups.
+
+        Args:
+            answers_list (models.QuerySet): Answers (of the concrete type) to summarize.
+            group_by (Optional[str], optional): Field to group the summaries by (f.e. `question_id`). Defaults to None.
+            max_choices (Optional[int], optional): Maximum number of choices of the answers with an open number of them (f.e. the programs of `MultipleChoiceAnswer`), the rest are counted together. Defaults to None.
+            justification_limits (Optional[int]): `max_justifications` and `max_justification_length` of the justifications in the summaries.
+
+        Returns:
+            Dict[Any, Dict[str, Any]]: Summary per `group_by` value (only for values with answers), or a single summary with key `None`.
+        """
+        raise NotImplementedError(
+            "Detailed summary only supported on inherited Answer classes."
+        )
+
+    @staticmethod
+    def get_summary_justifications(
+        answers_list: models.QuerySet,
+        group_by: Optional[str] = None,
+        **justification_limits: Optional[int],
+    ) -> Dict[Any, Dict[str, List[str]]]:
+        """
+        Method to be overriden in concrete classes with justifications. Gets the justifications of the given answers per selected choice.
+
+        Args:
+            answers_list (models.QuerySet): Answers (of the concrete type).
+            group_by (Optional[str], optional): Field to group the justifications by (f.e. `question_id`). Defaults to None.
+            justification_limits (Optional[int]): `max_justifications` (per choice) and `max_justification_length`.
+
+        Returns:
+            Dict[Any, Dict[str, List[str]]]: Justifications per selected choice, per `group_by` value.
+        """
+        return {}
+
+    @staticmethod
+    def format_detailed_summary(
+        choice_counts: Dict[str, int], justifications: Dict[str, List[str]]
+    ) -> Dict[str, Any]:
+        """
+        Method to be overriden in concrete classes. Formats a detailed summary from already counted answers (f.e. from the `AnswerSummary` table).
+
+        Args:
+            choice_counts (Dict[str, int]): Number of answers per selected choice (empty for answers without choice), for linkages per selected program name.
+            justifications (Dict[str, List[str]]): Justifications per selected choice.
+
+        Returns:
+            Dict[str, Any]: Detailed summary.
+        """
+        raise NotImplementedError(
+            "Detailed summary only supported on inherited Answer classes."
+        )
+
 
 class YesNoAnswer(Answer):
     short_answer: str = models.CharField(
         YesNoAnswerType.choices, max_length=50, blank=True
     )
     justify_answer: str = models.TextField(blank=True)
+    summary_choice_field = "short_answer"
+    summary_choice_types = [YesNoAnswerType.YES, YesNoAnswerType.NO]
 
     @staticmethod
     def _get_supported_questions() -> List[Question]:
@@ -114,25 +620,51 @@ class YesNoAnswer(Answer):
         return self.short_answer in YesNoAnswerType
 
     @staticmethod
-    def get_detailed_summary(answers_list: List[YesNoAnswer]) -> Dict[str, Any]:
-        def _yesno_type_summary(filter_type: YesNoAnswerType) -> Dict[str, Any]:
-            filter_query = answers_list.filter(short_answer=filter_type)
-            return {
-                filter_type.label: len(filter_query),
-                f"{filter_type.label}_justify": [
-                    fq.justify_answer for fq in filter_query.all() if fq.justify_answer
-                ],
-            }
+    def get_valid_answer_filter(prefix: str = "") -> models.Q:
+        return models.Q(**{f"{prefix}short_answer__in": YesNoAnswerType.values})
 
-        return {
-            **_yesno_type_summary(YesNoAnswerType.YES),
-            **_yesno_type_summary(YesNoAnswerType.NO),
-            **dict(
-                no_valid_response=len(
-                    [al for al in answers_list.all() if not al.is_valid_answer()]
-                )
-            ),
-        }
+    def get_answer_text(self) -> str:
+        return _get_choice_label(self.short_answer, YesNoAnswerType)
+
+    @staticmethod
+    def get_detailed_summary(answers_list: models.QuerySet) -> Dict[str, Any]:
+        return YesNoAnswer.get_detailed_summaries(answers_list)[None]
+
+    @staticmethod
+    def get_detailed_summaries(
+        answers_list: models.QuerySet,
+        group_by: Optional[str] = None,
+        max_choices: Optional[int] = None,
+        **justification_limits: Optional[int],
+    ) -> Dict[Any, Dict[str, Any]]:
+        return _get_choice_summaries(
+            answers_list,
+            YesNoAnswer.summary_choice_field,
+            YesNoAnswer.summary_choice_types,
+            group_by,
+            **justification_limits,
+        )
+
+    @staticmethod
+    def get_summary_justifications(
+        answers_list: models.QuerySet,
+        group_by: Optional[str] = None,
+        **justification_limits: Optional[int],
+    ) -> Dict[Any, Dict[str, List[str]]]:
+        return _get_justifications(
+            answers_list,
+            YesNoAnswer.summary_choice_field,
+            group_by,
+            **justification_limits,
+        )
+
+    @staticmethod
+    def format_detailed_summary(
+        choice_counts: Dict[str, int], justifications: Dict[str, List[str]]
+    ) -> Dict[str, Any]:
+        return _format_choice_summary(
+            choice_counts, justifications, YesNoAnswer.summary_choice_types
+        )
 
 
 class SingleChoiceAnswer(Answer):
@@ -140,6 +672,13 @@ class SingleChoiceAnswer(Answer):
         EvolutionChoiceType.choices, max_length=50, blank=True
     )
     justify_answer: str = models.TextField(blank=True)
+    summary_choice_field = "selected_choice"
+    summary_choice_types = [
+        EvolutionChoiceType.CAPABLE,
+        EvolutionChoiceType.EFFECTIVE,
+        EvolutionChoiceType.ENGAGED,
+        EvolutionChoiceType.NASCENT,
+    ]
 
     def get_selected_choice_text(self) -> str:
         return next(
@@ -156,36 +695,59 @@ class SingleChoiceAnswer(Answer):
         return self.selected_choice in EvolutionChoiceType
 
     @staticmethod
-    def get_detailed_summary(
-        answers_list: Union[models.QuerySet, List[YesNoAnswer]]
-    ) -> Dict[str, Any]:
-        def _single_choice_summary(filter_type: EvolutionChoiceType) -> Dict[str, Any]:
-            filter_query = answers_list.filter(selected_choice=filter_type)
-            label = str(filter_type.label)
-            return {
-                label: len(filter_query),
-                f"{label}_justify": [
-                    fq.justify_answer for fq in filter_query.all() if fq.justify_answer
-                ],
-            }
+    def get_valid_answer_filter(prefix: str = "") -> models.Q:
+        return models.Q(**{f"{prefix}selected_choice__in": EvolutionChoiceType.values})
 
-        return {
-            **_single_choice_summary(EvolutionChoiceType.CAPABLE),
-            **_single_choice_summary(EvolutionChoiceType.EFFECTIVE),
-            **_single_choice_summary(EvolutionChoiceType.ENGAGED),
-            **_single_choice_summary(EvolutionChoiceType.NASCENT),
-            **dict(
-                no_valid_response=len(
-                    [al for al in answers_list.all() if not al.is_valid_answer()]
-                )
-            ),
-        }
+    def get_answer_text(self) -> str:
+        return _get_choice_label(self.selected_choice, EvolutionChoiceType)
+
+    @staticmethod
+    def get_detailed_summary(answers_list: models.QuerySet) -> Dict[str, Any]:
+        return SingleChoiceAnswer.get_detailed_summaries(answers_list)[None]
+
+    @staticmethod
+    def get_detailed_summaries(
+        answers_list: models.QuerySet,
+        group_by: Optional[str] = None,
+        max_choices: Optional[int] = None,
+        **justification_limits: Optional[int],
+    ) -> Dict[Any, Dict[str, Any]]:
+        return _get_choice_summaries(
+            answers_list,
+            SingleChoiceAnswer.summary_choice_field,
+            SingleChoiceAnswer.summary_choice_types,
+            group_by,
+            **justification_limits,
+        )
+
+    @staticmethod
+    def get_summary_justifications(
+        answers_list: models.QuerySet,
+        group_by: Optional[str] = None,
+        **justification_limits: Optional[int],
+    ) -> Dict[Any, Dict[str, List[str]]]:
+        return _get_justifications(
+            answers_list,
+            SingleChoiceAnswer.summary_choice_field,
+            group_by,
+            **justification_limits,
+        )
+
+    @staticmethod
+    def format_detailed_summary(
+        choice_counts: Dict[str, int], justifications: Dict[str, List[str]]
+    ) -> Dict[str, Any]:
+        return _format_choice_summary(
+            choice_counts, justifications, SingleChoiceAnswer.summary_choice_types
+        )
 
 
 class MultipleChoiceAnswer(Answer):
     selected_programs = models.ManyToManyField(
         to=base_models.Program, blank=True, related_name="selected_answers"
     )
+    # Summary key of the selections of the programs left out by `max_choices` (see `get_detailed_summaries`).
+    OTHER_PROGRAMS = "other_programs"
 
     @staticmethod
     def _get_supported_questions() -> List[Question]:
@@ -195,22 +757,162 @@ class MultipleChoiceAnswer(Answer):
         return any(self.selected_programs.all())
 
     @staticmethod
-    def get_detailed_summary(answers_list: List[YesNoAnswer]) -> Dict[str, Any]:
-        all_sp = {
-            p.name: p_count
-            for p, p_count in dict(
-                Counter(
-                    itertools.chain.from_iterable(
-                        [a.selected_programs.all() for a in answers_list]
-                    )
+    def get_valid_answer_filter(prefix: str = "") -> models.Q:
+        return models.Q(
+            models.Exists(
+                MultipleChoiceAnswer.selected_programs.through.objects.filter(
+                    multiplechoiceanswer_id=models.OuterRef(f"{prefix}pk")
                 )
-            ).items()
+            )
+        )
+
+    def get_answer_text(self) -> str:
+        # Sorted in python, so prefetched selections are reused.
+        return ", ".join(sorted(p.name for p in self.selected_programs.all()))
+
+    def get_summary_counters(self) -> Optional[SummaryCounters]:
+        stored_answer = (
+            MultipleChoiceAnswer.objects.filter(pk=self.pk)
+            .values_list("question_id", "user__organization_id")
+            .first()
+        )
+        if not stored_answer:
+            return None
+        question_id, organization_id = stored_answer
+        selected_programs = list(
+            MultipleChoiceAnswer.selected_programs.through.objects.filter(
+                multiplechoiceanswer_id=self.pk
+            )
+            .order_by("program_id")
+            .values_list("program_id", flat=True)
+        )
+        counters = [(AnswerSummary.TOTAL_CHOICE, None)]
+        if not selected_programs:
+            counters.append(("", None))
+        counters.extend([("", p_id) for p_id in selected_programs])
+        return question_id, organization_id, counters
+
+    @staticmethod
+    def get_detailed_summary(answers_list: models.QuerySet) -> Dict[str, Any]:
+        return MultipleChoiceAnswer.get_detailed_summaries(answers_list)[None]
+
+    @staticmethod
+    def get_detailed_summaries(
+        answers_list: models.QuerySet,
+        group_by: Optional[str] = None,
+        max_choices: Optional[int] = None,
+        **justification_limits: Optional[int],
+    ) -> Dict[Any, Dict[str, Any]]:
+        """
+        Counts the selected programs with one grouped query on the selections table (`GROUP BY group_by, program`) and the answers without selection with another one.
+        Programs are listed in order of first selection. With `max_choices` only the most selected ones are listed (ties in order of first selection), the selections of the rest are counted as `OTHER_PROGRAMS`.
+        """
+        group_fields = [group_by] if group_by else []
+        selection_group_fields = [f"multiplechoiceanswer__{gf}" for gf in group_fields]
+        answer_selections = (
+            MultipleChoiceAnswer.selected_programs.through.objects.filter(
+                multiplechoiceanswer__in=answers_list.values("pk")
+            ).order_by()
+        )
+        selections = answer_selections.values_list(
+            *selection_group_fields, "program__name"
+        ).annotate(
+            n_selections=models.Count("pk"),
+            first_selection=models.Min("multiplechoiceanswer_id"),
+        )
+        if max_choices is None:
+            selections = selections.order_by(
+                *selection_group_fields, "first_selection", "program_id"
+            )
+        else:
+            selections = selections.filter(
+                program_id__in=MultipleChoiceAnswer.get_top_programs(
+                    answer_selections.filter(
+                        **{sgf: models.OuterRef(sgf) for sgf in selection_group_fields}
+                    ),
+                    models.Count("pk"),
+                    models.Min("multiplechoiceanswer_id"),
+                    max_choices,
+                )
+            ).order_by(
+                *selection_group_fields,
+                "-n_selections",
+                "first_selection",
+                "program_id",
+            )
+        invalid_answers = answers_list.order_by().invalid()
+        if group_by:
+            no_valid_responses = dict(
+                invalid_answers.values_list(group_by).annotate(
+                    n_answers=models.Count("pk")
+                )
+            )
+        else:
+            no_valid_responses = {None: invalid_answers.count()}
+
+        programs_counts: Dict[Any, Dict[str, int]] = defaultdict(dict)
+        for *group_value, program_name, n_selections, _ in selections:
+            programs_counts[next(iter(group_value), None)][program_name] = n_selections
+        if max_choices is not None and group_by:
+            MultipleChoiceAnswer.add_other_programs(
+                programs_counts,
+                dict(
+                    answer_selections.values_list(*selection_group_fields).annotate(
+                        n_selections=models.Count("pk")
+                    )
+                ),
+            )
+        elif max_choices is not None:
+            MultipleChoiceAnswer.add_other_programs(
+                programs_counts, {None: answer_selections.count()}
+            )
+        for group_value, n_answers in no_valid_responses.items():
+            programs_counts[group_value][""] = n_answers
+        return {
+            group_value: MultipleChoiceAnswer.format_detailed_summary(p_counts, {})
+            for group_value, p_counts in programs_counts.items()
         }
+
+    @staticmethod
+    def get_top_programs(
+        selections: models.QuerySet,
+        count: models.Aggregate,
+        first_selection: models.Aggregate,
+        max_programs: int,
+    ) -> models.QuerySet:
+        """
+        Gets the subquery of the ids of the `max_programs` most selected programs (ties in order of first selection) of the given selections (f.e. correlated to a question with `OuterRef`).
+        """
+        return (
+            selections.values("program_id")
+            .annotate(top_count=count, top_first_selection=first_selection)
+            .order_by("-top_count", "top_first_selection", "program_id")
+            .values("program_id")[:max_programs]
+        )
+
+    @staticmethod
+    def add_other_programs(
+        programs_counts: Dict[Any, Dict[str, int]], total_counts: Dict[Any, int]
+    ):
+        """
+        Adds the selections of the programs left out of limited program counts (the total minus the listed ones) as `OTHER_PROGRAMS`, when there are any.
+
+        Args:
+            programs_counts (Dict[Any, Dict[str, int]]): Number of selections of the listed programs, per group.
+            total_counts (Dict[Any, int]): Number of selections of all programs, per group.
+        """
+        for group_value, n_total in total_counts.items():
+            n_other = n_total - sum(programs_counts[group_value].values())
+            if n_other > 0:
+                programs_counts[group_value][
+                    MultipleChoiceAnswer.OTHER_PROGRAMS
+                ] = n_other
+
+    @staticmethod
+    def format_detailed_summary(
+        choice_counts: Dict[str, int], justifications: Dict[str, List[str]]
+    ) -> Dict[str, Any]:
         return {
-            **all_sp,
-            **dict(
-                no_valid_response=len(
-                    [al for al in answers_list.all() if not al.is_valid_answer()]
-                )
-            ),
+            **{p_name: p_count for p_name, p_count in choice_counts.items() if p_name},
+            **dict(no_valid_response=choice_counts.get("", 0)),
         }
@@ -0,0 +1,170 @@
+from __future__ import annotations
+
+import threading
+from contextlib import contextmanager
+from typing import Iterable, List, Optional, Set, Tuple
+
+from django.db import models, transaction
+
+_deferred = threading.local()
+
+# Organization (or user) ids and question (or program) ids whose counters get rebuilt, `None` for all of them.
+BookkeepingScope = Tuple[Optional[Set[Optional[int]]], Optional[Set[int]]]
+
+
+def is_answer_bookkeeping_deferred() -> bool:
+    """
+    Whether the answers being deleted are part of a cascade whose `AnswerSummary` and `UserProgress` get rebuilt afterwards (see `defer_answer_bookkeeping`).
+
+    Returns:
+        bool: Whether the per-answer bookkeeping can be skipped.
+    """
+    return getattr(_deferred, "depth", 0) > 0
+
+
+def _get_scope(pairs: Iterable[Tuple[Optional[int], int]]) -> BookkeepingScope:
+    pairs = list(pairs)
+    return {first for first, _ in pairs}, {second for _, second in pairs}
+
+
+def get_bookkeeping_scopes(
+    deleted: models.QuerySet,
+) -> Tuple[List[BookkeepingScope], List[BookkeepingScope]]:
+    """
+    Gets the `AnswerSummary` and `UserProgress` counters depending on the given entities, about to be deleted: the ones of their answers, of the selections of their programs and of the programs losing questions.
+
+    Args:
+        deleted (models.QuerySet): Entities of an `AnswerCascadeModel` about to be deleted.
+
+    Returns:
+        Tuple[List[BookkeepingScope], List[BookkeepingScope]]: (Organization ids, question ids) of the summaries and (user ids, program ids) of the progress to rebuild.
+    """
+    from epic_app.models.epic_answers import Answer, MultipleChoiceAnswer
+    from epic_app.models.epic_questions import Question
+    from epic_app.models.models import Program
+
+    model = deleted.model
+    deleted_pks = deleted.values("pk")
+    deleted_answers = Answer.objects.filter(
+        **{f"{model.answer_lookup}__in": deleted_pks}
+    ).order_by()
+    summary_scopes = [
+        _get_scope(
+            deleted_answers.values_list(
+                "user__organization_id", "question_id"
+            ).distinct()
+        )
+    ]
+    if model.answer_lookup.startswith("question"):
+        # The remaining users of the programs losing questions have less of them to answer.
+        question_lookup = model.answer_lookup[len("question__") :] or "pk"
+        progress_scopes = [
+            (
+                None,
+                set(
+                    Question.objects.filter(**{f"{question_lookup}__in": deleted_pks})
+                    .order_by()
+                    .values_list("program_id", flat=True)
+                    .distinct()
+                ),
+            )
+        ]
+    else:
+        progress_scopes = [
+            _get_scope(
+                deleted_answers.values_list(
+                    "user_id", "question__program_id"
+                ).distinct()
+            )
+        ]
+    if model.program_lookup:
+        # Linkage answers (of other programs) selecting the deleted programs.
+        selecting_answers = MultipleChoiceAnswer.objects.filter(
+            selected_programs__in=Program.objects.filter(
+                **{f"{model.program_lookup}__in": deleted_pks}
+            )
+        ).order_by()
+        summary_scopes.append(
+            _get_scope(
+                selecting_answers.values_list(
+                    "user__organization_id", "question_id"
+                ).distinct()
+            )
+        )
+        progress_scopes.append(
+            _get_scope(
+                selecting_answers.values_list(
+                    "user_id", "question__program_id"
+                ).distinct()
+            )
+        )
+    return summary_scopes, progress_scopes
+
+
+@contextmanager
+def defer_answer_bookkeeping(deleted: models.QuerySet):
+    """
+    Skips the per-answer bookkeeping of the answers deleted within (f.e. all the answers of a deleted `Area`), rebuilding once instead, within the same transaction, only the `AnswerSummary` and `UserProgress` counters depending on the `deleted` entities (see `get_bookkeeping_scopes`).
+    Nested blocks only rebuild when the outermost one ends.
+
+    Args:
+        deleted (models.QuerySet): Entities of an `AnswerCascadeModel` deleted within.
+    """
+    from epic_app.models.epic_summaries import AnswerSummary, UserProgress
+    from epic_app.models.epic_versions import EpicDataVersion
+
+    depth = getattr(_deferred, "depth", 0)
+    with transaction.atomic():
+        if not depth:
+            _deferred.summary_scopes, _deferred.progress_scopes = [], []
+        summary_scopes, progress_scopes = get_bookkeeping_scopes(deleted)
+        _deferred.summary_scopes.extend(summary_scopes)
+        _deferred.progress_scopes.extend(progress_scopes)
+        _deferred.depth = depth + 1
+        try:
+            yield
+        finally:
+            _deferred.depth = depth
+        if depth:
+            return
+        for organization_ids, question_ids in _deferred.summary_scopes:
+            if question_ids:
+                AnswerSummary.rebuild(organization_ids, question_ids)
+        for user_ids, program_ids in _deferred.progress_scopes:
+            if program_ids:
+                UserProgress.rebuild(user_ids, program_ids)
+        EpicDataVersion.increase(EpicDataVersion.ANSWERS)
+
+
+class AnswerCascadeQuerySet(models.QuerySet):
+    """
+    QuerySet whose deletion cascades to answers, rebuilding the answer bookkeeping once afterwards.
+    """
+
+    def delete(self):
+        with defer_answer_bookkeeping(self):
+            return super().delete()
+
+
+class AnswerCascadeModel(models.Model):
+    """
+    Base of the models whose deletion cascades to answers (f.e. `Question` or `EpicOrganization`).
+    Updating the `AnswerSummary` and `UserProgress` counters per deleted answer takes several queries each, so the ones depending on the deleted entities get rebuilt once after the cascade instead.
+
+    Args:
+        models (models.Model): Derives directly from base class Model.
+    """
+
+    # Lookup from `Answer` to this model (f.e. `question__program`).
+    answer_lookup: str = ""
+    # Lookup from `Program` to this model, for the models whose deletion cascades to programs (hence to the selections of them).
+    program_lookup: Optional[str] = None
+
+    objects = AnswerCascadeQuerySet.as_manager()
+
+    class Meta:
+        abstract = True
+
+    def delete(self, *args, **kwargs):
+        with defer_answer_bookkeeping(type(self)._default_manager.filter(pk=self.pk)):
+            return super().delete(*args, **kwargs)
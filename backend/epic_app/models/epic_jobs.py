@@ -0,0 +1,212 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+from typing import Any, Dict, Optional, Tuple
+
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.db import models, transaction
+from django.utils import timezone
+
+from epic_app.models.epic_user import EpicOrganization
+
+
+class ReportJobStatus(models.TextChoices):
+    PENDING = "PENDING", ("Pending")
+    RUNNING = "RUNNING", ("Running")
+    DONE = "DONE", ("Done")
+    FAILED = "FAILED", ("Failed")
+
+
+class ReportJob(models.Model):
+    """
+    Report requested to be generated in the background by the `run_report_jobs` worker command.
+    Jobs requesting the same report (`report_key`) are deduplicated while pending, running or not expired.
+    Finished jobs (and their artifact) expire after `EPIC_REPORT_JOB_RETENTION` seconds.
+
+    Args:
+        models (models.Model): Derives directly from base class Model.
+    """
+
+    requested_by: User = models.ForeignKey(
+        to=User, on_delete=models.CASCADE, related_name="report_jobs"
+    )
+    # Reported organization, all of them when not set.
+    organization: EpicOrganization = models.ForeignKey(
+        to=EpicOrganization,
+        on_delete=models.CASCADE,
+        related_name="report_jobs",
+        blank=True,
+        null=True,
+    )
+    report_format: str = models.CharField(max_length=10, default="pdf")
+    # Generation options (f.e. the table of contents mode), passed to the report builder.
+    options: dict = models.JSONField(default=dict, blank=True)
+    # Identifies the requested report (format, scope and data versions).
+    report_key: str = models.CharField(max_length=255, db_index=True)
+    status: str = models.CharField(
+        max_length=10,
+        choices=ReportJobStatus.choices,
+        default=ReportJobStatus.PENDING,
+        db_index=True,
+    )
+    progress: float = models.FloatField(default=0)
+    artifact: bytes = models.BinaryField(blank=True, null=True)
+    error: str = models.TextField(blank=True)
+    created_at: datetime = models.DateTimeField(default=timezone.now)
+    started_at: datetime = models.DateTimeField(blank=True, null=True)
+    finished_at: datetime = models.DateTimeField(blank=True, null=True)
+    expires_at: datetime = models.DateTimeField(blank=True, null=True)
+
+    def __str__(self) -> str:
+        return f"{self.report_format} report job {self.pk} ({self.status})"
+
+    @property
+    def is_expired(self) -> bool:
+        return self.expires_at is not None and self.expires_at <= timezone.now()
+
+    @staticmethod
+    def get_retention() -> timedelta:
+        return timedelta(
+            seconds=getattr(settings, "EPIC_REPORT_JOB_RETENTION", 24 * 60 * 60)
+        )
+
+    @staticmethod
+    def enqueue(
+        requested_by: User,
+        organization: Optional[EpicOrganization],
+        report_key: str,
+        report_format: str = "pdf",
+        options: Optional[Dict[str, Any]] = None,
+    ) -> Tuple[ReportJob, bool]:
+        """
+        Requests a report, reusing the job of an identical request when it is pending, running or done (and not expired yet).
+
+        Args:
+            requested_by (User): User requesting the report.
+            organization (Optional[EpicOrganization]): Reported organization, all of them when not given.
+            report_key (str): Key identifying the requested report.
+            report_format (str, optional): Format of the report. Defaults to "pdf".
+            options (Optional[Dict[str, Any]], optional): Generation options, which should be part of the `report_key`. Defaults to None.
+
+        Returns:
+            Tuple[ReportJob, bool]: Job generating the report and whether it was created.
+        """
+        with transaction.atomic():
+            existing_job = (
+                ReportJob.objects.filter(
+                    report_key=report_key, report_format=report_format
+                )
+                .filter(
+                    models.Q(
+                        status__in=[ReportJobStatus.PENDING, ReportJobStatus.RUNNING]
+                    )
+                    | models.Q(
+                        status=ReportJobStatus.DONE, expires_at__gt=timezone.now()
+                    )
+                )
+                .order_by("created_at")
+                .first()
+            )
+            if existing_job:
+                return existing_job, False
+            return (
+                ReportJob.objects.create(
+                    requested_by=requested_by,
+                    organization=organization,
+                    report_key=report_key,
+                    report_format=report_format,
+                    options=options or {},
+                ),
+                True,
+            )
+
+    @staticmethod
+    def claim_next() -> Optional[ReportJob]:
+        """
+        Marks the oldest pending job as running. Safe to be called by concurrent workers, a job is only claimed by one of them.
+
+        Returns:
+            Optional[ReportJob]: Claimed job, `None` when there are no pending jobs.
+        """
+        pending_ids = ReportJob.objects.filter(status=ReportJobStatus.PENDING).order_by(
+            "created_at", "pk"
+        )
+        for job_id in pending_ids.values_list("pk", flat=True)[:10]:
+            if ReportJob.objects.filter(
+                pk=job_id, status=ReportJobStatus.PENDING
+            ).update(status=ReportJobStatus.RUNNING, started_at=timezone.now()):
+                return ReportJob.objects.get(pk=job_id)
+        return None
+
+    def set_progress(self, progress: float):
+        """
+        Stores the progress (from 0 to 1) of a running job.
+
+        Args:
+            progress (float): Fraction of the report already generated.
+        """
+        self.progress = progress
+        ReportJob.objects.filter(pk=self.pk).update(progress=progress)
+
+    def finish(self, artifact: Optional[bytes] = None, error: str = "") -> bool:
+        """
+        Stores the result of a running job, starting its retention period.
+        Jobs no longer running (f.e. already failed by `fail_stale`) are left unchanged, so their result does not flip.
+
+        Args:
+            artifact (Optional[bytes], optional): Generated report. Defaults to None.
+            error (str, optional): Reason of the failure, when the report could not be generated. Defaults to "".
+
+        Returns:
+            bool: Whether the job was still running, hence its result stored.
+        """
+        finished_at = timezone.now()
+        finished_fields = dict(
+            finished_at=finished_at,
+            expires_at=finished_at + ReportJob.get_retention(),
+            status=ReportJobStatus.FAILED if error else ReportJobStatus.DONE,
+            progress=self.progress if error else 1,
+            artifact=None if error else artifact,
+            error=error,
+        )
+        if not ReportJob.objects.filter(
+            pk=self.pk, status=ReportJobStatus.RUNNING
+        ).update(**finished_fields):
+            self.refresh_from_db()
+            return False
+        for field_name, value in finished_fields.items():
+            setattr(self, field_name, value)
+        return True
+
+    @staticmethod
+    def fail_stale(timeout: timedelta) -> int:
+        """
+        Marks as failed the jobs running for longer than the given time (f.e. because their worker was stopped).
+
+        Args:
+            timeout (timedelta): Maximum running time of a job.
+
+        Returns:
+            int: Number of failed jobs.
+        """
+        now = timezone.now()
+        return ReportJob.objects.filter(
+            status=ReportJobStatus.RUNNING, started_at__lt=now - timeout
+        ).update(
+            status=ReportJobStatus.FAILED,
+            error="The report generation timed out.",
+            finished_at=now,
+            expires_at=now + ReportJob.get_retention(),
+        )
+
+    @staticmethod
+    def purge_expired() -> int:
+        """
+        Removes the finished jobs (and their artifacts) whose retention period is over.
+
+        Returns:
+            int: Number of removed jobs.
+        """
+        n_removed, _ = ReportJob.objects.filter(expires_at__lte=timezone.now()).delete()
+        return n_removed
@@ -4,14 +4,20 @@ from django.db import IntegrityError, models
 from django.utils.translation import gettext_lazy as _
 
 from epic_app.models import models as base_models
+from epic_app.models.epic_cascades import AnswerCascadeModel
 
 
-class Question(models.Model):
+class Question(AnswerCascadeModel):
+    answer_lookup = "question"
 
     title: str = models.CharField(null=False, blank=False, max_length=512)
     program: base_models.Program = models.ForeignKey(
         to=base_models.Program, on_delete=models.CASCADE, related_name="questions"
     )
+    # Discriminator with the `model_name` of the concrete `Question` subtype.
+    submodel_type: str = models.CharField(
+        max_length=50, blank=True, editable=False, db_index=True
+    )
 
     class Meta:
         unique_together = ["title", "program"]
@@ -19,6 +25,14 @@ class Question(models.Model):
     def __str__(self) -> str:
         return self.title[0:15]
 
+    def save(self, *args, **kwargs) -> None:
+        """
+        Overriding of the save method to store the concrete subtype of this `Question` in the base table.
+        """
+        if self._meta.parents:
+            self.submodel_type = self._meta.model_name
+        return super(Question, self).save(*args, **kwargs)
+
 
 class YesNoQuestion(Question):
     description: str = models.TextField(null=False, blank=False)
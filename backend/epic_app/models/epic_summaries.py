@@ -0,0 +1,697 @@
+from __future__ import annotations
+
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from django.db import IntegrityError, models, transaction
+from django.db.models.functions import Coalesce, Least
+
+from epic_app.models.epic_questions import Question
+from epic_app.models.epic_user import EpicOrganization, EpicUser
+from epic_app.models.models import Program
+
+# Question id, organization id and the (choice, program id) counters of an answer.
+SummaryCounters = Tuple[int, Optional[int], List[Tuple[str, Optional[int]]]]
+
+# Question id, organization id, choice and program id identifying an `AnswerSummary` row.
+SummaryKey = Tuple[int, Optional[int], str, Optional[int]]
+
+# User id, program id and validity of an answer.
+ProgressCounters = Tuple[int, int, bool]
+
+
+class AnswerSummary(models.Model):
+    """
+    Precomputed counter of the answers given to a `Question` by the users of an `EpicOrganization`, per choice.
+    Counters are updated within the same transaction as the answers (see `Answer.save` and `epic_app.signals`), bulk updates (`QuerySet.update`) are not tracked and require running the `rebuild_answer_summaries` command.
+    Deleting the entities answers depend on (f.e. a `Program`, along with its answers and the selections of it) rebuilds them once afterwards (see `defer_answer_bookkeeping`).
+
+    Rows are identified by their `choice`:
+        - `TOTAL_CHOICE`: number of answers.
+        - The selected choice (f.e. `Y` or `NASCENT`), empty for answers without choice.
+        - Empty with a `program`: number of (linkage) answers selecting said program.
+
+    Args:
+        models (models.Model): Derives directly from base class Model.
+    """
+
+    TOTAL_CHOICE = "*"
+
+    question: Question = models.ForeignKey(
+        to=Question, on_delete=models.CASCADE, related_name="answer_summaries"
+    )
+    organization: EpicOrganization = models.ForeignKey(
+        to=EpicOrganization,
+        on_delete=models.CASCADE,
+        related_name="answer_summaries",
+        blank=True,
+        null=True,
+    )
+    choice: str = models.CharField(max_length=50, blank=True)
+    program: Program = models.ForeignKey(
+        to=Program,
+        on_delete=models.CASCADE,
+        related_name="answer_summaries",
+        blank=True,
+        null=True,
+    )
+    n_answers: int = models.IntegerField(default=0)
+    # Id of the first answer counted in this row, to sort the selected programs.
+    first_answer: int = models.IntegerField(blank=True, null=True)
+
+    class Meta:
+        # NULL values are distinct in unique constraints, so each combination of the nullable columns gets its own one.
+        constraints = [
+            models.UniqueConstraint(
+                fields=fields,
+                condition=models.Q(
+                    organization__isnull="organization" not in fields,
+                    program__isnull="program" not in fields,
+                ),
+                name=f"unique_answersummary_{'_'.join(fields)}",
+            )
+            for fields in [
+                ("question", "organization", "choice", "program"),
+                ("question", "organization", "choice"),
+                ("question", "choice", "program"),
+                ("question", "choice"),
+            ]
+        ]
+
+    def __str__(self) -> str:
+        return f"[{self.organization}] {self.question}: {self.choice or self.program} ({self.n_answers})"
+
+    @staticmethod
+    def add_answers(
+        question_id: int,
+        organization_id: Optional[int],
+        choice: str,
+        delta: int,
+        program_id: Optional[int] = None,
+        answer_id: Optional[int] = None,
+    ):
+        """
+        Adds (or removes when `delta` is negative) answers to a counter, the counter gets created when it does not exist yet and removed when it gets empty.
+        When a concurrent transaction creates the same counter first, the answers are added to it instead.
+
+        Args:
+            question_id (int): Id of the answered `Question`.
+            organization_id (Optional[int]): Id of the `EpicOrganization` of the answering user.
+            choice (str): Counted choice.
+            delta (int): Number of answers to add.
+            program_id (Optional[int], optional): Id of the selected `Program`. Defaults to None.
+            answer_id (Optional[int], optional): Id of the added (or removed) answer, to keep track of the first one. Defaults to None.
+        """
+        if delta == 0:
+            return
+        rows = AnswerSummary.objects.filter(
+            question_id=question_id,
+            organization_id=organization_id,
+            choice=choice,
+            program_id=program_id,
+        )
+        if delta > 0:
+            updated_fields = dict(n_answers=models.F("n_answers") + delta)
+            if answer_id is not None:
+                updated_fields["first_answer"] = Least(
+                    Coalesce("first_answer", models.Value(answer_id)),
+                    models.Value(answer_id),
+                )
+            if rows.update(**updated_fields):
+                return
+            try:
+                with transaction.atomic():
+                    AnswerSummary.objects.create(
+                        question_id=question_id,
+                        organization_id=organization_id,
+                        choice=choice,
+                        program_id=program_id,
+                        n_answers=delta,
+                        first_answer=answer_id,
+                    )
+            except IntegrityError:
+                rows.update(**updated_fields)
+            return
+
+        rows.update(n_answers=models.F("n_answers") + delta)
+        rows.filter(n_answers__lte=0).delete()
+        if answer_id is not None and program_id is not None:
+            rows.filter(first_answer=answer_id).update(
+                first_answer=AnswerSummary._get_first_selection(
+                    question_id, organization_id, program_id
+                )
+            )
+
+    @staticmethod
+    def add_many_answers(deltas: Dict[Tuple[int, Optional[int], str], int]):
+        """
+        Adds answers to several counters (without program) at once, with one query to read the existing counters, one to update them and one to create the missing ones.
+        When a concurrent transaction creates some of the missing counters first, they get added one by one instead.
+
+        Args:
+            deltas (Dict[Tuple[int, Optional[int], str], int]): Number of answers (positive) to add per question id, organization id and choice.
+        """
+        deltas = {key: delta for key, delta in deltas.items() if delta > 0}
+        if not deltas:
+            return
+        existing_rows = {
+            (row.question_id, row.organization_id, row.choice): row
+            for row in AnswerSummary.objects.filter(
+                question_id__in={q_id for q_id, _, _ in deltas},
+                choice__in={choice for _, _, choice in deltas},
+                program__isnull=True,
+            )
+        }
+        updated_rows = []
+        for key, delta in deltas.items():
+            if key in existing_rows:
+                row = existing_rows[key]
+                row.n_answers = models.F("n_answers") + delta
+                updated_rows.append(row)
+        AnswerSummary.objects.bulk_update(updated_rows, ["n_answers"])
+        missing_deltas = {
+            key: delta for key, delta in deltas.items() if key not in existing_rows
+        }
+        try:
+            with transaction.atomic():
+                AnswerSummary.objects.bulk_create(
+                    [
+                        AnswerSummary(
+                            question_id=question_id,
+                            organization_id=organization_id,
+                            choice=choice,
+                            n_answers=delta,
+                        )
+                        for (
+                            question_id,
+                            organization_id,
+                            choice,
+                        ), delta in missing_deltas.items()
+                    ]
+                )
+        except IntegrityError:
+            for (question_id, organization_id, choice), delta in missing_deltas.items():
+                AnswerSummary.add_answers(question_id, organization_id, choice, delta)
+
+    @staticmethod
+    def replace_counters(
+        previous_counters: Optional[SummaryCounters],
+        current_counters: Optional[SummaryCounters],
+        answer_id: int,
+    ):
+        """
+        Moves an answer from the counters it was counted in to its current ones.
+
+        Args:
+            previous_counters (Optional[SummaryCounters]): Counters of the answer before it changed, `None` for new answers.
+            current_counters (Optional[SummaryCounters]): Counters of the answer after it changed, `None` for removed answers.
+            answer_id (int): Id of the answer.
+        """
+        if previous_counters == current_counters:
+            return
+        for counters, delta in [(previous_counters, -1), (current_counters, 1)]:
+            if not counters:
+                continue
+            question_id, organization_id, choices = counters
+            for choice, program_id in choices:
+                AnswerSummary.add_answers(
+                    question_id,
+                    organization_id,
+                    choice,
+                    delta,
+                    program_id=program_id,
+                    answer_id=answer_id if program_id else None,
+                )
+
+    @staticmethod
+    def _get_first_selection(
+        question_id: int, organization_id: Optional[int], program_id: int
+    ) -> Optional[int]:
+        from epic_app.models.epic_answers import MultipleChoiceAnswer
+
+        return (
+            MultipleChoiceAnswer.selected_programs.through.objects.filter(
+                program_id=program_id,
+                multiplechoiceanswer__question_id=question_id,
+                multiplechoiceanswer__user__organization_id=organization_id,
+            )
+            .aggregate(first_answer=models.Min("multiplechoiceanswer_id"))
+            .get("first_answer", None)
+        )
+
+    @staticmethod
+    def update_selections(selections: Iterable[Tuple[int, int]], delta: int):
+        """
+        Updates the counters of the given (linkage) answer selections once they have been added (`delta` = 1) or removed (`delta` = -1).
+
+        Args:
+            selections (Iterable[Tuple[int, int]]): Pairs of `MultipleChoiceAnswer` and `Program` ids.
+            delta (int): Whether the selections were added (1) or removed (-1).
+        """
+        from epic_app.models.epic_answers import MultipleChoiceAnswer
+
+        selections = list(selections)
+        answer_ids = {a_id for a_id, _ in selections}
+        if not answer_ids:
+            return
+        answers_info = {
+            a_id: (q_id, o_id)
+            for a_id, q_id, o_id in MultipleChoiceAnswer.objects.filter(
+                pk__in=answer_ids
+            ).values_list("pk", "question_id", "user__organization_id")
+        }
+        n_selections = dict(
+            MultipleChoiceAnswer.selected_programs.through.objects.filter(
+                multiplechoiceanswer__in=answer_ids
+            )
+            .order_by()
+            .values_list("multiplechoiceanswer")
+            .annotate(n_selections=models.Count("pk"))
+        )
+        n_changed = {a_id: 0 for a_id in answer_ids}
+        for a_id, p_id in selections:
+            if a_id not in answers_info:
+                continue
+            n_changed[a_id] += 1
+            AnswerSummary.add_answers(
+                *answers_info[a_id], "", delta, program_id=p_id, answer_id=a_id
+            )
+
+        # Keep track of the answers without any selection.
+        for a_id, a_changed in n_changed.items():
+            if a_id not in answers_info:
+                continue
+            n_after = n_selections.get(a_id, 0)
+            n_before = n_after - delta * a_changed
+            if bool(n_before) != bool(n_after):
+                AnswerSummary.add_answers(*answers_info[a_id], "", -1 if n_after else 1)
+
+    @staticmethod
+    def _get_scope_filter(
+        organization_ids: Optional[Iterable[Optional[int]]],
+        question_ids: Optional[Iterable[int]],
+        question_field: str = "question_id",
+        organization_field: str = "organization",
+    ) -> models.Q:
+        """
+        Gets the filter of the given organizations and questions (all of them when not given), as the given lookups of their fields (f.e. `user__organization` from `Answer`).
+        """
+        scope_filter = models.Q()
+        if question_ids is not None:
+            scope_filter &= models.Q(**{f"{question_field}__in": set(question_ids)})
+        if organization_ids is None:
+            return scope_filter
+        organization_ids = set(organization_ids)
+        o_filter = models.Q(
+            **{f"{organization_field}_id__in": organization_ids - {None}}
+        )
+        if None in organization_ids:
+            o_filter |= models.Q(**{f"{organization_field}__isnull": True})
+        return scope_filter & o_filter
+
+    @staticmethod
+    def get_expected_summaries(
+        organization_ids: Optional[Iterable[Optional[int]]] = None,
+        question_ids: Optional[Iterable[int]] = None,
+    ) -> List[AnswerSummary]:
+        """
+        Computes the counters from the stored answers with grouped aggregate queries.
+
+        Args:
+            organization_ids (Optional[Iterable[Optional[int]]], optional): Only computes the counters of these organizations (`None` for users without organization). Defaults to None (all of them).
+            question_ids (Optional[Iterable[int]], optional): Only computes the counters of these questions. Defaults to None (all of them).
+
+        Returns:
+            List[AnswerSummary]: Counters (not saved).
+        """
+        from epic_app.models.epic_answers import Answer, MultipleChoiceAnswer
+        from epic_app.utils import get_submodel_type_list
+
+        if organization_ids is not None:
+            organization_ids = set(organization_ids)
+        if question_ids is not None:
+            question_ids = set(question_ids)
+
+        def get_scope_filter(question_field: str, organization_field: str) -> models.Q:
+            return AnswerSummary._get_scope_filter(
+                organization_ids, question_ids, question_field, organization_field
+            )
+
+        answer_filter = get_scope_filter("question_id", "user__organization")
+        answer_keys = ["question_id", "user__organization_id"]
+        summaries = [
+            AnswerSummary(
+                question_id=q_id,
+                organization_id=o_id,
+                choice=AnswerSummary.TOTAL_CHOICE,
+                n_answers=n_answers,
+            )
+            for q_id, o_id, n_answers in Answer.objects.filter(answer_filter)
+            .order_by()
+            .values_list(*answer_keys)
+            .annotate(n_answers=models.Count("pk"))
+        ]
+        for answer_type in get_submodel_type_list(Answer):
+            if not answer_type.summary_choice_field:
+                continue
+            summaries.extend(
+                AnswerSummary(
+                    question_id=q_id,
+                    organization_id=o_id,
+                    choice=choice,
+                    n_answers=n_answers,
+                )
+                for q_id, o_id, choice, n_answers in answer_type.objects.filter(
+                    answer_filter
+                )
+                .order_by()
+                .values_list(*answer_keys, answer_type.summary_choice_field)
+                .annotate(n_answers=models.Count("pk"))
+            )
+        summaries.extend(
+            AnswerSummary(
+                question_id=q_id, organization_id=o_id, choice="", n_answers=n_answers
+            )
+            for q_id, o_id, n_answers in MultipleChoiceAnswer.objects.filter(
+                answer_filter
+            )
+            .order_by()
+            .invalid()
+            .values_list(*answer_keys)
+            .annotate(n_answers=models.Count("pk"))
+        )
+        summaries.extend(
+            AnswerSummary(
+                question_id=q_id,
+                organization_id=o_id,
+                choice="",
+                program_id=p_id,
+                n_answers=n_answers,
+                first_answer=first_answer,
+            )
+            for q_id, o_id, p_id, n_answers, first_answer in MultipleChoiceAnswer.selected_programs.through.objects.filter(
+                get_scope_filter(
+                    "multiplechoiceanswer__question_id",
+                    "multiplechoiceanswer__user__organization",
+                )
+            )
+            .order_by()
+            .values_list(
+                *[f"multiplechoiceanswer__{ak}" for ak in answer_keys], "program_id"
+            )
+            .annotate(
+                n_answers=models.Count("pk"),
+                first_answer=models.Min("multiplechoiceanswer_id"),
+            )
+        )
+
+        return summaries
+
+    @staticmethod
+    def get_inconsistencies() -> List[SummaryKey]:
+        """
+        Compares the stored counters with the ones computed from the stored answers.
+
+        Returns:
+            List[SummaryKey]: Sorted (question id, organization id, choice, program id) keys whose counters are missing, outdated, not expected or duplicated.
+        """
+        expected_counters = {
+            (s.question_id, s.organization_id, s.choice, s.program_id): (
+                s.n_answers,
+                s.first_answer,
+            )
+            for s in AnswerSummary.get_expected_summaries()
+        }
+        stored_counters: Dict[SummaryKey, List[Tuple[int, Optional[int]]]] = {}
+        for *key, n_answers, first_answer in AnswerSummary.objects.values_list(
+            "question_id",
+            "organization_id",
+            "choice",
+            "program_id",
+            "n_answers",
+            "first_answer",
+        ):
+            stored_counters.setdefault(tuple(key), []).append((n_answers, first_answer))
+        return sorted(
+            (
+                key
+                for key in expected_counters.keys() | stored_counters.keys()
+                if stored_counters.get(key, []) != [expected_counters.get(key, None)]
+            ),
+            key=lambda key: [(value is not None, value) for value in key],
+        )
+
+    @staticmethod
+    def rebuild(
+        organization_ids: Optional[Iterable[Optional[int]]] = None,
+        question_ids: Optional[Iterable[int]] = None,
+    ) -> int:
+        """
+        Recomputes the counters from the stored answers (f.e. to recover from bulk updates), replacing the stored ones, duplicated ones included.
+
+        Args:
+            organization_ids (Optional[Iterable[Optional[int]]], optional): Only recomputes the counters of these organizations (`None` for users without organization). Defaults to None (all of them).
+            question_ids (Optional[Iterable[int]], optional): Only recomputes the counters of these questions. Defaults to None (all of them).
+
+        Returns:
+            int: Number of created counters.
+        """
+        if organization_ids is not None:
+            organization_ids = set(organization_ids)
+        if question_ids is not None:
+            question_ids = set(question_ids)
+        summaries = AnswerSummary.get_expected_summaries(organization_ids, question_ids)
+        with transaction.atomic():
+            AnswerSummary.objects.filter(
+                AnswerSummary._get_scope_filter(organization_ids, question_ids)
+            ).delete()
+            AnswerSummary.objects.bulk_create(summaries)
+        return len(summaries)
+
+
+class UserProgress(models.Model):
+    """
+    Precomputed progress of an `EpicUser` on a `Program`: its number of questions and the number of them the user answered (validly or not).
+    Rows only exist for the programs the user answered, they are updated within the same transaction as the answers and questions (see `Answer.save` and `epic_app.signals`).
+    Bulk updates (`QuerySet.update`) and questions moved to another program are not tracked and require running the `rebuild_user_progress` command.
+    Deleting the entities answers depend on (f.e. a `Program`, whose selections may have been the only ones of an answer) rebuilds them once afterwards (see `defer_answer_bookkeeping`).
+
+    Args:
+        models (models.Model): Derives directly from base class Model.
+    """
+
+    user: EpicUser = models.ForeignKey(
+        to=EpicUser, on_delete=models.CASCADE, related_name="user_progress"
+    )
+    program: Program = models.ForeignKey(
+        to=Program, on_delete=models.CASCADE, related_name="user_progress"
+    )
+    n_questions: int = models.IntegerField(default=0)
+    n_answered: int = models.IntegerField(default=0)
+    n_valid: int = models.IntegerField(default=0)
+
+    class Meta:
+        unique_together = ["user", "program"]
+
+    def __str__(self) -> str:
+        return f"[{self.user}] {self.program}: {self.n_valid}/{self.n_questions}"
+
+    @property
+    def progress(self) -> float:
+        return self.n_valid / self.n_questions if self.n_questions else 0.0
+
+    @staticmethod
+    def get_counters(answer_ids: Iterable[int]) -> Dict[int, ProgressCounters]:
+        """
+        Gets the progress counters the given (stored) answers are counted in, with one query.
+
+        Args:
+            answer_ids (Iterable[int]): Ids of the answers.
+
+        Returns:
+            Dict[int, ProgressCounters]: User, program and validity per answer id, stored answers only.
+        """
+        from epic_app.models.epic_answers import Answer
+
+        return {
+            a_id: (u_id, p_id, is_valid)
+            for a_id, u_id, p_id, is_valid in Answer.objects.filter(pk__in=answer_ids)
+            .with_validity()
+            .values_list("pk", "user_id", "question__program_id", "is_valid")
+        }
+
+    @staticmethod
+    def add_answers(user_id: int, program_id: int, n_answered: int, n_valid: int):
+        """
+        Adds (or removes when negative) answers to the progress of a user, the row gets created when it does not exist yet and removed when it has no answers left.
+
+        Args:
+            user_id (int): Id of the answering `EpicUser`.
+            program_id (int): Id of the `Program` of the answered questions.
+            n_answered (int): Number of answers to add.
+            n_valid (int): Number of valid answers to add.
+        """
+        if n_answered == 0 and n_valid == 0:
+            return
+        rows = UserProgress.objects.filter(user_id=user_id, program_id=program_id)
+        updated = rows.update(
+            n_answered=models.F("n_answered") + n_answered,
+            n_valid=models.F("n_valid") + n_valid,
+        )
+        if not updated and n_answered > 0:
+            UserProgress.objects.create(
+                user_id=user_id,
+                program_id=program_id,
+                n_questions=Question.objects.filter(program_id=program_id).count(),
+                n_answered=n_answered,
+                n_valid=n_valid,
+            )
+        elif n_answered < 0:
+            rows.filter(n_answered__lte=0).delete()
+
+    @staticmethod
+    def replace_counters(
+        previous_counters: Optional[ProgressCounters],
+        current_counters: Optional[ProgressCounters],
+    ):
+        """
+        Moves an answer from the progress it was counted in to its current one.
+
+        Args:
+            previous_counters (Optional[ProgressCounters]): Counters of the answer before it changed, `None` for new answers.
+            current_counters (Optional[ProgressCounters]): Counters of the answer after it changed, `None` for removed answers.
+        """
+        if previous_counters == current_counters:
+            return
+        # Net changes per row, so an answer becoming valid does not remove (and recreate) its row.
+        deltas: Dict[Tuple[int, int], List[int]] = {}
+        for counters, delta in [(previous_counters, -1), (current_counters, 1)]:
+            if not counters:
+                continue
+            user_id, program_id, is_valid = counters
+            row_deltas = deltas.setdefault((user_id, program_id), [0, 0])
+            row_deltas[0] += delta
+            row_deltas[1] += delta * is_valid
+        for (user_id, program_id), (n_answered, n_valid) in deltas.items():
+            UserProgress.add_answers(user_id, program_id, n_answered, n_valid)
+
+    @staticmethod
+    def add_questions(program_id: int, delta: int):
+        """
+        Adds (or removes when `delta` is negative) questions to the progress of all the users of a program.
+
+        Args:
+            program_id (int): Id of the `Program` of the questions.
+            delta (int): Number of questions to add.
+        """
+        UserProgress.objects.filter(program_id=program_id).update(
+            n_questions=models.F("n_questions") + delta
+        )
+
+    @staticmethod
+    def _get_scope_filter(
+        user_ids: Optional[Iterable[int]],
+        program_ids: Optional[Iterable[int]],
+        prefix: str = "",
+    ) -> models.Q:
+        """
+        Gets the filter of the given users and programs (all of them when not given), as a lookup from the model with the given prefix (f.e. `question__` from `Answer`).
+        """
+        scope_filter = models.Q()
+        if user_ids is not None:
+            scope_filter &= models.Q(user_id__in=set(user_ids))
+        if program_ids is not None:
+            scope_filter &= models.Q(**{f"{prefix}program_id__in": set(program_ids)})
+        return scope_filter
+
+    @staticmethod
+    def get_expected_progress(
+        user_ids: Optional[Iterable[int]] = None,
+        program_ids: Optional[Iterable[int]] = None,
+    ) -> Dict[Tuple[int, int], Tuple[int, int, int]]:
+        """
+        Computes the progress of every user from the stored questions and answers, with grouped aggregate queries.
+
+        Args:
+            user_ids (Optional[Iterable[int]], optional): Only computes the progress of these users. Defaults to None (all of them).
+            program_ids (Optional[Iterable[int]], optional): Only computes the progress on these programs. Defaults to None (all of them).
+
+        Returns:
+            Dict[Tuple[int, int], Tuple[int, int, int]]: Number of questions, answered and valid ones per (user id, program id).
+        """
+        from epic_app.models.epic_answers import Answer
+
+        n_questions = dict(
+            Question.objects.filter(UserProgress._get_scope_filter(None, program_ids))
+            .order_by()
+            .values_list("program_id")
+            .annotate(n_questions=models.Count("pk"))
+        )
+        return {
+            (u_id, p_id): (n_questions[p_id], n_answered, n_valid)
+            for u_id, p_id, n_answered, n_valid in Answer.objects.filter(
+                UserProgress._get_scope_filter(user_ids, program_ids, "question__")
+            )
+            .order_by()
+            .values_list("user_id", "question__program_id")
+            .annotate(
+                n_answered=models.Count("pk"),
+                n_valid=models.Count("pk", filter=Answer.get_valid_answer_filter()),
+            )
+        }
+
+    @staticmethod
+    def get_inconsistencies() -> List[Tuple[int, int]]:
+        """
+        Compares the stored progress with the one computed from the stored questions and answers.
+
+        Returns:
+            List[Tuple[int, int]]: Sorted (user id, program id) pairs whose progress is missing, outdated or not expected.
+        """
+        expected_progress = UserProgress.get_expected_progress()
+        stored_progress = {
+            (u_id, p_id): counts
+            for u_id, p_id, *counts in UserProgress.objects.values_list(
+                "user_id", "program_id", "n_questions", "n_answered", "n_valid"
+            )
+        }
+        return sorted(
+            key
+            for key in expected_progress.keys() | stored_progress.keys()
+            if tuple(stored_progress.get(key, ())) != expected_progress.get(key, ())
+        )
+
+    @staticmethod
+    def rebuild(
+        user_ids: Optional[Iterable[int]] = None,
+        program_ids: Optional[Iterable[int]] = None,
+    ) -> int:
+        """
+        Recomputes the progress of every user from the stored questions and answers (f.e. to recover from bulk updates).
+
+        Args:
+            user_ids (Optional[Iterable[int]], optional): Only recomputes the progress of these users. Defaults to None (all of them).
+            program_ids (Optional[Iterable[int]], optional): Only recomputes the progress on these programs. Defaults to None (all of them).
+
+        Returns:
+            int: Number of created rows.
+        """
+        progress_rows = [
+            UserProgress(
+                user_id=u_id,
+                program_id=p_id,
+                n_questions=n_questions,
+                n_answered=n_answered,
+                n_valid=n_valid,
+            )
+            for (u_id, p_id), (
+                n_questions,
+                n_answered,
+                n_valid,
+            ) in UserProgress.get_expected_progress(user_ids, program_ids).items()
+        ]
+        with transaction.atomic():
+            UserProgress.objects.filter(
+                UserProgress._get_scope_filter(user_ids, program_ids)
+            ).delete()
+            UserProgress.objects.bulk_create(progress_rows)
+        return len(progress_rows)
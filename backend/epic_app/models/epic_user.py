@@ -2,13 +2,17 @@ from __future__ import annotations
 
 from typing import List
 
-from django.contrib.auth.models import User
+from django.contrib.auth.models import User, UserManager
 from django.db import models
 from django.utils.crypto import get_random_string
 from rest_framework.authtoken.models import Token
 
+from epic_app.models.epic_cascades import AnswerCascadeModel, AnswerCascadeQuerySet
+
+
+class EpicOrganization(AnswerCascadeModel):
+    answer_lookup = "user__organization"
 
-class EpicOrganization(models.Model):
     name: str = models.CharField(max_length=50)
 
     def __str__(self) -> str:
@@ -43,14 +47,25 @@ class EpicOrganization(models.Model):
         return [create_epic_user() for n in range(0, n_users)]
 
 
-class EpicUser(User):
+class EpicUserManager(UserManager.from_queryset(AnswerCascadeQuerySet)):
+    """
+    Same as the `User` manager, rebuilding the answer bookkeeping once after deleting `EpicUser` querysets.
+    """
+
+
+class EpicUser(AnswerCascadeModel, User):
     """
     Defines the properties for a typical user in EpicTool.
 
     Args:
+        AnswerCascadeModel (models.Model): Its deletion cascades to answers.
         User (auth.models.User): Derives directly from the base class User.
     """
 
+    answer_lookup = "user"
+
+    objects = EpicUserManager()
+
     is_advisor = models.BooleanField(default=False)
     organization = models.ForeignKey(
         to=EpicOrganization,
@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Dict, Optional, Tuple
+
+from django.db import models
+from django.utils import timezone
+
+
+class EpicDataVersion(models.Model):
+    """
+    Monotonically increasing version of a set of data (f.e. all the answers), increased on every write.
+    Used to validate cached (and conditionally requested) reports.
+
+    Args:
+        models (models.Model): Derives directly from base class Model.
+    """
+
+    ANSWERS = "answers"
+    DOMAIN = "domain"
+    CATALOGUE = "catalogue"
+
+    name: str = models.CharField(max_length=50, unique=True)
+    version: int = models.BigIntegerField(default=0)
+    last_modified: datetime = models.DateTimeField(default=timezone.now)
+
+    def __str__(self) -> str:
+        return f"{self.name} (v{self.version})"
+
+    @staticmethod
+    def increase(name: str):
+        """
+        Increases the version of the given data set, within the current transaction (if any).
+
+        Args:
+            name (str): Name of the data set (f.e. `EpicDataVersion.ANSWERS`).
+        """
+        last_modified = timezone.now()
+        if not EpicDataVersion.objects.filter(name=name).update(
+            version=models.F("version") + 1, last_modified=last_modified
+        ):
+            EpicDataVersion.objects.create(
+                name=name, version=1, last_modified=last_modified
+            )
+
+    @staticmethod
+    def get_versions(*names: str) -> Dict[str, Tuple[int, Optional[datetime]]]:
+        """
+        Gets the current version of the given data sets with a single query.
+
+        Returns:
+            Dict[str, Tuple[int, Optional[datetime]]]: Version and last modification per data set name. Data sets never written have version 0.
+        """
+        versions = {name: (0, None) for name in names}
+        versions.update(
+            {
+                name: (version, last_modified)
+                for name, version, last_modified in EpicDataVersion.objects.filter(
+                    name__in=names
+                ).values_list("name", "version", "last_modified")
+            }
+        )
+        return versions
@@ -5,16 +5,21 @@ from typing import List, Optional
 from django.db import models
 from django.forms import ValidationError
 
+from epic_app.models.epic_cascades import AnswerCascadeModel
+
 
 # region Default models
-class Area(models.Model):
+class Area(AnswerCascadeModel):
     """
     Higher up entity containing a set of Groups.
 
     Args:
-        models (models.Model): Derives directly from the base class Model.
+        AnswerCascadeModel (models.Model): Derives from the base class of the models whose deletion cascades to answers.
     """
 
+    answer_lookup = "question__program__group__area"
+    program_lookup = "group__area"
+
     name: str = models.CharField(max_length=50)
 
     def get_groups(self) -> List[Group]:
@@ -50,14 +55,17 @@ class Agency(models.Model):
         return self.name
 
 
-class Group(models.Model):
+class Group(AnswerCascadeModel):
     """
     Higher up entity containing one or programs.
 
     Args:
-        models (models.Model): Derives directly from the base class Model.
+        AnswerCascadeModel (models.Model): Derives from the base class of the models whose deletion cascades to answers.
     """
 
+    answer_lookup = "question__program__group"
+    program_lookup = "group"
+
     name: str = models.CharField(max_length=50)
     area: Area = models.ForeignKey(
         to=Area, on_delete=models.CASCADE, related_name="groups"
@@ -76,14 +84,17 @@ class Group(models.Model):
         return self.name
 
 
-class Program(models.Model):
+class Program(AnswerCascadeModel):
     """
     Higher up entity containing one or many questions and answers.
 
     Args:
-        models (models.Model): Derives directly from the base class Model.
+        AnswerCascadeModel (models.Model): Derives from the base class of the models whose deletion cascades to answers.
     """
 
+    answer_lookup = "question__program"
+    program_lookup = "pk"
+
     name: str = models.CharField(
         max_length=50,
         unique=True,
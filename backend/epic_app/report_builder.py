@@ -0,0 +1,312 @@
+import io
+import os
+import threading
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Callable, Dict, List, Optional, Tuple, Union
+
+import django
+from django.conf import settings
+from django.db import models
+from django.utils.text import slugify
+from rest_framework.request import Request
+
+from epic_app.models.epic_user import EpicOrganization, EpicUser
+from epic_app.models.models import Area, Program
+from epic_app.serializers.report_data import (
+    ProgramReportData,
+    ReportFilters,
+    SummaryOptions,
+)
+from epic_app.serializers.report_engine import AnswersReportEngine
+from epic_app.serializers.report_pdf import EpicPdfReport
+from epic_app.serializers.report_serializer import ProgramReportDataSerializer
+
+
+def get_report_users(
+    organization: Optional[EpicOrganization],
+) -> Union[models.QuerySet, models.Manager]:
+    """
+    Gets the `EpicUsers` whose answers are reported.
+
+    Args:
+        organization (Optional[EpicOrganization]): Reported organization, all of them when not given.
+
+    Returns:
+        Union[models.QuerySet, models.Manager]: Users of the reported organization(s).
+    """
+    if organization is None:
+        return EpicUser.objects.all()
+    return organization.organization_users
+
+
+def get_program_reports(
+    report_users: Union[models.QuerySet, models.Manager],
+    include_answers: bool = True,
+    filters: Optional[ReportFilters] = None,
+    summary_options: Optional[SummaryOptions] = None,
+) -> List[ProgramReportData]:
+    """
+    Builds the report data of all the (filtered) `Programs` for the given `EpicUsers`.
+
+    Args:
+        report_users (Union[models.QuerySet, models.Manager]): Users whose answers are reported.
+        include_answers (bool, optional): Whether the answers themselves are included. Defaults to True.
+        filters (Optional[ReportFilters], optional): Scope of the report. Defaults to None.
+        summary_options (Optional[SummaryOptions], optional): Justifications and linkages included in the summaries. Defaults to None.
+
+    Returns:
+        List[ProgramReportData]: Report data per `Program`.
+    """
+    return AnswersReportEngine(
+        report_users, filters, summary_options=summary_options
+    ).get_program_reports(include_answers)
+
+
+def get_report_data(
+    report_users: Union[models.QuerySet, models.Manager],
+    request: Optional[Request] = None,
+    filters: Optional[ReportFilters] = None,
+    summary_options: Optional[SummaryOptions] = None,
+) -> List[dict]:
+    """
+    Serializes all the `Answers` for each of the `Questions` filled by the given `EpicUsers`.
+
+    Args:
+        report_users (Union[models.QuerySet, models.Manager]): Users whose answers are reported.
+        request (Optional[Request], optional): Request of the report, if any. Defaults to None.
+        filters (Optional[ReportFilters], optional): Scope of the report. Defaults to None.
+        summary_options (Optional[SummaryOptions], optional): Justifications and linkages included in the summaries. Defaults to None.
+
+    Returns:
+        List[dict]: Report data per `Program`.
+    """
+    return ProgramReportDataSerializer(
+        get_program_reports(
+            report_users, filters=filters, summary_options=summary_options
+        ),
+        many=True,
+        context={"request": request},
+    ).data
+
+
+def get_pdf_report(
+    organization: Optional[EpicOrganization],
+    author: str,
+    report_data: Optional[List[ProgramReportData]] = None,
+    toc: str = EpicPdfReport.TOC_MULTIPASS,
+    filters: Optional[ReportFilters] = None,
+    summary_options: Optional[SummaryOptions] = None,
+    on_progress: Optional[Callable[[float], None]] = None,
+) -> bytes:
+    """
+    Generates the answers report as a PDF document.
+
+    Args:
+        organization (Optional[EpicOrganization]): Reported organization, all of them when not given.
+        author (str): Username of the user requesting the report.
+        report_data (Optional[List[ProgramReportData]], optional): Already built report data (answers are not needed). Defaults to None.
+        toc (str, optional): Table of contents mode (see `EpicPdfReport.toc_modes`). Defaults to `EpicPdfReport.TOC_MULTIPASS`.
+        filters (Optional[ReportFilters], optional): Scope of the report, when its data is not given. Defaults to None.
+        summary_options (Optional[SummaryOptions], optional): Justifications and linkages included in the summaries, when the data is not given. Defaults to None.
+        on_progress (Optional[Callable[[float], None]], optional): Called with the fraction of the document laid out, after each program chapter. Defaults to None.
+
+    Returns:
+        bytes: Content of the PDF file.
+    """
+    if report_data is None:
+        report_data = get_program_reports(
+            get_report_users(organization),
+            include_answers=False,
+            filters=filters,
+            summary_options=summary_options,
+        )
+    return _render_pdf_report(
+        _get_report_subtitle(organization), author, toc, report_data, on_progress
+    )
+
+
+def _get_report_subtitle(organization: Optional[EpicOrganization]) -> str:
+    if organization is None:
+        organization_names = [eo.name for eo in EpicOrganization.objects.all()]
+    else:
+        organization_names = [organization.name]
+    return "EPIC report for {}".format((", ").join(organization_names))
+
+
+def _render_pdf_report(
+    subtitle: str,
+    author: str,
+    toc: str,
+    report_data: List[ProgramReportData],
+    on_progress: Optional[Callable[[float], None]] = None,
+) -> bytes:
+    """
+    Lays out the PDF document of the given report data. Does not access the database (unless `on_progress` does), so it can run in a worker process.
+    """
+    # Create a file-like buffer to receive PDF data.
+    buffer = io.BytesIO()
+    pdf_report = EpicPdfReport()
+    pdf_report.report_subtitle = subtitle
+    pdf_report.report_author = author
+    pdf_report.toc = toc
+    pdf_report.on_progress = on_progress
+    pdf_report.generate_report(buffer, report_data)
+    return buffer.getvalue()
+
+
+# Ways of splitting a PDF bundle, one document per program or per area.
+BUNDLE_SPLIT_PROGRAM = "program"
+BUNDLE_SPLIT_AREA = "area"
+bundle_splits = (BUNDLE_SPLIT_PROGRAM, BUNDLE_SPLIT_AREA)
+
+
+def _get_bundle_parts(
+    report_data: List[ProgramReportData], split_by: str
+) -> List[Tuple[str, str, List[ProgramReportData]]]:
+    """
+    Splits the report data in the documents of a bundle, programs without answers are left out (as their chapters in `EpicPdfReport`).
+
+    Returns:
+        List[Tuple[str, str, List[ProgramReportData]]]: File name, title and report data of each document.
+    """
+    report_data = [
+        p_data
+        for p_data in report_data
+        if any(q_data.n_answers for q_data in p_data.questions)
+    ]
+    if split_by == BUNDLE_SPLIT_PROGRAM:
+        return [
+            (f"program-{p_data.id}-{slugify(p_data.name)}.pdf", p_data.name, [p_data])
+            for p_data in report_data
+        ]
+
+    program_areas = dict(
+        Program.objects.filter(pk__in=[p_data.id for p_data in report_data])
+        .values_list("pk", "group__area_id")
+        .order_by()
+    )
+    area_programs: Dict[int, List[ProgramReportData]] = {}
+    for p_data in report_data:
+        area_programs.setdefault(program_areas[p_data.id], []).append(p_data)
+    return [
+        (f"area-{a_id}-{slugify(a_name)}.pdf", a_name, area_programs[a_id])
+        for a_id, a_name in Area.objects.filter(pk__in=area_programs.keys())
+        .order_by("pk")
+        .values_list("pk", "name")
+    ]
+
+
+def get_bundle_workers(max_workers: Optional[int] = None) -> int:
+    """
+    Gets the number of processes rendering the documents of a PDF bundle, `EPIC_REPORT_BUNDLE_WORKERS` (or one per CPU core) when not given.
+    """
+    return max(
+        max_workers
+        or getattr(settings, "EPIC_REPORT_BUNDLE_WORKERS", None)
+        or os.cpu_count()
+        or 1,
+        1,
+    )
+
+
+_bundle_pool: Optional[ProcessPoolExecutor] = None
+# Number of workers and process id of the pool, a forked process can not use the pool of its parent.
+_bundle_pool_key: Optional[Tuple[int, int]] = None
+_bundle_pool_lock = threading.Lock()
+
+
+def _get_bundle_pool(n_workers: int) -> ProcessPoolExecutor:
+    """
+    Gets the pool of worker processes rendering the PDF bundles. Each process keeps one pool, it is only created again when a different number of workers is requested.
+    """
+    global _bundle_pool, _bundle_pool_key
+    key = (n_workers, os.getpid())
+    with _bundle_pool_lock:
+        if _bundle_pool is None or _bundle_pool_key != key:
+            if _bundle_pool is not None and _bundle_pool_key[1] == key[1]:
+                _bundle_pool.shutdown(wait=False)
+            # Workers only lay out documents, `django.setup` is needed to unpickle the report data when they are not forked.
+            _bundle_pool = ProcessPoolExecutor(n_workers, initializer=django.setup)
+            _bundle_pool_key = key
+        return _bundle_pool
+
+
+def shutdown_bundle_pool():
+    """
+    Stops the worker processes rendering the PDF bundles of this process (f.e. between tests). A new pool is created for the next bundle.
+    """
+    global _bundle_pool, _bundle_pool_key
+    with _bundle_pool_lock:
+        if _bundle_pool is not None and _bundle_pool_key[1] == os.getpid():
+            _bundle_pool.shutdown()
+        _bundle_pool = None
+        _bundle_pool_key = None
+
+
+def get_pdf_report_bundle(
+    organization: Optional[EpicOrganization],
+    author: str,
+    split_by: str = BUNDLE_SPLIT_PROGRAM,
+    toc: str = EpicPdfReport.TOC_MULTIPASS,
+    filters: Optional[ReportFilters] = None,
+    max_workers: Optional[int] = None,
+    summary_options: Optional[SummaryOptions] = None,
+) -> bytes:
+    """
+    Generates the answers report as a ZIP archive with one PDF document per `Program` (or per `Area`).
+    The report data is built once, the documents are then laid out in parallel by the pool of worker processes kept by this process (see `_get_bundle_pool`).
+
+    Args:
+        organization (Optional[EpicOrganization]): Reported organization, all of them when not given.
+        author (str): Username of the user requesting the report.
+        split_by (str, optional): Documents of the bundle (see `bundle_splits`). Defaults to `BUNDLE_SPLIT_PROGRAM`.
+        toc (str, optional): Table of contents mode of each document (see `EpicPdfReport.toc_modes`). Defaults to `EpicPdfReport.TOC_MULTIPASS`.
+        filters (Optional[ReportFilters], optional): Scope of the report. Defaults to None.
+        max_workers (Optional[int], optional): Number of worker processes (see `get_bundle_workers`). Defaults to None.
+        summary_options (Optional[SummaryOptions], optional): Justifications and linkages included in the summaries. Defaults to None.
+
+    Raises:
+        ValueError: When the split or the table of contents mode are not supported.
+
+    Returns:
+        bytes: Content of the ZIP file.
+    """
+    if split_by not in bundle_splits:
+        raise ValueError(f"Bundle split `{split_by}` not supported.")
+    if toc not in EpicPdfReport.toc_modes:
+        raise ValueError(f"Table of contents mode `{toc}` not supported.")
+    report_data = get_program_reports(
+        get_report_users(organization),
+        include_answers=False,
+        filters=filters,
+        summary_options=summary_options,
+    )
+    bundle_parts = _get_bundle_parts(report_data, split_by)
+    subtitle = _get_report_subtitle(organization)
+    part_args = (
+        [f"{subtitle} ({p_title})" for _, p_title, _ in bundle_parts],
+        [author] * len(bundle_parts),
+        [toc] * len(bundle_parts),
+        [p_data for _, _, p_data in bundle_parts],
+    )
+
+    n_workers = get_bundle_workers(max_workers)
+    if min(n_workers, len(bundle_parts)) > 1:
+        try:
+            documents = list(
+                _get_bundle_pool(n_workers).map(_render_pdf_report, *part_args)
+            )
+        except BrokenProcessPool:
+            # F.e. a worker got killed, the next bundle gets a new pool.
+            shutdown_bundle_pool()
+            raise
+    else:
+        documents = list(map(_render_pdf_report, *part_args))
+
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as bundle:
+        for (file_name, _, _), document in zip(bundle_parts, documents):
+            bundle.writestr(file_name, document)
+    return buffer.getvalue()
@@ -0,0 +1,88 @@
+import hashlib
+from calendar import timegm
+from typing import Any, Callable, Optional
+
+from django.conf import settings
+from django.core.cache import caches
+from django.http import HttpResponse
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, quote_etag
+from rest_framework.request import Request
+
+from epic_app.models.epic_versions import EpicDataVersion
+
+
+class ReportCache:
+    """
+    Cache of a report (for a given scope, f.e. an organization) validated with the current data versions.
+    Any answer, domain or catalogue write (f.e. the agencies of a program, used by the report filters) changes the versions, hence the cache key and the `ETag`, so entries never need to be invalidated.
+    """
+
+    def __init__(self, report_format: str, scope: str):
+        """
+        Args:
+            report_format (str): Format of the report (f.e. `json` or `pdf`).
+            scope (str): Scope of the report data (f.e. the requesting organization).
+        """
+        versions = EpicDataVersion.get_versions(
+            EpicDataVersion.ANSWERS, EpicDataVersion.DOMAIN, EpicDataVersion.CATALOGUE
+        )
+        modifications = [lm for _, lm in versions.values() if lm]
+        self.last_modified = (
+            timegm(max(modifications).utctimetuple()) if modifications else None
+        )
+        # The modification times prevent reusing keys when versions get reset (f.e. restored databases).
+        version_key = ":".join(
+            f"{v}-{lm.timestamp() if lm else 0}" for v, lm in versions.values()
+        )
+        self.key = f"epic-report:{report_format}:{scope}:{version_key}"
+        self.etag = quote_etag(hashlib.sha1(self.key.encode()).hexdigest())
+
+    @property
+    def _cache(self):
+        return caches[getattr(settings, "EPIC_REPORT_CACHE", "default")]
+
+    def get_not_modified_response(self, request: Request) -> Optional[HttpResponse]:
+        """
+        Gets the `304 Not Modified` response when the request is conditional (`If-None-Match` / `If-Modified-Since`) and the report did not change.
+
+        Args:
+            request (Request): Report request.
+
+        Returns:
+            Optional[HttpResponse]: Response to return, `None` when the report needs to be sent.
+        """
+        return get_conditional_response(
+            request, etag=self.etag, last_modified=self.last_modified
+        )
+
+    def get_or_set(self, get_report: Callable[[], Any]) -> Any:
+        """
+        Gets the cached report, generating (and caching) it when not found.
+
+        Args:
+            get_report (Callable[[], Any]): Report generator.
+
+        Returns:
+            Any: Report content.
+        """
+        report = self._cache.get(self.key, None)
+        if report is None:
+            report = get_report()
+            self._cache.set(self.key, report)
+        return report
+
+    def set_headers(self, response: HttpResponse) -> HttpResponse:
+        """
+        Sets the validators of the report in its response.
+
+        Args:
+            response (HttpResponse): Report response.
+
+        Returns:
+            HttpResponse: Same response with the `ETag` and `Last-Modified` headers.
+        """
+        response["ETag"] = self.etag
+        if self.last_modified:
+            response["Last-Modified"] = http_date(self.last_modified)
+        return response
@@ -0,0 +1,169 @@
+import csv
+from typing import IO, Any, Iterator, List, Optional, Union
+
+from django.db import models
+from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.cell.cell import ILLEGAL_CHARACTERS_RE
+
+from epic_app.serializers.report_data import ReportFilters, SummaryOptions
+from epic_app.serializers.report_engine import AnswersReportEngine
+
+# Sheets of the spreadsheet exports, with their header.
+ANSWERS_SHEET = "answers"
+SUMMARY_SHEET = "summary"
+export_sheets = {
+    ANSWERS_SHEET: ["Program", "Question", "User", "Answer", "Justification"],
+    SUMMARY_SHEET: ["Program", "Question", "Answers", "Choice", "Count"],
+}
+
+
+def iterate_answer_rows(report_engine: AnswersReportEngine) -> Iterator[List[Any]]:
+    """
+    Iterates over the rows of the answers sheet, one per reported answer ordered by program and question.
+
+    Args:
+        report_engine (AnswersReportEngine): Engine of the report, its `chunk_size` bounds the answers kept in memory.
+
+    Returns:
+        Iterator[List[Any]]: Program, question, user, answer and justification of each answer.
+    """
+    for answer in report_engine.iterate_answers():
+        yield [
+            answer.question.program.name,
+            answer.question.title,
+            answer.user.username,
+            answer.get_answer_text(),
+            getattr(answer, "justify_answer", ""),
+        ]
+
+
+def iterate_summary_rows(report_engine: AnswersReportEngine) -> Iterator[List[Any]]:
+    """
+    Iterates over the rows of the summary sheet, one per choice of each answered question (justifications are left out).
+
+    Args:
+        report_engine (AnswersReportEngine): Engine of the report.
+
+    Returns:
+        Iterator[List[Any]]: Program, question, number of answers, choice and number of answers of said choice.
+    """
+    for p_report in report_engine.get_program_reports(include_answers=False):
+        for q_report in p_report.questions:
+            for choice, count in q_report.summary.items():
+                if choice.endswith("_justify"):
+                    continue
+                yield [p_report.name, q_report.title, q_report.n_answers, choice, count]
+
+
+_sheet_rows = {
+    ANSWERS_SHEET: iterate_answer_rows,
+    SUMMARY_SHEET: iterate_summary_rows,
+}
+
+
+def _get_export_engine(
+    report_users: Union[models.QuerySet, models.Manager],
+    filters: Optional[ReportFilters],
+    chunk_size: Optional[int],
+) -> AnswersReportEngine:
+    # Justifications are exported with each answer, not in the summary.
+    return AnswersReportEngine(
+        report_users, filters, chunk_size, SummaryOptions(include_justifications=False)
+    )
+
+
+# Leading characters that make spreadsheet applications read a CSV cell as a formula.
+CSV_FORMULA_CHARACTERS = ("=", "+", "-", "@", "\t", "\r")
+
+
+def _get_csv_row(row: List[Any]) -> List[Any]:
+    """
+    Gets the cells of a CSV row, text that would be read as a formula is prefixed with `'` (as the XLSX export writes it as text).
+    """
+    return [
+        f"'{value}"
+        if isinstance(value, str) and value.startswith(CSV_FORMULA_CHARACTERS)
+        else value
+        for value in row
+    ]
+
+
+class _Echo:
+    """
+    Pseudo buffer returning what is written, so `csv.writer` rows can be yielded.
+    """
+
+    def write(self, value: str) -> str:
+        return value
+
+
+def iterate_csv_report(
+    report_users: Union[models.QuerySet, models.Manager],
+    sheet: str = ANSWERS_SHEET,
+    filters: Optional[ReportFilters] = None,
+    chunk_size: Optional[int] = None,
+) -> Iterator[str]:
+    """
+    Generates a sheet of the answers report as CSV lines, text starting like a formula (f.e. `=SUM(A1)`) is prefixed with `'`.
+
+    Args:
+        report_users (Union[models.QuerySet, models.Manager]): Users whose answers are reported.
+        sheet (str, optional): Exported sheet (see `export_sheets`). Defaults to `ANSWERS_SHEET`.
+        filters (Optional[ReportFilters], optional): Scope of the report. Defaults to None.
+        chunk_size (Optional[int], optional): Number of answers fetched at once. Defaults to None.
+
+    Raises:
+        ValueError: When the sheet is not known.
+
+    Returns:
+        Iterator[str]: CSV lines, starting with the header.
+    """
+    if sheet not in export_sheets:
+        raise ValueError(f"Sheet `{sheet}` not supported.")
+    report_engine = _get_export_engine(report_users, filters, chunk_size)
+    writer = csv.writer(_Echo())
+    yield writer.writerow(export_sheets[sheet])
+    for row in _sheet_rows[sheet](report_engine):
+        yield writer.writerow(_get_csv_row(row))
+
+
+def _get_xlsx_row(worksheet: Any, row: List[Any]) -> List[Any]:
+    """
+    Gets the cells of a row of a write-only worksheet, text is never written as a formula nor with characters not allowed in XLSX files.
+    """
+    cells = []
+    for value in row:
+        if not isinstance(value, str):
+            cells.append(value)
+            continue
+        cell = WriteOnlyCell(worksheet, ILLEGAL_CHARACTERS_RE.sub("", value))
+        cell.data_type = "s"
+        cells.append(cell)
+    return cells
+
+
+def write_xlsx_report(
+    output: IO[bytes],
+    report_users: Union[models.QuerySet, models.Manager],
+    filters: Optional[ReportFilters] = None,
+    chunk_size: Optional[int] = None,
+):
+    """
+    Writes the answers report as an XLSX workbook with an answers and a summary sheet.
+    The workbook is created in write-only mode, so rows are flushed to disk instead of being kept in memory.
+
+    Args:
+        output (IO[bytes]): File (or buffer) where to write the workbook.
+        report_users (Union[models.QuerySet, models.Manager]): Users whose answers are reported.
+        filters (Optional[ReportFilters], optional): Scope of the report. Defaults to None.
+        chunk_size (Optional[int], optional): Number of answers fetched at once. Defaults to None.
+    """
+    report_engine = _get_export_engine(report_users, filters, chunk_size)
+    workbook = Workbook(write_only=True)
+    for sheet, header in export_sheets.items():
+        worksheet = workbook.create_sheet(sheet.capitalize())
+        worksheet.append(header)
+        for row in _sheet_rows[sheet](report_engine):
+            worksheet.append(_get_xlsx_row(worksheet, row))
+    workbook.save(output)
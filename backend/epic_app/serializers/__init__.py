@@ -8,7 +8,10 @@ from epic_app.serializers.epic_user_serializer import (
 )
 from epic_app.serializers.group_serializer import GroupSerializer
 from epic_app.serializers.program_serializer import ProgramSerializer
-from epic_app.serializers.progress_serializer import ProgressSerializer
+from epic_app.serializers.progress_serializer import (
+    ProgramsProgressSerializer,
+    ProgressSerializer,
+)
 from epic_app.serializers.question_serializer import (
     EvolutionQuestionSerializer,
     KeyAgencyQuestionSerializer,
@@ -16,4 +19,5 @@ from epic_app.serializers.question_serializer import (
     NationalFrameworkQuestionSerializer,
     QuestionSerializer,
 )
-from epic_app.serializers.report_serializer import ProgramReportSerializer
+from epic_app.serializers.report_job_serializer import ReportJobSerializer
+from epic_app.serializers.report_serializer import ProgramReportDataSerializer
@@ -16,12 +16,9 @@ from epic_app.utils import get_instance_as_submodel_type
 class _BaseAnswerSerializer(serializers.ModelSerializer):
     @staticmethod
     def get_concrete_serializer(q_type: Type[Answer]) -> serializers.ModelSerializer:
-        dict_serializers = {
-            YesNoAnswer: YesNoAnswerSerializer,
-            SingleChoiceAnswer: SingleChoiceAnswerSerializer,
-            MultipleChoiceAnswer: MultipleChoiceAnswerSerializer,
-        }
-        serializer = dict_serializers.get(q_type, None)
+        from epic_app.submodel_registry import get_registry
+
+        serializer = get_registry().get_answer_serializer(q_type)
         if not serializer:
             raise ValueError(f"Question type {q_type} has no designated serializer.")
         return serializer
@@ -45,7 +42,7 @@ class YesNoAnswerSerializer(_BaseAnswerSerializer):
 
     class Meta:
         model = YesNoAnswer
-        fields = "__all__"
+        exclude = ["submodel_type"]
 
 
 class SingleChoiceAnswerSerializer(_BaseAnswerSerializer):
@@ -55,13 +52,13 @@ class SingleChoiceAnswerSerializer(_BaseAnswerSerializer):
 
     class Meta:
         model = SingleChoiceAnswer
-        fields = "__all__"
+        exclude = ["submodel_type"]
 
 
 class MultipleChoiceAnswerSerializer(_BaseAnswerSerializer):
     class Meta:
         model = MultipleChoiceAnswer
-        fields = "__all__"
+        exclude = ["submodel_type"]
 
     def update(self, instance: Answer, validated_data):
         return super().update(instance, validated_data)
@@ -1,22 +1,42 @@
-from typing import List, Optional, Tuple
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
+from django.db import models
+from django.db.models.functions import Coalesce
 from rest_framework import serializers
 
 from epic_app.models.epic_answers import Answer
 from epic_app.models.epic_questions import Question
 from epic_app.models.epic_user import EpicUser
 from epic_app.models.models import Program
-from epic_app.utils import get_instance_as_submodel_type
 
-_QuestionAnswer = Tuple[Question, Optional[Answer]]
+# Question and the id of its answer (if any).
+_QuestionAnswer = Tuple[Question, Optional[int]]
 
 
 class _QuestionAnswerSerializer(serializers.BaseSerializer):
     def to_representation(self, instance: _QuestionAnswer):
-        question, answer = instance
+        question, answer_id = instance
         if not isinstance(question, Question):
             raise ValueError("No valid question provided.")
-        return {"question": question.id, "answer": answer.id if answer else None}
+        return {"question": question.id, "answer": answer_id}
+
+
+def _annotate_user_answers(
+    questions: models.QuerySet, progress_user: EpicUser
+) -> models.QuerySet:
+    """
+    Left-joins the questions to the answer of the given `EpicUser` (as `user_answer`).
+    """
+    return questions.annotate(
+        user_answer=models.FilteredRelation(
+            "question_answers",
+            condition=models.Q(question_answers__user=progress_user.pk),
+        )
+    )
+
+
+def _get_progress(n_valid_answers: int, n_questions: int) -> float:
+    return n_valid_answers / n_questions if n_questions else 0.0
 
 
 class ProgressSerializer(serializers.BaseSerializer):
@@ -31,28 +51,132 @@ class ProgressSerializer(serializers.BaseSerializer):
         except:
             raise ValueError("No user found in context-request.")
 
-    def _get_question_answer(self, question: Question) -> _QuestionAnswer:
-        progress_user: EpicUser = self._get_context_epic_user()
-        answer = None
-        try:
-            answer = Answer.objects.get(user=progress_user, question=question)
-            answer = get_instance_as_submodel_type(answer)
-        finally:
-            return (question, answer)
+    def _get_program_questions(self, program: Program) -> models.QuerySet:
+        """
+        Gets the questions of the program, left-joined to the answer of the context `EpicUser` (`answer_id`), with the validity of said answer evaluated by the database (`valid_answer`).
+        """
+        return _annotate_user_answers(
+            program.questions.all(), self._get_context_epic_user()
+        ).annotate(
+            answer_id=models.F("user_answer__pk"),
+            valid_answer=models.Case(
+                models.When(Answer.get_valid_answer_filter("user_answer__"), then=True),
+                default=False,
+                output_field=models.BooleanField(),
+            ),
+        )
 
-    def _get_total_progress(self, answer_list: List[_QuestionAnswer]) -> float:
-        valid_answers = sum(a.is_valid_answer() for _, a in answer_list if a)
-        return valid_answers / len(answer_list)
+    def _get_total_progress(self, questions: List[Question]) -> float:
+        valid_answers = sum(question.valid_answer for question in questions)
+        return valid_answers / len(questions)
 
     def to_representation(self, instance: Program):
         if not isinstance(instance, Program):
             raise ValueError(
                 f"Expected instance type {type(Program)}, got {type(instance)}"
             )
-        qa_list = [self._get_question_answer(q) for q in instance.questions.all()]
+        questions = list(self._get_program_questions(instance))
         return {
-            "progress": self._get_total_progress(qa_list),
+            "progress": self._get_total_progress(questions),
             "questions_answers": [
-                _QuestionAnswerSerializer().to_representation(qa) for qa in qa_list
+                _QuestionAnswerSerializer().to_representation(
+                    (question, question.answer_id)
+                )
+                for question in questions
             ],
         }
+
+
+class ProgramsProgressSerializer(ProgressSerializer):
+    """
+    Serializer to show the progress of the context `EpicUser` on several programs (optionally rolled up to their groups and areas), read from the `UserProgress` rows with one query.
+    Programs without questions are left out. Only meant for GET / FETCH endpoints.
+    """
+
+    # Levels the progress can be rolled up to.
+    ROLLUP_GROUP = "group"
+    ROLLUP_AREA = "area"
+    rollup_levels = (ROLLUP_GROUP, ROLLUP_AREA)
+
+    def _get_programs_counts(self, programs: models.QuerySet) -> List[Dict[str, Any]]:
+        """
+        Reads the number of questions and valid answers of the context `EpicUser` of each program from its `UserProgress` row.
+        Programs the user did not answer yet have no row, only their questions are counted.
+        """
+        progress_user: EpicUser = self._get_context_epic_user()
+        program_questions = (
+            Question.objects.filter(program=models.OuterRef("pk"))
+            .order_by()
+            .values("program")
+            .annotate(n_questions=models.Count("pk"))
+            .values("n_questions")
+        )
+        return list(
+            programs.annotate(
+                progress_row=models.FilteredRelation(
+                    "user_progress",
+                    condition=models.Q(user_progress__user=progress_user.pk),
+                ),
+                n_questions=Coalesce(
+                    "progress_row__n_questions",
+                    models.Subquery(program_questions),
+                    models.Value(0),
+                ),
+                n_valid_answers=Coalesce("progress_row__n_valid", models.Value(0)),
+            )
+            .filter(n_questions__gt=0)
+            .values(
+                "id", "group_id", "group__area_id", "n_questions", "n_valid_answers"
+            )
+            .order_by("id")
+        )
+
+    def _rollup(
+        self, programs_counts: List[Dict[str, Any]], level_key: str
+    ) -> List[Dict[str, Any]]:
+        level_counts: Dict[int, List[int]] = {}
+        for p_counts in programs_counts:
+            counts = level_counts.setdefault(p_counts[level_key], [0, 0])
+            counts[0] += p_counts["n_questions"]
+            counts[1] += p_counts["n_valid_answers"]
+        return [
+            self._get_progress_entry(level_id, n_questions, n_valid_answers)
+            for level_id, (n_questions, n_valid_answers) in sorted(level_counts.items())
+        ]
+
+    def _get_progress_entry(
+        self, entry_id: int, n_questions: int, n_valid_answers: int
+    ) -> Dict[str, Any]:
+        return {
+            "id": entry_id,
+            "progress": _get_progress(n_valid_answers, n_questions),
+            "n_questions": n_questions,
+            "n_valid_answers": n_valid_answers,
+        }
+
+    def to_representation(self, instance: models.QuerySet):
+        """
+        Args:
+            instance (models.QuerySet): Programs whose progress is shown. The context `rollup` lists the levels (see `rollup_levels`) it is also rolled up to.
+        """
+        if not isinstance(instance, models.QuerySet) or instance.model != Program:
+            raise ValueError(
+                f"Expected instance type {type(models.QuerySet)} of {Program}, got {type(instance)}"
+            )
+        programs_counts = self._get_programs_counts(instance)
+        progress = {
+            "programs": [
+                self._get_progress_entry(
+                    p_counts["id"],
+                    p_counts["n_questions"],
+                    p_counts["n_valid_answers"],
+                )
+                for p_counts in programs_counts
+            ]
+        }
+        rollup: Iterable[str] = self.context.get("rollup", ())
+        if self.ROLLUP_GROUP in rollup:
+            progress["groups"] = self._rollup(programs_counts, "group_id")
+        if self.ROLLUP_AREA in rollup:
+            progress["areas"] = self._rollup(programs_counts, "group__area_id")
+        return progress
@@ -16,17 +16,13 @@ from epic_app.models.epic_questions import (
 class QuestionSerializer(serializers.ModelSerializer):
     class Meta:
         model = Question
-        fields = "__all__"
+        exclude = ["submodel_type"]
 
     @staticmethod
     def get_concrete_serializer(q_type: Type[Question]) -> serializers.ModelSerializer:
-        dict_serializers = {
-            NationalFrameworkQuestion: NationalFrameworkQuestionSerializer,
-            KeyAgencyActionsQuestion: KeyAgencyQuestionSerializer,
-            EvolutionQuestion: EvolutionQuestionSerializer,
-            LinkagesQuestion: LinkagesQuestionSerializer,
-        }
-        serializer = dict_serializers.get(q_type, None)
+        from epic_app.submodel_registry import get_registry
+
+        serializer = get_registry().get_question_serializer(q_type)
         if not serializer:
             raise ValueError(f"Question type {q_type} has no designated serializer.")
         return serializer
@@ -35,22 +31,22 @@ class QuestionSerializer(serializers.ModelSerializer):
 class NationalFrameworkQuestionSerializer(serializers.ModelSerializer):
     class Meta:
         model = NationalFrameworkQuestion
-        fields = "__all__"
+        exclude = ["submodel_type"]
 
 
 class KeyAgencyQuestionSerializer(serializers.ModelSerializer):
     class Meta:
         model = KeyAgencyActionsQuestion
-        fields = "__all__"
+        exclude = ["submodel_type"]
 
 
 class EvolutionQuestionSerializer(serializers.ModelSerializer):
     class Meta:
         model = EvolutionQuestion
-        fields = "__all__"
+        exclude = ["submodel_type"]
 
 
 class LinkagesQuestionSerializer(serializers.ModelSerializer):
     class Meta:
         model = LinkagesQuestion
-        fields = "__all__"
+        exclude = ["submodel_type"]
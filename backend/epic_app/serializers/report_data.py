@@ -0,0 +1,250 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Dict, Mapping, Optional, Tuple
+
+from django.db import models
+
+from epic_app.models.epic_answers import Answer
+from epic_app.models.models import Program
+
+
+@dataclass(frozen=True)
+class QuestionReportData:
+    """
+    Answers report of a `Question`.
+    """
+
+    id: int
+    title: str
+    # Number of answers given by the reported users.
+    n_answers: int
+    # Detailed summary of the answers (see `Answer.format_detailed_summary`), empty when there are no answers.
+    summary: Dict[str, Any]
+    # Answers (as their `Answer` subtype) ordered by creation, only loaded when requested.
+    answers: Tuple[Answer, ...] = ()
+
+
+@dataclass(frozen=True)
+class ProgramReportData:
+    """
+    Answers report of all the `Questions` of a `Program`.
+    """
+
+    id: int
+    name: str
+    questions: Tuple[QuestionReportData, ...]
+
+
+# Query parameter of each `ReportFilters` field.
+_FILTER_QUERY_PARAMS = {
+    "program": "program_ids",
+    "group": "group_ids",
+    "area": "area_ids",
+    "agency": "agency_ids",
+    "question_type": "question_types",
+    "user": "user_ids",
+}
+
+
+@dataclass(frozen=True)
+class ReportFilters:
+    """
+    Scope of an answers report, applied to the report querysets. Fields left as `None` do not filter.
+    """
+
+    program_ids: Optional[Tuple[int, ...]] = None
+    group_ids: Optional[Tuple[int, ...]] = None
+    area_ids: Optional[Tuple[int, ...]] = None
+    agency_ids: Optional[Tuple[int, ...]] = None
+    # `Question` subtypes, as their `submodel_type` (f.e. `evolutionquestion`).
+    question_types: Optional[Tuple[str, ...]] = None
+    # Subset of the reported users.
+    user_ids: Optional[Tuple[int, ...]] = None
+
+    @staticmethod
+    def from_query_params(query_params: Mapping[str, Any]) -> ReportFilters:
+        """
+        Gets the filters from (comma separated) query parameters, f.e. `?area=1&question_type=evolutionquestion,linkagesquestion`.
+
+        Args:
+            query_params (Mapping[str, Any]): Query parameters of a report request.
+
+        Raises:
+            ValueError: When the ids are not integers or the question types are not known.
+
+        Returns:
+            ReportFilters: Filters of the report.
+        """
+        from epic_app.submodel_registry import get_registry
+
+        known_question_types = {
+            q_type._meta.model_name for q_type in get_registry().question_types
+        }
+        filters = {}
+        for param_name, field_name in _FILTER_QUERY_PARAMS.items():
+            if hasattr(query_params, "getlist"):
+                raw_values = query_params.getlist(param_name)
+            else:
+                raw_values = [query_params.get(param_name, None)]
+            values = {
+                value.strip()
+                for raw_value in raw_values
+                if raw_value is not None
+                for value in str(raw_value).split(",")
+                if value.strip()
+            }
+            if not values:
+                continue
+            if field_name == "question_types":
+                values = {value.lower() for value in values}
+                unknown_types = values - known_question_types
+                if unknown_types:
+                    raise ValueError(
+                        f"Unknown question types: {', '.join(sorted(unknown_types))}."
+                    )
+                filters[field_name] = tuple(sorted(values))
+                continue
+            try:
+                filters[field_name] = tuple(sorted({int(value) for value in values}))
+            except ValueError:
+                raise ValueError(f"`{param_name}` expects comma separated ids.")
+        return ReportFilters(**filters)
+
+    def to_query_params(self) -> Dict[str, str]:
+        """
+        Gets the query parameters representing these filters (the inverse of `from_query_params`).
+
+        Returns:
+            Dict[str, str]: Comma separated values per query parameter.
+        """
+        return {
+            param_name: ",".join(map(str, getattr(self, field_name)))
+            for param_name, field_name in _FILTER_QUERY_PARAMS.items()
+            if getattr(self, field_name) is not None
+        }
+
+    @property
+    def filters_programs(self) -> bool:
+        return any(
+            ids is not None
+            for ids in [
+                self.program_ids,
+                self.group_ids,
+                self.area_ids,
+                self.agency_ids,
+            ]
+        )
+
+    def filter_programs(self, programs: models.QuerySet) -> models.QuerySet:
+        """
+        Filters the given `Program` queryset by program, group, area and agency.
+        """
+        if self.program_ids is not None:
+            programs = programs.filter(pk__in=self.program_ids)
+        if self.group_ids is not None:
+            programs = programs.filter(group__in=self.group_ids)
+        if self.area_ids is not None:
+            programs = programs.filter(group__area__in=self.area_ids)
+        if self.agency_ids is not None:
+            # Subquery, so programs of several agencies are not repeated.
+            programs = programs.filter(
+                pk__in=Program.objects.filter(agencies__in=self.agency_ids).values("pk")
+            )
+        return programs
+
+    def get_questions_filter(self, prefix: str = "") -> models.Q:
+        """
+        Gets the filter of the reported questions, as a lookup from the model with the given prefix (f.e. `question__` from `Answer`).
+        """
+        questions_filter = models.Q()
+        if self.filters_programs:
+            questions_filter &= models.Q(
+                **{
+                    f"{prefix}program__in": self.filter_programs(
+                        Program.objects.all()
+                    ).values("pk")
+                }
+            )
+        if self.question_types is not None:
+            questions_filter &= models.Q(
+                **{f"{prefix}submodel_type__in": self.question_types}
+            )
+        return questions_filter
+
+
+# Values of the `justifications` query parameter excluding them.
+_EXCLUDE_JUSTIFICATIONS = ("0", "false", "no", "none")
+
+# Query parameter of each (positive integer) `SummaryOptions` limit.
+_LIMIT_QUERY_PARAMS = ("max_justifications", "max_justification_length", "max_linkages")
+
+
+@dataclass(frozen=True)
+class SummaryOptions:
+    """
+    Detail of the summaries of an answers report. All the justifications (as written) and selected programs by default.
+    """
+
+    include_justifications: bool = True
+    # Justifications per selected choice, the first ones given.
+    max_justifications: Optional[int] = None
+    # Characters per justification, longer ones are truncated.
+    max_justification_length: Optional[int] = None
+    # Programs per linkages summary, the most selected ones (the rest are counted together).
+    max_linkages: Optional[int] = None
+
+    @staticmethod
+    def from_query_params(query_params: Mapping[str, Any]) -> SummaryOptions:
+        """
+        Gets the options from query parameters, f.e. `?max_justifications=10&max_justification_length=200&max_linkages=10` or `?justifications=false`.
+
+        Args:
+            query_params (Mapping[str, Any]): Query parameters of a report request.
+
+        Raises:
+            ValueError: When the limits are not positive integers.
+
+        Returns:
+            SummaryOptions: Options of the report summaries.
+        """
+        options = {}
+        include = query_params.get("justifications", None)
+        if include is not None:
+            options["include_justifications"] = (
+                str(include).lower() not in _EXCLUDE_JUSTIFICATIONS
+            )
+        for param_name in _LIMIT_QUERY_PARAMS:
+            value = query_params.get(param_name, None)
+            if value in (None, ""):
+                continue
+            if not str(value).isdigit() or int(value) < 1:
+                raise ValueError(f"`{param_name}` expects a positive integer.")
+            options[param_name] = int(value)
+        return SummaryOptions(**options)
+
+    def to_query_params(self) -> Dict[str, str]:
+        """
+        Gets the query parameters representing these options (the inverse of `from_query_params`).
+
+        Returns:
+            Dict[str, str]: Value per query parameter, only for the options not set to their default.
+        """
+        query_params = {}
+        if not self.include_justifications:
+            query_params["justifications"] = "false"
+        for param_name in _LIMIT_QUERY_PARAMS:
+            if getattr(self, param_name) is not None:
+                query_params[param_name] = str(getattr(self, param_name))
+        return query_params
+
+    def get_justification_limits(self) -> Dict[str, Optional[int]]:
+        """
+        Gets the justification limits as the keyword arguments of the `Answer` summary methods (f.e. `Answer.get_detailed_summaries`), no justifications at all when not included.
+        """
+        return dict(
+            max_justifications=self.max_justifications
+            if self.include_justifications
+            else 0,
+            max_justification_length=self.max_justification_length,
+        )
@@ -0,0 +1,340 @@
+from __future__ import annotations
+
+import heapq
+from collections import defaultdict
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Type, Union
+
+from django.db import models
+from django.utils.functional import cached_property
+
+from epic_app.models.epic_answers import Answer, MultipleChoiceAnswer
+from epic_app.models.epic_questions import Question
+from epic_app.models.epic_summaries import AnswerSummary
+from epic_app.models.models import Program
+from epic_app.serializers.report_data import (
+    ProgramReportData,
+    QuestionReportData,
+    ReportFilters,
+    SummaryOptions,
+)
+from epic_app.submodel_registry import get_registry
+from epic_app.utils import get_submodel_types
+
+
+class AnswersReportEngine:
+    """
+    Computes the answers and their summaries, for all questions, of a set of `EpicUser`.
+    Answers are fetched with one query per `Answer` subtype and the summaries are read from the precomputed `AnswerSummary` counters (plus one query per `Answer` subtype with justifications), so the number of queries does not depend on the number of programs, questions or users.
+    Counters are kept per `EpicOrganization`, hence the users should include all the users of their organizations.
+    When the report is restricted to a subset of them (`ReportFilters.user_ids`) the summaries are computed from the answers instead, with one grouped query per `Answer` subtype.
+    Either way the counts are aggregated by the database, which also keeps only the top `SummaryOptions.max_linkages` programs of each linkages summary (with a correlated subquery) and counts the rest.
+    """
+
+    def __init__(
+        self,
+        users: Union[models.QuerySet, models.Manager],
+        filters: Optional[ReportFilters] = None,
+        chunk_size: Optional[int] = None,
+        summary_options: Optional[SummaryOptions] = None,
+    ):
+        """
+        Args:
+            users (Union[models.QuerySet, models.Manager]): Users whose answers are reported.
+            filters (Optional[ReportFilters], optional): Scope of the report (programs, questions and users), everything when not given. Defaults to None.
+            chunk_size (Optional[int], optional): When given, answers are fetched in chunks of said size (`QuerySet.iterator`). Defaults to None.
+            summary_options (Optional[SummaryOptions], optional): Justifications and linkages included in the summaries, all of them when not given. Defaults to None.
+        """
+        self.filters = filters or ReportFilters()
+        self.summary_options = summary_options or SummaryOptions()
+        self.uses_summary_counters = self.filters.user_ids is None
+        self.users = (
+            users
+            if self.uses_summary_counters
+            else users.filter(pk__in=self.filters.user_ids)
+        )
+        self.chunk_size = chunk_size
+
+    def _get_answers_queryset(
+        self, answer_type: Type[Answer] = Answer
+    ) -> models.QuerySet:
+        return answer_type.objects.filter(
+            self.filters.get_questions_filter("question__"),
+            user__in=self.users.values("pk"),
+        )
+
+    def _iterate_answers(
+        self,
+        answer_type: Type[Answer],
+        ordering: Tuple[str, ...] = ("pk",),
+        related_fields: Tuple[str, ...] = (),
+    ) -> Iterator[Answer]:
+        """
+        Iterates over the reported answers of the given type, ordered by creation (or the given ordering) and with their many-to-many fields prefetched.
+        """
+        m2m_fields = [m2m.name for m2m in answer_type._meta.local_many_to_many]
+        answers = (
+            self._get_answers_queryset(answer_type)
+            .select_related(*related_fields)
+            .order_by(*ordering)
+        )
+        if not self.chunk_size:
+            yield from answers.prefetch_related(*m2m_fields)
+            return
+
+        # `iterator()` ignores `prefetch_related`, so each chunk is prefetched on its own.
+        answers_chunk: List[Answer] = []
+        for answer in answers.iterator(chunk_size=self.chunk_size):
+            answers_chunk.append(answer)
+            if len(answers_chunk) == self.chunk_size:
+                models.prefetch_related_objects(answers_chunk, *m2m_fields)
+                yield from answers_chunk
+                answers_chunk = []
+        models.prefetch_related_objects(answers_chunk, *m2m_fields)
+        yield from answers_chunk
+
+    def iterate_answers(self) -> Iterator[Answer]:
+        """
+        Iterates over all the reported answers (as their `Answer` subtype) ordered by program, question and creation, with their question, program and user loaded.
+        The answers of each subtype are merged while iterated, so with `chunk_size` only one chunk per subtype is kept in memory.
+
+        Returns:
+            Iterator[Answer]: Reported answers.
+        """
+        return heapq.merge(
+            *[
+                self._iterate_answers(
+                    answer_type,
+                    ordering=("question__program_id", "question_id", "pk"),
+                    related_fields=("question__program", "user"),
+                )
+                for answer_type in get_registry().answer_types
+            ],
+            key=lambda answer: (
+                answer.question.program_id,
+                answer.question_id,
+                answer.pk,
+            ),
+        )
+
+    @cached_property
+    def expected_answers(self) -> int:
+        """
+        Number of answers expected for each question (one per user).
+        """
+        return self.users.count()
+
+    @cached_property
+    def _answers_by_question(self) -> Dict[int, List[Answer]]:
+        answers: Dict[int, List[Answer]] = defaultdict(list)
+        for answer_type in get_registry().answer_types:
+            for answer in self._iterate_answers(answer_type):
+                answers[answer.question_id].append(answer)
+        return answers
+
+    def _get_organizations_filter(self) -> models.Q:
+        """
+        Gets the filter of the organizations (counted in `AnswerSummary`) of the reported users.
+        """
+        organization_ids = set(
+            self.users.order_by().values_list("organization_id", flat=True).distinct()
+        )
+        organizations_filter = models.Q(organization_id__in=organization_ids - {None})
+        if None in organization_ids:
+            organizations_filter |= models.Q(organization__isnull=True)
+        return organizations_filter
+
+    @cached_property
+    def _summary_counters(self) -> Tuple[Dict[int, int], Dict[int, Dict[str, int]]]:
+        """
+        Reads the `AnswerSummary` counters, as the number of answers and the number of answers per choice (or selected program name) of each question.
+        """
+        summary_rows = AnswerSummary.objects.filter(
+            self._get_organizations_filter(),
+            self.filters.get_questions_filter("question__"),
+        ).order_by()
+        max_programs = self.summary_options.max_linkages
+        counted_rows = summary_rows
+        ordering = ("question_id", "first_answer", "program_id")
+        if max_programs is not None:
+            counted_rows = summary_rows.filter(
+                models.Q(program__isnull=True)
+                | models.Q(
+                    program_id__in=MultipleChoiceAnswer.get_top_programs(
+                        summary_rows.filter(
+                            question_id=models.OuterRef("question_id"),
+                            program__isnull=False,
+                        ),
+                        models.Sum("n_answers"),
+                        models.Min("first_answer"),
+                        max_programs,
+                    )
+                )
+            )
+            ordering = ("question_id", "-n_answers", "first_answer", "program_id")
+        choice_counts: Dict[int, Dict[str, int]] = defaultdict(dict)
+        n_answers: Dict[int, int] = {}
+        for q_id, choice, program_name, n_summary_answers, _ in (
+            counted_rows.values_list("question_id", "choice", "program__name")
+            .annotate(
+                n_answers=models.Sum("n_answers"),
+                first_answer=models.Min("first_answer"),
+            )
+            .order_by(*ordering)
+        ):
+            if choice == AnswerSummary.TOTAL_CHOICE:
+                n_answers[q_id] = n_summary_answers
+            else:
+                choice_counts[q_id][program_name or choice] = n_summary_answers
+        if max_programs is not None:
+            MultipleChoiceAnswer.add_other_programs(
+                choice_counts,
+                dict(
+                    summary_rows.filter(program__isnull=False)
+                    .values_list("question_id")
+                    .annotate(n_selections=models.Sum("n_answers"))
+                ),
+            )
+        return n_answers, choice_counts
+
+    @cached_property
+    def _answer_counts(self) -> Dict[int, int]:
+        if self.uses_summary_counters:
+            return self._summary_counters[0]
+        return dict(
+            self._get_answers_queryset()
+            .order_by()
+            .values("question_id")
+            .annotate(n_answers=models.Count("pk"))
+            .values_list("question_id", "n_answers")
+        )
+
+    def _get_answers_summaries(self) -> Dict[int, Dict[str, Any]]:
+        """
+        Computes the summaries (not counting missing answers) of the answers of the reported users, instead of reading the organization counters.
+        """
+        registry = get_registry()
+        summaries: Dict[int, Dict[str, Any]] = {}
+        for answer_type in registry.answer_types:
+            summaries.update(
+                registry.get_summary(answer_type)(
+                    self._get_answers_queryset(answer_type),
+                    group_by="question_id",
+                    max_choices=self.summary_options.max_linkages,
+                    **self.summary_options.get_justification_limits(),
+                )
+            )
+        return summaries
+
+    def _get_counters_summaries(self) -> Dict[int, Dict[str, Any]]:
+        """
+        Formats the summaries (not counting missing answers) from the `AnswerSummary` counters, only the justifications are read from the answers.
+        """
+        n_answers, choice_counts = self._summary_counters
+        registry = get_registry()
+        justifications = {
+            answer_type: answer_type.get_summary_justifications(
+                self._get_answers_queryset(answer_type),
+                group_by="question_id",
+                **self.summary_options.get_justification_limits(),
+            )
+            for answer_type in registry.answer_types
+        }
+        question_types = get_submodel_types(Question, n_answers.keys())
+        summaries: Dict[int, Dict[str, Any]] = {}
+        for q_id in n_answers.keys():
+            answer_type = registry.get_answer_type(question_types.get(q_id, None))
+            if not answer_type:
+                continue
+            summaries[q_id] = registry.get_summary_format(answer_type)(
+                choice_counts[q_id], justifications[answer_type].get(q_id, {})
+            )
+        return summaries
+
+    @cached_property
+    def _summaries_by_question(self) -> Dict[int, Dict[str, Any]]:
+        if self.uses_summary_counters:
+            summaries = self._get_counters_summaries()
+        else:
+            summaries = self._get_answers_summaries()
+        for q_id, summary in summaries.items():
+            missing_answers = self.expected_answers - self._answer_counts[q_id]
+            summary["no_valid_response"] = (
+                missing_answers + summary["no_valid_response"]
+            )
+            if not self.summary_options.include_justifications:
+                for justify_key in [k for k in summary if k.endswith("_justify")]:
+                    del summary[justify_key]
+        return summaries
+
+    def get_question_answers(self, question_id: int) -> List[Answer]:
+        """
+        Gets the answers (as their `Answer` subtype) given to a question.
+
+        Args:
+            question_id (int): Id of the `Question`.
+
+        Returns:
+            List[Answer]: Answers ordered by creation.
+        """
+        return self._answers_by_question.get(question_id, [])
+
+    def get_question_answers_count(self, question_id: int) -> int:
+        """
+        Gets the number of answers given to a question, without loading them.
+
+        Args:
+            question_id (int): Id of the `Question`.
+
+        Returns:
+            int: Number of answers.
+        """
+        return self._answer_counts.get(question_id, 0)
+
+    def get_question_summary(self, question_id: int) -> Dict[str, Any]:
+        """
+        Gets the detailed summary of the answers given to a question, missing answers are reported as not valid.
+
+        Args:
+            question_id (int): Id of the `Question`.
+
+        Returns:
+            Dict[str, Any]: Detailed summary, empty when the question has no answers.
+        """
+        return self._summaries_by_question.get(question_id, {})
+
+    def get_program_reports(
+        self, include_answers: bool = True
+    ) -> List[ProgramReportData]:
+        """
+        Builds the report data of the reported programs and their questions, with one query for each of them (plus the ones of the answers and summaries).
+
+        Args:
+            include_answers (bool, optional): Whether the answers themselves are included, not needed when only the summaries are reported. Defaults to True.
+
+        Returns:
+            List[ProgramReportData]: Report data per `Program`.
+        """
+        programs = self.filters.filter_programs(Program.objects.order_by("pk"))
+        questions = Question.objects.filter(
+            self.filters.get_questions_filter()
+        ).order_by("pk")
+
+        program_questions: Dict[int, List[QuestionReportData]] = defaultdict(list)
+        for q_id, q_title, p_id in questions.values_list("id", "title", "program_id"):
+            program_questions[p_id].append(
+                QuestionReportData(
+                    id=q_id,
+                    title=q_title,
+                    n_answers=self.get_question_answers_count(q_id),
+                    summary=self.get_question_summary(q_id),
+                    answers=tuple(self.get_question_answers(q_id))
+                    if include_answers
+                    else (),
+                )
+            )
+        return [
+            ProgramReportData(
+                id=p_id, name=p_name, questions=tuple(program_questions[p_id])
+            )
+            for p_id, p_name in programs.values_list("id", "name")
+        ]
@@ -0,0 +1,31 @@
+from rest_framework import serializers
+
+from epic_app.models.epic_jobs import ReportJob
+
+
+class ReportJobSerializer(serializers.ModelSerializer):
+    """
+    Serializer for 'ReportJob', only exposing its state (the report is downloaded through its own endpoint).
+    """
+
+    class Meta:
+        """
+        Overriden meta class for serializing purposes.
+        """
+
+        model = ReportJob
+        fields = (
+            "url",
+            "id",
+            "report_format",
+            "options",
+            "organization",
+            "status",
+            "progress",
+            "error",
+            "created_at",
+            "started_at",
+            "finished_at",
+            "expires_at",
+        )
+        read_only_fields = fields
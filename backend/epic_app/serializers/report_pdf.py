@@ -1,6 +1,7 @@
 from datetime import datetime
 from io import BytesIO
-from typing import Any, List, Optional
+from typing import Any, Callable, Dict, Iterable, List, Optional
+from xml.sax.saxutils import escape
 
 from reportlab.graphics.charts.barcharts import VerticalBarChart
 from reportlab.graphics.shapes import Drawing, Rect
@@ -8,11 +9,21 @@ from reportlab.lib import colors
 from reportlab.lib.styles import ParagraphStyle as PS
 from reportlab.lib.styles import getSampleStyleSheet
 from reportlab.lib.units import inch
-from reportlab.platypus import PageBreak, Paragraph, SimpleDocTemplate, Spacer
+from reportlab.platypus import (
+    PageBreak,
+    Paragraph,
+    SimpleDocTemplate,
+    Spacer,
+    Table,
+    TableStyle,
+)
+from reportlab.platypus.flowables import Flowable, PageBreakIfNotEmpty
 from reportlab.platypus.paragraph import Paragraph
 from reportlab.platypus.tableofcontents import TableOfContents
 from reportlab.rl_config import defaultPageSize
 
+from epic_app.serializers.report_data import ProgramReportData, QuestionReportData
+
 PAGE_HEIGHT = defaultPageSize[1]
 PAGE_WIDTH = defaultPageSize[0]
 
@@ -51,13 +62,62 @@ class EpicStyles:
         spaceBefore=0,
         leading=12,
     )
+    table_cell = PS(
+        fontSize=8,
+        name="TableCell",
+        leading=9,
+    )
+
+
+class _TrailingTableOfContents(TableOfContents):
+    """
+    Table of contents placed at the end of the document, so all its entries are already known when it is drawn in a single layout pass.
+    """
+
+    def wrap(self, availWidth, availHeight):
+        self._lastEntries = self._entries[:]
+        return super().wrap(availWidth, availHeight)
+
+
+class _ProgressMark(Flowable):
+    """
+    Empty flowable marking the end of a program chapter, with the fraction of the chapters laid out so far.
+    """
+
+    def __init__(self, fraction: float):
+        super().__init__()
+        self.fraction = fraction
+
+    def wrap(self, availWidth, availHeight):
+        return (0, 0)
+
+    def draw(self):
+        pass
 
 
 class EpicReportDocTemplate(SimpleDocTemplate):
+    # Called with the fraction (from 0 to 1) of the document laid out, after each program chapter.
+    on_progress: Optional[Callable[[float], None]] = None
+    # Layout passes expected (`multiBuild` needs at least two), more are added when needed.
+    expected_passes = 1
+    _n_passes = 0
+    _progress = 0.0
+
+    def build(self, flowables, *args, **kwargs):
+        self._n_passes += 1
+        self.expected_passes = max(self.expected_passes, self._n_passes)
+        super().build(flowables, *args, **kwargs)
+
     def afterFlowable(self, flowable):
         """
-        Registers TOC entries.
+        Registers TOC entries and notifies the progress of the layout.
         """
+        if isinstance(flowable, _ProgressMark):
+            progress = (self._n_passes - 1 + flowable.fraction) / self.expected_passes
+            if self.on_progress and progress > self._progress:
+                self._progress = progress
+                self.on_progress(progress)
+            return
         if flowable.__class__.__name__ == "Paragraph":
             indentation = {
                 "TOCHeading1": 1,
@@ -69,13 +129,37 @@ class EpicReportDocTemplate(SimpleDocTemplate):
             if level:
                 self.notify("TOCEntry", (level, flowable.getPlainText(), self.page))
 
+    def singleBuild(self, story: List[Any], **buildKwds):
+        """
+        Builds the document in a single layout pass (unlike `multiBuild`), indexing flowables only get the entries notified before they are drawn.
+
+        Args:
+            story (List[Any]): Flowables of the document.
+        """
+        self._indexingFlowables = [fl for fl in story if fl.isIndexing()]
+        for fl in self._indexingFlowables:
+            fl.beforeBuild()
+        self.build(story[:], **buildKwds)
+
 
 class EpicPdfReport:
+    # Table of contents modes: at the beginning (needs several layout passes), at the end (single pass) or none.
+    TOC_MULTIPASS = "multipass"
+    TOC_END = "end"
+    TOC_NONE = "none"
+    toc_modes = (TOC_MULTIPASS, TOC_END, TOC_NONE)
+
     styles = getSampleStyleSheet()
     report_title = "Epic Report"
     report_subtitle = ""
     report_author = ""
     report_description = "An automatic generated report containing all the questions and answers taken by the users of the organization."
+    toc = TOC_MULTIPASS
+    # Wider categorical data (more choices, or longer ones) is reported as a table instead of a bar chart.
+    max_chart_categories = 12
+    max_chart_label = 40
+    # Called with the fraction (from 0 to 1) of the report laid out, after each program chapter.
+    on_progress: Optional[Callable[[float], None]] = None
 
     # Create the PDF object, using the buffer as its "file."
     def _get_abstract(self) -> List[Any]:
@@ -91,14 +175,19 @@ class EpicPdfReport:
 
     def _get_toc(self) -> List[Any]:
         # TODO: clickable TOC https://www.reportlab.com/snippets/13/
-        self._toc = TableOfContents()
+        self._toc = (
+            _TrailingTableOfContents()
+            if self.toc == self.TOC_END
+            else TableOfContents()
+        )
         self._toc.levelStyles = [
             EpicStyles.h1,
             EpicStyles.h2,
             EpicStyles.h3,
             EpicStyles.h4,
         ]
-
+        if self.toc == self.TOC_END:
+            return [PageBreakIfNotEmpty(), self._toc]
         return [PageBreak(), self._toc, PageBreak()]
 
     def _first_page(self, canvas, doc):
@@ -138,6 +227,12 @@ class EpicPdfReport:
         if not id_keys:
             return []
         id_values = [input_data[id_k] for id_k in id_keys]
+        max_key = len(max(map(str, id_keys), key=len))
+        if len(id_keys) > self.max_chart_categories or max_key > self.max_chart_label:
+            chart_story = self._get_line("Answers:", EpicStyles.h3)
+            chart_story.append(self._get_answers_table(id_keys, id_values))
+            chart_story.append(Spacer(1, 0.2 * inch))
+            return chart_story
 
         bc = VerticalBarChart()
         bc.x = 50
@@ -153,7 +248,6 @@ class EpicPdfReport:
         bc.categoryAxis.labels.dy = -2
 
         # Add to report.
-        max_key = len(max(id_keys, key=len))
         drawing_width = 450
         drawing_height = 200
         if max_key > len("no_valid_response"):
@@ -169,13 +263,38 @@ class EpicPdfReport:
         chart_story.append(drawing)
         return chart_story
 
+    def _get_answers_table(self, id_keys: List[Any], id_values: List[int]) -> Table:
+        """
+        Gets a compact table with the number of answers of each choice, long choices are wrapped.
+        """
+        rows = [["Choice", "Answers"]]
+        rows.extend(
+            [Paragraph(escape(str(id_k)), EpicStyles.table_cell), id_v]
+            for id_k, id_v in zip(id_keys, id_values)
+        )
+        table = Table(rows, colWidths=[4.5 * inch, inch], repeatRows=1)
+        table.setStyle(
+            TableStyle(
+                [
+                    ("FONTSIZE", (0, 0), (-1, -1), 8),
+                    ("LEADING", (0, 0), (-1, -1), 9),
+                    ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
+                    ("ALIGN", (1, 0), (1, -1), "RIGHT"),
+                    ("VALIGN", (0, 0), (-1, -1), "TOP"),
+                    ("LINEBELOW", (0, 0), (-1, 0), 0.5, colors.grey),
+                    ("TOPPADDING", (0, 0), (-1, -1), 1),
+                    ("BOTTOMPADDING", (0, 0), (-1, -1), 1),
+                ]
+            )
+        )
+        return table
+
     def _get_line(self, line: str, style: Optional[Any] = None) -> List[Any]:
         if not style:
             style = self.styles["Normal"]
         return [Paragraph(line, style), Spacer(1, 0.2 * inch)]
 
-    def _get_justifications(self, q_qa: dict) -> List[Any]:
-        q_summary = q_qa["summary"]
+    def _get_justifications(self, q_summary: Dict[str, Any]) -> List[Any]:
         j_story = []
         for k_j in q_summary.keys():
             if "justify" not in str(k_j):
@@ -190,36 +309,53 @@ class EpicPdfReport:
         story.extend(j_story)
         return story
 
-    def _get_questions(self, questions_data: dict) -> List[Any]:
+    def _get_questions(self, questions_data: Iterable[QuestionReportData]) -> List[Any]:
         story = []
         for q_entry in questions_data:
-            if not q_entry["question_answers"]["answers"]:
+            if not q_entry.n_answers:
                 continue
-            story.extend(self._get_line(q_entry["title"], EpicStyles.h2))
-            story.extend(self._get_charts(q_entry["question_answers"]["summary"]))
-            story.extend(self._get_justifications(q_entry["question_answers"]))
+            story.extend(self._get_line(q_entry.title, EpicStyles.h2))
+            story.extend(self._get_charts(q_entry.summary))
+            story.extend(self._get_justifications(q_entry.summary))
         return story
 
-    def _get_programs(self, report_data: dict) -> List[Any]:
-        story = []
+    def _get_programs(self, report_data: Iterable[ProgramReportData]) -> List[Any]:
+        chapters = []
         for p_entry in report_data:
-            program_name = p_entry["name"]
+            program_name = p_entry.name
             # Don't include empty chapters without questions.
-            q_stories = self._get_questions(p_entry["questions"])
+            q_stories = self._get_questions(p_entry.questions)
             if not q_stories:
                 continue
-            story.extend(self._get_line(f"Program: {program_name}", EpicStyles.h1))
-            story.extend(q_stories)
+            chapter = self._get_line(f"Program: {program_name}", EpicStyles.h1)
+            chapter.extend(q_stories)
+            chapters.append(chapter)
+        story = []
+        for n_chapter, chapter in enumerate(chapters, start=1):
+            story.extend(chapter)
+            story.append(_ProgressMark(n_chapter / len(chapters)))
             story.append(PageBreak())
         return story
 
-    def generate_report(self, buffer: BytesIO, report_data: dict):
+    def generate_report(
+        self, buffer: BytesIO, report_data: Iterable[ProgramReportData]
+    ):
+        if self.toc not in self.toc_modes:
+            raise ValueError(f"Table of contents mode `{self.toc}` not supported.")
         report_story = [Spacer(1, 2 * inch)]
         report_story.extend(self._get_abstract())
-        report_story.extend(self._get_toc())
+        if self.toc == self.TOC_MULTIPASS:
+            report_story.extend(self._get_toc())
         report_story.extend(self._get_programs(report_data))
-        EpicReportDocTemplate(buffer).multiBuild(
-            report_story,
-            onFirstPage=self._first_page,
-            onLaterPages=self._later_pages,
+        build_kwargs = dict(
+            onFirstPage=self._first_page, onLaterPages=self._later_pages
         )
+        doc_template = EpicReportDocTemplate(buffer)
+        doc_template.on_progress = self.on_progress
+        if self.toc == self.TOC_MULTIPASS:
+            doc_template.expected_passes = 2
+            doc_template.multiBuild(report_story, **build_kwargs)
+            return
+        if self.toc == self.TOC_END:
+            report_story.extend(self._get_toc())
+        doc_template.singleBuild(report_story, **build_kwargs)
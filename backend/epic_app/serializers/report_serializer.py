@@ -1,78 +1,68 @@
 from __future__ import annotations
 
-from typing import Any, Dict, List, Type, Union
+from typing import Any, Dict, Type
 
-from django.db import models
 from rest_framework import serializers
+from rest_framework.reverse import reverse
 
 from epic_app.models.epic_answers import Answer
-from epic_app.models.epic_questions import Question
-from epic_app.models.models import Program
 from epic_app.serializers.answer_serializer import AnswerSerializer
-from epic_app.utils import get_instance_as_submodel_type
-
-
-class AnswerListReportSerializer(serializers.ListSerializer):
-    def _get_answers_summary(
-        self, answers_list: Union[models.QuerySet, List[Answer]], expected_answers: int
-    ) -> Dict[str, Any]:
-        if not answers_list or len(answers_list) == 0:
-            return {}
-        subtype: Type[Answer] = type(
-            get_instance_as_submodel_type(answers_list.first())
-        )
-        subtype_answer_list = subtype.objects.filter(
-            id__in=[al.id for al in answers_list]
-        )
-        detailed_summary = subtype.get_detailed_summary(
-            subtype_answer_list,
-        )
-        missing_answers = expected_answers - len(answers_list)
-        detailed_summary["no_valid_response"] = (
-            missing_answers + detailed_summary["no_valid_response"]
+from epic_app.serializers.report_data import ProgramReportData, QuestionReportData
+
+
+class ProgramReportDataSerializer(serializers.BaseSerializer):
+    """
+    Serializer of the answers report data (`ProgramReportData`): each program with its questions and, per question, its answers and summary.
+    Only the answers themselves go through their model serializers.
+    Only meant for GET / FETCH endpoints.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Serializer of each `Answer` subtype, instantiated only once.
+        self._answer_serializers: Dict[Type[Answer], serializers.ModelSerializer] = {}
+
+    def _get_url(self, view_name: str, pk: int) -> str:
+        return reverse(
+            view_name,
+            kwargs={"pk": pk},
+            request=self.context.get("request", None),
+            format=self.context.get("format", None),
         )
-        return detailed_summary
-
-    def to_representation(self, data):
-        organization_users = self.context["users"].all()
-        user_ids = [eu.id for eu in organization_users]
-        filtered_data = Answer.objects.filter(question=data.instance, user__in=user_ids)
-        answers_summary = self._get_answers_summary(filtered_data, len(user_ids))
-
-        serialized_answers = super(AnswerListReportSerializer, self).to_representation(
-            filtered_data
-        )
-        return {"answers": serialized_answers, "summary": answers_summary}
-
-
-class AnswerReportSerializer(serializers.BaseSerializer):
-    class Meta:
-        model = Answer
-        fields = "__all__"
-        list_serializer_class = AnswerListReportSerializer
 
-    def to_representation(self, instance: Answer):
-        st_answer: Answer = get_instance_as_submodel_type(instance)
-        st_serializer: serializers.ModelSerializer = (
-            AnswerSerializer.get_concrete_serializer(type(st_answer))
-        )
-        return st_serializer(context={"request": self.context}).to_representation(
-            st_answer
-        )
-
-
-class QuestionReportSerializer(serializers.ModelSerializer):
-    question_answers = AnswerReportSerializer(many=True, read_only=True)
-
-    class Meta:
-        model = Question
-        fields = ("url", "id", "title", "question_answers")
-
-
-class ProgramReportSerializer(serializers.ModelSerializer):
-
-    questions = QuestionReportSerializer(many=True, read_only=True)
-
-    class Meta:
-        model = Program
-        fields = ("url", "id", "name", "questions")
+    def _get_answer_representation(self, answer: Answer) -> Dict[str, Any]:
+        answer_type = type(answer)
+        if answer_type not in self._answer_serializers:
+            self._answer_serializers[
+                answer_type
+            ] = AnswerSerializer.get_concrete_serializer(answer_type)(
+                context=self.context
+            )
+        return self._answer_serializers[answer_type].to_representation(answer)
+
+    def _get_question_representation(
+        self, question_data: QuestionReportData
+    ) -> Dict[str, Any]:
+        return {
+            "url": self._get_url("question-detail", question_data.id),
+            "id": question_data.id,
+            "title": question_data.title,
+            "question_answers": {
+                "answers": [
+                    self._get_answer_representation(answer)
+                    for answer in question_data.answers
+                ],
+                "summary": question_data.summary,
+            },
+        }
+
+    def to_representation(self, instance: ProgramReportData) -> Dict[str, Any]:
+        return {
+            "url": self._get_url("program-detail", instance.id),
+            "id": instance.id,
+            "name": instance.name,
+            "questions": [
+                self._get_question_representation(question_data)
+                for question_data in instance.questions
+            ],
+        }
@@ -0,0 +1,239 @@
+from typing import List, Tuple, Type
+
+from django.db import models
+from django.db.models.signals import (
+    m2m_changed,
+    post_delete,
+    post_save,
+    pre_delete,
+    pre_save,
+)
+from django.dispatch import receiver
+
+from epic_app.models.epic_answers import Answer, MultipleChoiceAnswer
+from epic_app.models.epic_cascades import is_answer_bookkeeping_deferred
+from epic_app.models.epic_questions import Question
+from epic_app.models.epic_summaries import AnswerSummary, UserProgress
+from epic_app.models.epic_user import EpicOrganization, EpicUser
+from epic_app.models.epic_versions import EpicDataVersion
+from epic_app.models.models import Agency, Area, Group, Program
+from epic_app.utils import update_submodel_type_cache
+
+
+def _get_subclasses(model: Type[models.Model]) -> List[Type[models.Model]]:
+    """
+    Gets all the (nested) subclasses of a model, f.e. `YesNoQuestion` and `NationalFrameworkQuestion` for `Question`.
+    """
+    subclasses = []
+    for subclass in model.__subclasses__():
+        subclasses.extend([subclass] + _get_subclasses(subclass))
+    return subclasses
+
+
+def _receiver(signal, senders: List[Type[models.Model]]):
+    """
+    Same as `django.dispatch.receiver`, but connecting the receiver to each of the given senders.
+    Receivers without a sender run for every model, which also prevents Django from fast-deleting (cascaded) rows.
+    """
+
+    def _decorator(func):
+        for sender in senders:
+            receiver(signal, sender=sender)(func)
+        return func
+
+    return _decorator
+
+
+_submodels = _get_subclasses(Question) + _get_subclasses(Answer)
+
+
+@_receiver(post_save, _submodels)
+def on_submodel_saved(sender, instance, created: bool, **kwargs):
+    """
+    Registers the submodel type of a newly created `Question` or `Answer`.
+    """
+    if created:
+        update_submodel_type_cache(sender, instance.pk)
+
+
+@_receiver(post_delete, _submodels)
+def on_submodel_deleted(sender, instance, **kwargs):
+    """
+    Removes the submodel type of a deleted `Question` or `Answer`.
+    """
+    update_submodel_type_cache(sender, instance.pk, is_removed=True)
+
+
+_answer_types = _get_subclasses(Answer)
+
+
+@_receiver(pre_delete, _answer_types)
+def on_answer_deleting(sender, instance, **kwargs):
+    """
+    Keeps the `AnswerSummary` and `UserProgress` counters of an `Answer` subtype about to be deleted (its selections are deleted first).
+    Answers deleted by a cascade (f.e. from a deleted `Question`) are skipped, as both tables get rebuilt afterwards (see `defer_answer_bookkeeping`).
+    """
+    if is_answer_bookkeeping_deferred():
+        return
+    instance._deleted_summary_counters = instance.get_summary_counters()
+    instance._deleted_progress_counters = UserProgress.get_counters([instance.pk]).get(
+        instance.pk, None
+    )
+
+
+@_receiver(post_delete, _answer_types)
+def on_answer_deleted(sender, instance, **kwargs):
+    """
+    Removes a deleted `Answer` subtype from the `AnswerSummary` and `UserProgress` counters, within the deletion transaction.
+    """
+    if is_answer_bookkeeping_deferred():
+        return
+    AnswerSummary.replace_counters(
+        getattr(instance, "_deleted_summary_counters", None), None, instance.pk
+    )
+    UserProgress.replace_counters(
+        getattr(instance, "_deleted_progress_counters", None), None
+    )
+    EpicDataVersion.increase(EpicDataVersion.ANSWERS)
+
+
+def _get_selections(instance, reverse: bool, pk_set) -> List[Tuple[int, int]]:
+    """
+    Gets the (answer, program) pairs affected by a change of `MultipleChoiceAnswer.selected_programs`. All the current ones when `pk_set` is not given (clear).
+    """
+    instance_field, target_field = "multiplechoiceanswer_id", "program_id"
+    if reverse:
+        instance_field, target_field = target_field, instance_field
+    through_rows = MultipleChoiceAnswer.selected_programs.through.objects.filter(
+        **{instance_field: instance.pk}
+    )
+    if pk_set is not None:
+        through_rows = through_rows.filter(**{f"{target_field}__in": pk_set})
+    return list(through_rows.values_list("multiplechoiceanswer_id", "program_id"))
+
+
+@receiver(m2m_changed, sender=MultipleChoiceAnswer.selected_programs.through)
+def on_selected_programs_changed(
+    sender, instance, action: str, reverse: bool, pk_set, **kwargs
+):
+    """
+    Updates the `AnswerSummary` selection counters and the `UserProgress` of the changed answers, within the transaction changing the selections.
+    Added selections (`pk_set`) are only the missing ones, whereas removed ones need to be checked before they get removed.
+    """
+    if action in ["pre_remove", "pre_clear"]:
+        instance._removed_selections = _get_selections(instance, reverse, pk_set)
+        instance._previous_progress = UserProgress.get_counters(
+            {a_id for a_id, _ in instance._removed_selections}
+        )
+    elif action == "pre_add":
+        instance._previous_progress = UserProgress.get_counters(
+            pk_set if reverse else [instance.pk]
+        )
+    elif action in ["post_remove", "post_clear"]:
+        AnswerSummary.update_selections(
+            getattr(instance, "_removed_selections", []), -1
+        )
+        _update_selections_progress(instance)
+        EpicDataVersion.increase(EpicDataVersion.ANSWERS)
+    elif action == "post_add":
+        if reverse:
+            selections = [(a_id, instance.pk) for a_id in pk_set]
+        else:
+            selections = [(instance.pk, p_id) for p_id in pk_set]
+        AnswerSummary.update_selections(selections, 1)
+        _update_selections_progress(instance)
+        EpicDataVersion.increase(EpicDataVersion.ANSWERS)
+
+
+def _update_selections_progress(instance):
+    """
+    Updates the `UserProgress` of the answers whose selections changed, as they may no longer (or now) be valid.
+    """
+    previous_progress = getattr(instance, "_previous_progress", {})
+    current_progress = UserProgress.get_counters(previous_progress.keys())
+    for a_id, a_counters in previous_progress.items():
+        UserProgress.replace_counters(a_counters, current_progress.get(a_id, None))
+
+
+@_receiver(post_save, [Question] + _get_subclasses(Question))
+def on_question_saved(sender, instance, created: bool, **kwargs):
+    """
+    Adds a newly created `Question` to the `UserProgress` of its program.
+    """
+    if created:
+        UserProgress.add_questions(instance.program_id, 1)
+
+
+@receiver(post_delete, sender=Question)
+def on_question_deleted(sender, instance, **kwargs):
+    """
+    Removes a deleted `Question` from the `UserProgress` of its program (its answers are removed on their own).
+    The base `Question` row is always deleted, also when deleting a subtype, so it is only handled once.
+    """
+    if not is_answer_bookkeeping_deferred():
+        UserProgress.add_questions(instance.program_id, -1)
+
+
+@receiver(pre_save, sender=EpicUser)
+def on_epic_user_saving(sender, instance, update_fields, **kwargs):
+    """
+    Keeps the stored organization of an `EpicUser` about to be saved, as its answers are counted per organization.
+    """
+    if instance._state.adding or (
+        update_fields is not None and "organization" not in update_fields
+    ):
+        return
+    instance._stored_organization_id = (
+        EpicUser.objects.filter(pk=instance.pk)
+        .values_list("organization_id", flat=True)
+        .first()
+    )
+
+
+@receiver(post_save, sender=EpicUser)
+def on_epic_user_saved(sender, instance, **kwargs):
+    """
+    Moves the answers of an `EpicUser` whose organization changed to the `AnswerSummary` counters of the new one, by recomputing the counters of both organizations.
+    """
+    if not hasattr(instance, "_stored_organization_id"):
+        return
+    stored_organization_id = instance._stored_organization_id
+    del instance._stored_organization_id
+    if stored_organization_id != instance.organization_id:
+        AnswerSummary.rebuild([stored_organization_id, instance.organization_id])
+        EpicDataVersion.increase(EpicDataVersion.ANSWERS)
+
+
+# Entities whose changes modify the (answers) reports, besides the answers.
+_domain_models = [Program, Question, EpicUser, EpicOrganization] + _get_subclasses(
+    Question
+)
+
+
+@_receiver([post_save, post_delete], _domain_models)
+def on_domain_changed(sender, **kwargs):
+    """
+    Increases the domain version when an entity shown in the reports changes.
+    """
+    EpicDataVersion.increase(EpicDataVersion.DOMAIN)
+
+
+# Entities of the domain catalogue (see `epic_app.domain_catalogue`).
+_catalogue_models = [Area, Group, Agency, Program, Question] + _get_subclasses(Question)
+
+
+@_receiver([post_save, post_delete], _catalogue_models)
+def on_catalogue_changed(sender, **kwargs):
+    """
+    Increases the catalogue version when an entity of the catalogue changes.
+    """
+    EpicDataVersion.increase(EpicDataVersion.CATALOGUE)
+
+
+@receiver(m2m_changed, sender=Program.agencies.through)
+def on_program_agencies_changed(sender, action: str, **kwargs):
+    """
+    Increases the catalogue version when the agencies of a program change.
+    """
+    if action in ("post_add", "post_remove", "post_clear"):
+        EpicDataVersion.increase(EpicDataVersion.CATALOGUE)
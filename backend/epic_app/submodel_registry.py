@@ -0,0 +1,204 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Tuple, Type
+
+from django.core.exceptions import ImproperlyConfigured
+from rest_framework import serializers
+
+from epic_app.models.epic_answers import Answer
+from epic_app.models.epic_questions import Question
+from epic_app.utils import register_submodel_types
+
+
+@dataclass(frozen=True)
+class QuestionTypeEntry:
+    """
+    Everything needed to dispatch a concrete `Question` subtype.
+    """
+
+    question_type: Type[Question]
+    answer_type: Type[Answer]
+    question_serializer: Type[serializers.ModelSerializer]
+    answer_serializer: Type[serializers.ModelSerializer]
+    # Function generating the summaries of a list of answers (of `answer_type`), see `Answer.get_detailed_summaries`.
+    summary: Callable[..., Dict[Any, Dict[str, Any]]]
+    # Function formatting a summary from already counted answers, see `Answer.format_detailed_summary`.
+    summary_format: Callable[[Dict[str, int], Dict[str, List[str]]], Dict[str, Any]]
+    # Suffix used in the urls related to this question type (f.e. `question-{url_slug}`).
+    url_slug: str
+
+
+class SubmodelRegistry:
+    """
+    Immutable registry of all the `Question` subtypes and their related `Answer` subtype, serializers and summary.
+    It is built only once, when the app is ready, so that no reflection is needed on each request.
+    """
+
+    def __init__(self, entries: Iterable[QuestionTypeEntry]):
+        self.entries: Tuple[QuestionTypeEntry, ...] = tuple(entries)
+        self._by_question_type: Mapping[
+            Type[Question], QuestionTypeEntry
+        ] = MappingProxyType({e.question_type: e for e in self.entries})
+        self._by_url_slug: Mapping[str, QuestionTypeEntry] = MappingProxyType(
+            {e.url_slug: e for e in self.entries}
+        )
+        self._answer_serializers: Mapping[
+            Type[Answer], Type[serializers.ModelSerializer]
+        ] = MappingProxyType({e.answer_type: e.answer_serializer for e in self.entries})
+        self._by_answer_type: Mapping[
+            Type[Answer], QuestionTypeEntry
+        ] = MappingProxyType({e.answer_type: e for e in self.entries})
+        self.question_types: Tuple[Type[Question], ...] = tuple(
+            self._by_question_type.keys()
+        )
+        self.answer_types: Tuple[Type[Answer], ...] = tuple(
+            self._answer_serializers.keys()
+        )
+        self._validate()
+
+    def _validate(self):
+        """
+        Verifies the registered `Answer` types support their registered `Question` types.
+
+        Raises:
+            ImproperlyConfigured: When the registry is not consistent with the models.
+        """
+        for entry in self.entries:
+            if entry.question_type not in entry.answer_type._get_supported_questions():
+                raise ImproperlyConfigured(
+                    f"Answer type `{entry.answer_type.__name__}` does not support question type `{entry.question_type.__name__}`."
+                )
+
+    def get_entry(self, question_type: Type[Question]) -> Optional[QuestionTypeEntry]:
+        return self._by_question_type.get(question_type, None)
+
+    def get_entry_by_url_slug(self, url_slug: str) -> Optional[QuestionTypeEntry]:
+        return self._by_url_slug.get(url_slug, None)
+
+    def get_answer_type(self, question_type: Type[Question]) -> Optional[Type[Answer]]:
+        entry = self.get_entry(question_type)
+        return entry.answer_type if entry else None
+
+    def get_question_serializer(
+        self, question_type: Type[Question]
+    ) -> Optional[Type[serializers.ModelSerializer]]:
+        entry = self.get_entry(question_type)
+        return entry.question_serializer if entry else None
+
+    def get_answer_serializer(
+        self, answer_type: Type[Answer]
+    ) -> Optional[Type[serializers.ModelSerializer]]:
+        return self._answer_serializers.get(answer_type, None)
+
+    def get_summary(
+        self, answer_type: Type[Answer]
+    ) -> Optional[Callable[..., Dict[Any, Dict[str, Any]]]]:
+        entry = self._by_answer_type.get(answer_type, None)
+        return entry.summary if entry else None
+
+    def get_summary_format(
+        self, answer_type: Type[Answer]
+    ) -> Optional[Callable[[Dict[str, int], Dict[str, List[str]]], Dict[str, Any]]]:
+        entry = self._by_answer_type.get(answer_type, None)
+        return entry.summary_format if entry else None
+
+
+_registry: Optional[SubmodelRegistry] = None
+
+
+def _get_registry_entries() -> Tuple[QuestionTypeEntry, ...]:
+    """
+    Declares all the supported question types. New question types only need to be added here.
+    """
+    # Serializers depend on the models, so they can only be imported once the apps are loaded.
+    from epic_app.models.epic_answers import (
+        MultipleChoiceAnswer,
+        SingleChoiceAnswer,
+        YesNoAnswer,
+    )
+    from epic_app.models.epic_questions import (
+        EvolutionQuestion,
+        KeyAgencyActionsQuestion,
+        LinkagesQuestion,
+        NationalFrameworkQuestion,
+    )
+    from epic_app.serializers.answer_serializer import (
+        MultipleChoiceAnswerSerializer,
+        SingleChoiceAnswerSerializer,
+        YesNoAnswerSerializer,
+    )
+    from epic_app.serializers.question_serializer import (
+        EvolutionQuestionSerializer,
+        KeyAgencyQuestionSerializer,
+        LinkagesQuestionSerializer,
+        NationalFrameworkQuestionSerializer,
+    )
+
+    return (
+        QuestionTypeEntry(
+            question_type=NationalFrameworkQuestion,
+            answer_type=YesNoAnswer,
+            question_serializer=NationalFrameworkQuestionSerializer,
+            answer_serializer=YesNoAnswerSerializer,
+            summary=YesNoAnswer.get_detailed_summaries,
+            summary_format=YesNoAnswer.format_detailed_summary,
+            url_slug="nationalframework",
+        ),
+        QuestionTypeEntry(
+            question_type=KeyAgencyActionsQuestion,
+            answer_type=YesNoAnswer,
+            question_serializer=KeyAgencyQuestionSerializer,
+            answer_serializer=YesNoAnswerSerializer,
+            summary=YesNoAnswer.get_detailed_summaries,
+            summary_format=YesNoAnswer.format_detailed_summary,
+            url_slug="keyagencyactions",
+        ),
+        QuestionTypeEntry(
+            question_type=EvolutionQuestion,
+            answer_type=SingleChoiceAnswer,
+            question_serializer=EvolutionQuestionSerializer,
+            answer_serializer=SingleChoiceAnswerSerializer,
+            summary=SingleChoiceAnswer.get_detailed_summaries,
+            summary_format=SingleChoiceAnswer.format_detailed_summary,
+            url_slug="evolution",
+        ),
+        QuestionTypeEntry(
+            question_type=LinkagesQuestion,
+            answer_type=MultipleChoiceAnswer,
+            question_serializer=LinkagesQuestionSerializer,
+            answer_serializer=MultipleChoiceAnswerSerializer,
+            summary=MultipleChoiceAnswer.get_detailed_summaries,
+            summary_format=MultipleChoiceAnswer.format_detailed_summary,
+            url_slug="linkages",
+        ),
+    )
+
+
+def build_registry() -> SubmodelRegistry:
+    """
+    Builds the (global) registry and registers the known submodel types, so they are no longer discovered through reflection.
+    Meant to be called from `EpicAppConfig.ready()`.
+
+    Returns:
+        SubmodelRegistry: Built registry.
+    """
+    global _registry
+    registry = SubmodelRegistry(_get_registry_entries())
+    register_submodel_types(Question, registry.question_types)
+    register_submodel_types(Answer, registry.answer_types)
+    _registry = registry
+    return registry
+
+
+def get_registry() -> SubmodelRegistry:
+    """
+    Gets the registry of question types, building it when the app has not done it yet.
+
+    Returns:
+        SubmodelRegistry: Registry of question types.
+    """
+    if _registry is None:
+        return build_registry()
+    return _registry
@@ -0,0 +1,51 @@
+import pytest
+from django.core.management import call_command
+
+from epic_app.models.epic_answers import (
+    Answer,
+    SingleChoiceAnswer,
+    YesNoAnswer,
+    YesNoAnswerType,
+)
+from epic_app.models.epic_questions import (
+    EvolutionQuestion,
+    NationalFrameworkQuestion,
+    Question,
+)
+from epic_app.models.epic_user import EpicUser
+from epic_app.tests.epic_db_fixture import epic_test_db
+from epic_app.utils import clear_submodel_type_cache, get_submodel_type
+
+
+@pytest.mark.django_db
+class TestBackfillSubmodelTypesCommand:
+    def test_backfill_restores_discriminators(self, epic_test_db: pytest.fixture):
+        # Define test data.
+        e_user = EpicUser.objects.first()
+        yna = YesNoAnswer.objects.create(
+            user=e_user,
+            question=NationalFrameworkQuestion.objects.first(),
+            short_answer=YesNoAnswerType.YES,
+        )
+        sca = SingleChoiceAnswer.objects.create(
+            user=e_user, question=EvolutionQuestion.objects.first()
+        )
+        # Emulate a database created before the discriminator existed.
+        Question.objects.update(submodel_type="")
+        Answer.objects.update(submodel_type="")
+        clear_submodel_type_cache()
+
+        # Run test.
+        call_command("backfill_submodel_types")
+
+        # Verify final expectations.
+        assert not Question.objects.filter(submodel_type="").exists()
+        assert not Answer.objects.filter(submodel_type="").exists()
+        for q_instance in EvolutionQuestion.objects.all():
+            assert (
+                Question.objects.get(pk=q_instance.pk).submodel_type
+                == "evolutionquestion"
+            )
+        assert Answer.objects.get(pk=yna.pk).submodel_type == "yesnoanswer"
+        assert Answer.objects.get(pk=sca.pk).submodel_type == "singlechoiceanswer"
+        assert get_submodel_type(Answer, sca.pk) == SingleChoiceAnswer
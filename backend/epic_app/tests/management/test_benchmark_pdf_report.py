@@ -0,0 +1,23 @@
+from io import StringIO
+
+from django.core.management import call_command
+
+from epic_app.serializers.report_pdf import EpicPdfReport
+
+
+class TestBenchmarkPdfReportCommand:
+    def test_all_toc_modes_are_measured(self):
+        # Run test.
+        output = StringIO()
+        call_command(
+            "benchmark_pdf_report",
+            "--programs=2",
+            "--questions=2",
+            "--justifications=1",
+            "--repeat=1",
+            stdout=output,
+        )
+
+        # Verify final expectations.
+        for toc in EpicPdfReport.toc_modes:
+            assert f"toc={toc}: " in output.getvalue()
@@ -0,0 +1,119 @@
+import zipfile
+from io import StringIO
+from pathlib import Path
+
+import pytest
+from django.core.management import call_command
+from django.core.management.base import CommandError
+
+from epic_app import report_builder
+from epic_app.models.epic_answers import YesNoAnswer, YesNoAnswerType
+from epic_app.models.epic_questions import NationalFrameworkQuestion
+from epic_app.models.epic_user import EpicUser
+from epic_app.models.models import Area, Program
+from epic_app.tests.epic_db_fixture import epic_test_db
+
+
+@pytest.mark.django_db
+class TestGeneratePdfReportBundleCommand:
+    @pytest.fixture(autouse=True)
+    def pdf_report_bundle_fixture(self, epic_test_db: pytest.fixture):
+        """
+        Answers all the national framework questions, of two programs, with 'Anakin'.
+
+        Args:
+            epic_test_db (pytest.fixture): Fixture to load for the whole file tests.
+        """
+        NationalFrameworkQuestion.objects.create(
+            title="Is there a framework?", program=Program.objects.last()
+        )
+        e_user = EpicUser.objects.get(username="Anakin")
+        for nfq in NationalFrameworkQuestion.objects.all():
+            YesNoAnswer.objects.create(
+                user=e_user, question=nfq, short_answer=YesNoAnswerType.YES
+            )
+        yield
+        report_builder.shutdown_bundle_pool()
+
+    @pytest.mark.parametrize("workers", [1, 2])
+    def test_one_document_per_program(self, workers: int, tmp_path: Path):
+        # Define test data.
+        output = tmp_path / "bundle.zip"
+        answered_programs = set(
+            NationalFrameworkQuestion.objects.values_list("program_id", flat=True)
+        )
+
+        # Run test.
+        call_command(
+            "generate_pdf_report_bundle",
+            str(output),
+            f"--workers={workers}",
+            "--toc=none",
+            stdout=StringIO(),
+        )
+
+        # Verify final expectations.
+        with zipfile.ZipFile(output) as bundle:
+            file_names = bundle.namelist()
+            assert len(answered_programs) == 2
+            assert {int(f_name.split("-")[1]) for f_name in file_names} == (
+                answered_programs
+            )
+            for f_name in file_names:
+                assert bundle.read(f_name).startswith(b"%PDF")
+
+    def test_bundles_reuse_the_worker_processes(self, tmp_path: Path):
+        # Define test data.
+        def generate_bundle(workers: int) -> report_builder.ProcessPoolExecutor:
+            call_command(
+                "generate_pdf_report_bundle",
+                str(tmp_path / "bundle.zip"),
+                f"--workers={workers}",
+                "--toc=none",
+                stdout=StringIO(),
+            )
+            return report_builder._bundle_pool
+
+        # Run test.
+        first_pool = generate_bundle(2)
+        second_pool = generate_bundle(2)
+        resized_pool = generate_bundle(3)
+
+        # Verify final expectations.
+        assert first_pool is not None
+        assert second_pool is first_pool
+        assert resized_pool is not first_pool
+
+    def test_one_document_per_area(self, tmp_path: Path):
+        # Define test data.
+        output = tmp_path / "bundle.zip"
+        answered_areas = set(
+            Area.objects.filter(
+                groups__programs__questions__in=NationalFrameworkQuestion.objects.all()
+            ).values_list("pk", flat=True)
+        )
+
+        # Run test.
+        call_command(
+            "generate_pdf_report_bundle",
+            str(output),
+            "--split=area",
+            "--toc=end",
+            "--filters=question_type=nationalframeworkquestion",
+            stdout=StringIO(),
+        )
+
+        # Verify final expectations.
+        with zipfile.ZipFile(output) as bundle:
+            assert {
+                int(f_name.split("-")[1]) for f_name in bundle.namelist()
+            } == answered_areas
+
+    def test_invalid_filters_raise(self, tmp_path: Path):
+        with pytest.raises(CommandError) as e_info:
+            call_command(
+                "generate_pdf_report_bundle",
+                str(tmp_path / "bundle.zip"),
+                "--filters=program=first",
+            )
+        assert str(e_info.value) == "`program` expects comma separated ids."
@@ -0,0 +1,43 @@
+import pytest
+from django.core.management import call_command
+
+from epic_app.models.epic_answers import SingleChoiceAnswer
+from epic_app.models.epic_questions import EvolutionChoiceType, EvolutionQuestion
+from epic_app.models.epic_summaries import AnswerSummary
+from epic_app.models.epic_user import EpicUser
+from epic_app.tests.epic_db_fixture import epic_test_db
+
+
+@pytest.mark.django_db
+class TestRebuildAnswerSummariesCommand:
+    def test_check_and_rebuild_restore_counters(
+        self, epic_test_db: pytest.fixture, capsys: pytest.CaptureFixture
+    ):
+        # Define test data.
+        eq = EvolutionQuestion.objects.first()
+        for e_user in EpicUser.objects.all():
+            SingleChoiceAnswer.objects.create(
+                user=e_user, question=eq, selected_choice=EvolutionChoiceType.NASCENT
+            )
+        expected_counters = set(
+            AnswerSummary.objects.values_list("question_id", "choice", "n_answers")
+        )
+        AnswerSummary.objects.all().delete()
+
+        # Run test.
+        call_command("rebuild_answer_summaries", "--check")
+        check_output = capsys.readouterr().out
+        call_command("rebuild_answer_summaries")
+        call_command("rebuild_answer_summaries", "--check")
+
+        # Verify final expectations.
+        assert "Inconsistent answer summaries" in check_output
+        assert "Answer summaries are consistent." in capsys.readouterr().out
+        assert expected_counters == {
+            (eq.pk, "*", EpicUser.objects.count()),
+            (eq.pk, EvolutionChoiceType.NASCENT, EpicUser.objects.count()),
+        }
+        assert (
+            set(AnswerSummary.objects.values_list("question_id", "choice", "n_answers"))
+            == expected_counters
+        )
@@ -0,0 +1,42 @@
+import pytest
+from django.core.management import call_command
+
+from epic_app.models.epic_answers import YesNoAnswer, YesNoAnswerType
+from epic_app.models.epic_questions import NationalFrameworkQuestion
+from epic_app.models.epic_summaries import UserProgress
+from epic_app.models.epic_user import EpicUser
+from epic_app.tests.epic_db_fixture import epic_test_db
+
+
+@pytest.mark.django_db
+class TestRebuildUserProgressCommand:
+    def test_check_and_rebuild_restore_progress(
+        self, epic_test_db: pytest.fixture, capsys: pytest.CaptureFixture
+    ):
+        # Define test data.
+        nfq = NationalFrameworkQuestion.objects.first()
+        for e_user in EpicUser.objects.all():
+            YesNoAnswer.objects.create(
+                user=e_user, question=nfq, short_answer=YesNoAnswerType.YES
+            )
+        expected_progress = set(
+            UserProgress.objects.values_list("user_id", "program_id", "n_valid")
+        )
+        UserProgress.objects.all().delete()
+
+        # Run test.
+        call_command("rebuild_user_progress", "--check")
+        check_output = capsys.readouterr().out
+        call_command("rebuild_user_progress")
+        call_command("rebuild_user_progress", "--check")
+
+        # Verify final expectations.
+        assert "Inconsistent user progress" in check_output
+        assert "User progress is consistent." in capsys.readouterr().out
+        assert expected_progress == {
+            (e_user.pk, nfq.program_id, 1) for e_user in EpicUser.objects.all()
+        }
+        assert (
+            set(UserProgress.objects.values_list("user_id", "program_id", "n_valid"))
+            == expected_progress
+        )
@@ -0,0 +1,63 @@
+import pytest
+from django.core.management import call_command
+
+from epic_app.models.epic_answers import YesNoAnswer, YesNoAnswerType
+from epic_app.models.epic_jobs import ReportJob, ReportJobStatus
+from epic_app.models.epic_questions import NationalFrameworkQuestion
+from epic_app.models.epic_user import EpicUser
+from epic_app.tests.epic_db_fixture import epic_test_db
+
+
+@pytest.mark.django_db
+class TestRunReportJobsCommand:
+    def test_pending_jobs_are_generated(self, epic_test_db: pytest.fixture):
+        # Define test data.
+        e_user = EpicUser.objects.get(username="Dooku")
+        organization_job, _ = ReportJob.enqueue(e_user, e_user.organization, "report-a")
+        all_job, _ = ReportJob.enqueue(e_user, None, "report-b")
+        unknown_job, _ = ReportJob.enqueue(
+            e_user, None, "report-c", report_format="doc"
+        )
+
+        # Run test.
+        call_command("run_report_jobs", "--once")
+
+        # Verify final expectations.
+        for report_job in [organization_job, all_job]:
+            report_job.refresh_from_db()
+            assert report_job.status == ReportJobStatus.DONE
+            assert bytes(report_job.artifact).startswith(b"%PDF")
+        unknown_job.refresh_from_db()
+        assert unknown_job.status == ReportJobStatus.FAILED
+        assert unknown_job.error == "Report format `doc` not supported."
+        assert ReportJob.claim_next() is None
+
+    def test_progress_is_updated_per_program(
+        self, epic_test_db: pytest.fixture, monkeypatch: pytest.MonkeyPatch
+    ):
+        # Define test data.
+        e_user = EpicUser.objects.get(username="Dooku")
+        for nfq in NationalFrameworkQuestion.objects.all():
+            YesNoAnswer.objects.create(
+                user=e_user, question=nfq, short_answer=YesNoAnswerType.YES
+            )
+        report_job, _ = ReportJob.enqueue(e_user, None, "report-a")
+        stored_progress = []
+        set_progress = ReportJob.set_progress
+
+        def store_progress(job: ReportJob, progress: float):
+            set_progress(job, progress)
+            stored_progress.append(ReportJob.objects.get(pk=job.pk).progress)
+
+        monkeypatch.setattr(ReportJob, "set_progress", store_progress)
+
+        # Run test.
+        call_command("run_report_jobs", "--once")
+
+        # Verify final expectations.
+        report_job.refresh_from_db()
+        assert report_job.status == ReportJobStatus.DONE
+        assert report_job.progress == 1
+        assert len(stored_progress) > 2
+        assert stored_progress == sorted(set(stored_progress))
+        assert 0 < stored_progress[0] < stored_progress[-1] == 1
@@ -1,8 +1,9 @@
 import itertools
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Type
 
 import pytest
-from django.db import IntegrityError
+from django.db import IntegrityError, connection
+from django.test.utils import CaptureQueriesContext
 
 from epic_app.models.epic_answers import (
     Answer,
@@ -19,9 +20,11 @@ from epic_app.models.epic_questions import (
     NationalFrameworkQuestion,
     Question,
 )
+from epic_app.models.epic_summaries import AnswerSummary, UserProgress
 from epic_app.models.epic_user import EpicUser
 from epic_app.models.models import Program
 from epic_app.tests.epic_db_fixture import epic_test_db
+from epic_app.utils import clear_submodel_type_cache, get_instances_as_submodel_type
 
 
 @pytest.fixture(autouse=True)
@@ -92,6 +95,79 @@ class TestEpicAnswers:
             == "Detailed summary only supported on inherited Answer classes."
         )
 
+    def _add_valid_and_invalid_answers(self):
+        """
+        Adds a valid and a not valid answer of each `Answer` subtype.
+        """
+        users = EpicUser.objects.order_by("pk")[:2]
+        for user, valid in zip(users, [True, False]):
+            YesNoAnswer.objects.create(
+                user=user,
+                question=NationalFrameworkQuestion.objects.first(),
+                short_answer=YesNoAnswerType.YES if valid else "",
+            )
+            SingleChoiceAnswer.objects.create(
+                user=user,
+                question=EvolutionQuestion.objects.first(),
+                selected_choice=EvolutionChoiceType.CAPABLE if valid else "",
+            )
+            mca = MultipleChoiceAnswer.objects.create(
+                user=user, question=LinkagesQuestion.objects.first()
+            )
+            if valid:
+                mca.selected_programs.set([1, 2])
+
+    def test_get_valid_answer_filter_matches_is_valid_answer(self):
+        # Define test data.
+        self._add_valid_and_invalid_answers()
+
+        # Run test.
+        valid_answers = set(
+            Answer.objects.filter(Answer.get_valid_answer_filter()).values_list(
+                "pk", flat=True
+            )
+        )
+
+        # Verify expectations.
+        for answer_type in get_subtypes(Answer):
+            answers = answer_type.objects.all()
+            assert set(
+                answers.filter(answer_type.get_valid_answer_filter()).values_list(
+                    "pk", flat=True
+                )
+            ) == {a.pk for a in answers if a.is_valid_answer()}
+        assert valid_answers == {
+            a.pk
+            for answer_type in get_subtypes(Answer)
+            for a in answer_type.objects.all()
+            if a.is_valid_answer()
+        }
+        assert len(valid_answers) == 3
+
+    @pytest.mark.parametrize("answer_type", [Answer] + get_subtypes(Answer))
+    def test_validity_queryset_matches_is_valid_answer(self, answer_type: Type[Answer]):
+        # Define test data.
+        self._add_valid_and_invalid_answers()
+        answers = answer_type.objects.all()
+        if answer_type is Answer:
+            answers = get_instances_as_submodel_type(answers)
+        expected_validity = {a.pk: a.is_valid_answer() for a in answers}
+
+        # Run test.
+        validity = dict(
+            answer_type.objects.with_validity().values_list("pk", "is_valid")
+        )
+        with CaptureQueriesContext(connection) as captured_queries:
+            n_invalid = answer_type.objects.invalid().count()
+
+        # Verify expectations.
+        assert validity == expected_validity
+        assert set(answer_type.objects.valid().values_list("pk", flat=True)) == {
+            a_id for a_id, is_valid in expected_validity.items() if is_valid
+        }
+        assert n_invalid == list(expected_validity.values()).count(False) > 0
+        assert len(captured_queries) == 1
+
     @pytest.mark.parametrize(
         "question_subtype",
         get_subtypes(Question),
@@ -117,6 +193,10 @@ class TestEpicAnswers:
             answer_instance.save()
             # Verify final expectations.
             assert answer_instance in list(answer_subtype.objects.all())
+            assert (
+                Answer.objects.get(pk=answer_instance.pk).submodel_type
+                == answer_subtype._meta.model_name
+            )
         else:
             # Run test
             with pytest.raises(IntegrityError) as ie_exc:
@@ -134,6 +214,174 @@ class TestEpicAnswers:
                 == f"Question type `{question_subtype.__name__}` not allowed. Supported types: [{supported_answers}]."
             )
 
+    @pytest.mark.parametrize(
+        "question_subtype, answer_subtype",
+        [
+            pytest.param(NationalFrameworkQuestion, YesNoAnswer),
+            pytest.param(KeyAgencyActionsQuestion, YesNoAnswer),
+            pytest.param(EvolutionQuestion, SingleChoiceAnswer),
+            pytest.param(LinkagesQuestion, MultipleChoiceAnswer),
+        ],
+    )
+    def test_check_question_integrity_does_not_query(
+        self,
+        question_subtype: Question,
+        answer_subtype: Answer,
+        django_assert_num_queries,
+    ):
+        # Define test data.
+        q_instance = question_subtype.objects.first()
+        answer_instance: Answer = answer_subtype(
+            question=Question.objects.get(pk=q_instance.pk),
+            user=EpicUser.objects.first(),
+        )
+        answer_instance.save()
+        stored_answer = answer_subtype.objects.get(pk=answer_instance.pk)
+
+        # Run test and verify expectations.
+        with django_assert_num_queries(0):
+            assert answer_instance._check_question_integrity()
+            assert stored_answer._check_question_integrity()
+
+    def test_validate_many_single_query(self, django_assert_num_queries):
+        # Define test data.
+        e_user = EpicUser.objects.first()
+        answers = []
+        for q_type, a_type in [
+            (NationalFrameworkQuestion, YesNoAnswer),
+            (KeyAgencyActionsQuestion, YesNoAnswer),
+            (EvolutionQuestion, SingleChoiceAnswer),
+            (LinkagesQuestion, MultipleChoiceAnswer),
+        ]:
+            answers.extend(
+                a_type(question_id=q.pk, user=e_user) for q in q_type.objects.all()
+            )
+        clear_submodel_type_cache()
+
+        # Run test and verify expectations.
+        with django_assert_num_queries(1):
+            Answer.validate_many(answers)
+
+    def test_validate_many_raises_on_unsupported_questions(self):
+        # Define test data.
+        e_user = EpicUser.objects.first()
+        nfq = NationalFrameworkQuestion.objects.first()
+        evq = EvolutionQuestion.objects.first()
+        answers = [
+            YesNoAnswer(question_id=nfq.pk, user=e_user),
+            YesNoAnswer(question_id=evq.pk, user=e_user),
+        ]
+
+        # Run test.
+        with pytest.raises(IntegrityError) as err_info:
+            Answer.validate_many(answers)
+
+        # Verify final expectations.
+        assert (
+            str(err_info.value)
+            == f"Question type not allowed for answers: [`YesNoAnswer` (question {evq.pk}: `EvolutionQuestion`)]."
+        )
+
+    def test_SAVE_answer_without_counted_changes_skips_counters(self):
+        # Define test data.
+        yna = YesNoAnswer.objects.create(
+            user=EpicUser.objects.get(username="Anakin"),
+            question=NationalFrameworkQuestion.objects.first(),
+            short_answer=YesNoAnswerType.YES,
+        )
+        counters = list(AnswerSummary.objects.values_list("choice", "n_answers"))
+
+        def get_saved_tables() -> List[str]:
+            with CaptureQueriesContext(connection) as captured:
+                yna.save()
+            return [
+                table
+                for table in ["answersummary", "userprogress", "epicdataversion"]
+                if any(f"epic_app_{table}" in query["sql"] for query in captured)
+            ]
+
+        # Run test.
+        yna.justify_answer = "Only the justification changed."
+        justified_tables = get_saved_tables()
+        unchanged_tables = get_saved_tables()
+        yna.short_answer = YesNoAnswerType.NO
+        answered_tables = get_saved_tables()
+
+        # Verify final expectations.
+        assert justified_tables == ["epicdataversion"]
+        assert unchanged_tables == []
+        assert answered_tables[0] == "answersummary"
+        assert answered_tables[-1] == "epicdataversion"
+        assert counters != list(
+            AnswerSummary.objects.values_list("choice", "n_answers")
+        )
+        assert UserProgress.get_inconsistencies() == []
+
+    def test_create_missing_answers(self):
+        # Define test data.
+        e_user = EpicUser.objects.get(username="Anakin")
+        nfq = NationalFrameworkQuestion.objects.first()
+        existing_answer = YesNoAnswer.objects.create(
+            user=e_user, question=nfq, short_answer=YesNoAnswerType.YES
+        )
+        questions = get_instances_as_submodel_type(Question.objects.all())
+
+        # Run test.
+        n_created = Answer.create_missing(e_user, questions)
+
+        # Verify final expectations.
+        assert n_created == len(questions) - 1
+        assert Answer.create_missing(e_user, questions) == 0
+        answers = get_instances_as_submodel_type(
+            Answer.objects.filter(user=e_user).order_by("question_id")
+        )
+        assert [a.question_id for a in answers] == sorted(q.pk for q in questions)
+        for answer in answers:
+            assert answer._check_question_integrity()
+            assert answer.submodel_type == answer._meta.model_name
+            if answer.pk != existing_answer.pk:
+                assert not answer.is_valid_answer()
+        assert YesNoAnswer.objects.get(pk=existing_answer.pk).short_answer == "Y"
+        assert (
+            AnswerSummary.objects.get(
+                question=nfq, choice=AnswerSummary.TOTAL_CHOICE
+            ).n_answers
+            == 1
+        )
+        assert UserProgress.get_inconsistencies() == []
+        user_progress = UserProgress.objects.get(user=e_user)
+        assert (user_progress.n_answered, user_progress.n_valid) == (
+            len(questions),
+            1,
+        )
+
+    def test_create_missing_answers_updates_summaries(self):
+        # Define test data.
+        e_users = list(EpicUser.objects.order_by("pk")[:2])
+        questions = get_instances_as_submodel_type(Question.objects.all())
+        YesNoAnswer.objects.create(
+            user=e_users[0], question=NationalFrameworkQuestion.objects.first()
+        )
+
+        # Run test.
+        for e_user in e_users:
+            Answer.create_missing(e_user, questions)
+
+        # Verify final expectations.
+        counters = sorted(
+            AnswerSummary.objects.values_list(
+                "question_id", "organization_id", "choice", "program_id", "n_answers"
+            ),
+            key=str,
+        )
+        AnswerSummary.rebuild()
+        assert counters == sorted(
+            AnswerSummary.objects.values_list(
+                "question_id", "organization_id", "choice", "program_id", "n_answers"
+            ),
+            key=str,
+        )
+
     @pytest.mark.parametrize(
         "question_subtype, answer_subtype",
         [
@@ -197,6 +445,23 @@ class TestSingleChoiceAnswer:
         sca.save()
         assert sca.is_valid_answer() == expected_result
 
+    @pytest.mark.parametrize(
+        "selected_choice, expected_text",
+        [
+            pytest.param("", "", id="No selected choice"),
+            pytest.param(
+                EvolutionChoiceType.CAPABLE,
+                EvolutionChoiceType.CAPABLE.label,
+                id="CAPABLE selected choice",
+            ),
+        ],
+    )
+    def test_singlechoiceanswer_get_answer_text(
+        self, selected_choice: str, expected_text: str
+    ):
+        sca = SingleChoiceAnswer(selected_choice=selected_choice)
+        assert sca.get_answer_text() == expected_text
+
     @pytest.mark.parametrize(
         "selected_choice",
         EvolutionChoiceType,
@@ -291,6 +556,18 @@ class TestYesNoAnswer:
         yna.save()
         assert yna.is_valid_answer() == expected_result
 
+    @pytest.mark.parametrize(
+        "yesno_answer, expected_text",
+        [
+            pytest.param(YesNoAnswerType.YES, "Yes", id="Yes answer"),
+            pytest.param(YesNoAnswerType.NO, "No", id="No answer"),
+            pytest.param("", "", id="Empty answer"),
+        ],
+    )
+    def test_yesnoanswer_get_answer_text(self, yesno_answer: str, expected_text: str):
+        yna = YesNoAnswer(short_answer=yesno_answer)
+        assert yna.get_answer_text() == expected_text
+
     @pytest.mark.parametrize(
         "short_answer",
         YesNoAnswerType,
@@ -335,6 +612,45 @@ class TestYesNoAnswer:
         # Verify expectations
         assert return_summary == expected_result
 
+    @pytest.mark.parametrize(
+        "justification_limits, expected_justifications",
+        [
+            pytest.param({}, ["Lorem ipsum", "Dolor"], id="No limits"),
+            pytest.param(dict(max_justifications=1), ["Lorem ipsum"], id="First one"),
+            pytest.param(
+                dict(max_justification_length=6),
+                ["Lorem…", "Dolor"],
+                id="Truncated",
+            ),
+            pytest.param(dict(max_justifications=0), [], id="None"),
+        ],
+    )
+    def test_yesnoanswer_get_detailed_summaries_with_justification_limits(
+        self, justification_limits: Dict[str, int], expected_justifications: List[str]
+    ):
+        # Define test data
+        YesNoAnswer.objects.all().delete()
+        a_yn_question = NationalFrameworkQuestion.objects.first()
+        for e_user, justify in zip(
+            EpicUser.objects.order_by("pk")[:3], ["Lorem ipsum", "", "Dolor"]
+        ):
+            YesNoAnswer.objects.create(
+                user=e_user,
+                question=a_yn_question,
+                short_answer=YesNoAnswerType.YES,
+                justify_answer=justify,
+            )
+
+        # Run test
+        return_summaries = YesNoAnswer.get_detailed_summaries(
+            YesNoAnswer.objects.all(), group_by="question_id", **justification_limits
+        )
+
+        # Verify expectations
+        q_summary = return_summaries[a_yn_question.pk]
+        assert q_summary["Yes"] == 3
+        assert q_summary["Yes_justify"] == expected_justifications
+
 
 @pytest.mark.django_db
 class TestMultipleChoiceAnswer:
@@ -360,6 +676,19 @@ class TestMultipleChoiceAnswer:
         mca.save()
         assert mca.is_valid_answer() == expected_result
 
+    def test_multiplechoiceanswer_get_answer_text(self):
+        an_user: EpicUser = EpicUser.objects.first()
+        MultipleChoiceAnswer.objects.all().delete()
+        a_lnk_question = LinkagesQuestion.objects.first()
+        mca = MultipleChoiceAnswer.objects.create(user=an_user, question=a_lnk_question)
+        assert mca.get_answer_text() == ""
+        mca.selected_programs.set([2, 1])
+        assert mca.get_answer_text() == ", ".join(
+            Program.objects.filter(pk__in=[1, 2])
+            .order_by("name")
+            .values_list("name", flat=True)
+        )
+
     @pytest.mark.parametrize(
         "selected_programs",
         [
@@ -392,3 +721,55 @@ class TestMultipleChoiceAnswer:
 
         # Verify final expectations
         assert detailed_summary == expected_result
+
+    @pytest.mark.parametrize(
+        "max_choices, expected_summary",
+        [
+            pytest.param(
+                1,
+                {"c": 3, "other_programs": 4, "no_valid_response": 1},
+                id="Top one",
+            ),
+            pytest.param(
+                3,
+                {"c": 3, "b": 2, "d": 1, "other_programs": 1, "no_valid_response": 1},
+                id="Tie keeps first selected",
+            ),
+            pytest.param(
+                4,
+                {"c": 3, "b": 2, "d": 1, "e": 1, "no_valid_response": 1},
+                id="Nothing to limit",
+            ),
+        ],
+    )
+    @pytest.mark.parametrize("group_by", [None, "question_id"])
+    def test_multiplechoiceanswer_get_detailed_summaries_with_max_choices(
+        self,
+        max_choices: int,
+        expected_summary: Dict[str, int],
+        group_by: Optional[str],
+    ):
+        # Define test data.
+        MultipleChoiceAnswer.objects.all().delete()
+        lnk_question = LinkagesQuestion.objects.first()
+        e_users = list(EpicUser.objects.order_by("pk")[:3])
+        e_users.append(EpicUser.objects.create(username="Yoda"))
+        for e_user, p_names in zip(
+            e_users, [["b", "c"], ["c", "d"], ["c", "b", "e"], []]
+        ):
+            mca = MultipleChoiceAnswer.objects.create(
+                user=e_user, question=lnk_question
+            )
+            mca.selected_programs.set(Program.objects.filter(name__in=p_names))
+
+        # Run test.
+        summaries = MultipleChoiceAnswer.get_detailed_summaries(
+            MultipleChoiceAnswer.objects.all(),
+            group_by=group_by,
+            max_choices=max_choices,
+        )
+
+        # Verify expectations.
+        group_value = lnk_question.pk if group_by else None
+        assert list(summaries) == [group_value]
+        assert list(summaries[group_value].items()) == list(expected_summary.items())
@@ -0,0 +1,144 @@
+from datetime import timedelta
+
+import pytest
+from django.contrib.auth.models import User
+from django.utils import timezone
+
+from epic_app.models.epic_jobs import ReportJob, ReportJobStatus
+from epic_app.models.epic_user import EpicUser
+from epic_app.tests.epic_db_fixture import epic_test_db
+
+
+@pytest.mark.django_db
+class TestReportJob:
+    @pytest.fixture(autouse=True)
+    def _report_job_fixture(self, epic_test_db: pytest.fixture):
+        pass
+
+    def _enqueue(self, report_key: str = "report-a") -> ReportJob:
+        e_user = EpicUser.objects.get(username="Dooku")
+        report_job, _ = ReportJob.enqueue(e_user, e_user.organization, report_key)
+        return report_job
+
+    def test_identical_requests_are_deduplicated(self):
+        # Define test data.
+        e_user = EpicUser.objects.get(username="Dooku")
+        first_job, first_created = ReportJob.enqueue(
+            e_user, e_user.organization, "report-a"
+        )
+
+        # Run test.
+        pending_job, pending_created = ReportJob.enqueue(
+            e_user, e_user.organization, "report-a"
+        )
+        other_job, other_created = ReportJob.enqueue(
+            e_user, e_user.organization, "report-b"
+        )
+        assert ReportJob.claim_next() == first_job
+        first_job.finish(error="Lorem ipsum")
+        retried_job, retried_created = ReportJob.enqueue(
+            e_user, e_user.organization, "report-a"
+        )
+
+        # Verify expectations.
+        assert first_created and other_created and retried_created
+        assert not pending_created
+        assert pending_job == first_job
+        assert other_job != first_job
+        assert retried_job != first_job
+
+    def test_finished_jobs_are_reused_until_expired(self):
+        # Define test data.
+        report_job = self._enqueue()
+        ReportJob.claim_next()
+        report_job.finish(b"%PDF")
+
+        # Verify expectations.
+        assert self._enqueue() == report_job
+        ReportJob.objects.filter(pk=report_job.pk).update(expires_at=timezone.now())
+        assert self._enqueue() != report_job
+
+    def test_jobs_are_claimed_once_in_order(self):
+        # Define test data.
+        first_job = self._enqueue("report-a")
+        second_job = self._enqueue("report-b")
+
+        # Run test.
+        claimed_jobs = [ReportJob.claim_next() for _ in range(3)]
+
+        # Verify expectations.
+        assert claimed_jobs == [first_job, second_job, None]
+        assert all(
+            report_job.status == ReportJobStatus.RUNNING and report_job.started_at
+            for report_job in claimed_jobs[:2]
+        )
+
+    def test_finish_starts_retention(self, settings: pytest.fixture):
+        # Define test data.
+        settings.EPIC_REPORT_JOB_RETENTION = 60
+        self._enqueue()
+        report_job = ReportJob.claim_next()
+        report_job.set_progress(0.5)
+
+        # Run test.
+        assert report_job.finish(b"%PDF")
+        report_job.refresh_from_db()
+
+        # Verify expectations.
+        assert report_job.status == ReportJobStatus.DONE
+        assert report_job.progress == 1
+        assert bytes(report_job.artifact) == b"%PDF"
+        assert report_job.expires_at - report_job.finished_at == timedelta(seconds=60)
+        assert not report_job.is_expired
+
+    def test_stale_jobs_fail(self):
+        # Define test data.
+        report_job = self._enqueue()
+        ReportJob.claim_next()
+        ReportJob.objects.filter(pk=report_job.pk).update(
+            started_at=timezone.now() - timedelta(hours=2)
+        )
+
+        # Run test.
+        assert ReportJob.fail_stale(timedelta(hours=3)) == 0
+        assert ReportJob.fail_stale(timedelta(hours=1)) == 1
+
+        # Verify expectations.
+        report_job.refresh_from_db()
+        assert report_job.status == ReportJobStatus.FAILED
+        assert report_job.error
+
+    def test_stale_jobs_are_not_finished(self):
+        # Define test data.
+        report_job = self._enqueue()
+        ReportJob.claim_next()
+        ReportJob.objects.filter(pk=report_job.pk).update(
+            started_at=timezone.now() - timedelta(hours=2)
+        )
+        ReportJob.fail_stale(timedelta(hours=1))
+
+        # Run test.
+        finished = report_job.finish(b"%PDF")
+
+        # Verify expectations.
+        assert not finished
+        assert report_job.status == ReportJobStatus.FAILED
+        report_job.refresh_from_db()
+        assert report_job.status == ReportJobStatus.FAILED
+        assert report_job.error == "The report generation timed out."
+        assert report_job.artifact is None
+
+    def test_purge_expired_removes_jobs(self):
+        # Define test data.
+        expired_job = self._enqueue("report-a")
+        ReportJob.claim_next()
+        expired_job.finish(b"%PDF")
+        ReportJob.objects.filter(pk=expired_job.pk).update(expires_at=timezone.now())
+        pending_job = self._enqueue("report-b")
+
+        # Run test.
+        assert ReportJob.purge_expired() == 1
+
+        # Verify expectations.
+        assert list(ReportJob.objects.all()) == [pending_job]
+        assert User.objects.filter(username="Dooku").exists()
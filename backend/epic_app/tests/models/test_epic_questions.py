@@ -38,8 +38,23 @@ class TestQuestion:
 
         # Verify final expectations
         assert Question.objects.filter(title=q_title, program=q_program).exists()
+        assert q_created.submodel_type == ""
         assert str(q_created) == q_title[0:15]
 
+    @pytest.mark.parametrize(
+        "question_type",
+        [
+            NationalFrameworkQuestion,
+            KeyAgencyActionsQuestion,
+            EvolutionQuestion,
+            LinkagesQuestion,
+        ],
+    )
+    def test_question_subtype_stores_submodel_type(self, question_type: Question):
+        for q_instance in question_type.objects.all():
+            base_question = Question.objects.get(pk=q_instance.pk)
+            assert base_question.submodel_type == question_type._meta.model_name
+
     def test_delete_question_program_deletes_in_cascade(self):
         # Define data
         q_title = "Aliqua culpa consequat eiusmod eu voluptate quis proident."
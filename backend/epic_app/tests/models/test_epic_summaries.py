@@ -0,0 +1,499 @@
+from typing import List, Optional, Tuple
+
+import pytest
+from django.db import IntegrityError, connection, models, transaction
+from django.test.utils import CaptureQueriesContext
+
+from epic_app.models.epic_answers import (
+    Answer,
+    MultipleChoiceAnswer,
+    SingleChoiceAnswer,
+    YesNoAnswer,
+    YesNoAnswerType,
+)
+from epic_app.models.epic_questions import (
+    EvolutionChoiceType,
+    EvolutionQuestion,
+    LinkagesQuestion,
+    NationalFrameworkQuestion,
+    Question,
+)
+from epic_app.models.epic_summaries import AnswerSummary, UserProgress
+from epic_app.models.epic_user import EpicOrganization, EpicUser
+from epic_app.models.models import Area, Program
+from epic_app.tests.epic_db_fixture import epic_test_db
+
+
+def _get_counters() -> List[Tuple]:
+    return sorted(
+        AnswerSummary.objects.values_list(
+            "question_id",
+            "organization_id",
+            "choice",
+            "program_id",
+            "n_answers",
+            "first_answer",
+        ),
+        key=str,
+    )
+
+
+def _get_rebuilt_counters() -> List[Tuple]:
+    AnswerSummary.rebuild()
+    return _get_counters()
+
+
+@pytest.mark.django_db
+class TestAnswerSummary:
+    @pytest.fixture(autouse=True)
+    def _summary_fixture(self, epic_test_db: pytest.fixture):
+        pass
+
+    def test_choice_answers_are_counted(self):
+        # Define test data.
+        anakin = EpicUser.objects.get(username="Anakin")
+        nfq = NationalFrameworkQuestion.objects.first()
+        yna = YesNoAnswer.objects.create(user=anakin, question=nfq)
+        counters = _get_counters()
+
+        # Verify expectations.
+        assert counters == [
+            (nfq.pk, anakin.organization_id, "", None, 1, None),
+            (nfq.pk, anakin.organization_id, "*", None, 1, None),
+        ]
+        yna.short_answer = YesNoAnswerType.YES
+        yna.save()
+        assert _get_counters() == [
+            (nfq.pk, anakin.organization_id, "*", None, 1, None),
+            (nfq.pk, anakin.organization_id, "Y", None, 1, None),
+        ]
+        assert _get_counters() == _get_rebuilt_counters()
+
+    def test_deleted_answers_are_not_counted(self):
+        # Define test data.
+        anakin = EpicUser.objects.get(username="Anakin")
+        sca = SingleChoiceAnswer.objects.create(
+            user=anakin,
+            question=EvolutionQuestion.objects.first(),
+            selected_choice=EvolutionChoiceType.CAPABLE,
+        )
+        mca = MultipleChoiceAnswer.objects.create(
+            user=anakin, question=LinkagesQuestion.objects.first()
+        )
+        mca.selected_programs.set([1, 2])
+
+        # Run test.
+        sca.delete()
+        Answer.objects.filter(pk=mca.pk).delete()
+
+        # Verify expectations.
+        assert _get_counters() == []
+
+    def test_selected_programs_are_counted(self):
+        # Define test data.
+        lq = LinkagesQuestion.objects.first()
+        org_id = EpicOrganization.objects.first().pk
+        mca_list = [
+            MultipleChoiceAnswer.objects.create(user=e_user, question=lq)
+            for e_user in EpicUser.objects.order_by("pk")
+        ]
+
+        # Run test.
+        mca_list[0].selected_programs.add(3, 1)
+        mca_list[1].selected_programs.set([2, 3])
+        mca_list[1].selected_programs.add(2)
+        Program.objects.get(pk=4).selected_answers.add(mca_list[2])
+
+        # Verify expectations.
+        assert _get_counters() == [
+            (lq.pk, org_id, "", 1, 1, mca_list[0].pk),
+            (lq.pk, org_id, "", 2, 1, mca_list[1].pk),
+            (lq.pk, org_id, "", 3, 2, mca_list[0].pk),
+            (lq.pk, org_id, "", 4, 1, mca_list[2].pk),
+            (lq.pk, org_id, "*", None, 3, None),
+        ]
+        assert _get_counters() == _get_rebuilt_counters()
+
+    def test_removed_programs_are_not_counted(self):
+        # Define test data.
+        lq = LinkagesQuestion.objects.first()
+        org_id = EpicOrganization.objects.first().pk
+        mca_list = [
+            MultipleChoiceAnswer.objects.create(user=e_user, question=lq)
+            for e_user in EpicUser.objects.order_by("pk")
+        ]
+        for mca in mca_list:
+            mca.selected_programs.set([1, 2])
+
+        # Run test.
+        mca_list[0].selected_programs.remove(1, 5)
+        mca_list[1].selected_programs.clear()
+        Program.objects.get(pk=2).selected_answers.remove(mca_list[2])
+
+        # Verify expectations.
+        assert _get_counters() == [
+            (lq.pk, org_id, "", 1, 1, mca_list[2].pk),
+            (lq.pk, org_id, "", 2, 1, mca_list[0].pk),
+            (lq.pk, org_id, "", None, 1, None),
+            (lq.pk, org_id, "*", None, 3, None),
+        ]
+        assert _get_counters() == _get_rebuilt_counters()
+
+    def test_selections_of_deleted_programs_are_not_counted(self):
+        # Define test data.
+        lq = LinkagesQuestion.objects.first()
+        anakin = EpicUser.objects.get(username="Anakin")
+        mca = MultipleChoiceAnswer.objects.create(user=anakin, question=lq)
+        mca.selected_programs.set([2])
+
+        # Run test.
+        Program.objects.get(pk=2).delete()
+
+        # Verify expectations.
+        assert _get_counters() == [
+            (lq.pk, anakin.organization_id, "", None, 1, None),
+            (lq.pk, anakin.organization_id, "*", None, 1, None),
+        ]
+        assert _get_counters() == _get_rebuilt_counters()
+
+    def test_cascaded_answers_are_deleted_in_one_batch(self):
+        def count_deletion_queries() -> int:
+            with transaction.atomic():
+                with CaptureQueriesContext(connection) as captured:
+                    Area.objects.all().delete()
+                transaction.set_rollback(True)
+            return len(captured)
+
+        # Define test data.
+        questions = list(Question.objects.filter(program_id=1))
+        users = list(EpicUser.objects.order_by("pk"))
+        Answer.create_missing(users[0], questions)
+        n_queries = count_deletion_queries()
+        for e_user in users[1:]:
+            Answer.create_missing(e_user, questions)
+
+        # Run test.
+        assert count_deletion_queries() == n_queries
+        Area.objects.all().delete()
+
+        # Verify expectations.
+        assert not Answer.objects.exists()
+        assert _get_counters() == []
+        assert not UserProgress.objects.exists()
+
+    def test_cascaded_deletes_only_rebuild_their_counters(self):
+        def get_summary_pks(**kwargs) -> List[int]:
+            return sorted(
+                AnswerSummary.objects.filter(**kwargs).values_list("pk", flat=True)
+            )
+
+        def get_progress_pks(**kwargs) -> List[int]:
+            return sorted(
+                UserProgress.objects.filter(**kwargs).values_list("pk", flat=True)
+            )
+
+        # Define test data.
+        anakin = EpicUser.objects.get(username="Anakin")
+        rebels = EpicOrganization.objects.create(name="Rebel Alliance")
+        yoda = EpicUser.objects.create(username="Yoda", organization=rebels)
+        b_program = Program.objects.get(name="b")
+        bq = NationalFrameworkQuestion.objects.create(
+            title="Is there a framework?", program=b_program
+        )
+        for e_user in [anakin, yoda]:
+            Answer.create_missing(e_user, list(Question.objects.all()))
+        rebels_summaries = get_summary_pks(organization=rebels)
+        yoda_progress = get_progress_pks(user=yoda)
+
+        # Run test.
+        anakin.delete()
+
+        # Verify expectations.
+        assert get_summary_pks(organization=rebels) == rebels_summaries
+        assert get_progress_pks(user=yoda) == yoda_progress
+        assert _get_counters() == _get_rebuilt_counters()
+        assert UserProgress.get_inconsistencies() == []
+
+        # Run test.
+        other_summaries = get_summary_pks(question__program__in=[1])
+        other_progress = get_progress_pks(program__in=[1])
+        bq.delete()
+
+        # Verify expectations.
+        assert get_summary_pks(question__program__in=[1]) == other_summaries
+        assert get_progress_pks(program__in=[1]) == other_progress
+        assert _get_counters() == _get_rebuilt_counters()
+        assert UserProgress.get_inconsistencies() == []
+
+    def test_answers_of_users_without_organization_are_counted(self):
+        # Define test data.
+        e_user = EpicUser.objects.create(username="Yoda")
+        nfq = NationalFrameworkQuestion.objects.first()
+
+        # Run test.
+        YesNoAnswer.objects.create(
+            user=e_user, question=nfq, short_answer=YesNoAnswerType.NO
+        )
+
+        # Verify expectations.
+        assert _get_counters() == [
+            (nfq.pk, None, "*", None, 1, None),
+            (nfq.pk, None, "N", None, 1, None),
+        ]
+        e_user.delete()
+        assert _get_counters() == []
+
+    def test_answers_are_counted_in_the_current_organization_of_their_user(self):
+        # Define test data.
+        anakin = EpicUser.objects.get(username="Anakin")
+        palpatine = EpicUser.objects.get(username="Palpatine")
+        empire_id = anakin.organization_id
+        rebels = EpicOrganization.objects.create(name="Rebel Alliance")
+        nfq = NationalFrameworkQuestion.objects.first()
+        lq = LinkagesQuestion.objects.first()
+        for e_user in [anakin, palpatine]:
+            YesNoAnswer.objects.create(
+                user=e_user, question=nfq, short_answer=YesNoAnswerType.YES
+            )
+            MultipleChoiceAnswer.objects.create(
+                user=e_user, question=lq
+            ).selected_programs.set([2])
+
+        # Run test.
+        anakin.organization = rebels
+        anakin.save()
+
+        # Verify expectations.
+        assert {o_id for _, o_id, *_ in _get_counters()} == {empire_id, rebels.pk}
+        assert _get_counters() == _get_rebuilt_counters()
+        anakin.organization = None
+        anakin.save()
+        assert {o_id for _, o_id, *_ in _get_counters()} == {empire_id, None}
+        assert _get_counters() == _get_rebuilt_counters()
+
+    def test_rebuild_restores_bulk_updates(self):
+        # Define test data.
+        anakin = EpicUser.objects.get(username="Anakin")
+        nfq = NationalFrameworkQuestion.objects.first()
+        YesNoAnswer.objects.create(user=anakin, question=nfq)
+        YesNoAnswer.objects.update(short_answer=YesNoAnswerType.YES)
+
+        # Run test.
+        inconsistencies = AnswerSummary.get_inconsistencies()
+        AnswerSummary.rebuild()
+
+        # Verify expectations.
+        assert inconsistencies == [
+            (nfq.pk, anakin.organization_id, "", None),
+            (nfq.pk, anakin.organization_id, "Y", None),
+        ]
+        assert _get_counters() == [
+            (nfq.pk, anakin.organization_id, "*", None, 1, None),
+            (nfq.pk, anakin.organization_id, "Y", None, 1, None),
+        ]
+        assert AnswerSummary.get_inconsistencies() == []
+
+    @pytest.mark.parametrize(
+        "organization_id, program_id",
+        [
+            pytest.param(1, 1, id="Organization and program"),
+            pytest.param(1, None, id="Organization"),
+            pytest.param(None, 1, id="Program"),
+            pytest.param(None, None, id="Neither"),
+        ],
+    )
+    def test_counters_are_unique_with_null_columns(
+        self, organization_id: Optional[int], program_id: Optional[int]
+    ):
+        # Define test data.
+        lq = LinkagesQuestion.objects.first()
+        counter = dict(
+            question_id=lq.pk,
+            organization_id=organization_id,
+            choice="",
+            program_id=program_id,
+        )
+        AnswerSummary.objects.create(**counter, n_answers=1)
+
+        # Run test and verify expectations.
+        with pytest.raises(IntegrityError), transaction.atomic():
+            AnswerSummary.objects.create(**counter, n_answers=1)
+
+    def test_concurrently_created_counter_gets_the_answers(
+        self, monkeypatch: pytest.MonkeyPatch
+    ):
+        # Define test data.
+        nfq = NationalFrameworkQuestion.objects.first()
+        AnswerSummary.objects.create(question=nfq, choice="Y", n_answers=1)
+        queryset_update = models.QuerySet.update
+        n_updates = [0]
+
+        def update(queryset: models.QuerySet, **kwargs) -> int:
+            # The counter does not exist yet on the first update, a concurrent transaction creates it right after.
+            n_updates[0] += 1
+            if n_updates[0] == 1:
+                return 0
+            return queryset_update(queryset, **kwargs)
+
+        monkeypatch.setattr(models.QuerySet, "update", update)
+
+        # Run test.
+        AnswerSummary.add_answers(nfq.pk, None, "Y", 2)
+
+        # Verify expectations.
+        assert _get_counters() == [(nfq.pk, None, "Y", None, 3, None)]
+
+    def test_concurrently_created_counters_get_the_many_answers(
+        self, monkeypatch: pytest.MonkeyPatch
+    ):
+        # Define test data.
+        nfq, other_nfq = NationalFrameworkQuestion.objects.order_by("pk")[:2]
+        AnswerSummary.objects.create(question=nfq, choice="Y", n_answers=1)
+        manager_filter = AnswerSummary.objects.filter
+        n_filters = [0]
+
+        def filter_rows(*args, **kwargs) -> models.QuerySet:
+            # The counters do not exist yet when read, a concurrent transaction creates one right after.
+            n_filters[0] += 1
+            if n_filters[0] == 1:
+                return AnswerSummary.objects.none()
+            return manager_filter(*args, **kwargs)
+
+        monkeypatch.setattr(AnswerSummary.objects, "filter", filter_rows)
+
+        # Run test.
+        AnswerSummary.add_many_answers(
+            {(nfq.pk, None, "Y"): 2, (other_nfq.pk, None, "Y"): 1}
+        )
+
+        # Verify expectations.
+        assert _get_counters() == sorted(
+            [
+                (nfq.pk, None, "Y", None, 3, None),
+                (other_nfq.pk, None, "Y", None, 1, None),
+            ],
+            key=str,
+        )
+
+
+def _get_progress() -> List[Tuple]:
+    return sorted(
+        UserProgress.objects.values_list(
+            "user_id", "program_id", "n_questions", "n_answered", "n_valid"
+        )
+    )
+
+
+@pytest.mark.django_db
+class TestUserProgress:
+    @pytest.fixture(autouse=True)
+    def _progress_fixture(self, epic_test_db: pytest.fixture):
+        pass
+
+    def test_answers_are_counted(self):
+        # Define test data.
+        anakin = EpicUser.objects.get(username="Anakin")
+        nfq = NationalFrameworkQuestion.objects.first()
+        n_questions = nfq.program.questions.count()
+
+        # Run test.
+        yna = YesNoAnswer.objects.create(user=anakin, question=nfq)
+
+        # Verify expectations.
+        assert _get_progress() == [(anakin.pk, nfq.program_id, n_questions, 1, 0)]
+        yna.short_answer = YesNoAnswerType.YES
+        yna.save()
+        assert _get_progress() == [(anakin.pk, nfq.program_id, n_questions, 1, 1)]
+        assert UserProgress.objects.get().progress == 1 / n_questions
+        assert UserProgress.get_inconsistencies() == []
+        yna.delete()
+        assert _get_progress() == []
+
+    def test_selected_programs_are_counted(self):
+        # Define test data.
+        lq = LinkagesQuestion.objects.first()
+        users = list(EpicUser.objects.order_by("pk")[:3])
+        mca_list = [
+            MultipleChoiceAnswer.objects.create(user=e_user, question=lq)
+            for e_user in users
+        ]
+
+        # Run test.
+        mca_list[0].selected_programs.add(1, 2)
+        mca_list[0].selected_programs.remove(1)
+        mca_list[1].selected_programs.set([1])
+        mca_list[1].selected_programs.clear()
+        Program.objects.get(pk=2).selected_answers.add(mca_list[2])
+
+        # Verify expectations.
+        assert [p_row[-1] for p_row in _get_progress()] == [1, 0, 1]
+        assert UserProgress.get_inconsistencies() == []
+        Program.objects.get(pk=2).selected_answers.clear()
+        assert [p_row[-1] for p_row in _get_progress()] == [0, 0, 0]
+        assert UserProgress.get_inconsistencies() == []
+
+    def test_selections_of_deleted_programs_are_not_counted(self):
+        # Define test data.
+        lq = LinkagesQuestion.objects.first()
+        users = list(EpicUser.objects.order_by("pk")[:2])
+        mca_list = [
+            MultipleChoiceAnswer.objects.create(user=e_user, question=lq)
+            for e_user in users
+        ]
+        mca_list[0].selected_programs.set([2])
+        mca_list[1].selected_programs.set([2, 3])
+
+        # Run test.
+        Program.objects.get(pk=2).delete()
+
+        # Verify expectations.
+        assert [p_row[-1] for p_row in _get_progress()] == [0, 1]
+        assert UserProgress.get_inconsistencies() == []
+
+    def test_questions_are_counted(self):
+        # Define test data.
+        anakin = EpicUser.objects.get(username="Anakin")
+        nfq = NationalFrameworkQuestion.objects.first()
+        YesNoAnswer.objects.create(
+            user=anakin, question=nfq, short_answer=YesNoAnswerType.NO
+        )
+        n_questions = nfq.program.questions.count()
+
+        # Run test.
+        new_nfq = NationalFrameworkQuestion.objects.create(
+            title="Lorem ipsum?", program=nfq.program
+        )
+
+        # Verify expectations.
+        assert _get_progress() == [(anakin.pk, nfq.program_id, n_questions + 1, 1, 1)]
+        new_nfq.delete()
+        assert _get_progress() == [(anakin.pk, nfq.program_id, n_questions, 1, 1)]
+        nfq.delete()
+        assert _get_progress() == []
+        assert UserProgress.get_inconsistencies() == []
+
+    def test_rebuild_restores_bulk_updates(self):
+        # Define test data.
+        anakin = EpicUser.objects.get(username="Anakin")
+        for eq in EvolutionQuestion.objects.all():
+            SingleChoiceAnswer.objects.create(user=anakin, question=eq)
+        SingleChoiceAnswer.objects.update(selected_choice=EvolutionChoiceType.ENGAGED)
+        program_id = EvolutionQuestion.objects.first().program_id
+
+        # Run test.
+        inconsistencies = UserProgress.get_inconsistencies()
+        UserProgress.rebuild()
+
+        # Verify expectations.
+        assert inconsistencies == [(anakin.pk, program_id)]
+        n_evolution = EvolutionQuestion.objects.count()
+        assert _get_progress() == [
+            (
+                anakin.pk,
+                program_id,
+                Question.objects.filter(program=program_id).count(),
+                n_evolution,
+                n_evolution,
+            )
+        ]
+        assert UserProgress.get_inconsistencies() == []
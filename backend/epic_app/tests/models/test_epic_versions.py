@@ -0,0 +1,71 @@
+import pytest
+
+from epic_app.models.epic_answers import MultipleChoiceAnswer, YesNoAnswer
+from epic_app.models.epic_questions import LinkagesQuestion, NationalFrameworkQuestion
+from epic_app.models.epic_user import EpicUser
+from epic_app.models.epic_versions import EpicDataVersion
+from epic_app.models.models import Agency, Area, Program
+from epic_app.tests.epic_db_fixture import epic_test_db
+
+
+def _get_version(name: str) -> int:
+    return EpicDataVersion.get_versions(name)[name][0]
+
+
+@pytest.mark.django_db
+class TestEpicDataVersion:
+    def test_increase(self):
+        assert EpicDataVersion.get_versions("dummy") == {"dummy": (0, None)}
+        EpicDataVersion.increase("dummy")
+        EpicDataVersion.increase("dummy")
+        version, last_modified = EpicDataVersion.get_versions("dummy")["dummy"]
+        assert version == 2
+        assert last_modified is not None
+
+    def test_answer_writes_increase_answers_version(self, epic_test_db: pytest.fixture):
+        e_user = EpicUser.objects.first()
+        domain_version = _get_version(EpicDataVersion.DOMAIN)
+        answers_version = _get_version(EpicDataVersion.ANSWERS)
+
+        # Create, update, select and remove answers.
+        yna = YesNoAnswer.objects.create(
+            user=e_user, question=NationalFrameworkQuestion.objects.first()
+        )
+        yna.save()
+        yna.justify_answer = "Lorem ipsum"
+        yna.save()
+        mca = MultipleChoiceAnswer.objects.create(
+            user=e_user, question=LinkagesQuestion.objects.first()
+        )
+        mca.selected_programs.add(1)
+        mca.selected_programs.clear()
+        yna.delete()
+
+        # Verify expectations.
+        assert _get_version(EpicDataVersion.ANSWERS) == answers_version + 6
+        assert _get_version(EpicDataVersion.DOMAIN) == domain_version
+
+    def test_domain_writes_increase_domain_version(self, epic_test_db: pytest.fixture):
+        domain_version = _get_version(EpicDataVersion.DOMAIN)
+        Program.objects.create(
+            name="f", description="Lorem ipsum", group=Program.objects.first().group
+        )
+        assert _get_version(EpicDataVersion.DOMAIN) == domain_version + 1
+
+    def test_catalogue_writes_increase_catalogue_version(
+        self, epic_test_db: pytest.fixture
+    ):
+        # Define test data.
+        catalogue_version = _get_version(EpicDataVersion.CATALOGUE)
+        program = Program.objects.first()
+
+        # Create an area, link an agency and answer a question.
+        Area.objects.create(name="Lorem")
+        program.agencies.add(Agency.objects.create(name="Ipsum"))
+        YesNoAnswer.objects.create(
+            user=EpicUser.objects.first(),
+            question=NationalFrameworkQuestion.objects.first(),
+        )
+
+        # Verify expectations.
+        assert _get_version(EpicDataVersion.CATALOGUE) == catalogue_version + 3
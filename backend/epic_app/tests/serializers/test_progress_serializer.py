@@ -1,17 +1,32 @@
 from multiprocessing.sharedctypes import Value
 
 import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from rest_framework import serializers
 
-from epic_app.models.epic_answers import YesNoAnswer
-from epic_app.models.epic_questions import NationalFrameworkQuestion, Question
+from epic_app.models.epic_answers import (
+    Answer,
+    MultipleChoiceAnswer,
+    SingleChoiceAnswer,
+    YesNoAnswer,
+    YesNoAnswerType,
+)
+from epic_app.models.epic_questions import (
+    EvolutionChoiceType,
+    NationalFrameworkQuestion,
+    Question,
+)
 from epic_app.models.epic_user import EpicUser
 from epic_app.models.models import Program
 from epic_app.serializers.progress_serializer import (
+    ProgramsProgressSerializer,
     ProgressSerializer,
     _QuestionAnswerSerializer,
 )
+from epic_app.submodel_registry import get_registry
 from epic_app.tests.epic_db_fixture import epic_test_db
+from epic_app.utils import get_instances_as_submodel_type, get_submodel_type
 
 
 @pytest.mark.django_db
@@ -27,7 +42,7 @@ class TestQuestionAnswerSerializer:
             question=q_instance, user=a_user
         )
         serializer = _QuestionAnswerSerializer()
-        json_dict = serializer.to_representation((q_instance, a_instance))
+        json_dict = serializer.to_representation((q_instance, a_instance.id))
         assert json_dict == dict(question=q_instance.id, answer=a_instance.id)
 
     def test_to_representation_invalid_question(self, epic_test_db):
@@ -38,7 +53,7 @@ class TestQuestionAnswerSerializer:
         )
         serializer = _QuestionAnswerSerializer()
         with pytest.raises(ValueError) as err_info:
-            serializer.to_representation((None, a_instance))
+            serializer.to_representation((None, a_instance.id))
         assert str(err_info.value) == "No valid question provided."
 
     def test_to_representation_no_answer(self, epic_test_db):
@@ -104,3 +119,86 @@ class TestProgressSerializer:
         assert isinstance(qa_list, list)
         assert list(qa_list[0].keys()) == ["question", "answer"]
         assert len(qa_list) == len(program.questions.all())
+
+    def test_to_representation_evaluates_validity_in_one_query(self, epic_test_db):
+        # Define test data.
+        program = Program.objects.get(pk=1)
+        users = list(EpicUser.objects.order_by("pk")[:2])
+        yes_no = [YesNoAnswerType.YES, ""]
+        for idx, question in enumerate(program.questions.order_by("pk")):
+            for user in users:
+                answer_type = get_registry().get_answer_type(
+                    get_submodel_type(Question, question.pk)
+                )
+                answer = answer_type.objects.create(user=user, question=question)
+                if idx % 2 or user != users[0]:
+                    continue
+                if isinstance(answer, YesNoAnswer):
+                    answer.short_answer = yes_no[idx % 4 // 2]
+                elif isinstance(answer, SingleChoiceAnswer):
+                    answer.selected_choice = EvolutionChoiceType.NASCENT
+                elif isinstance(answer, MultipleChoiceAnswer):
+                    answer.selected_programs.add(program)
+                answer.save()
+        user_answers = {
+            answer.question_id: answer
+            for answer in get_instances_as_submodel_type(
+                Answer.objects.filter(user=users[0])
+            )
+        }
+        fr = self._FakeRequest()
+        fr.user = users[0]
+
+        # Run test.
+        with CaptureQueriesContext(connection) as captured_queries:
+            serialized_dict = ProgressSerializer(
+                context={"request": fr}
+            ).to_representation(program)
+
+        # Verify final expectations.
+        assert len(captured_queries) == 1
+        valid_answers = [a for a in user_answers.values() if a.is_valid_answer()]
+        assert 0 < len(valid_answers) < len(user_answers)
+        assert serialized_dict["progress"] == len(valid_answers) / len(user_answers)
+        assert serialized_dict["questions_answers"] == [
+            dict(question=q_id, answer=user_answers[q_id].pk)
+            for q_id in program.questions.values_list("pk", flat=True)
+        ]
+
+
+@pytest.mark.django_db
+class TestProgramsProgressSerializer:
+    class _FakeRequest:
+        user: EpicUser
+
+    def test_to_representation_invalid_instance_raises(self, epic_test_db):
+        with pytest.raises(ValueError) as err_info:
+            ProgramsProgressSerializer().to_representation(Program.objects.first())
+        assert str(err_info.value).startswith("Expected instance type")
+
+    def test_to_representation_is_one_query(self, epic_test_db):
+        # Define test data.
+        fr = self._FakeRequest()
+        fr.user = EpicUser.objects.first()
+        for nfq in NationalFrameworkQuestion.objects.all():
+            YesNoAnswer.objects.create(
+                user=fr.user, question=nfq, short_answer=YesNoAnswerType.NO
+            )
+        progress_serializer = ProgramsProgressSerializer(
+            context={"request": fr, "rollup": ProgramsProgressSerializer.rollup_levels}
+        )
+        expected_progress = ProgressSerializer(
+            context={"request": fr}
+        ).to_representation(Program.objects.get(pk=1))["progress"]
+
+        # Run test.
+        with CaptureQueriesContext(connection) as captured_queries:
+            serialized_dict = progress_serializer.to_representation(
+                Program.objects.all()
+            )
+
+        # Verify final expectations.
+        assert len(captured_queries) == 1
+        assert list(serialized_dict.keys()) == ["programs", "groups", "areas"]
+        assert [p_entry["id"] for p_entry in serialized_dict["programs"]] == [1]
+        assert serialized_dict["programs"][0]["progress"] == expected_progress > 0
@@ -0,0 +1,151 @@
+import pytest
+from django.http import QueryDict
+
+from epic_app.models.epic_questions import EvolutionQuestion, LinkagesQuestion
+from epic_app.models.models import Area, Program
+from epic_app.serializers.report_data import ReportFilters, SummaryOptions
+from epic_app.tests.epic_db_fixture import epic_test_db
+
+
+class TestReportFilters:
+    def test_from_query_params(self):
+        # Define test data.
+        query_params = QueryDict(
+            "program=3,1&program=2&area=4&question_type=LinkagesQuestion, evolutionquestion"
+        )
+
+        # Run test.
+        report_filters = ReportFilters.from_query_params(query_params)
+
+        # Verify expectations.
+        assert report_filters == ReportFilters(
+            program_ids=(1, 2, 3),
+            area_ids=(4,),
+            question_types=("evolutionquestion", "linkagesquestion"),
+        )
+        assert (
+            ReportFilters.from_query_params(report_filters.to_query_params())
+            == report_filters
+        )
+
+    def test_from_empty_query_params(self):
+        # Run test.
+        report_filters = ReportFilters.from_query_params(QueryDict("program=&stream=1"))
+
+        # Verify expectations.
+        assert report_filters == ReportFilters()
+        assert report_filters.to_query_params() == {}
+        assert not report_filters.filters_programs
+
+    @pytest.mark.parametrize(
+        "query_string, expected_error",
+        [
+            pytest.param("user=anakin", "`user` expects comma separated ids."),
+            pytest.param("group=1,2.5", "`group` expects comma separated ids."),
+            pytest.param(
+                "question_type=jediquestion", "Unknown question types: jediquestion."
+            ),
+        ],
+    )
+    def test_from_invalid_query_params_raises(
+        self, query_string: str, expected_error: str
+    ):
+        with pytest.raises(ValueError) as e_info:
+            ReportFilters.from_query_params(QueryDict(query_string))
+        assert str(e_info.value) == expected_error
+
+
+class TestSummaryOptions:
+    @pytest.mark.parametrize(
+        "query_string, expected_options",
+        [
+            pytest.param("", SummaryOptions(), id="Default"),
+            pytest.param(
+                "justifications=false",
+                SummaryOptions(include_justifications=False),
+                id="Excluded",
+            ),
+            pytest.param(
+                "max_justifications=5&max_justification_length=100",
+                SummaryOptions(max_justifications=5, max_justification_length=100),
+                id="Limited",
+            ),
+            pytest.param(
+                "max_linkages=10",
+                SummaryOptions(max_linkages=10),
+                id="Linkages",
+            ),
+        ],
+    )
+    def test_from_query_params(
+        self, query_string: str, expected_options: SummaryOptions
+    ):
+        # Run test.
+        options = SummaryOptions.from_query_params(QueryDict(query_string))
+
+        # Verify expectations.
+        assert options == expected_options
+        assert SummaryOptions.from_query_params(options.to_query_params()) == options
+
+    @pytest.mark.parametrize(
+        "query_string",
+        ["max_justifications=0", "max_justification_length=many", "max_linkages=-1"],
+    )
+    def test_from_invalid_query_params_raises(self, query_string: str):
+        with pytest.raises(ValueError) as e_info:
+            SummaryOptions.from_query_params(QueryDict(query_string))
+        assert str(e_info.value).endswith("expects a positive integer.")
+
+    def test_get_justification_limits(self):
+        assert SummaryOptions(
+            max_justifications=3, max_justification_length=10
+        ).get_justification_limits() == dict(
+            max_justifications=3, max_justification_length=10
+        )
+        assert SummaryOptions(
+            include_justifications=False, max_justifications=3
+        ).get_justification_limits() == dict(
+            max_justifications=0, max_justification_length=None
+        )
+
+
+@pytest.mark.django_db
+class TestReportFiltersQueries:
+    @pytest.fixture(autouse=True)
+    def report_filters_fixture(self, epic_test_db: pytest.fixture):
+        """
+        Dummy fixture just to load a default db from dummy_db.
+
+        Args:
+            epic_test_db (pytest.fixture): Fixture to load for the whole file tests.
+        """
+        pass
+
+    def test_filter_programs_by_area(self):
+        # Define test data.
+        area = Area.objects.first()
+        report_filters = ReportFilters(area_ids=(area.pk,))
+
+        # Run test.
+        programs = report_filters.filter_programs(Program.objects.all())
+
+        # Verify expectations.
+        assert set(programs) == set(Program.objects.filter(group__area=area))
+
+    def test_get_questions_filter(self):
+        # Define test data.
+        program = Program.objects.first()
+        report_filters = ReportFilters(
+            program_ids=(program.pk,), question_types=("linkagesquestion",)
+        )
+
+        # Run test.
+        questions = LinkagesQuestion.objects.filter(
+            report_filters.get_questions_filter()
+        )
+
+        # Verify expectations.
+        assert set(questions) == set(LinkagesQuestion.objects.filter(program=program))
+        assert not EvolutionQuestion.objects.filter(
+            report_filters.get_questions_filter()
+        ).exists()
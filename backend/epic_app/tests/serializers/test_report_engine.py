@@ -0,0 +1,468 @@
+import dataclasses
+import json
+from typing import Any, Dict, List, Optional
+
+import pytest
+from django.db import connection, models
+from django.test.utils import CaptureQueriesContext
+from rest_framework.request import Request
+from rest_framework.reverse import reverse
+from rest_framework.test import APIRequestFactory
+
+from epic_app import submodel_registry
+from epic_app.models.epic_answers import (
+    Answer,
+    MultipleChoiceAnswer,
+    SingleChoiceAnswer,
+    YesNoAnswer,
+    YesNoAnswerType,
+)
+from epic_app.models.epic_questions import (
+    EvolutionChoiceType,
+    EvolutionQuestion,
+    KeyAgencyActionsQuestion,
+    LinkagesQuestion,
+    NationalFrameworkQuestion,
+)
+from epic_app.models.epic_user import EpicUser
+from epic_app.models.models import Program
+from epic_app.serializers.answer_serializer import AnswerSerializer
+from epic_app.serializers.report_data import ReportFilters, SummaryOptions
+from epic_app.serializers.report_engine import AnswersReportEngine
+from epic_app.serializers.report_serializer import ProgramReportDataSerializer
+from epic_app.submodel_registry import SubmodelRegistry, get_registry
+from epic_app.tests.epic_db_fixture import epic_test_db
+from epic_app.utils import get_instances_as_submodel_type
+
+
+def _get_report() -> List[Dict[str, Any]]:
+    users = EpicUser.objects.all()
+    return ProgramReportDataSerializer(
+        AnswersReportEngine(users).get_program_reports(),
+        many=True,
+        context={"request": Request(APIRequestFactory().get("/"))},
+    ).data
+
+
+def _get_expected_report(users: models.QuerySet) -> List[Dict[str, Any]]:
+    """
+    Builds the expected answers report straight from the models, question by question.
+    """
+    request = Request(APIRequestFactory().get("/"))
+    expected_report = []
+    for program in Program.objects.order_by("pk"):
+        expected_questions = []
+        for question in program.questions.order_by("pk"):
+            answers = get_instances_as_submodel_type(
+                Answer.objects.filter(question=question, user__in=users).order_by("pk")
+            )
+            summary = {}
+            if answers:
+                answer_type = type(answers[0])
+                summary = answer_type.get_detailed_summary(
+                    answer_type.objects.filter(pk__in=[a.pk for a in answers])
+                )
+                summary["no_valid_response"] += users.count() - len(answers)
+            expected_questions.append(
+                {
+                    "url": reverse(
+                        "question-detail", kwargs={"pk": question.pk}, request=request
+                    ),
+                    "id": question.pk,
+                    "title": question.title,
+                    "question_answers": {
+                        "answers": [
+                            AnswerSerializer.get_concrete_serializer(type(answer))(
+                                context={"request": request}
+                            ).to_representation(answer)
+                            for answer in answers
+                        ],
+                        "summary": summary,
+                    },
+                }
+            )
+        expected_report.append(
+            {
+                "url": reverse(
+                    "program-detail", kwargs={"pk": program.pk}, request=request
+                ),
+                "id": program.pk,
+                "name": program.name,
+                "questions": expected_questions,
+            }
+        )
+    return expected_report
+
+
+def _add_answers(user: EpicUser, answer_index: int):
+    """
+    Fills in (alternating) answers of the given user for all the existing questions.
+    """
+    yes_no = [YesNoAnswerType.YES, YesNoAnswerType.NO, ""]
+    choices = [""] + list(EvolutionChoiceType)
+    for nfq in NationalFrameworkQuestion.objects.all():
+        YesNoAnswer.objects.create(
+            user=user,
+            question=nfq,
+            short_answer=yes_no[answer_index % len(yes_no)],
+            justify_answer=f"{user.username} on {nfq.pk}" if answer_index % 2 else "",
+        )
+    for kaq in KeyAgencyActionsQuestion.objects.all():
+        YesNoAnswer.objects.create(
+            user=user, question=kaq, short_answer=yes_no[answer_index % 2]
+        )
+    for eq in EvolutionQuestion.objects.all():
+        SingleChoiceAnswer.objects.create(
+            user=user,
+            question=eq,
+            selected_choice=choices[answer_index % len(choices)],
+            justify_answer=f"{user.username} on {eq.pk}",
+        )
+    for lq in LinkagesQuestion.objects.all():
+        mca = MultipleChoiceAnswer.objects.create(user=user, question=lq)
+        mca.selected_programs.set(
+            Program.objects.all()[answer_index % 3 : answer_index % 3 + 2]
+        )
+
+
+@pytest.mark.django_db
+class TestAnswersReportEngine:
+    @pytest.fixture(autouse=True)
+    def _report_engine_fixture(self, epic_test_db: pytest.fixture):
+        pass
+
+    def test_report_is_equal_to_serialized_report(self):
+        # Define test data.
+        for idx, user in enumerate(EpicUser.objects.all().order_by("pk")):
+            if idx % 3 != 2:
+                _add_answers(user, idx)
+
+        # Verify expectations.
+        assert json.dumps(_get_report()) == json.dumps(
+            _get_expected_report(EpicUser.objects.all())
+        )
+
+    def test_report_without_answers(self):
+        report_engine = AnswersReportEngine(EpicUser.objects.all())
+        assert report_engine.get_question_answers(1) == []
+        assert report_engine.get_question_summary(1) == {}
+
+    def test_summary_counts_missing_answers_as_not_valid(self):
+        # Define test data.
+        _add_answers(EpicUser.objects.get(username="Anakin"), 0)
+        nfq = NationalFrameworkQuestion.objects.first()
+
+        # Run test.
+        summary = AnswersReportEngine(EpicUser.objects.all()).get_question_summary(
+            nfq.pk
+        )
+
+        # Verify expectations.
+        assert summary == {
+            "Yes": 1,
+            "Yes_justify": [],
+            "No": 0,
+            "No_justify": [],
+            "no_valid_response": EpicUser.objects.count() - 1,
+        }
+
+    def test_report_queries_do_not_depend_on_data_size(self):
+        # Define initial test data.
+        _add_answers(EpicUser.objects.get(username="Anakin"), 1)
+        with CaptureQueriesContext(connection) as small_report:
+            _get_report()
+
+        # Add more users, questions and answers.
+        a_program = Program.objects.get(name="a")
+        for p_idx, program in enumerate(Program.objects.exclude(pk=a_program.pk)):
+            NationalFrameworkQuestion.objects.create(
+                title=f"National framework {p_idx}",
+                program=program,
+                description="Lorem ipsum",
+            )
+            EvolutionQuestion.objects.create(
+                title=f"Evolution {p_idx}", program=program
+            )
+            LinkagesQuestion.objects.create(title=f"Linkages {p_idx}", program=program)
+        for u_idx in range(5):
+            EpicUser.objects.create(
+                username=f"Trooper{u_idx}",
+                organization=EpicUser.objects.first().organization,
+            )
+        YesNoAnswer.objects.all().delete()
+        SingleChoiceAnswer.objects.all().delete()
+        MultipleChoiceAnswer.objects.all().delete()
+        for u_idx, user in enumerate(EpicUser.objects.all()):
+            _add_answers(user, u_idx)
+
+        # Run test.
+        with CaptureQueriesContext(connection) as large_report:
+            _get_report()
+
+        # Verify expectations.
+        assert len(large_report.captured_queries) == len(small_report.captured_queries)
+
+    def test_program_chunks_are_equal_to_full_report(self):
+        # Define test data.
+        for idx, user in enumerate(EpicUser.objects.all().order_by("pk")):
+            _add_answers(user, idx)
+        users = EpicUser.objects.all()
+        report_engine = AnswersReportEngine(users)
+
+        # Run test.
+        for program in Program.objects.all():
+            program_engine = AnswersReportEngine(
+                users, ReportFilters(program_ids=(program.pk,)), chunk_size=2
+            )
+
+            # Verify expectations.
+            for question in program.questions.all():
+                assert program_engine.get_question_answers(
+                    question.pk
+                ) == report_engine.get_question_answers(question.pk)
+                assert program_engine.get_question_summary(
+                    question.pk
+                ) == report_engine.get_question_summary(question.pk)
+            assert set(program_engine._answers_by_question.keys()) <= set(
+                program.questions.values_list("pk", flat=True)
+            )
+
+    def test_program_reports_without_answers(self):
+        # Define test data.
+        anakin = EpicUser.objects.get(username="Anakin")
+        _add_answers(anakin, 1)
+        report_engine = AnswersReportEngine(EpicUser.objects.all())
+
+        # Run test.
+        program_reports = report_engine.get_program_reports(include_answers=False)
+
+        # Verify expectations.
+        assert [p_report.name for p_report in program_reports] == list(
+            Program.objects.order_by("pk").values_list("name", flat=True)
+        )
+        for p_report in program_reports:
+            for q_report in p_report.questions:
+                assert q_report.answers == ()
+                assert (
+                    q_report.n_answers
+                    == anakin.user_answers.filter(question=q_report.id).count()
+                )
+                assert q_report.summary == report_engine.get_question_summary(
+                    q_report.id
+                )
+
+    def test_user_subset_report_is_equal_to_expected_report(self):
+        # Define test data.
+        for idx, user in enumerate(EpicUser.objects.all().order_by("pk")):
+            _add_answers(user, idx)
+        subset = EpicUser.objects.filter(username__in=["Anakin", "Palpatine"])
+        context = {"request": Request(APIRequestFactory().get("/"))}
+        report_engine = AnswersReportEngine(
+            EpicUser.objects.all(),
+            ReportFilters(user_ids=tuple(subset.values_list("pk", flat=True))),
+        )
+
+        # Run test.
+        engine_report = ProgramReportDataSerializer(
+            report_engine.get_program_reports(), many=True, context=context
+        ).data
+
+        # Verify expectations.
+        assert not report_engine.uses_summary_counters
+        assert json.loads(json.dumps(engine_report)) == json.loads(
+            json.dumps(_get_expected_report(subset))
+        )
+
+    def test_question_type_filter(self):
+        # Define test data.
+        for idx, user in enumerate(EpicUser.objects.all().order_by("pk")):
+            _add_answers(user, idx)
+        report_filters = ReportFilters(question_types=("evolutionquestion",))
+
+        # Run test.
+        program_reports = AnswersReportEngine(
+            EpicUser.objects.all(), report_filters
+        ).get_program_reports()
+
+        # Verify expectations.
+        reported_ids = {
+            q_report.id
+            for p_report in program_reports
+            for q_report in p_report.questions
+        }
+        assert reported_ids == set(
+            EvolutionQuestion.objects.values_list("pk", flat=True)
+        )
+        for p_report in program_reports:
+            for q_report in p_report.questions:
+                assert all(
+                    isinstance(answer, SingleChoiceAnswer)
+                    for answer in q_report.answers
+                )
+
+    @pytest.mark.parametrize(
+        "user_names",
+        [
+            pytest.param(None, id="Summary counters"),
+            pytest.param(["Anakin", "Palpatine"], id="Users subset"),
+        ],
+    )
+    def test_summaries_are_dispatched_through_the_registry(
+        self, monkeypatch: pytest.MonkeyPatch, user_names: Optional[List[str]]
+    ):
+        # Define test data.
+        for idx, user in enumerate(EpicUser.objects.all().order_by("pk")):
+            _add_answers(user, idx)
+        registry = get_registry()
+
+        def summary(*args, **kwargs) -> Dict[Any, Dict[str, Any]]:
+            return {
+                group: dict(group_summary, custom=True)
+                for group, group_summary in SingleChoiceAnswer.get_detailed_summaries(
+                    *args, **kwargs
+                ).items()
+            }
+
+        def summary_format(*args) -> Dict[str, Any]:
+            return dict(SingleChoiceAnswer.format_detailed_summary(*args), custom=True)
+
+        monkeypatch.setattr(
+            submodel_registry,
+            "_registry",
+            SubmodelRegistry(
+                dataclasses.replace(
+                    entry, summary=summary, summary_format=summary_format
+                )
+                if entry.answer_type is SingleChoiceAnswer
+                else entry
+                for entry in registry.entries
+            ),
+        )
+        report_filters = ReportFilters()
+        if user_names:
+            report_filters = ReportFilters(
+                user_ids=tuple(
+                    EpicUser.objects.filter(username__in=user_names).values_list(
+                        "pk", flat=True
+                    )
+                )
+            )
+
+        # Run test.
+        report_engine = AnswersReportEngine(EpicUser.objects.all(), report_filters)
+
+        # Verify expectations.
+        evolution_ids = set(EvolutionQuestion.objects.values_list("pk", flat=True))
+        assert {
+            q_id
+            for q_id in report_engine._summaries_by_question
+            if report_engine.get_question_summary(q_id).get("custom", False)
+        } == evolution_ids
+
+    def test_iterate_answers_in_chunks(self):
+        # Define test data.
+        for idx, user in enumerate(EpicUser.objects.all().order_by("pk")):
+            _add_answers(user, idx)
+        report_engine = AnswersReportEngine(EpicUser.objects.all(), chunk_size=2)
+
+        # Run test.
+        answers = list(report_engine.iterate_answers())
+
+        # Verify expectations.
+        assert [
+            (answer.question.program_id, answer.question_id, answer.pk)
+            for answer in answers
+        ] == sorted(
+            (answer.question.program_id, answer.question_id, answer.pk)
+            for answer in answers
+        )
+        assert {(type(answer), answer.pk) for answer in answers} == {
+            (type(answer), answer.pk)
+            for q_answers in report_engine._answers_by_question.values()
+            for answer in q_answers
+        }
+
+    @pytest.mark.parametrize(
+        "report_filters",
+        [
+            pytest.param(ReportFilters(), id="Summary counters"),
+            pytest.param(ReportFilters(user_ids=(1, 2, 3)), id="User subset"),
+        ],
+    )
+    def test_justifications_are_limited(self, report_filters: ReportFilters):
+        # Define test data.
+        for idx, user in enumerate(EpicUser.objects.all().order_by("pk")):
+            _add_answers(user, idx)
+        full_engine = AnswersReportEngine(EpicUser.objects.all(), report_filters)
+        limited_engine = AnswersReportEngine(
+            EpicUser.objects.all(),
+            report_filters,
+            summary_options=SummaryOptions(
+                max_justifications=1, max_justification_length=5
+            ),
+        )
+        excluded_engine = AnswersReportEngine(
+            EpicUser.objects.all(),
+            report_filters,
+            summary_options=SummaryOptions(include_justifications=False),
+        )
+
+        # Run test.
+        for question in NationalFrameworkQuestion.objects.all():
+            full_summary = full_engine.get_question_summary(question.pk)
+            limited_summary = limited_engine.get_question_summary(question.pk)
+            excluded_summary = excluded_engine.get_question_summary(question.pk)
+
+            # Verify expectations.
+            assert full_summary.keys() == limited_summary.keys()
+            for key, value in full_summary.items():
+                if not key.endswith("_justify"):
+                    assert limited_summary[key] == value
+                    assert excluded_summary[key] == value
+                    continue
+                assert key not in excluded_summary
+                assert limited_summary[key] == [
+                    justify if len(justify) <= 5 else justify[:4] + "…"
+                    for justify in value[:1]
+                ]
+
+    @pytest.mark.parametrize(
+        "report_filters",
+        [
+            pytest.param(ReportFilters(), id="Summary counters"),
+            pytest.param(ReportFilters(user_ids=(1, 2, 3)), id="User subset"),
+        ],
+    )
+    def test_linkages_are_limited(self, report_filters: ReportFilters):
+        # Define test data.
+        for idx, user in enumerate(EpicUser.objects.all().order_by("pk")):
+            _add_answers(user, idx)
+        full_engine = AnswersReportEngine(EpicUser.objects.all(), report_filters)
+        limited_engine = AnswersReportEngine(
+            EpicUser.objects.all(),
+            report_filters,
+            summary_options=SummaryOptions(max_linkages=1),
+        )
+
+        # Run test.
+        for question in LinkagesQuestion.objects.all():
+            full_summary = full_engine.get_question_summary(question.pk)
+            limited_summary = limited_engine.get_question_summary(question.pk)
+
+            # Verify expectations.
+            program_counts = {
+                p_name: p_count
+                for p_name, p_count in full_summary.items()
+                if p_name != "no_valid_response"
+            }
+            top_program = max(program_counts, key=program_counts.get)
+            assert limited_summary == {
+                top_program: program_counts[top_program],
+                MultipleChoiceAnswer.OTHER_PROGRAMS: sum(program_counts.values())
+                - program_counts[top_program],
+                "no_valid_response": full_summary["no_valid_response"],
+            }
+        for question in NationalFrameworkQuestion.objects.all():
+            assert limited_engine.get_question_summary(
+                question.pk
+            ) == full_engine.get_question_summary(question.pk)
@@ -0,0 +1,125 @@
+import io
+from typing import List
+
+import pytest
+from reportlab.graphics.shapes import Drawing
+from reportlab.platypus import Table
+
+from epic_app.management.commands.benchmark_pdf_report import _get_synthetic_report
+from epic_app.serializers.report_data import ProgramReportData, QuestionReportData
+from epic_app.serializers.report_pdf import EpicPdfReport, EpicReportDocTemplate
+
+
+class TestEpicPdfReport:
+    @pytest.fixture
+    def _build_passes(self, monkeypatch: pytest.MonkeyPatch) -> List[int]:
+        build_passes = []
+        template_build = EpicReportDocTemplate.build
+
+        def count_build(doc_template, *args, **kwargs):
+            build_passes.append(1)
+            return template_build(doc_template, *args, **kwargs)
+
+        monkeypatch.setattr(EpicReportDocTemplate, "build", count_build)
+        return build_passes
+
+    def _generate_report(self, toc: str) -> EpicPdfReport:
+        pdf_report = EpicPdfReport()
+        pdf_report.toc = toc
+        buffer = io.BytesIO()
+        pdf_report.generate_report(buffer, _get_synthetic_report(3, 2, 1))
+        assert buffer.getvalue().startswith(b"%PDF")
+        return pdf_report
+
+    def _get_toc_headings(self, pdf_report: EpicPdfReport) -> List[str]:
+        return [text for _, text, _, _ in pdf_report._toc._lastEntries]
+
+    def test_multipass_toc_needs_several_passes(self, _build_passes: List[int]):
+        pdf_report = self._generate_report(EpicPdfReport.TOC_MULTIPASS)
+        assert len(_build_passes) > 1
+        assert "Program: Program 2" in self._get_toc_headings(pdf_report)
+
+    def test_end_toc_is_built_in_single_pass(self, _build_passes: List[int]):
+        multipass_headings = self._get_toc_headings(
+            self._generate_report(EpicPdfReport.TOC_MULTIPASS)
+        )
+        _build_passes.clear()
+        pdf_report = self._generate_report(EpicPdfReport.TOC_END)
+        assert len(_build_passes) == 1
+        assert self._get_toc_headings(pdf_report) == multipass_headings
+
+    def test_no_toc_is_built_in_single_pass(self, _build_passes: List[int]):
+        pdf_report = self._generate_report(EpicPdfReport.TOC_NONE)
+        assert len(_build_passes) == 1
+        assert not hasattr(pdf_report, "_toc")
+
+    @pytest.mark.parametrize("toc", EpicPdfReport.toc_modes)
+    def test_progress_is_notified_per_program(self, toc: str):
+        # Define test data.
+        notified_progress = []
+        pdf_report = EpicPdfReport()
+        pdf_report.toc = toc
+        pdf_report.on_progress = notified_progress.append
+
+        # Run test.
+        pdf_report.generate_report(io.BytesIO(), _get_synthetic_report(3, 2, 1))
+
+        # Verify final expectations.
+        assert len(notified_progress) >= 3
+        assert notified_progress == sorted(set(notified_progress))
+        assert notified_progress[-1] == 1
+
+    def test_unknown_toc_raises(self):
+        pdf_report = EpicPdfReport()
+        pdf_report.toc = "middle"
+        with pytest.raises(ValueError) as exc_info:
+            pdf_report.generate_report(io.BytesIO(), [])
+        assert str(exc_info.value) == "Table of contents mode `middle` not supported."
+
+    def test_narrow_summary_is_charted(self):
+        # Run test.
+        chart_story = EpicPdfReport()._get_charts(
+            {"Yes": 2, "Yes_justify": ["Lorem ipsum"], "No": 1, "no_valid_response": 0}
+        )
+
+        # Verify expectations.
+        assert isinstance(chart_story[-1], Drawing)
+
+    @pytest.mark.parametrize(
+        "summary",
+        [
+            pytest.param(
+                {f"Program {p_idx}": p_idx for p_idx in range(20)}, id="Many choices"
+            ),
+            pytest.param(
+                {"A program with a rather long name & a longer description": 1},
+                id="Long",
+            ),
+        ],
+    )
+    def test_wide_summary_is_tabulated(self, summary: dict):
+        # Define test data.
+        pdf_report = EpicPdfReport()
+        pdf_report.toc = EpicPdfReport.TOC_NONE
+        report_data = [
+            ProgramReportData(
+                id=1,
+                name="Program 1",
+                questions=(
+                    QuestionReportData(
+                        id=1, title="Linkages", n_answers=1, summary=summary
+                    ),
+                ),
+            )
+        ]
+        buffer = io.BytesIO()
+
+        # Run test.
+        chart_story = pdf_report._get_charts(summary)
+        pdf_report.generate_report(buffer, report_data)
+
+        # Verify expectations.
+        charts_table = next(fl for fl in chart_story if isinstance(fl, Table))
+        assert len(charts_table._cellvalues) == len(summary) + 1
+        assert not any(isinstance(fl, Drawing) for fl in chart_story)
+        assert buffer.getvalue().startswith(b"%PDF")
@@ -7,7 +7,6 @@ from rest_framework.request import Request
 from rest_framework.test import APIRequestFactory
 
 from epic_app.models.epic_answers import (
-    Answer,
     MultipleChoiceAnswer,
     SingleChoiceAnswer,
     YesNoAnswer,
@@ -22,13 +21,8 @@ from epic_app.models.epic_questions import (
     Question,
 )
 from epic_app.models.epic_user import EpicUser
-from epic_app.models.models import Program
-from epic_app.serializers.report_serializer import (
-    AnswerListReportSerializer,
-    AnswerReportSerializer,
-    ProgramReportSerializer,
-    QuestionReportSerializer,
-)
+from epic_app.serializers.report_engine import AnswersReportEngine
+from epic_app.serializers.report_serializer import ProgramReportDataSerializer
 from epic_app.tests.epic_db_fixture import epic_test_db
 from epic_app.utils import get_submodel_type_list
 
@@ -73,208 +67,150 @@ def _report_serializer_fixture(
     mca.selected_programs.add(4, 2)
 
 
-@pytest.mark.django_db
-class TestAnswerReportSerializer:
-    def test_ctor(self):
-        serializer = AnswerReportSerializer()
-        assert isinstance(serializer, serializers.BaseSerializer)
-
-    expected_answer_dict = {
-        YesNoAnswer: {
-            "id": 1,
-            "short_answer": "N",
-            "justify_answer": "Laboris proident enim dolore ullamco voluptate nisi labore laborum ut qui adipisicing occaecat exercitation culpa.",
-            "user": 3,
-            "question": 1,
-        },
-        SingleChoiceAnswer: {
-            "id": 2,
-            "selected_choice": "EFFECTIVE",
-            "justify_answer": "Ea ut ipsum deserunt culpa laborum excepteur laboris ad adipisicing ad officia laboris.",
-            "user": 3,
-            "question": 3,
-        },
-        MultipleChoiceAnswer: {
-            "id": 3,
-            "user": 3,
-            "question": 5,
-            "selected_programs": [2, 4],
-        },
-    }
-
-    @pytest.mark.parametrize("answer_type", get_submodel_type_list(Answer))
-    def test_answer_report_to_representation(
-        self, answer_type: Type[Answer], _report_serializer_fixture: pytest.fixture
-    ):
-        subtype_instance = answer_type.objects.all().first()
-        answer_instance = Answer.objects.get(id=subtype_instance.id)
-        represented_data = AnswerReportSerializer(
-            context=serializer_context
-        ).to_representation(answer_instance)
-        assert represented_data == self.expected_answer_dict[answer_type]
-
-
-@pytest.mark.django_db
-class TestAnswerListReportSerializer:
-
-    expected_answer_list_dict = {
-        YesNoAnswer: {
-            "answers": [TestAnswerReportSerializer.expected_answer_dict[YesNoAnswer]],
-            "summary": {
-                "Yes": 0,
-                "Yes_justify": [],
-                "No": 1,
-                "No_justify": [
-                    "Laboris proident enim dolore ullamco voluptate nisi labore laborum ut qui adipisicing occaecat exercitation culpa."
-                ],
-                "no_valid_response": 2,
-            },
-        },
-        SingleChoiceAnswer: {
-            "answers": [
-                TestAnswerReportSerializer.expected_answer_dict[SingleChoiceAnswer],
-            ],
-            "summary": {
-                "Capable": 0,
-                "Capable_justify": [],
-                "Effective": 1,
-                "Effective_justify": [
-                    "Ea ut ipsum deserunt culpa laborum excepteur laboris ad adipisicing ad officia laboris."
-                ],
-                "Engaged": 0,
-                "Engaged_justify": [],
-                "Nascent": 0,
-                "Nascent_justify": [],
-                "no_valid_response": 2,
-            },
-        },
-        MultipleChoiceAnswer: {
-            "answers": [
-                TestAnswerReportSerializer.expected_answer_dict[MultipleChoiceAnswer]
-            ],
-            "summary": {"b": 1, "d": 1, "no_valid_response": 2},
-        },
-    }
-
-    def test_ctor(self):
-        serializer = AnswerListReportSerializer(
-            child=AnswerReportSerializer(read_only=True),
-        )
-        assert isinstance(serializer, serializers.ListSerializer)
-
-    @pytest.mark.parametrize("answer_type", get_submodel_type_list(Answer))
-    def test_answer_list_report_to_representation(
-        self, answer_type: Type[Answer], _report_serializer_fixture: pytest.fixture
-    ):
-        # Define test data
-        subtype_instance = answer_type.objects.all().first()
-
-        class FakeInstance:
-            instance = subtype_instance.question
-
-        # Serialize data
-        represented_data = AnswerListReportSerializer(
-            child=AnswerReportSerializer(read_only=True), context=serializer_context
-        ).to_representation(FakeInstance())
-
-        # Verify final expectations.
-        assert json.dumps(represented_data) == json.dumps(
-            self.expected_answer_list_dict[answer_type]
-        )
-
-
-@pytest.mark.django_db
-class TestQuestionReportSerializer:
-    def test_ctor(self):
-        serializer = QuestionReportSerializer()
-        assert isinstance(serializer, serializers.BaseSerializer)
-
-    expected_question_dict = {
-        NationalFrameworkQuestion: {
-            "url": "http://testserver/api/question/1/",
-            "id": 1,
-            "title": "Is this a National Framework question?",
-            "question_answers": TestAnswerListReportSerializer.expected_answer_list_dict[
-                YesNoAnswer
+expected_answer_dict = {
+    YesNoAnswer: {
+        "id": 1,
+        "short_answer": "N",
+        "justify_answer": "Laboris proident enim dolore ullamco voluptate nisi labore laborum ut qui adipisicing occaecat exercitation culpa.",
+        "user": 3,
+        "question": 1,
+    },
+    SingleChoiceAnswer: {
+        "id": 2,
+        "selected_choice": "EFFECTIVE",
+        "justify_answer": "Ea ut ipsum deserunt culpa laborum excepteur laboris ad adipisicing ad officia laboris.",
+        "user": 3,
+        "question": 3,
+    },
+    MultipleChoiceAnswer: {
+        "id": 3,
+        "user": 3,
+        "question": 5,
+        "selected_programs": [2, 4],
+    },
+}
+
+expected_answer_list_dict = {
+    YesNoAnswer: {
+        "answers": [expected_answer_dict[YesNoAnswer]],
+        "summary": {
+            "Yes": 0,
+            "Yes_justify": [],
+            "No": 1,
+            "No_justify": [
+                "Laboris proident enim dolore ullamco voluptate nisi labore laborum ut qui adipisicing occaecat exercitation culpa."
             ],
+            "no_valid_response": 2,
         },
-        EvolutionQuestion: {
-            "url": "http://testserver/api/question/3/",
-            "id": 3,
-            "title": "Is this an Evolution question?",
-            "question_answers": TestAnswerListReportSerializer.expected_answer_list_dict[
-                SingleChoiceAnswer
+    },
+    SingleChoiceAnswer: {
+        "answers": [
+            expected_answer_dict[SingleChoiceAnswer],
+        ],
+        "summary": {
+            "Capable": 0,
+            "Capable_justify": [],
+            "Effective": 1,
+            "Effective_justify": [
+                "Ea ut ipsum deserunt culpa laborum excepteur laboris ad adipisicing ad officia laboris."
             ],
+            "Engaged": 0,
+            "Engaged_justify": [],
+            "Nascent": 0,
+            "Nascent_justify": [],
+            "no_valid_response": 2,
         },
-        LinkagesQuestion: {
-            "url": "http://testserver/api/question/5/",
-            "id": 5,
-            "title": "Finally a linkage question?",
-            "question_answers": TestAnswerListReportSerializer.expected_answer_list_dict[
-                MultipleChoiceAnswer
-            ],
+    },
+    MultipleChoiceAnswer: {
+        "answers": [expected_answer_dict[MultipleChoiceAnswer]],
+        "summary": {"b": 1, "d": 1, "no_valid_response": 2},
+    },
+}
+
+expected_question_dict = {
+    NationalFrameworkQuestion: {
+        "url": "http://testserver/api/question/1/",
+        "id": 1,
+        "title": "Is this a National Framework question?",
+        "question_answers": expected_answer_list_dict[YesNoAnswer],
+    },
+    EvolutionQuestion: {
+        "url": "http://testserver/api/question/3/",
+        "id": 3,
+        "title": "Is this an Evolution question?",
+        "question_answers": expected_answer_list_dict[SingleChoiceAnswer],
+    },
+    LinkagesQuestion: {
+        "url": "http://testserver/api/question/5/",
+        "id": 5,
+        "title": "Finally a linkage question?",
+        "question_answers": expected_answer_list_dict[MultipleChoiceAnswer],
+    },
+    KeyAgencyActionsQuestion: {
+        "url": "http://testserver/api/question/6/",
+        "id": 6,
+        "title": "Is this the new Key Agency Action question?",
+        "question_answers": {"answers": [], "summary": {}},
+    },
+}
+
+expected_program_data = {
+    "url": "http://testserver/api/program/1/",
+    "id": 1,
+    "name": "a",
+    "questions": [
+        expected_question_dict[NationalFrameworkQuestion],
+        {
+            "url": "http://testserver/api/question/2/",
+            "id": 2,
+            "title": "Is this another National Framework question?",
+            "question_answers": {"answers": [], "summary": {}},
         },
-        KeyAgencyActionsQuestion: {
-            "url": "http://testserver/api/question/6/",
-            "id": 6,
-            "title": "Is this the new Key Agency Action question?",
+        expected_question_dict[EvolutionQuestion],
+        {
+            "url": "http://testserver/api/question/4/",
+            "id": 4,
+            "title": "Is this yet another Evolution question?",
             "question_answers": {"answers": [], "summary": {}},
         },
-    }
-
-    @pytest.mark.parametrize("question_type", get_submodel_type_list(Question))
-    def test_question_report_to_representation(
-        self, question_type: Type[Answer], _report_serializer_fixture: pytest.fixture
-    ):
-        subtype_instance = question_type.objects.all().first()
-        question_instance = Question.objects.get(id=subtype_instance.id)
-        represented_data = QuestionReportSerializer(
-            context=serializer_context
-        ).to_representation(question_instance)
-        assert json.dumps(represented_data) == json.dumps(
-            self.expected_question_dict[question_type]
-        )
+        expected_question_dict[LinkagesQuestion],
+        expected_question_dict[KeyAgencyActionsQuestion],
+    ],
+}
 
 
 @pytest.mark.django_db
-class TestProgramReportSerializer:
+class TestProgramReportDataSerializer:
     def test_ctor(self):
-        serializer = ProgramReportSerializer()
+        serializer = ProgramReportDataSerializer()
         assert isinstance(serializer, serializers.BaseSerializer)
 
-    expected_program_data = {
-        "url": "http://testserver/api/program/1/",
-        "id": 1,
-        "name": "a",
-        "questions": [
-            TestQuestionReportSerializer.expected_question_dict[
-                NationalFrameworkQuestion
-            ],
-            {
-                "url": "http://testserver/api/question/2/",
-                "id": 2,
-                "title": "Is this another National Framework question?",
-                "question_answers": {"answers": [], "summary": {}},
-            },
-            TestQuestionReportSerializer.expected_question_dict[EvolutionQuestion],
-            {
-                "url": "http://testserver/api/question/4/",
-                "id": 4,
-                "title": "Is this yet another Evolution question?",
-                "question_answers": {"answers": [], "summary": {}},
-            },
-            TestQuestionReportSerializer.expected_question_dict[LinkagesQuestion],
-            TestQuestionReportSerializer.expected_question_dict[
-                KeyAgencyActionsQuestion
-            ],
-        ],
-    }
-
     def test_program_report_to_representation(
         self, _report_serializer_fixture: pytest.fixture
     ):
-        program_instance = Program.objects.get(name="a")
-        represented_data = ProgramReportSerializer(
+        program_reports = AnswersReportEngine(
+            serializer_context["users"]
+        ).get_program_reports()
+        represented_data = ProgramReportDataSerializer(
             context=serializer_context
-        ).to_representation(program_instance)
-        assert json.dumps(represented_data) == json.dumps(self.expected_program_data)
+        ).to_representation(program_reports[0])
+        assert json.dumps(represented_data) == json.dumps(expected_program_data)
+
+    @pytest.mark.parametrize("question_type", get_submodel_type_list(Question))
+    def test_question_report_to_representation(
+        self, question_type: Type[Question], _report_serializer_fixture: pytest.fixture
+    ):
+        program_reports = AnswersReportEngine(
+            serializer_context["users"]
+        ).get_program_reports()
+        question_id = question_type.objects.first().pk
+        represented_data = next(
+            q_data
+            for q_data in ProgramReportDataSerializer(
+                context=serializer_context
+            ).to_representation(program_reports[0])["questions"]
+            if q_data["id"] == question_id
+        )
+        assert json.dumps(represented_data) == json.dumps(
+            expected_question_dict[question_type]
+        )
@@ -0,0 +1,90 @@
+import json
+
+import pytest
+from django.test import RequestFactory
+
+from epic_app.domain_catalogue import (
+    clear_catalogue_snapshot,
+    compile_catalogue,
+    get_catalogue_snapshot,
+)
+from epic_app.models.epic_questions import Question
+from epic_app.models.models import Agency, Area, Group, Program
+from epic_app.tests.epic_db_fixture import epic_test_db
+
+
+@pytest.mark.django_db
+class TestDomainCatalogue:
+    @pytest.fixture(autouse=True)
+    def domain_catalogue_fixture(self, epic_test_db: pytest.fixture):
+        clear_catalogue_snapshot()
+        yield
+        clear_catalogue_snapshot()
+
+    def test_compile_catalogue(self):
+        # Run test.
+        catalogue = compile_catalogue()
+
+        # Verify expectations.
+        assert [a["id"] for a in catalogue["areas"]] == list(
+            Area.objects.order_by("pk").values_list("pk", flat=True)
+        )
+        assert [a["id"] for a in catalogue["agencies"]] == list(
+            Agency.objects.order_by("pk").values_list("pk", flat=True)
+        )
+        for c_area in catalogue["areas"]:
+            assert [g["id"] for g in c_area["groups"]] == list(
+                Group.objects.filter(area=c_area["id"])
+                .order_by("pk")
+                .values_list("pk", flat=True)
+            )
+            for c_group in c_area["groups"]:
+                assert c_group["area"] == c_area["id"]
+                for c_program in c_group["programs"]:
+                    program = Program.objects.get(pk=c_program["id"])
+                    assert program.group_id == c_group["id"]
+                    assert c_program["name"] == program.name
+                    assert c_program["questions"] == list(
+                        Question.objects.filter(program=program)
+                        .order_by("pk")
+                        .values_list("pk", flat=True)
+                    )
+        for c_agency in catalogue["agencies"]:
+            assert [p["id"] for p in c_agency["programs"]] == list(
+                Program.objects.filter(agencies=c_agency["id"])
+                .order_by("pk")
+                .values_list("pk", flat=True)
+            )
+
+    def test_snapshot_is_kept_until_the_catalogue_changes(
+        self, django_assert_num_queries
+    ):
+        # Define test data.
+        snapshot = get_catalogue_snapshot()
+
+        # Run test and verify expectations.
+        with django_assert_num_queries(1):
+            assert get_catalogue_snapshot() is snapshot
+        assert json.loads(snapshot.content) == compile_catalogue()
+        Area.objects.create(name="Lorem")
+        new_snapshot = get_catalogue_snapshot()
+        assert new_snapshot.etag != snapshot.etag
+        assert "Lorem" in [a["name"] for a in json.loads(new_snapshot.content)["areas"]]
+
+    def test_snapshot_response_is_conditional(self):
+        # Define test data.
+        snapshot = get_catalogue_snapshot()
+
+        # Run test.
+        response = snapshot.get_response(RequestFactory().get("/api/catalogue/"))
+        conditional_response = snapshot.get_response(
+            RequestFactory().get("/api/catalogue/", HTTP_IF_NONE_MATCH=snapshot.etag)
+        )
+
+        # Verify expectations.
+        assert response.status_code == 200
+        assert response.content == snapshot.content
+        assert response["ETag"] == snapshot.etag
+        assert "max-age=" in response["Cache-Control"]
+        assert conditional_response.status_code == 304
+        assert conditional_response["ETag"] == snapshot.etag
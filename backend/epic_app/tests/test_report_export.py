@@ -0,0 +1,170 @@
+import csv
+import io
+from typing import List
+
+import openpyxl
+import pytest
+
+from epic_app.models.epic_answers import (
+    MultipleChoiceAnswer,
+    SingleChoiceAnswer,
+    YesNoAnswer,
+    YesNoAnswerType,
+)
+from epic_app.models.epic_questions import (
+    EvolutionChoiceType,
+    EvolutionQuestion,
+    LinkagesQuestion,
+    NationalFrameworkQuestion,
+)
+from epic_app.models.epic_user import EpicUser
+from epic_app.models.models import Program
+from epic_app.report_export import (
+    ANSWERS_SHEET,
+    CSV_FORMULA_CHARACTERS,
+    SUMMARY_SHEET,
+    export_sheets,
+    iterate_csv_report,
+    write_xlsx_report,
+)
+from epic_app.serializers.report_data import ReportFilters
+from epic_app.tests.epic_db_fixture import epic_test_db
+
+
+def _read_csv(lines: List[str]) -> List[List[str]]:
+    return list(csv.reader(io.StringIO("".join(lines))))
+
+
+@pytest.mark.django_db
+class TestReportExport:
+    @pytest.fixture(autouse=True)
+    def report_export_fixture(self, epic_test_db: pytest.fixture):
+        """
+        Answers all the questions with 'Anakin' and 'Palpatine'.
+
+        Args:
+            epic_test_db (pytest.fixture): Fixture to load for the whole file tests.
+        """
+        for e_user in EpicUser.objects.filter(username__in=["Anakin", "Palpatine"]):
+            for nfq in NationalFrameworkQuestion.objects.all():
+                YesNoAnswer.objects.create(
+                    user=e_user,
+                    question=nfq,
+                    short_answer=YesNoAnswerType.YES,
+                    justify_answer=f"=SUM(A1) by {e_user.username}",
+                )
+            for eq in EvolutionQuestion.objects.all():
+                SingleChoiceAnswer.objects.create(
+                    user=e_user,
+                    question=eq,
+                    selected_choice=EvolutionChoiceType.ENGAGED,
+                )
+            for lnk in LinkagesQuestion.objects.all():
+                mca = MultipleChoiceAnswer.objects.create(user=e_user, question=lnk)
+                mca.selected_programs.add(Program.objects.first())
+
+    def test_csv_answers_sheet(self):
+        # Run test.
+        rows = _read_csv(iterate_csv_report(EpicUser.objects.all(), chunk_size=2))
+
+        # Verify expectations.
+        assert rows[0] == export_sheets[ANSWERS_SHEET]
+        assert len(rows) == 1 + YesNoAnswer.objects.count() + (
+            SingleChoiceAnswer.objects.count() + MultipleChoiceAnswer.objects.count()
+        )
+        assert [
+            "Yes",
+            "'=SUM(A1) by Anakin",
+        ] in [row[3:] for row in rows[1:]]
+        assert [
+            str(EvolutionChoiceType.ENGAGED.label),
+            "",
+        ] in [row[3:] for row in rows[1:]]
+        assert [Program.objects.first().name, ""] in [row[3:] for row in rows[1:]]
+
+    def test_csv_answers_are_ordered_by_question(self):
+        # Run test.
+        rows = _read_csv(iterate_csv_report(EpicUser.objects.all(), chunk_size=1))
+
+        # Verify expectations.
+        question_titles = [row[1] for row in rows[1:]]
+        # Answers of a question are consecutive.
+        assert len(set(question_titles)) == len(
+            [
+                q_title
+                for idx, q_title in enumerate(question_titles)
+                if idx == 0 or question_titles[idx - 1] != q_title
+            ]
+        )
+
+    def test_csv_summary_sheet(self):
+        # Run test.
+        rows = _read_csv(
+            iterate_csv_report(
+                EpicUser.objects.all(),
+                SUMMARY_SHEET,
+                ReportFilters(question_types=("nationalframeworkquestion",)),
+            )
+        )
+
+        # Verify expectations.
+        assert rows[0] == export_sheets[SUMMARY_SHEET]
+        for nfq in NationalFrameworkQuestion.objects.all():
+            assert [nfq.program.name, nfq.title, "2", "Yes", "2"] in rows
+            assert [
+                nfq.program.name,
+                nfq.title,
+                "2",
+                "no_valid_response",
+                str(EpicUser.objects.count() - 2),
+            ] in rows
+
+    @pytest.mark.parametrize(
+        "justification",
+        [
+            pytest.param('=HYPERLINK("http://evil")', id="Equals"),
+            pytest.param("+1+1", id="Plus"),
+            pytest.param("-1+1", id="Minus"),
+            pytest.param("@SUM(A1)", id="At"),
+            pytest.param("\t=1+1", id="Tab"),
+        ],
+    )
+    def test_csv_formulas_are_escaped(self, justification: str):
+        # Define test data.
+        YesNoAnswer.objects.update(justify_answer=justification)
+
+        # Run test.
+        rows = _read_csv(iterate_csv_report(EpicUser.objects.all()))
+
+        # Verify expectations.
+        justifications = {row[4] for row in rows[1:] if row[3] == "Yes"}
+        assert justifications == {f"'{justification}"}
+
+    def test_csv_unknown_sheet_raises(self):
+        with pytest.raises(ValueError) as e_info:
+            list(iterate_csv_report(EpicUser.objects.all(), "justifications"))
+        assert str(e_info.value) == "Sheet `justifications` not supported."
+
+    def test_xlsx_report_is_equal_to_csv_report(self):
+        # Define test data.
+        output = io.BytesIO()
+
+        # Run test.
+        write_xlsx_report(output, EpicUser.objects.all(), chunk_size=2)
+
+        # Verify expectations.
+        workbook = openpyxl.load_workbook(output)
+        assert workbook.sheetnames == [sheet.capitalize() for sheet in export_sheets]
+        for sheet in export_sheets:
+            xlsx_rows = [
+                ["" if value is None else str(value) for value in row]
+                for row in workbook[sheet.capitalize()].iter_rows(values_only=True)
+            ]
+            # Text is never read as a formula, in CSV it is escaped with a leading `'`.
+            xlsx_rows = [
+                [f"'{v}" if v.startswith(CSV_FORMULA_CHARACTERS) else v for v in row]
+                for row in xlsx_rows
+            ]
+            assert xlsx_rows == _read_csv(
+                iterate_csv_report(EpicUser.objects.all(), sheet)
+            )
@@ -1,12 +1,22 @@
+import csv
+import io
 import json
+import zipfile
 from pathlib import Path
-from typing import Callable, Optional, Type
+from typing import Callable, List, Optional, Tuple, Type
+from unittest.mock import patch
 
+import openpyxl
 import pytest
 from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.db import connection
 from django.http import FileResponse
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
 from rest_framework.test import APIClient
 
+from epic_app.domain_catalogue import clear_catalogue_snapshot
 from epic_app.models.epic_answers import (
     Answer,
     MultipleChoiceAnswer,
@@ -14,6 +24,7 @@ from epic_app.models.epic_answers import (
     YesNoAnswer,
     YesNoAnswerType,
 )
+from epic_app.models.epic_jobs import ReportJob, ReportJobStatus
 from epic_app.models.epic_questions import (
     EvolutionChoiceType,
     EvolutionQuestion,
@@ -22,11 +33,14 @@ from epic_app.models.epic_questions import (
     NationalFrameworkQuestion,
     Question,
 )
+from epic_app.models.epic_summaries import AnswerSummary, UserProgress
 from epic_app.models.epic_user import EpicOrganization, EpicUser
-from epic_app.models.models import Program
+from epic_app.models.models import Agency, Area, Group, Program
+from epic_app.serializers.report_pdf import EpicPdfReport
 from epic_app.tests import test_data_dir
 from epic_app.tests.epic_db_fixture import epic_test_db
 from epic_app.utils import get_submodel_type_list
+from epic_app.views import QuestionViewSet
 
 
 @pytest.fixture(autouse=True)
@@ -403,6 +417,430 @@ class TestEpicOrganizationViewSet:
             f.write(fs)
         assert output_file.exists()
 
+    @pytest.mark.parametrize("toc", EpicPdfReport.toc_modes)
+    def test_RETRIEVE_pdf_report_with_toc(
+        self, toc: str, _report_fixture: dict, api_client: APIClient
+    ):
+        full_url = self.url_root + "report-pdf/"
+        set_user_auth_token(api_client, "Dooku")
+        default_response = api_client.get(full_url)
+
+        # Run request.
+        response = api_client.get(full_url, {"toc": toc})
+
+        # Verify final expectations.
+        assert response.status_code == 200
+        assert b"".join(response.streaming_content).startswith(b"%PDF")
+        assert (response["ETag"] == default_response["ETag"]) == (
+            toc == EpicPdfReport.TOC_MULTIPASS
+        )
+
+    def test_RETRIEVE_pdf_report_with_unknown_toc(
+        self, _report_fixture: dict, api_client: APIClient
+    ):
+        set_user_auth_token(api_client, "Dooku")
+        response = api_client.get(self.url_root + "report-pdf/", {"toc": "middle"})
+        assert response.status_code == 400
+        assert "toc" in response.data
+
+    def test_RETRIEVE_xlsx_report(self, _report_fixture: dict, api_client: APIClient):
+        set_user_auth_token(api_client, "Dooku")
+
+        # Run request.
+        response = api_client.get(self.url_root + "report-xlsx/")
+
+        # Verify final expectations.
+        assert response.status_code == 200
+        assert "answers_report.xlsx" in response["Content-Disposition"]
+        workbook = openpyxl.load_workbook(
+            io.BytesIO(b"".join(response.streaming_content))
+        )
+        assert workbook.sheetnames == ["Answers", "Summary"]
+        assert workbook["Answers"].max_row == 1 + len(
+            EpicUser.objects.get(username="Anakin").user_answers.all()
+        )
+
+    @pytest.mark.parametrize("sheet", ["answers", "summary"])
+    def test_RETRIEVE_csv_report(
+        self, sheet: str, _report_fixture: dict, api_client: APIClient
+    ):
+        full_url = self.url_root + "report-csv/"
+        set_user_auth_token(api_client, "Dooku")
+
+        # Run request.
+        response = api_client.get(full_url, {"sheet": sheet})
+
+        # Verify final expectations.
+        assert response.status_code == 200
+        assert response.streaming
+        assert response["Content-Type"] == "text/csv"
+        rows = list(
+            csv.reader(io.StringIO(b"".join(response.streaming_content).decode()))
+        )
+        assert len(rows) > 1
+        response = api_client.get(
+            full_url, {"sheet": sheet}, HTTP_IF_NONE_MATCH=response["ETag"]
+        )
+        assert response.status_code == 304
+
+    def test_RETRIEVE_csv_report_with_unknown_sheet(
+        self, _report_fixture: dict, api_client: APIClient
+    ):
+        set_user_auth_token(api_client, "Dooku")
+        response = api_client.get(
+            self.url_root + "report-csv/", {"sheet": "justifications"}
+        )
+        assert response.status_code == 400
+        assert "sheet" in response.data
+
+    @pytest.mark.parametrize("split_by", ["program", "area"])
+    def test_RETRIEVE_pdf_report_bundle(
+        self, split_by: str, _report_fixture: dict, api_client: APIClient
+    ):
+        full_url = self.url_root + "report-pdf-bundle/"
+        set_user_auth_token(api_client, "Dooku")
+
+        # Run request.
+        response = api_client.get(full_url, {"split": split_by, "toc": "none"})
+
+        # Verify final expectations.
+        assert response.status_code == 200
+        assert response["Content-Type"] == "application/zip"
+        with zipfile.ZipFile(
+            io.BytesIO(b"".join(response.streaming_content))
+        ) as bundle:
+            file_names = bundle.namelist()
+            assert file_names
+            for f_name in file_names:
+                assert f_name.startswith(f"{split_by}-")
+                assert bundle.read(f_name).startswith(b"%PDF")
+        response = api_client.get(
+            full_url,
+            {"split": split_by, "toc": "none"},
+            HTTP_IF_NONE_MATCH=response["ETag"],
+        )
+        assert response.status_code == 304
+
+    def test_RETRIEVE_pdf_report_bundle_with_unknown_split(
+        self, _report_fixture: dict, api_client: APIClient
+    ):
+        set_user_auth_token(api_client, "Dooku")
+        response = api_client.get(
+            self.url_root + "report-pdf-bundle/", {"split": "group"}
+        )
+        assert response.status_code == 400
+        assert "split" in response.data
+
+    @pytest.mark.parametrize(
+        "report_url",
+        [pytest.param("report/", id="JSON"), pytest.param("report-pdf/", id="PDF")],
+    )
+    def test_RETRIEVE_report_conditionally(
+        self, report_url: str, _report_fixture: dict, api_client: APIClient
+    ):
+        full_url = self.url_root + report_url
+        set_user_auth_token(api_client, "Dooku")
+
+        # Run first request.
+        response = api_client.get(full_url)
+        assert response.status_code == 200
+        etag = response["ETag"]
+        assert response["Last-Modified"]
+
+        # Verify unchanged reports are not sent again.
+        response = api_client.get(full_url, HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == 304
+        assert response["ETag"] == etag
+        response = api_client.get(
+            full_url, HTTP_IF_MODIFIED_SINCE=response["Last-Modified"]
+        )
+        assert response.status_code == 304
+
+        # Verify any answer write changes the report version.
+        yna = YesNoAnswer.objects.first()
+        yna.short_answer = YesNoAnswerType.NO
+        yna.save()
+        response = api_client.get(full_url, HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == 200
+        assert response["ETag"] != etag
+
+    def test_RETRIEVE_report_is_cached(
+        self,
+        _report_fixture: dict,
+        api_client: APIClient,
+        django_assert_max_num_queries: Callable,
+    ):
+        full_url = self.url_root + "report/"
+        set_user_auth_token(api_client, "Dooku")
+        first_response = api_client.get(full_url)
+
+        # Only authentication and data versions are queried.
+        with django_assert_max_num_queries(4):
+            response = api_client.get(full_url)
+
+        # Verify final expectations.
+        assert response.status_code == 200
+        assert response["ETag"] == first_response["ETag"]
+        assert json.dumps(response.data) == json.dumps(first_response.data)
+
+    def test_RETRIEVE_streamed_report(
+        self, _report_fixture: dict, api_client: APIClient
+    ):
+        full_url = self.url_root + "report/"
+        set_user_auth_token(api_client, "Dooku")
+        expected_response = api_client.get(full_url)
+
+        # Run request.
+        response = api_client.get(full_url, {"stream": "true"})
+
+        # Verify final expectations.
+        assert response.status_code == 200
+        assert response.streaming
+        assert response["ETag"] == expected_response["ETag"]
+        assert b"".join(response.streaming_content) == expected_response.content
+
+    def test_RETRIEVE_report_by_area_and_question_type(
+        self, _report_fixture: dict, api_client: APIClient
+    ):
+        full_url = self.url_root + "report/"
+        set_user_auth_token(api_client, "Dooku")
+        area = Area.objects.first()
+
+        # Run request.
+        response = api_client.get(
+            full_url, {"area": area.pk, "question_type": "evolutionquestion"}
+        )
+
+        # Verify final expectations.
+        assert response.status_code == 200
+        area_programs = Program.objects.filter(group__area=area)
+        assert [p_report["id"] for p_report in response.data] == list(
+            area_programs.order_by("pk").values_list("pk", flat=True)
+        )
+        assert {
+            q_report["id"]
+            for p_report in response.data
+            for q_report in p_report["questions"]
+        } == set(
+            EvolutionQuestion.objects.filter(program__in=area_programs).values_list(
+                "pk", flat=True
+            )
+        )
+        streamed_response = api_client.get(
+            full_url,
+            {"area": area.pk, "question_type": "evolutionquestion", "stream": "true"},
+        )
+        assert b"".join(streamed_response.streaming_content) == response.content
+
+    def test_RETRIEVE_report_by_user(
+        self, _report_fixture: dict, api_client: APIClient
+    ):
+        full_url = self.url_root + "report/"
+        set_user_auth_token(api_client, "Dooku")
+        anakin = EpicUser.objects.get(username="Anakin")
+        full_response = api_client.get(full_url)
+
+        # Run request.
+        response = api_client.get(full_url, {"user": anakin.pk})
+
+        # Verify final expectations.
+        assert response.status_code == 200
+        assert response["ETag"] != full_response["ETag"]
+        for p_report in response.data:
+            for q_report in p_report["questions"]:
+                assert len(q_report["question_answers"]["answers"]) == (
+                    anakin.user_answers.filter(question=q_report["id"]).count()
+                )
+
+    @pytest.mark.parametrize(
+        "report_url",
+        [pytest.param("report/", id="JSON"), pytest.param("report-pdf/", id="PDF")],
+    )
+    def test_RETRIEVE_report_by_agency_after_agencies_change(
+        self, report_url: str, _report_fixture: dict, api_client: APIClient
+    ):
+        # Define test data.
+        full_url = self.url_root + report_url
+        set_user_auth_token(api_client, "Dooku")
+        rws_agency = Agency.objects.get(name="R.W.S.")
+        a_program = Program.objects.get(name="a")
+        response = api_client.get(full_url, {"agency": rws_agency.pk})
+        etag = response["ETag"]
+
+        # Run test.
+        a_program.agencies.add(rws_agency)
+        response = api_client.get(
+            full_url, {"agency": rws_agency.pk}, HTTP_IF_NONE_MATCH=etag
+        )
+
+        # Verify final expectations.
+        assert response.status_code == 200
+        assert response["ETag"] != etag
+        if report_url == "report/":
+            assert a_program.pk in [p_report["id"] for p_report in response.data]
+
+    def test_RETRIEVE_report_without_justifications(
+        self, _report_fixture: dict, api_client: APIClient
+    ):
+        full_url = self.url_root + "report/"
+        set_user_auth_token(api_client, "Dooku")
+        full_response = api_client.get(full_url)
+
+        # Run request.
+        response = api_client.get(full_url, {"justifications": "false"})
+
+        # Verify final expectations.
+        assert response.status_code == 200
+        assert response["ETag"] != full_response["ETag"]
+        for p_report in response.data:
+            for q_report in p_report["questions"]:
+                assert not any(
+                    key.endswith("_justify")
+                    for key in q_report["question_answers"]["summary"]
+                )
+        response = api_client.get(full_url, {"max_justifications": "all"})
+        assert response.status_code == 400
+        assert "summary" in response.data
+
+    def test_RETRIEVE_report_with_limited_linkages(
+        self, _report_fixture: dict, api_client: APIClient
+    ):
+        full_url = self.url_root + "report/"
+        set_user_auth_token(api_client, "Dooku")
+        linkages_ids = set(LinkagesQuestion.objects.values_list("pk", flat=True))
+        full_response = api_client.get(full_url)
+
+        # Run request.
+        response = api_client.get(full_url, {"max_linkages": 1})
+
+        # Verify final expectations.
+        assert response.status_code == 200
+        assert response["ETag"] != full_response["ETag"]
+        linkages_summaries = [
+            q_report["question_answers"]["summary"]
+            for p_report in response.data
+            for q_report in p_report["questions"]
+            if q_report["id"] in linkages_ids
+            and q_report["question_answers"]["answers"]
+        ]
+        assert linkages_summaries
+        for summary in linkages_summaries:
+            assert summary[MultipleChoiceAnswer.OTHER_PROGRAMS] == 1
+            assert len(summary) == 3
+        response = api_client.get(full_url, {"max_linkages": 0})
+        assert response.status_code == 400
+        assert "summary" in response.data
+
+    @pytest.mark.parametrize(
+        "report_url",
+        [pytest.param("report/", id="JSON"), pytest.param("report-pdf/", id="PDF")],
+    )
+    @pytest.mark.parametrize(
+        "query_params",
+        [
+            pytest.param({"program": "first"}, id="Not an id"),
+            pytest.param({"question_type": "jediquestion"}, id="Unknown type"),
+        ],
+    )
+    def test_RETRIEVE_report_with_invalid_filters(
+        self, report_url: str, query_params: dict, api_client: APIClient
+    ):
+        set_user_auth_token(api_client, "Dooku")
+        response = api_client.get(self.url_root + report_url, query_params)
+        assert response.status_code == 400
+        assert "filters" in response.data
+
+
+@pytest.mark.django_db
+class TestReportJobViewSet:
+    url_root = "/api/reportjob/"
+
+    def test_report_job_is_requested_and_downloaded(self, api_client: APIClient):
+        set_user_auth_token(api_client, "Dooku")
+
+        # Request the report twice.
+        response = api_client.post(self.url_root)
+        assert response.status_code == 202
+        job_url = self.url_root + f"{response.data['id']}/"
+        assert response["Location"].endswith(job_url)
+        assert response.data["status"] == ReportJobStatus.PENDING
+        response = api_client.post(self.url_root)
+        assert response.status_code == 200
+        assert response["Location"].endswith(job_url)
+
+        # Verify the report is not available until generated.
+        response = api_client.get(job_url + "download/")
+        assert response.status_code == 409
+        call_command("run_report_jobs", "--once")
+
+        # Verify final expectations.
+        response = api_client.get(job_url)
+        assert response.status_code == 200
+        assert response.data["status"] == ReportJobStatus.DONE
+        assert response.data["progress"] == 1
+        assert len(api_client.get(self.url_root).data) == 1
+        response: FileResponse = api_client.get(job_url + "download/")
+        assert response.status_code == 200
+        assert b"".join(response.streaming_content).startswith(b"%PDF")
+
+    def test_report_job_options(self, api_client: APIClient):
+        set_user_auth_token(api_client, "Dooku")
+        default_job = api_client.post(self.url_root).data
+
+        # Run request.
+        response = api_client.post(self.url_root + "?toc=end")
+
+        # Verify final expectations.
+        assert response.status_code == 202
+        assert response.data["id"] != default_job["id"]
+        assert response.data["options"] == {
+            "toc": EpicPdfReport.TOC_END,
+            "filters": {},
+            "summary": {},
+        }
+        assert api_client.post(self.url_root + "?toc=middle").status_code == 400
+        filtered_job = api_client.post(self.url_root + "?toc=end&area=1").data
+        assert filtered_job["id"] != response.data["id"]
+        filtered_job = api_client.post(
+            self.url_root + "?toc=end&area=1&max_justifications=2"
+        ).data
+        assert filtered_job["options"]["filters"] == {"area": "1"}
+        assert filtered_job["options"]["summary"] == {"max_justifications": "2"}
+        call_command("run_report_jobs", "--once")
+        assert ReportJob.objects.get(pk=response.data["id"]).status == (
+            ReportJobStatus.DONE
+        )
+        assert ReportJob.objects.get(pk=filtered_job["id"]).status == (
+            ReportJobStatus.DONE
+        )
+
+    def test_expired_report_job_is_gone(self, api_client: APIClient):
+        set_user_auth_token(api_client, "Dooku")
+        response = api_client.post(self.url_root)
+        call_command("run_report_jobs", "--once")
+        ReportJob.objects.update(expires_at=timezone.now())
+
+        # Run request.
+        response = api_client.get(self.url_root + f"{response.data['id']}/download/")
+
+        # Verify final expectations.
+        assert response.status_code == 410
+
+    def test_report_jobs_of_other_users_are_not_found(self, api_client: APIClient):
+        set_user_auth_token(api_client, "Dooku")
+        job_id = api_client.post(self.url_root).data["id"]
+
+        # Run request.
+        set_user_auth_token(api_client, "admin")
+        response = api_client.get(self.url_root + f"{job_id}/")
+
+        # Verify final expectations.
+        assert response.status_code == 404
+
+    def test_report_jobs_require_advisor(self, api_client: APIClient):
+        set_user_auth_token(api_client, "Palpatine")
+        assert api_client.post(self.url_root).status_code == 403
+
 
 @pytest.mark.django_db
 class TestAreaViewSet:
@@ -486,6 +924,56 @@ class TestAgencyViewSet:
         assert len(response.data) == expected_entries
 
 
+@pytest.mark.django_db
+class TestCatalogueViewSet:
+    url_root = "/api/catalogue/"
+
+    @pytest.fixture(autouse=True)
+    def catalogue_fixture(self):
+        clear_catalogue_snapshot()
+        yield
+        clear_catalogue_snapshot()
+
+    def test_GET_catalogue(self, api_client: APIClient):
+        # Define test data.
+        set_user_auth_token(api_client, "Palpatine")
+
+        # Run request.
+        response = api_client.get(self.url_root)
+
+        # Verify final expectations.
+        assert response.status_code == 200
+        catalogue = json.loads(response.content)
+        assert [a["id"] for a in catalogue["areas"]] == list(
+            Area.objects.order_by("pk").values_list("pk", flat=True)
+        )
+        assert len(catalogue["agencies"]) == Agency.objects.count()
+        assert response["ETag"]
+        assert "private" in response["Cache-Control"]
+
+    def test_GET_catalogue_is_conditional(
+        self, api_client: APIClient, django_assert_max_num_queries: Callable
+    ):
+        # Define test data.
+        set_user_auth_token(api_client, "Palpatine")
+        etag = api_client.get(self.url_root)["ETag"]
+
+        # Run request.
+        # Only authentication and the catalogue version are queried.
+        with django_assert_max_num_queries(2):
+            response = api_client.get(self.url_root, HTTP_IF_NONE_MATCH=etag)
+
+        # Verify final expectations.
+        assert response.status_code == 304
+        Area.objects.create(name="Lorem")
+        response = api_client.get(self.url_root, HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == 200
+        assert response["ETag"] != etag
+
+    def test_GET_catalogue_requires_authentication(self, api_client: APIClient):
+        assert api_client.get(self.url_root).status_code == 403
+
+
 @pytest.mark.django_db
 class TestGroupViewSet:
     url_root = "/api/group/"
@@ -665,6 +1153,288 @@ class TestProgramViewSet:
         for qa in response.data["questions_answers"]:
             assert qa in _progress_fixture["questions_answers"]
 
+    def test_RETRIEVE_programs_progress_epic_user(
+        self, api_client: APIClient, _progress_fixture: dict
+    ):
+        # Define test data.
+        a_program: Program = Program.objects.get(name="a")
+        set_user_auth_token(api_client, "Anakin")
+        expected_entry = dict(
+            id=a_program.pk,
+            progress=_progress_fixture["progress"],
+            n_questions=len(_progress_fixture["questions_answers"]),
+            n_valid_answers=NationalFrameworkQuestion.objects.count(),
+        )
+
+        # Run request.
+        response = api_client.get(self.url_root + "progress/", {"rollup": "group,area"})
+
+        # Verify final expectations
+        assert response.status_code == 200
+        assert response.data["programs"] == [expected_entry]
+        assert response.data["groups"] == [dict(expected_entry, id=a_program.group_id)]
+        assert response.data["areas"] == [
+            dict(expected_entry, id=a_program.group.area_id)
+        ]
+        single_response = api_client.get(self.url_root + f"{a_program.pk}/progress/")
+        assert single_response.data["progress"] == expected_entry["progress"]
+
+    @pytest.mark.parametrize(
+        "query_params, expected_keys",
+        [
+            pytest.param({}, ["programs"], id="No rollup"),
+            pytest.param({"rollup": "area"}, ["programs", "areas"], id="Area rollup"),
+            pytest.param({"program": "2,3"}, ["programs"], id="Without questions"),
+        ],
+    )
+    def test_RETRIEVE_programs_progress_options(
+        self, api_client: APIClient, query_params: dict, expected_keys: List[str]
+    ):
+        set_user_auth_token(api_client, "Palpatine")
+        response = api_client.get(self.url_root + "progress/", query_params)
+        assert response.status_code == 200
+        assert list(response.data.keys()) == expected_keys
+        if "program" in query_params:
+            assert response.data["programs"] == []
+        else:
+            assert response.data["programs"][0]["progress"] == 0
+
+    @pytest.mark.parametrize(
+        "query_params, error_key",
+        [
+            pytest.param({"rollup": "agency"}, "rollup", id="Unknown rollup"),
+            pytest.param({"program": "a"}, "filters", id="Invalid program"),
+            pytest.param({"user": "1"}, "filters", id="Unsupported user"),
+            pytest.param(
+                {"question_type": "evolutionquestion"},
+                "filters",
+                id="Unsupported question type",
+            ),
+        ],
+    )
+    def test_RETRIEVE_programs_progress_invalid_params(
+        self, api_client: APIClient, query_params: dict, error_key: str
+    ):
+        set_user_auth_token(api_client, "Palpatine")
+        response = api_client.get(self.url_root + "progress/", query_params)
+        assert response.status_code == 400
+        assert error_key in response.data
+
+    def test_RETRIEVE_questionnaire(self, api_client: APIClient):
+        # Define test data.
+        a_program: Program = Program.objects.get(name="a")
+        anakin = EpicUser.objects.get(username="Anakin")
+        nfq = NationalFrameworkQuestion.objects.filter(program=a_program).first()
+        yna = YesNoAnswer.objects.create(
+            user=anakin, question=nfq, short_answer=YesNoAnswerType.YES
+        )
+        set_user_auth_token(api_client, "Anakin")
+        full_url = self.url_root + f"{a_program.pk}/questionnaire/"
+
+        # Run request.
+        response = api_client.get(full_url)
+
+        # Verify final expectations.
+        assert response.status_code == 200
+        assert response.data["program"] == a_program.pk
+        assert {
+            slug: [q["id"] for q in questions]
+            for slug, questions in response.data["questions"].items()
+        } == {
+            "nationalframework": [
+                nfq.pk for nfq in NationalFrameworkQuestion.objects.order_by("pk")
+            ],
+            "keyagencyactions": [
+                kaa.pk for kaa in KeyAgencyActionsQuestion.objects.order_by("pk")
+            ],
+            "evolution": [evo.pk for evo in EvolutionQuestion.objects.order_by("pk")],
+            "linkages": [lnk.pk for lnk in LinkagesQuestion.objects.order_by("pk")],
+        }
+        assert [a["question"] for a in response.data["answers"]] == list(
+            a_program.questions.order_by("pk").values_list("pk", flat=True)
+        )
+        assert response.data["answers"][0] == dict(
+            id=yna.pk,
+            user=anakin.pk,
+            question=nfq.pk,
+            short_answer=YesNoAnswerType.YES,
+            justify_answer="",
+        )
+        assert api_client.get(full_url).data == response.data
+        assert Answer.objects.filter(user=anakin).count() == len(
+            response.data["answers"]
+        )
+        assert UserProgress.get_inconsistencies() == []
+
+    @pytest.mark.parametrize(
+        "url_slug, question_type",
+        [
+            pytest.param(
+                "nationalframework", NationalFrameworkQuestion, id="National Framework"
+            ),
+            pytest.param(
+                "keyagencyactions", KeyAgencyActionsQuestion, id="Key Agency Actions"
+            ),
+            pytest.param("evolution", EvolutionQuestion, id="Evolution"),
+            pytest.param("linkages", LinkagesQuestion, id="Linkages"),
+        ],
+    )
+    def test_RETRIEVE_questionnaire_by_question_type(
+        self, api_client: APIClient, url_slug: str, question_type: Type[Question]
+    ):
+        # Define test data.
+        a_program: Program = Program.objects.get(name="a")
+        anakin = EpicUser.objects.get(username="Anakin")
+        set_user_auth_token(api_client, "Anakin")
+        full_url = self.url_root + f"{a_program.pk}/questionnaire/"
+
+        # Run request.
+        response = api_client.get(full_url, {"question_type": url_slug})
+
+        # Verify final expectations.
+        assert response.status_code == 200
+        type_questions = list(
+            question_type.objects.filter(program=a_program)
+            .order_by("pk")
+            .values_list("pk", flat=True)
+        )
+        assert type_questions
+        assert {
+            slug: [q["id"] for q in questions]
+            for slug, questions in response.data["questions"].items()
+        } == {url_slug: type_questions}
+        assert [a["question"] for a in response.data["answers"]] == type_questions
+        assert (
+            list(
+                Answer.objects.filter(user=anakin)
+                .order_by("question_id")
+                .values_list("question_id", flat=True)
+            )
+            == type_questions
+        )
+        assert UserProgress.get_inconsistencies() == []
+
+    def test_RETRIEVE_questionnaire_unknown_question_type(self, api_client: APIClient):
+        # Define test data.
+        set_user_auth_token(api_client, "Anakin")
+
+        # Run request.
+        response = api_client.get(
+            self.url_root + "1/questionnaire/", {"question_type": "evolution,lorem"}
+        )
+
+        # Verify final expectations.
+        assert response.status_code == 400
+        assert "question_type" in response.data
+        assert not Answer.objects.exists()
+
+    def test_RETRIEVE_questionnaire_queries_do_not_depend_on_questions(
+        self, api_client: APIClient
+    ):
+        # Define test data.
+        def add_questions(program: Program, n_questions: int):
+            LinkagesQuestion.objects.create(title="Amet", program=program)
+            for idx in range(n_questions):
+                NationalFrameworkQuestion.objects.create(
+                    title=f"Lorem {idx}", description="Ipsum", program=program
+                )
+                KeyAgencyActionsQuestion.objects.create(
+                    title=f"Dolor {idx}", description="Ipsum", program=program
+                )
+                EvolutionQuestion.objects.create(title=f"Sit {idx}", program=program)
+
+        small_program, large_program = Program.objects.filter(name__in=["b", "c"])
+        add_questions(small_program, 1)
+        add_questions(large_program, 5)
+        set_user_auth_token(api_client, "Anakin")
+
+        def get_questionnaire(program: Program) -> int:
+            with CaptureQueriesContext(connection) as captured_queries:
+                response = api_client.get(
+                    self.url_root + f"{program.pk}/questionnaire/"
+                )
+            assert response.status_code == 200
+            assert len(response.data["answers"]) == program.questions.count()
+            return len(captured_queries)
+
+        # Run request and verify final expectations.
+        # The first answers ever created also create the answers data version.
+        get_questionnaire(Program.objects.get(name="a"))
+        assert get_questionnaire(small_program) == get_questionnaire(large_program)
+        assert get_questionnaire(small_program) == get_questionnaire(large_program)
+
+    def test_RETRIEVE_questionnaire_requires_epic_user(self, api_client: APIClient):
+        # Define test data.
+        set_user_auth_token(api_client, "admin")
+
+        # Run request.
+        response = api_client.get(self.url_root + "1/questionnaire/")
+
+        # Verify final expectations.
+        assert response.status_code == 403
+
+
+def _add_domain_rows(n_rows: int):
+    """
+    Adds `n_rows` areas, each with `n_rows` groups, each with `n_rows` programs with an agency and a question.
+    The first area, group and agency get `n_rows` more groups and programs.
+    """
+    for idx in range(n_rows):
+        group = Group.objects.create(name=f"Extra group {idx}", area_id=1)
+        Program.objects.create(name=f"Extra {idx}", description="Lorem", group=group)
+        Program.objects.create(
+            name=f"Extra first {idx}", description="Lorem", group_id=1
+        ).agencies.add(1)
+    for area_idx in range(n_rows):
+        area = Area.objects.create(name=f"Area {area_idx}")
+        agency = Agency.objects.create(name=f"Agency {area_idx}")
+        for group_idx in range(n_rows):
+            group = Group.objects.create(name=f"Group {group_idx}", area=area)
+            for program_idx in range(n_rows):
+                program = Program.objects.create(
+                    name=f"Program {area_idx}.{group_idx}.{program_idx}",
+                    description="Lorem ipsum",
+                    group=group,
+                )
+                program.agencies.add(agency)
+                NationalFrameworkQuestion.objects.create(
+                    title="Lorem", description="Ipsum", program=program
+                )
+
+
+@pytest.mark.django_db
+class TestDomainViewSetQueries:
+    @pytest.mark.parametrize(
+        "url",
+        [
+            pytest.param("/api/area/", id="Areas"),
+            pytest.param("/api/group/", id="Groups"),
+            pytest.param("/api/agency/", id="Agencies"),
+            pytest.param("/api/program/", id="Programs"),
+            pytest.param("/api/area/1/", id="Area"),
+            pytest.param("/api/group/1/", id="Group"),
+            pytest.param("/api/agency/1/", id="Agency"),
+            pytest.param("/api/program/1/", id="Program"),
+        ],
+    )
+    def test_GET_queries_do_not_depend_on_rows(self, url: str, api_client: APIClient):
+        # Define test data.
+        set_user_auth_token(api_client, "Palpatine")
+
+        def get_n_queries() -> int:
+            with CaptureQueriesContext(connection) as captured_queries:
+                response = api_client.get(url)
+            assert response.status_code == 200
+            return len(captured_queries)
+
+        # Run request.
+        n_queries = get_n_queries()
+        _add_domain_rows(3)
+        Program.objects.get(pk=1).agencies.add(*Agency.objects.all())
+
+        # Verify final expectations.
+        assert get_n_queries() == n_queries
+
 
 @pytest.mark.django_db
 class TestQuestionViewSet:
@@ -729,6 +1499,169 @@ class TestQuestionViewSet:
         # As many answers as users there are
         assert len(response.data) == len(EpicUser.objects.all())
 
+    @pytest.mark.parametrize("q_type", q_subtypes)
+    def test_RETRIEVE_answers_for_superuser_is_read_only(
+        self, q_type: Type[Question], api_client: APIClient
+    ):
+        # Define test data.
+        question = q_type.objects.all().first()
+        palpatine = EpicUser.objects.get(username="Palpatine")
+        answer = QuestionViewSet._get_related_answer_type(question.pk).objects.create(
+            question=question, user=palpatine
+        )
+        full_url = self.url_root + str(question.pk) + "/answers/"
+        set_user_auth_token(api_client, "admin")
+
+        def get_answers() -> Tuple[list, int]:
+            with CaptureQueriesContext(connection) as captured_queries:
+                response = api_client.get(full_url)
+            assert response.status_code == 200
+            return response.data, len(captured_queries)
+
+        # Run request.
+        answers, n_queries = get_answers()
+        for idx in range(3):
+            EpicUser.objects.create(username=f"Clone {idx}")
+        more_answers, more_n_queries = get_answers()
+
+        # Verify final expectations.
+        assert Answer.objects.count() == 1
+        assert sorted(a["user"] for a in answers) == sorted(
+            EpicUser.objects.exclude(username__startswith="Clone").values_list(
+                "pk", flat=True
+            )
+        )
+        assert [a["id"] for a in answers if a["user"] == palpatine.pk] == [answer.pk]
+        assert all(a["id"] is None for a in answers if a["user"] != palpatine.pk)
+        assert all(a["question"] == question.pk for a in answers)
+        assert len(more_answers) == len(answers) + 3
+        assert more_n_queries == n_queries
+
+    def test_RETRIEVE_answers_for_epic_user_is_created_once(
+        self, api_client: APIClient
+    ):
+        # Define test data.
+        question = NationalFrameworkQuestion.objects.first()
+        full_url = self.url_root + str(question.pk) + "/answers/"
+        set_user_auth_token(api_client, "Palpatine")
+
+        # Run request.
+        first_response = api_client.get(full_url)
+        response = api_client.get(full_url)
+
+        # Verify final expectations.
+        assert response.data == first_response.data
+        assert response.data[0]["id"] is not None
+        assert Answer.objects.filter(question=question).count() == 1
+        assert UserProgress.get_inconsistencies() == []
+
+    def test_RETRIEVE_answers_for_epic_user_created_concurrently(
+        self, api_client: APIClient
+    ):
+        # Define test data.
+        question = NationalFrameworkQuestion.objects.first()
+        palpatine = EpicUser.objects.get(username="Palpatine")
+        full_url = self.url_root + str(question.pk) + "/answers/"
+        set_user_auth_token(api_client, "Palpatine")
+        bulk_create = Answer.objects.bulk_create
+
+        def bulk_create_after_concurrent_request(*args, **kwargs):
+            # Another request creates the answer after it was found missing.
+            YesNoAnswer.objects.create(
+                user=palpatine, question=question, short_answer=YesNoAnswerType.YES
+            )
+            return bulk_create(*args, **kwargs)
+
+        # Run request.
+        with patch.object(
+            Answer.objects,
+            "bulk_create",
+            side_effect=bulk_create_after_concurrent_request,
+        ):
+            first_response = api_client.get(full_url)
+        response = api_client.get(full_url)
+
+        # Verify final expectations.
+        assert first_response.status_code == 200
+        assert response.data == first_response.data
+        assert response.data[0]["short_answer"] == YesNoAnswerType.YES
+        assert Answer.objects.filter(question=question).count() == 1
+        assert UserProgress.get_inconsistencies() == []
+        assert (
+            AnswerSummary.objects.get(
+                question=question, choice=AnswerSummary.TOTAL_CHOICE
+            ).n_answers
+            == 1
+        )
+
+    @pytest.fixture(autouse=False)
+    def _justifications_fixture(self) -> NationalFrameworkQuestion:
+        nfq = NationalFrameworkQuestion.objects.first()
+        for e_user, short_answer, justify in [
+            ("Palpatine", YesNoAnswerType.YES, "Unlimited power"),
+            ("Anakin", YesNoAnswerType.NO, "Not from my point of view"),
+            ("Dooku", YesNoAnswerType.YES, ""),
+        ]:
+            YesNoAnswer.objects.create(
+                user=EpicUser.objects.get(username=e_user),
+                question=nfq,
+                short_answer=short_answer,
+                justify_answer=justify,
+            )
+        return nfq
+
+    def test_RETRIEVE_justifications(
+        self, _justifications_fixture: NationalFrameworkQuestion, api_client: APIClient
+    ):
+        full_url = self.url_root + f"{_justifications_fixture.pk}/justifications/"
+        set_user_auth_token(api_client, "Dooku")
+
+        # Run request.
+        response = api_client.get(full_url, {"page_size": 1})
+
+        # Verify final expectations.
+        assert response.status_code == 200
+        assert response.data["count"] == 2
+        assert response.data["next"]
+        assert [
+            (j_data["choice"], j_data["justify_answer"])
+            for j_data in response.data["results"]
+        ] == [("Yes", "Unlimited power")]
+        response = api_client.get(full_url, {"choice": "no"})
+        assert response.status_code == 200
+        assert [j_data["justify_answer"] for j_data in response.data["results"]] == [
+            "Not from my point of view"
+        ]
+
+    def test_RETRIEVE_justifications_with_unknown_choice(
+        self, _justifications_fixture: NationalFrameworkQuestion, api_client: APIClient
+    ):
+        set_user_auth_token(api_client, "Dooku")
+        response = api_client.get(
+            self.url_root + f"{_justifications_fixture.pk}/justifications/",
+            {"choice": "Maybe"},
+        )
+        assert response.status_code == 400
+        assert "choice" in response.data
+
+    def test_RETRIEVE_justifications_without_justifications(
+        self, api_client: APIClient
+    ):
+        set_user_auth_token(api_client, "Dooku")
+        response = api_client.get(
+            self.url_root + f"{LinkagesQuestion.objects.first().pk}/justifications/"
+        )
+        assert response.status_code == 400
+
+    def test_RETRIEVE_justifications_requires_advisor(
+        self, _justifications_fixture: NationalFrameworkQuestion, api_client: APIClient
+    ):
+        set_user_auth_token(api_client, "Anakin")
+        response = api_client.get(
+            self.url_root + f"{_justifications_fixture.pk}/justifications/"
+        )
+        assert response.status_code == 403
+
 
 @pytest.mark.django_db
 class TestAnswerViewSet:
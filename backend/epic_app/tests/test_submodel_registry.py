@@ -0,0 +1,161 @@
+from typing import Type
+
+import pytest
+from django.core.exceptions import ImproperlyConfigured
+from django.db import models
+
+from epic_app.models.epic_answers import (
+    Answer,
+    MultipleChoiceAnswer,
+    SingleChoiceAnswer,
+    YesNoAnswer,
+)
+from epic_app.models.epic_questions import (
+    EvolutionQuestion,
+    KeyAgencyActionsQuestion,
+    LinkagesQuestion,
+    NationalFrameworkQuestion,
+    Question,
+)
+from epic_app.serializers.answer_serializer import (
+    MultipleChoiceAnswerSerializer,
+    SingleChoiceAnswerSerializer,
+    YesNoAnswerSerializer,
+)
+from epic_app.serializers.question_serializer import (
+    EvolutionQuestionSerializer,
+    KeyAgencyQuestionSerializer,
+    LinkagesQuestionSerializer,
+    NationalFrameworkQuestionSerializer,
+)
+from epic_app.submodel_registry import (
+    QuestionTypeEntry,
+    SubmodelRegistry,
+    get_registry,
+)
+from epic_app.utils import get_submodel_type_list
+
+
+class TestSubmodelRegistry:
+    def test_registry_is_built_when_app_is_ready(self):
+        from epic_app import submodel_registry
+
+        assert submodel_registry._registry is not None
+        assert get_registry() is submodel_registry._registry
+
+    @pytest.mark.parametrize(
+        "q_type, a_type, q_serializer, a_serializer, url_slug",
+        [
+            pytest.param(
+                NationalFrameworkQuestion,
+                YesNoAnswer,
+                NationalFrameworkQuestionSerializer,
+                YesNoAnswerSerializer,
+                "nationalframework",
+                id="NationalFramework",
+            ),
+            pytest.param(
+                KeyAgencyActionsQuestion,
+                YesNoAnswer,
+                KeyAgencyQuestionSerializer,
+                YesNoAnswerSerializer,
+                "keyagencyactions",
+                id="KeyAgencyActions",
+            ),
+            pytest.param(
+                EvolutionQuestion,
+                SingleChoiceAnswer,
+                EvolutionQuestionSerializer,
+                SingleChoiceAnswerSerializer,
+                "evolution",
+                id="Evolution",
+            ),
+            pytest.param(
+                LinkagesQuestion,
+                MultipleChoiceAnswer,
+                LinkagesQuestionSerializer,
+                MultipleChoiceAnswerSerializer,
+                "linkages",
+                id="Linkages",
+            ),
+        ],
+    )
+    def test_get_entry(
+        self,
+        q_type: Type[Question],
+        a_type: Type[Answer],
+        q_serializer: Type,
+        a_serializer: Type,
+        url_slug: str,
+    ):
+        registry = get_registry()
+        entry = registry.get_entry(q_type)
+        assert entry is registry.get_entry_by_url_slug(url_slug)
+        assert entry.answer_type == a_type
+        assert registry.get_answer_type(q_type) == a_type
+        assert registry.get_question_serializer(q_type) == q_serializer
+        assert registry.get_answer_serializer(a_type) == a_serializer
+        assert registry.get_summary(a_type) == a_type.get_detailed_summaries
+        assert registry.get_summary_format(a_type) == a_type.format_detailed_summary
+
+    def test_get_unknown_type_returns_none(self):
+        registry = get_registry()
+        assert registry.get_entry(Question) is None
+        assert registry.get_answer_type(Question) is None
+        assert registry.get_question_serializer(Question) is None
+        assert registry.get_answer_serializer(Answer) is None
+        assert registry.get_summary(Answer) is None
+        assert registry.get_summary_format(Answer) is None
+        assert registry.get_entry_by_url_slug("question") is None
+
+    def test_registry_is_immutable(self):
+        registry = get_registry()
+        with pytest.raises(TypeError):
+            registry._by_question_type[Question] = None
+        with pytest.raises(Exception):
+            registry.entries[0].url_slug = "changed"
+
+    @pytest.mark.parametrize(
+        "base_type, expected_types",
+        [
+            pytest.param(
+                Question,
+                [
+                    NationalFrameworkQuestion,
+                    KeyAgencyActionsQuestion,
+                    EvolutionQuestion,
+                    LinkagesQuestion,
+                ],
+                id="Question",
+            ),
+            pytest.param(
+                Answer,
+                [YesNoAnswer, SingleChoiceAnswer, MultipleChoiceAnswer],
+                id="Answer",
+            ),
+        ],
+    )
+    def test_submodel_types_are_registered(
+        self, base_type: Type[models.Model], expected_types: list
+    ):
+        assert get_submodel_type_list(base_type) == expected_types
+
+    def test_unsupported_question_raises(self):
+        with pytest.raises(ImproperlyConfigured) as exc_info:
+            SubmodelRegistry(
+                [
+                    QuestionTypeEntry(
+                        question_type=EvolutionQuestion,
+                        answer_type=YesNoAnswer,
+                        question_serializer=EvolutionQuestionSerializer,
+                        answer_serializer=YesNoAnswerSerializer,
+                        summary=YesNoAnswer.get_detailed_summaries,
+                        summary_format=YesNoAnswer.format_detailed_summary,
+                        url_slug="evolution",
+                    )
+                ]
+            )
+        assert (
+            str(exc_info.value)
+            == "Answer type `YesNoAnswer` does not support question type `EvolutionQuestion`."
+        )
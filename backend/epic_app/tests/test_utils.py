@@ -0,0 +1,161 @@
+from typing import Type
+
+import pytest
+from django.db import models
+
+from epic_app.models.epic_answers import (
+    Answer,
+    MultipleChoiceAnswer,
+    SingleChoiceAnswer,
+    YesNoAnswer,
+    YesNoAnswerType,
+)
+from epic_app.models.epic_questions import (
+    EvolutionChoiceType,
+    EvolutionQuestion,
+    LinkagesQuestion,
+    NationalFrameworkQuestion,
+    Question,
+)
+from epic_app.models.epic_user import EpicUser
+from epic_app.models.models import Program
+from epic_app.tests.epic_db_fixture import epic_test_db
+from epic_app.utils import (
+    clear_submodel_type_cache,
+    get_instance_as_submodel_type,
+    get_instances_as_submodel_type,
+    get_submodel_type,
+    get_submodel_type_list,
+    get_submodel_types,
+)
+
+
+@pytest.fixture(autouse=True)
+def utils_fixture(epic_test_db: pytest.fixture):
+    """
+    Loads the default test db and starts every test with an empty submodel type cache.
+
+    Args:
+        epic_test_db (pytest.fixture): Fixture to load for the whole file tests.
+    """
+    clear_submodel_type_cache()
+    yield
+    clear_submodel_type_cache()
+
+
+@pytest.mark.django_db
+class TestGetSubmodelType:
+    @pytest.mark.parametrize("q_type", get_submodel_type_list(Question))
+    def test_get_submodel_type_single_query(
+        self, q_type: Type[Question], django_assert_num_queries
+    ):
+        q_pk = q_type.objects.first().pk
+        with django_assert_num_queries(1):
+            assert get_submodel_type(Question, str(q_pk)) == q_type
+
+    def test_get_submodel_type_uses_discriminator(self, django_assert_num_queries):
+        q_pk = LinkagesQuestion.objects.first().pk
+        with django_assert_num_queries(1) as ctx:
+            assert get_submodel_type(Question, q_pk) == LinkagesQuestion
+        assert "JOIN" not in ctx.captured_queries[0]["sql"]
+
+    def test_get_submodel_type_without_discriminator(self, django_assert_num_queries):
+        # Rows created before the discriminator existed are resolved by joining the submodel tables.
+        q_pk = LinkagesQuestion.objects.first().pk
+        Question.objects.filter(pk=q_pk).update(submodel_type="")
+        with django_assert_num_queries(2) as ctx:
+            assert get_submodel_type(Question, q_pk) == LinkagesQuestion
+        assert "JOIN" in ctx.captured_queries[1]["sql"]
+
+    def test_get_submodel_type_is_cached(self, django_assert_num_queries):
+        q_pk = EvolutionQuestion.objects.first().pk
+        assert get_submodel_type(Question, q_pk) == EvolutionQuestion
+        with django_assert_num_queries(0):
+            assert get_submodel_type(Question, str(q_pk)) == EvolutionQuestion
+
+    def test_get_submodel_type_unknown_pk_returns_none(self):
+        assert get_submodel_type(Question, 42) is None
+
+    def test_get_submodel_types_single_query(self, django_assert_num_queries):
+        expected_types = {
+            q.pk: type(q) for q in NationalFrameworkQuestion.objects.all()
+        }
+        expected_types.update({q.pk: type(q) for q in EvolutionQuestion.objects.all()})
+        expected_types.update({q.pk: type(q) for q in LinkagesQuestion.objects.all()})
+        with django_assert_num_queries(1):
+            found_types = get_submodel_types(Question, expected_types.keys())
+        assert found_types == expected_types
+
+    def test_get_submodel_types_only_queries_missing(self, django_assert_num_queries):
+        nfq_pk = NationalFrameworkQuestion.objects.first().pk
+        evo_pk = EvolutionQuestion.objects.first().pk
+        get_submodel_type(Question, nfq_pk)
+        with django_assert_num_queries(1) as ctx:
+            found_types = get_submodel_types(Question, [nfq_pk, evo_pk])
+        assert found_types == {
+            nfq_pk: NationalFrameworkQuestion,
+            evo_pk: EvolutionQuestion,
+        }
+        assert f"IN ({evo_pk})" in ctx.captured_queries[0]["sql"]
+
+    def test_cache_follows_created_and_deleted_answers(self):
+        a_user = EpicUser.objects.first()
+        yna = YesNoAnswer.objects.create(
+            user=a_user,
+            question=NationalFrameworkQuestion.objects.first(),
+            short_answer=YesNoAnswerType.YES,
+        )
+        assert get_submodel_type(Answer, yna.pk) == YesNoAnswer
+        yna_pk = yna.pk
+        yna.delete()
+        assert get_submodel_type(Answer, yna_pk) is None
+
+    def test_get_instance_as_submodel_type(self):
+        q_instance = Question.objects.get(pk=LinkagesQuestion.objects.first().pk)
+        assert type(q_instance) == Question
+        sm_instance = get_instance_as_submodel_type(q_instance)
+        assert isinstance(sm_instance, LinkagesQuestion)
+        assert sm_instance.pk == q_instance.pk
+
+
+@pytest.mark.django_db
+class TestGetInstancesAsSubmodelType:
+    @pytest.fixture(autouse=False)
+    def _answers_fixture(self):
+        for e_user in EpicUser.objects.all():
+            YesNoAnswer.objects.create(
+                user=e_user,
+                question=NationalFrameworkQuestion.objects.first(),
+                short_answer=YesNoAnswerType.YES,
+            )
+            SingleChoiceAnswer.objects.create(
+                user=e_user,
+                question=EvolutionQuestion.objects.first(),
+                selected_choice=EvolutionChoiceType.CAPABLE,
+            )
+            mca = MultipleChoiceAnswer.objects.create(
+                user=e_user, question=LinkagesQuestion.objects.first()
+            )
+            mca.selected_programs.add(Program.objects.first(), Program.objects.last())
+
+    def test_empty_queryset(self, django_assert_num_queries):
+        with django_assert_num_queries(0):
+            assert get_instances_as_submodel_type(Answer.objects.none()) == []
+
+    def test_downcast_keeps_order(self, _answers_fixture: pytest.fixture):
+        queryset = Answer.objects.order_by("-pk")
+        sm_instances = get_instances_as_submodel_type(queryset)
+        assert [sm_i.pk for sm_i in sm_instances] == [a.pk for a in queryset]
+        for sm_instance in sm_instances:
+            assert type(sm_instance) == get_submodel_type(Answer, sm_instance.pk)
+
+    def test_downcast_query_count_does_not_grow(
+        self, _answers_fixture: pytest.fixture, django_assert_num_queries
+    ):
+        # One to resolve the types, one per answer subtype and one to prefetch `selected_programs`.
+        with django_assert_num_queries(5):
+            sm_instances = get_instances_as_submodel_type(Answer.objects.all())
+        assert len(sm_instances) == 3 * EpicUser.objects.count()
+        with django_assert_num_queries(0):
+            for sm_instance in sm_instances:
+                sm_instance.is_valid_answer()
@@ -1,8 +1,33 @@
 import itertools
-from typing import List, Type
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Iterable, List, Optional, Tuple, Type
 
+from django.conf import settings
+from django.core.exceptions import FieldDoesNotExist
 from django.db import models
 
+_discriminator_field = "submodel_type"
+
+
+_registered_submodel_types: Dict[
+    Type[models.Model], Tuple[Type[models.Model], ...]
+] = {}
+
+
+def register_submodel_types(
+    model: Type[models.Model], submodel_types: Iterable[Type[models.Model]]
+):
+    """
+    Registers the submodels of a base model so that `get_submodel_type_list` no longer needs to discover them through reflection.
+    Done once when the app is ready (see `epic_app.submodel_registry`).
+
+    Args:
+        model (Type[models.Model]): Base model Type containing submodels.
+        submodel_types (Iterable[Type[models.Model]]): Concrete submodel types of `model`.
+    """
+    _registered_submodel_types[model] = tuple(dict.fromkeys(submodel_types))
+
 
 def get_submodel_type_list(model: Type[models.Model]) -> List[Type[models.Model]]:
     """
@@ -14,6 +39,8 @@ def get_submodel_type_list(model: Type[models.Model]) -> List[Type[models.Model]
     Returns:
         List[Type[models.Model]]: List of submodel types which are subclass of the provided model.
     """
+    if model in _registered_submodel_types:
+        return list(_registered_submodel_types[model])
     subtypes = []
     for m in model.__subclasses__():
         if m.__subclasses__():
@@ -23,18 +50,254 @@ def get_submodel_type_list(model: Type[models.Model]) -> List[Type[models.Model]
     return list(itertools.chain(*subtypes))
 
 
-def get_submodel_type(model_type: Type[models.Model], pk: str) -> Type[models.Model]:
-    l_subtypes = get_submodel_type_list(model_type)
-    sm_type = next(
-        (q_t for q_t in l_subtypes if q_t.objects.filter(pk=pk).exists()),
-        None,
+class _SubmodelTypeCache:
+    """
+    Bounded (LRU) per-process cache of `(base model, pk) -> submodel type`.
+    A row never changes its submodel type, so entries only need to be refreshed when a row is created or removed.
+    """
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self._entries: "OrderedDict[Tuple[str, Hashable], Type[models.Model]]" = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+
+    def get(self, key: Tuple[str, Hashable]) -> Optional[Type[models.Model]]:
+        with self._lock:
+            sm_type = self._entries.get(key, None)
+            if sm_type:
+                self._entries.move_to_end(key)
+            return sm_type
+
+    def set(self, key: Tuple[str, Hashable], sm_type: Type[models.Model]):
+        if self.max_size <= 0:
+            return
+        with self._lock:
+            self._entries[key] = sm_type
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def pop(self, key: Tuple[str, Hashable]):
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+_submodel_type_cache = _SubmodelTypeCache(
+    getattr(settings, "EPIC_SUBMODEL_TYPE_CACHE_SIZE", 4096)
+)
+
+
+def _get_cache_key(model_type: Type[models.Model], pk: Any) -> Tuple[str, Hashable]:
+    return (model_type._meta.label, model_type._meta.pk.to_python(pk))
+
+
+def _get_submodel_lookups(
+    model_type: Type[models.Model],
+) -> Dict[str, Type[models.Model]]:
+    """
+    Gets the (reverse) parent link lookup of each submodel of the given base model, so that all of them can be joined in a single query.
+    """
+    return {
+        sm_type._meta.get_ancestor_link(model_type).related_query_name(): sm_type
+        for sm_type in get_submodel_type_list(model_type)
+    }
+
+
+def _get_discriminated_submodels(
+    model_type: Type[models.Model],
+) -> Optional[Dict[str, Type[models.Model]]]:
+    """
+    Gets the submodel types by their discriminator value (`model_name`) when the base model stores it in its `submodel_type` field.
+    """
+    try:
+        model_type._meta.get_field(_discriminator_field)
+    except FieldDoesNotExist:
+        return None
+    return {
+        sm_type._meta.model_name: sm_type
+        for sm_type in get_submodel_type_list(model_type)
+    }
+
+
+def _resolve_submodel_types(
+    queryset: models.QuerySet,
+) -> Dict[Any, Optional[Type[models.Model]]]:
+    """
+    Resolves the submodel type of each of the instances of a base model queryset and registers them in the cache.
+    The stored discriminator is used when available, otherwise (f.e. rows not yet backfilled) all the submodel tables are joined in a single query.
+
+    Returns:
+        Dict[Any, Optional[Type[models.Model]]]: Submodel type per primary key, in the same order as the queryset.
+    """
+    model_type: Type[models.Model] = queryset.model
+    found_types: Dict[Any, Optional[Type[models.Model]]] = {}
+    sm_by_name = _get_discriminated_submodels(model_type)
+    if sm_by_name is not None:
+        for pk, sm_name in queryset.values_list("pk", _discriminator_field):
+            found_types[pk] = sm_by_name.get(sm_name, None)
+    else:
+        found_types = {pk: None for pk in queryset.values_list("pk", flat=True)}
+
+    undiscriminated_pks = [pk for pk, sm_type in found_types.items() if not sm_type]
+    if undiscriminated_pks:
+        sm_lookups = _get_submodel_lookups(model_type)
+        rows = model_type.objects.filter(pk__in=undiscriminated_pks).values_list(
+            "pk", *sm_lookups.keys()
+        )
+        for pk, *sm_pks in rows:
+            found_types[pk] = next(
+                (
+                    sm_t
+                    for sm_t, sm_pk in zip(sm_lookups.values(), sm_pks)
+                    if sm_pk is not None
+                ),
+                None,
+            )
+
+    for pk, sm_type in found_types.items():
+        if sm_type:
+            _submodel_type_cache.set(_get_cache_key(model_type, pk), sm_type)
+    return found_types
+
+
+def get_submodel_types(
+    model_type: Type[models.Model], pks: Iterable[Any]
+) -> Dict[Any, Type[models.Model]]:
+    """
+    Gets the submodel type of each of the provided primary keys. Cached entries are resolved without database access, the rest are resolved with a single (indexed) query on the base table.
+
+    Args:
+        model_type (Type[models.Model]): Base model Type containing submodels.
+        pks (Iterable[Any]): Primary keys of `model_type` instances.
+
+    Returns:
+        Dict[Any, Type[models.Model]]: Submodel type per (normalized) primary key. Not found keys are not included.
+    """
+    found_types: Dict[Any, Type[models.Model]] = {}
+    missing_pks = set()
+    for pk in pks:
+        cache_key = _get_cache_key(model_type, pk)
+        sm_type = _submodel_type_cache.get(cache_key)
+        if sm_type:
+            found_types[cache_key[1]] = sm_type
+        else:
+            missing_pks.add(cache_key[1])
+    if not missing_pks:
+        return found_types
+
+    resolved_types = _resolve_submodel_types(
+        model_type.objects.filter(pk__in=missing_pks)
+    )
+    found_types.update(
+        {pk: sm_type for pk, sm_type in resolved_types.items() if sm_type}
+    )
+    return found_types
+
+
+def get_submodel_type(
+    model_type: Type[models.Model], pk: str
+) -> Optional[Type[models.Model]]:
+    """
+    Gets the submodel type of the `model_type` instance with the given primary key.
+
+    Args:
+        model_type (Type[models.Model]): Base model Type containing submodels.
+        pk (str): Primary key of the instance.
+
+    Returns:
+        Optional[Type[models.Model]]: Found submodel type, `None` when the instance does not exist.
+    """
+    return next(iter(get_submodel_types(model_type, [pk]).values()), None)
+
+
+def get_instance_submodel_type(
+    model_instance: models.Model,
+) -> Optional[Type[models.Model]]:
+    """
+    Gets the submodel type of an instance avoiding database access whenever possible: either the instance is already a submodel, it has a stored discriminator or its type is already cached.
+
+    Args:
+        model_instance (models.Model): Instance of a base model (or of one of its submodels).
+
+    Returns:
+        Optional[Type[models.Model]]: Found submodel type.
+    """
+    model_type = type(model_instance)
+    if model_type._meta.parents:
+        return model_type
+    submodel_type = (_get_discriminated_submodels(model_type) or {}).get(
+        getattr(model_instance, _discriminator_field, None), None
     )
-    return sm_type
+    if submodel_type:
+        return submodel_type
+    return get_submodel_type(model_type, model_instance.pk)
 
 
 def get_instance_as_submodel_type(model_instance: models.Model) -> models.Model:
     """
     Gets the instance equivalent as a submodel. This model is done to avoid using the polymorphic library for django.
     """
-    submodel_type = get_submodel_type(type(model_instance), model_instance.pk)
+    submodel_type = get_instance_submodel_type(model_instance)
     return submodel_type.objects.get(pk=model_instance.pk)
+
+
+def get_instances_as_submodel_type(
+    queryset: models.QuerySet,
+) -> List[models.Model]:
+    """
+    Gets all the instances of a base model queryset as their submodel equivalent.
+    Runs one query to resolve the submodel types (see `_resolve_submodel_types`) plus one query per found submodel type (and one per many-to-many field of said submodel, which gets prefetched).
+
+    Args:
+        queryset (models.QuerySet): Queryset of a base model (f.e. `Answer` or `Question`).
+
+    Returns:
+        List[models.Model]: Submodel instances in the same order as the given queryset.
+    """
+    sm_types = _resolve_submodel_types(queryset)
+    pks_by_type: Dict[Type[models.Model], List[Any]] = {}
+    for pk, sm_type in sm_types.items():
+        if sm_type:
+            pks_by_type.setdefault(sm_type, []).append(pk)
+
+    sm_instances: Dict[Any, models.Model] = {}
+    for sm_type, sm_pks in pks_by_type.items():
+        m2m_fields = [m2m.name for m2m in sm_type._meta.local_many_to_many]
+        sm_queryset = sm_type.objects.filter(pk__in=sm_pks).prefetch_related(
+            *m2m_fields
+        )
+        sm_instances.update({sm_i.pk: sm_i for sm_i in sm_queryset})
+    return [sm_instances[pk] for pk in sm_types.keys() if pk in sm_instances]
+
+
+def update_submodel_type_cache(
+    submodel_type: Type[models.Model], pk: Any, is_removed: bool = False
+):
+    """
+    Keeps the submodel type cache in sync when a submodel instance gets created or removed.
+    Needed as primary keys might be reused (f.e. rolled back transactions).
+
+    Args:
+        submodel_type (Type[models.Model]): Submodel type of the instance.
+        pk (Any): Primary key of the instance.
+        is_removed (bool, optional): Whether the instance has been removed. Defaults to False.
+    """
+    for parent_type in submodel_type._meta.get_parent_list():
+        cache_key = _get_cache_key(parent_type, pk)
+        if is_removed:
+            _submodel_type_cache.pop(cache_key)
+        else:
+            _submodel_type_cache.set(cache_key, submodel_type)
+
+
+def clear_submodel_type_cache():
+    """
+    Removes all the resolved submodel types from the (per-process) cache.
+    """
+    _submodel_type_cache.clear()
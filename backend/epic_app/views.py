@@ -1,18 +1,38 @@
 # Create your views here.
+import dataclasses
 import io
-from typing import List, Type, Union
+import tempfile
+from typing import Iterator, List, Optional, Tuple, Type, Union
 
+from django.conf import settings
 from django.contrib.auth.models import User
 from django.db import models
-from django.http import FileResponse, HttpResponseForbidden
-from rest_framework import permissions, serializers, viewsets
+from django.http import (
+    FileResponse,
+    HttpResponse,
+    HttpResponseForbidden,
+    StreamingHttpResponse,
+)
+from django.utils.http import urlencode
+from rest_framework import (
+    mixins,
+    pagination,
+    permissions,
+    serializers,
+    status,
+    viewsets,
+)
 from rest_framework.decorators import action
+from rest_framework.exceptions import PermissionDenied, ValidationError
+from rest_framework.renderers import JSONRenderer
 from rest_framework.request import Request
 from rest_framework.response import Response
 
 from epic_app import epic_permissions
 from epic_app import serializers as epic_serializer
+from epic_app.domain_catalogue import get_catalogue_snapshot
 from epic_app.models.epic_answers import Answer
+from epic_app.models.epic_jobs import ReportJob, ReportJobStatus
 from epic_app.models.epic_questions import (
     EvolutionQuestion,
     KeyAgencyActionsQuestion,
@@ -22,8 +42,121 @@ from epic_app.models.epic_questions import (
 )
 from epic_app.models.epic_user import EpicOrganization, EpicUser
 from epic_app.models.models import Agency, Area, Group, Program
+from epic_app.report_builder import (
+    BUNDLE_SPLIT_PROGRAM,
+    bundle_splits,
+    get_pdf_report,
+    get_pdf_report_bundle,
+    get_report_data,
+    get_report_users,
+)
+from epic_app.report_cache import ReportCache
+from epic_app.report_export import (
+    ANSWERS_SHEET,
+    export_sheets,
+    iterate_csv_report,
+    write_xlsx_report,
+)
+from epic_app.serializers.report_data import ReportFilters, SummaryOptions
+from epic_app.serializers.report_engine import AnswersReportEngine
 from epic_app.serializers.report_pdf import EpicPdfReport
-from epic_app.utils import get_submodel_type, get_submodel_type_list
+from epic_app.submodel_registry import get_registry
+from epic_app.utils import get_submodel_type
+
+
+def _filter_submodel_type(
+    queryset: models.QuerySet, request: Request
+) -> models.QuerySet:
+    """
+    Filters a `Question` or `Answer` queryset by the `submodel_type` query parameter (f.e. `?submodel_type=yesnoanswer`), if given.
+    """
+    submodel_type = request.query_params.get("submodel_type", None)
+    if submodel_type:
+        return queryset.filter(submodel_type=submodel_type.lower())
+    return queryset
+
+
+def _is_report_admin(request: Request) -> bool:
+    return bool(request.user.is_staff or request.user.is_superuser)
+
+
+def _get_report_organization(request: Request) -> Optional[EpicOrganization]:
+    """
+    Gets the `EpicOrganization` whose answers are reported, `None` (all of them) for admins or the one of the requesting `EpicUser`.
+    """
+    if _is_report_admin(request):
+        return None
+    epic_org = request.user.epicuser.organization
+    if epic_org is None:
+        raise PermissionDenied("The user does not belong to any organization.")
+    return epic_org
+
+
+def _get_report_filters(request: Request) -> ReportFilters:
+    """
+    Gets the scope of the report requested (`?program=`, `?group=`, `?area=`, `?agency=`, `?question_type=` and `?user=`, see `ReportFilters`).
+    """
+    try:
+        return ReportFilters.from_query_params(request.query_params)
+    except ValueError as e_info:
+        raise ValidationError({"filters": str(e_info)})
+
+
+def _get_report_summary_options(request: Request) -> SummaryOptions:
+    """
+    Gets the justifications and linkages included in the summaries of the report requested (`?justifications=false`, `?max_justifications=`, `?max_justification_length=` and `?max_linkages=`, see `SummaryOptions`).
+    """
+    try:
+        return SummaryOptions.from_query_params(request.query_params)
+    except ValueError as e_info:
+        raise ValidationError({"summary": str(e_info)})
+
+
+def _get_report_scope(
+    request: Request,
+    filters: ReportFilters,
+    summary_options: Optional[SummaryOptions] = None,
+) -> str:
+    """
+    Gets the scope of the report data requested, all organizations for admins or the one of the requesting `EpicUser`, its filters and summary options.
+    """
+    if _is_report_admin(request):
+        scope = "all"
+    else:
+        scope = f"organization-{request.user.epicuser.organization_id}"
+    filter_params = filters.to_query_params()
+    if summary_options:
+        filter_params.update(summary_options.to_query_params())
+    if filter_params:
+        scope += f":{urlencode(filter_params)}"
+    return scope
+
+
+def _get_pdf_report_toc(request: Request) -> str:
+    """
+    Gets the table of contents mode of the PDF report requested (`?toc=`, see `EpicPdfReport.toc_modes`).
+    """
+    toc = request.query_params.get("toc", EpicPdfReport.TOC_MULTIPASS).lower()
+    if toc not in EpicPdfReport.toc_modes:
+        raise ValidationError(
+            {"toc": f"Expected one of {', '.join(EpicPdfReport.toc_modes)}."}
+        )
+    return toc
+
+
+def _get_pdf_report_cache(
+    request: Request,
+    filters: ReportFilters,
+    summary_options: SummaryOptions,
+    toc: str,
+) -> ReportCache:
+    """
+    Gets the cache of the PDF report requested, whose author is the requesting user.
+    """
+    return ReportCache(
+        "pdf",
+        f"{_get_report_scope(request, filters, summary_options)}:{request.user.username}:toc-{toc}",
+    )
 
 
 class EpicUserViewSet(viewsets.ReadOnlyModelViewSet):
@@ -70,6 +203,52 @@ class EpicOrganizationViewSet(viewsets.ReadOnlyModelViewSet):
     serializer_class = epic_serializer.EpicOrganizationSerializer
     permission_classes = [permissions.IsAdminUser]
 
+    def _get_report_data(
+        self,
+        request: Request,
+        filters: ReportFilters,
+        summary_options: SummaryOptions,
+    ) -> List[dict]:
+        """
+        Serializes all the `Answers` for each of the `Questions` filled by the `EpicUsers` of the requested `EpicOrganization`.
+        """
+        return get_report_data(
+            get_report_users(_get_report_organization(request)),
+            request,
+            filters,
+            summary_options,
+        )
+
+    def _stream_report_data(
+        self,
+        request: Request,
+        filters: ReportFilters,
+        summary_options: SummaryOptions,
+    ) -> Iterator[bytes]:
+        """
+        Serializes the same report as `_get_report_data` one `Program` at a time, so only the answers of a single program are kept in memory.
+        """
+        report_users = get_report_users(_get_report_organization(request))
+        chunk_size = getattr(settings, "EPIC_REPORT_CHUNK_SIZE", 500)
+        renderer = JSONRenderer()
+        yield b"["
+        separator = b""
+        program_ids = filters.filter_programs(Program.objects.order_by("pk"))
+        for program_id in program_ids.values_list("pk", flat=True).iterator(chunk_size):
+            report_engine = AnswersReportEngine(
+                report_users,
+                dataclasses.replace(filters, program_ids=(program_id,)),
+                chunk_size=chunk_size,
+                summary_options=summary_options,
+            )
+            for program_data in report_engine.get_program_reports():
+                p_serializer = epic_serializer.ProgramReportDataSerializer(
+                    program_data, context={"request": request}
+                )
+                yield separator + renderer.render(p_serializer.data)
+                separator = b","
+        yield b"]"
+
     @action(
         detail=False,
         url_path="report",
@@ -79,24 +258,37 @@ class EpicOrganizationViewSet(viewsets.ReadOnlyModelViewSet):
     def get_answers_report(self, request: Request, pk: str = None) -> models.QuerySet:
         """
         RETRIEVES all the `Answers` for each of the `Questions` filled by the `EpicUsers` of the requested `EpicOrganization`.
+        The report is cached until any answer changes, conditional requests (`If-None-Match` / `If-Modified-Since`) get a `304` response when it did not change.
+        With `?stream=true` the (not cached) report is streamed one program at a time, keeping memory usage bounded.
+        The report can be restricted to some programs, groups, areas, agencies, question types or users (see `ReportFilters`), f.e. `?area=1&question_type=evolutionquestion`.
+        The justifications of the summaries can be limited (`?max_justifications=10&max_justification_length=200`) or excluded (`?justifications=false`), see the `justifications` action of the questions.
+        The linkages summaries can be limited to the most selected programs, the rest counted as `other_programs` (`?max_linkages=10`).
         """
+        report_filters = _get_report_filters(request)
+        report_summary_options = _get_report_summary_options(request)
+        report_cache = ReportCache(
+            "json", _get_report_scope(request, report_filters, report_summary_options)
+        )
+        not_modified = report_cache.get_not_modified_response(request)
+        if not_modified:
+            return report_cache.set_headers(not_modified)
+
+        if request.query_params.get("stream", "").lower() in ("1", "true", "yes"):
+            return report_cache.set_headers(
+                StreamingHttpResponse(
+                    self._stream_report_data(
+                        request, report_filters, report_summary_options
+                    ),
+                    content_type="application/json",
+                )
+            )
 
-        def _filter_queryset() -> Union[models.QuerySet, List[EpicUser]]:
-            if bool(request.user.is_staff or request.user.is_superuser):
-                return EpicUser.objects.all()
-            else:
-                epic_org = request.user.epicuser.organization
-                return epic_org.organization_users
-
-        r_serializer = epic_serializer.ProgramReportSerializer(
-            Program.objects.all(),
-            many=True,
-            context={
-                "request": request,
-                "users": _filter_queryset(),
-            },
+        report_data = report_cache.get_or_set(
+            lambda: self._get_report_data(
+                request, report_filters, report_summary_options
+            )
         )
-        return Response(r_serializer.data)
+        return report_cache.set_headers(Response(report_data))
 
     @action(
         detail=False,
@@ -107,64 +299,365 @@ class EpicOrganizationViewSet(viewsets.ReadOnlyModelViewSet):
     def get_answers_pdf_report(
         self, request: Request, pk: str = None
     ) -> models.QuerySet:
-        answer_report = self.get_answers_report(request, pk)
+        """
+        RETRIEVES the answers report as a PDF file. Cached and conditionally requested as the `report` action.
+        The table of contents is placed at the beginning (`?toc=multipass`, default), at the end (`?toc=end`, faster single layout pass) or not included (`?toc=none`).
+        Accepts the same filters and justification limits as the `report` action.
+        """
+        report_filters = _get_report_filters(request)
+        report_summary_options = _get_report_summary_options(request)
+        report_toc = _get_pdf_report_toc(request)
+        report_cache = _get_pdf_report_cache(
+            request, report_filters, report_summary_options, report_toc
+        )
+        not_modified = report_cache.get_not_modified_response(request)
+        if not_modified:
+            return report_cache.set_headers(not_modified)
+
+        # The author of the report is the requesting user.
+        buffer = io.BytesIO(
+            report_cache.get_or_set(
+                lambda: get_pdf_report(
+                    _get_report_organization(request),
+                    request.user.username,
+                    toc=report_toc,
+                    filters=report_filters,
+                    summary_options=report_summary_options,
+                )
+            )
+        )
+        return report_cache.set_headers(
+            FileResponse(buffer, as_attachment=True, filename="answers_report.pdf")
+        )
+
+    @action(
+        detail=False,
+        url_path="report-xlsx",
+        url_name="report-xlsx",
+        permission_classes=[epic_permissions.IsAdminOrEpicAdvisor],
+    )
+    def get_answers_xlsx_report(
+        self, request: Request, pk: str = None
+    ) -> models.QuerySet:
+        """
+        RETRIEVES the answers report as an XLSX workbook, with a row per answer (program, question, user, answer and justification) and a summary sheet.
+        The (not cached) workbook is written in write-only mode to a temporary file while the answers are fetched in chunks, keeping memory usage bounded.
+        Conditionally requested and filtered as the `report` action.
+        """
+        report_filters = _get_report_filters(request)
+        report_cache = ReportCache("xlsx", _get_report_scope(request, report_filters))
+        not_modified = report_cache.get_not_modified_response(request)
+        if not_modified:
+            return report_cache.set_headers(not_modified)
+
+        # The file is removed once the response is closed.
+        report_file = tempfile.TemporaryFile()
+        write_xlsx_report(
+            report_file,
+            get_report_users(_get_report_organization(request)),
+            report_filters,
+            getattr(settings, "EPIC_REPORT_CHUNK_SIZE", 500),
+        )
+        report_file.seek(0)
+        return report_cache.set_headers(
+            FileResponse(
+                report_file, as_attachment=True, filename="answers_report.xlsx"
+            )
+        )
 
-        def get_organization() -> List[str]:
-            if bool(request.user.is_staff or request.user.is_superuser):
-                return [eo.name for eo in EpicOrganization.objects.all()]
-            return [request.user.epicuser.organization.name]
+    @action(
+        detail=False,
+        url_path="report-csv",
+        url_name="report-csv",
+        permission_classes=[epic_permissions.IsAdminOrEpicAdvisor],
+    )
+    def get_answers_csv_report(
+        self, request: Request, pk: str = None
+    ) -> models.QuerySet:
+        """
+        RETRIEVES the answers report as a streamed CSV file, with a row per answer (`?sheet=answers`, default) or per summarized choice (`?sheet=summary`).
+        Conditionally requested and filtered as the `report` action.
+        """
+        report_filters = _get_report_filters(request)
+        sheet = request.query_params.get("sheet", ANSWERS_SHEET).lower()
+        if sheet not in export_sheets:
+            raise ValidationError(
+                {"sheet": f"Expected one of {', '.join(export_sheets)}."}
+            )
+        report_cache = ReportCache(
+            "csv", f"{_get_report_scope(request, report_filters)}:{sheet}"
+        )
+        not_modified = report_cache.get_not_modified_response(request)
+        if not_modified:
+            return report_cache.set_headers(not_modified)
+
+        response = StreamingHttpResponse(
+            iterate_csv_report(
+                get_report_users(_get_report_organization(request)),
+                sheet,
+                report_filters,
+                getattr(settings, "EPIC_REPORT_CHUNK_SIZE", 500),
+            ),
+            content_type="text/csv",
+        )
+        response["Content-Disposition"] = f'attachment; filename="answers_{sheet}.csv"'
+        return report_cache.set_headers(response)
 
-        # Create a file-like buffer to receive PDF data.
-        buffer = io.BytesIO()
-        pdf_report = EpicPdfReport()
-        pdf_report.report_subtitle = "EPIC report for {}".format(
-            (", ").join(get_organization())
+    @action(
+        detail=False,
+        url_path="report-pdf-bundle",
+        url_name="report-pdf-bundle",
+        permission_classes=[epic_permissions.IsAdminOrEpicAdvisor],
+    )
+    def get_answers_pdf_report_bundle(
+        self, request: Request, pk: str = None
+    ) -> models.QuerySet:
+        """
+        RETRIEVES the answers report as a ZIP file with one PDF document per program (`?split=program`, default) or per area (`?split=area`).
+        The documents are laid out in parallel (see `EPIC_REPORT_BUNDLE_WORKERS`). Cached, conditionally requested and filtered as the `report-pdf` action.
+        """
+        report_filters = _get_report_filters(request)
+        report_summary_options = _get_report_summary_options(request)
+        report_toc = _get_pdf_report_toc(request)
+        split_by = request.query_params.get("split", BUNDLE_SPLIT_PROGRAM).lower()
+        if split_by not in bundle_splits:
+            raise ValidationError(
+                {"split": f"Expected one of {', '.join(bundle_splits)}."}
+            )
+        report_cache = ReportCache(
+            "pdf-bundle",
+            f"{_get_report_scope(request, report_filters, report_summary_options)}:{request.user.username}:split-{split_by}:toc-{report_toc}",
+        )
+        not_modified = report_cache.get_not_modified_response(request)
+        if not_modified:
+            return report_cache.set_headers(not_modified)
+
+        buffer = io.BytesIO(
+            report_cache.get_or_set(
+                lambda: get_pdf_report_bundle(
+                    _get_report_organization(request),
+                    request.user.username,
+                    split_by,
+                    toc=report_toc,
+                    filters=report_filters,
+                    summary_options=report_summary_options,
+                )
+            )
+        )
+        return report_cache.set_headers(
+            FileResponse(buffer, as_attachment=True, filename="answers_report.zip")
         )
-        pdf_report.report_author = request.user.username
-        pdf_report.generate_report(buffer, answer_report.data)
-        buffer.seek(0)
-        return FileResponse(buffer, as_attachment=True, filename="answers_report.pdf")
 
 
-class AreaViewSet(viewsets.ReadOnlyModelViewSet):
+class ReportJobViewSet(mixins.CreateModelMixin, viewsets.ReadOnlyModelViewSet):
+    """
+    Acess point to request reports generated in the background (see the `run_report_jobs` command), follow their progress and download them.
+    """
+
+    queryset = ReportJob.objects.all().order_by("-created_at")
+    serializer_class = epic_serializer.ReportJobSerializer
+    permission_classes = [epic_permissions.IsAdminOrEpicAdvisor]
+
+    def get_queryset(self) -> models.QuerySet:
+        # Users only see their own jobs, the reports are only loaded when downloaded.
+        return (
+            super()
+            .get_queryset()
+            .filter(requested_by=self.request.user)
+            .defer("artifact")
+        )
+
+    def create(self, request: Request, *args, **kwargs) -> Response:
+        """
+        Requests the (PDF) answers report of the organization(s) of the requesting user, reusing the job of an identical previous request when possible.
+        Accepts the same options (and filters) as the `report-pdf` action.
+
+        Args:
+            request (Request): HTTP Request.
+
+        Returns:
+            Response: Requested job, with status `202` when just enqueued.
+        """
+        report_filters = _get_report_filters(request)
+        report_summary_options = _get_report_summary_options(request)
+        report_toc = _get_pdf_report_toc(request)
+        report_job, created = ReportJob.enqueue(
+            request.user,
+            _get_report_organization(request),
+            _get_pdf_report_cache(
+                request, report_filters, report_summary_options, report_toc
+            ).key,
+            options={
+                "toc": report_toc,
+                "filters": report_filters.to_query_params(),
+                "summary": report_summary_options.to_query_params(),
+            },
+        )
+        serializer = self.get_serializer(report_job)
+        return Response(
+            serializer.data,
+            status=status.HTTP_202_ACCEPTED if created else status.HTTP_200_OK,
+            headers={"Location": serializer.data["url"]},
+        )
+
+    @action(detail=True, url_path="download", url_name="download")
+    def download_report(self, request: Request, pk: str = None) -> FileResponse:
+        """
+        RETRIEVES the report generated by a finished job.
+
+        Args:
+            request (Request): HTTP Request.
+            pk (str, optional): Field representing the `pk` of a `ReportJob`. Defaults to None.
+
+        Returns:
+            FileResponse: Generated report, `409` when the job did not finish successfully or `410` when it already expired.
+        """
+        report_job: ReportJob = self.get_object()
+        if report_job.is_expired:
+            return Response(
+                {"detail": "The report expired, request it again."},
+                status=status.HTTP_410_GONE,
+            )
+        if report_job.status != ReportJobStatus.DONE:
+            return Response(
+                {"detail": f"The report job is {report_job.get_status_display()}."},
+                status=status.HTTP_409_CONFLICT,
+            )
+        return FileResponse(
+            io.BytesIO(bytes(report_job.artifact)),
+            as_attachment=True,
+            filename=f"answers_report.{report_job.report_format}",
+        )
+
+
+class _PrefetchPlanMixin:
+    """
+    Viewset serializing nested relations, fetched with its `prefetch_plan` so the number of queries does not depend on the number of rows.
+    The plan only applies to the `list` and `retrieve` actions, the ones using the (nested) serializer.
+    """
+
+    # Lookups (or `Prefetch` objects) matching the relations of the serializer.
+    prefetch_plan: Tuple[Union[str, models.Prefetch], ...] = ()
+
+    def get_queryset(self) -> models.QuerySet:
+        queryset = super().get_queryset()
+        if self.action in ("list", "retrieve"):
+            return queryset.prefetch_related(*self.prefetch_plan)
+        return queryset
+
+
+class AreaViewSet(_PrefetchPlanMixin, viewsets.ReadOnlyModelViewSet):
     """
     Acess point for CRUD operations on `Area` table.
     """
 
     queryset = Area.objects.all().order_by("name")
+    prefetch_plan = ("groups__programs",)
     serializer_class = epic_serializer.AreaSerializer
     permission_classes = [permissions.DjangoModelPermissions]
 
 
-class AgencyViewSet(viewsets.ReadOnlyModelViewSet):
+class AgencyViewSet(_PrefetchPlanMixin, viewsets.ReadOnlyModelViewSet):
     """
     Acess point for CRUD operations on `Agency` table.
     """
 
     queryset = Agency.objects.all().order_by("name")
+    prefetch_plan = ("programs",)
     serializer_class = epic_serializer.AgencySerializer
     permission_classes = [permissions.DjangoModelPermissions]
 
 
-class GroupViewSet(viewsets.ReadOnlyModelViewSet):
+class CatalogueViewSet(viewsets.ViewSet):
+    """
+    Access point to the catalogue of the EPIC domain (areas, groups, programs, agencies and question ids).
+    """
+
+    permission_classes = [permissions.IsAuthenticated]
+
+    def list(self, request: Request) -> HttpResponse:
+        """
+        GET the catalogue snapshot kept in memory, it is only compiled again after the domain changes.
+        Conditional requests (`If-None-Match` / `If-Modified-Since`) get a `304` response when it did not change.
+
+        Args:
+            request (Request): API Request.
+
+        Returns:
+            HttpResponse: Catalogue encoded as JSON.
+        """
+        return get_catalogue_snapshot().get_response(request)
+
+
+class GroupViewSet(_PrefetchPlanMixin, viewsets.ReadOnlyModelViewSet):
     """
     Acess point for CRUD operations on `Group` table.
     """
 
     queryset = Group.objects.all().order_by("name")
+    prefetch_plan = ("programs",)
     serializer_class = epic_serializer.GroupSerializer
     permission_classes = [permissions.DjangoModelPermissions]
 
 
-class ProgramViewSet(viewsets.ReadOnlyModelViewSet):
+class ProgramViewSet(_PrefetchPlanMixin, viewsets.ReadOnlyModelViewSet):
     """
     Acess point for CRUD operations on `Program` table.
     """
 
     queryset = Program.objects.all()
+    # Only the ids of the agencies and questions are serialized.
+    prefetch_plan = (
+        models.Prefetch("agencies", queryset=Agency.objects.only("pk")),
+        models.Prefetch("questions", queryset=Question.objects.only("pk", "program")),
+    )
     serializer_class = epic_serializer.ProgramSerializer
     permission_classes = [permissions.DjangoModelPermissions]
 
+    @action(detail=False, url_path="progress", url_name="programs-progress")
+    def get_programs_progress(self, request: Request) -> Response:
+        """
+        Gets the percentage of answered questions of the `EpicUser` currently logged in for all the `Program` (or the ones in `?program=`, `?group=`, `?area=` or `?agency=`).
+        The progress can be rolled up to the groups and areas of said programs (`?rollup=group,area`).
+
+        Args:
+            request (Request): API Request.
+
+        Raises:
+            ValidationError: When the filters (f.e. `?user=`, `?question_type=`) or rollup levels are not valid.
+
+        Returns:
+            Response: Result of the serialised request to `ProgramsProgressSerializer`.
+        """
+        try:
+            program_filters = ReportFilters.from_query_params(request.query_params)
+        except ValueError as e_info:
+            raise ValidationError({"filters": str(e_info)})
+        if program_filters.user_ids is not None or program_filters.question_types:
+            # The progress is always the one of the logged in user, over all the program questions.
+            raise ValidationError(
+                {
+                    "filters": "Only `program`, `group`, `area` and `agency` are supported."
+                }
+            )
+        rollup = {
+            level.strip().lower()
+            for level in request.query_params.get("rollup", "").split(",")
+            if level.strip()
+        }
+        unknown_levels = rollup - set(
+            epic_serializer.ProgramsProgressSerializer.rollup_levels
+        )
+        if unknown_levels:
+            raise ValidationError(
+                {"rollup": f"Unknown levels: {', '.join(sorted(unknown_levels))}."}
+            )
+        serializer = epic_serializer.ProgramsProgressSerializer(
+            program_filters.filter_programs(Program.objects.all()),
+            context={"request": request, "rollup": rollup},
+        )
+        return Response(serializer.data)
+
     @action(detail=True, url_path="progress", url_name="progress")
     def get_progress(self, request: Request, pk: str = None) -> Response:
         """
@@ -184,18 +677,94 @@ class ProgramViewSet(viewsets.ReadOnlyModelViewSet):
         )
         return Response(serializer.data)
 
+    @action(detail=True, url_path="questionnaire", url_name="questionnaire")
+    def get_questionnaire(self, request: Request, pk: str = None) -> Response:
+        """
+        Gets the questions (of every type, or only of the `?question_type=` ones, as their `url_slug`) of the `Program` with provided `id` together with the answers of the `EpicUser` currently logged in.
+        Missing answers of those questions are created (empty) in bulk, so the number of queries does not depend on the number of questions.
+
+        Args:
+            request (Request): API Request.
+            pk (str, optional): `Program` Id. Defaults to None.
+
+        Raises:
+            PermissionDenied: When the user logged in is not an `EpicUser`.
+            ValidationError: When the question types are not known.
+
+        Returns:
+            Response: Questions per type (`url_slug`) and answers of the program.
+        """
+        epic_user: Optional[EpicUser] = getattr(request.user, "epicuser", None)
+        if not epic_user:
+            raise PermissionDenied("Only an EpicUser can answer a questionnaire.")
+        registry = get_registry()
+        entries = registry.entries
+        url_slugs = {
+            url_slug.strip().lower()
+            for url_slug in request.query_params.get("question_type", "").split(",")
+            if url_slug.strip()
+        }
+        if url_slugs:
+            unknown_slugs = url_slugs - {entry.url_slug for entry in entries}
+            if unknown_slugs:
+                raise ValidationError(
+                    {
+                        "question_type": f"Unknown question types: {', '.join(sorted(unknown_slugs))}."
+                    }
+                )
+            entries = [entry for entry in entries if entry.url_slug in url_slugs]
+        program: Program = self.get_object()
+        questions = {
+            entry: list(
+                entry.question_type.objects.filter(program=program).order_by("pk")
+            )
+            for entry in entries
+        }
+        Answer.create_missing(
+            epic_user, [q for e_questions in questions.values() for q in e_questions]
+        )
+        answers = []
+        for answer_type in dict.fromkeys(entry.answer_type for entry in entries):
+            # Several question types can share an answer type (f.e. `YesNoAnswer`).
+            type_answers = (
+                answer_type.objects.filter(
+                    user=epic_user,
+                    question__program=program,
+                    question__submodel_type__in=[
+                        entry.question_type._meta.model_name
+                        for entry in entries
+                        if entry.answer_type is answer_type
+                    ],
+                )
+                .prefetch_related(*[f.name for f in answer_type._meta.many_to_many])
+                .order_by("pk")
+            )
+            answers.extend(
+                registry.get_answer_serializer(answer_type)(
+                    type_answers, many=True, context={"request": request}
+                ).data
+            )
+        return Response(
+            {
+                "program": program.pk,
+                "questions": {
+                    entry.url_slug: entry.question_serializer(
+                        e_questions, many=True, context={"request": request}
+                    ).data
+                    for entry, e_questions in questions.items()
+                },
+                "answers": sorted(answers, key=lambda answer: answer["question"]),
+            }
+        )
+
     def _get_question(
         self, request: Request, question_type: Question, pk: str = None
     ) -> Response:
-        question_serializers = {
-            NationalFrameworkQuestion: epic_serializer.NationalFrameworkQuestionSerializer,
-            EvolutionQuestion: epic_serializer.EvolutionQuestionSerializer,
-            LinkagesQuestion: epic_serializer.LinkagesQuestionSerializer,
-            KeyAgencyActionsQuestion: epic_serializer.KeyAgencyQuestionSerializer,
-        }
         queryset: Question = question_type.objects.filter(program=pk)
-        serializer: serializers.ModelSerializer = question_serializers[question_type](
-            queryset, many=True, context={"request": request}
+        serializer: serializers.ModelSerializer = (
+            get_registry().get_question_serializer(question_type)(
+                queryset, many=True, context={"request": request}
+            )
         )
         return Response(serializer.data)
 
@@ -272,24 +841,24 @@ class ProgramViewSet(viewsets.ReadOnlyModelViewSet):
         return self._get_question(request, LinkagesQuestion, pk)
 
 
+class JustificationsPagination(pagination.PageNumberPagination):
+    page_size = 50
+    page_size_query_param = "page_size"
+    max_page_size = 500
+
+
 class QuestionViewSet(viewsets.ReadOnlyModelViewSet):
     queryset = Question.objects.all()
     serializer_class = epic_serializer.QuestionSerializer
     permissiion_classes = [permissions.DjangoModelPermissions]
 
+    def get_queryset(self) -> models.QuerySet:
+        return _filter_submodel_type(super().get_queryset(), self.request)
+
     @staticmethod
     def _get_related_answer_type(question_pk: str) -> Type[Answer]:
         q_type = get_submodel_type(Question, question_pk)
-        answer_subtypes: List[Type[Answer]] = get_submodel_type_list(Answer)
-        a_type = next(
-            (
-                a_t
-                for a_t in answer_subtypes
-                if q_type in a_t._get_supported_questions()
-            ),
-            None,
-        )
-        return a_type
+        return get_registry().get_answer_type(q_type)
 
     def _get_epic_users_queryset(
         self, request: Request
@@ -324,31 +893,110 @@ class QuestionViewSet(viewsets.ReadOnlyModelViewSet):
     @action(detail=True, url_path="answers", url_name="answers")
     def retrieve_answers(self, request: Request, pk: str = None) -> models.QuerySet:
         """
-        Retrieves the `answers` for the given `question`.
+        Retrieves the `answers` for the given `question`, one per involved `EpicUser`, reading the existing ones with one query.
+        A missing answer of the requesting `EpicUser` is created (see `Answer.create_missing`, which ignores the answers created meanwhile by concurrent requests) so it can be updated afterwards.
+        Missing answers of other users (f.e. when requested by an admin) are returned as blank answers without `id`, nothing is written.
         ASSUMPTION: The request is done with an `EpicUser`.
 
         Args:
             request (Request): Request from the client.
-            pk (str, optional): `Answer` id. Defaults to None.
+            pk (str, optional): `Question` id. Defaults to None.
         """
-
-        def get_user_answer(epic_user: EpicUser) -> Answer:
-            a_instance, _ = a_type.objects.get_or_create(
-                question=Question.objects.get(pk=pk), user=epic_user
-            )
-            return a_instance
-
-        e_users = self._get_epic_users_queryset(request)
-        a_type = self._get_related_answer_type(question_pk=pk)
+        e_users = list(self._get_epic_users_queryset(request))
+        question = self.get_object()
+        a_type = self._get_related_answer_type(question_pk=question.pk)
+        if [e_user.pk for e_user in e_users] == [request.user.pk]:
+            Answer.create_missing(e_users[0], [question])
+        user_answers = {
+            answer.user_id: answer
+            for answer in a_type.objects.filter(
+                question=question, user__in=e_users
+            ).prefetch_related(*[f.name for f in a_type._meta.many_to_many])
+        }
+        a_instances = [
+            user_answers.get(e_user.pk, None) or a_type(question=question, user=e_user)
+            for e_user in e_users
+        ]
         a_serializer_type = epic_serializer.AnswerSerializer.get_concrete_serializer(
             a_type
         )
-        a_instances = [get_user_answer(e_user) for e_user in e_users]
         a_serializer = a_serializer_type(
             a_instances, many=True, context={"request": request}
         )
         return Response(a_serializer.data)
 
+    @action(
+        detail=True,
+        url_path="justifications",
+        url_name="justifications",
+        permission_classes=[epic_permissions.IsAdminOrEpicAdvisor],
+    )
+    def retrieve_justifications(self, request: Request, pk: str = None) -> Response:
+        """
+        Retrieves the (non empty) justifications given to the `question` by the `EpicUsers` of the requested `EpicOrganization` (as in the answers report), in order of creation and paginated (`?page=` and `?page_size=`).
+        They can be restricted to a selected choice with `?choice=` (its value or its label in the report summaries, f.e. `Yes`).
+
+        Args:
+            request (Request): Request from the client.
+            pk (str, optional): `Question` id. Defaults to None.
+        """
+        question = self.get_object()
+        a_type = self._get_related_answer_type(question_pk=question.pk)
+        if not a_type or a_type.summary_choice_field is None:
+            raise ValidationError(
+                {"question": "The answers to this question have no justifications."}
+            )
+        choice_labels = {
+            str(choice_type.value): str(choice_type.label)
+            for choice_type in a_type.summary_choice_types
+        }
+        justifications = (
+            a_type.objects.filter(
+                question=question,
+                user__in=get_report_users(_get_report_organization(request)).values(
+                    "pk"
+                ),
+            )
+            .exclude(justify_answer="")
+            .order_by("pk")
+        )
+        choice = request.query_params.get("choice", None)
+        if choice:
+            choice_value = next(
+                (
+                    c_value
+                    for c_value, c_label in choice_labels.items()
+                    if choice.lower() in (c_value.lower(), c_label.lower())
+                ),
+                None,
+            )
+            if choice_value is None:
+                raise ValidationError(
+                    {"choice": f"Expected one of {', '.join(choice_labels.values())}."}
+                )
+            justifications = justifications.filter(
+                **{a_type.summary_choice_field: choice_value}
+            )
+
+        paginator = JustificationsPagination()
+        page = paginator.paginate_queryset(
+            justifications.values_list(
+                "pk", a_type.summary_choice_field, "justify_answer"
+            ),
+            request,
+            view=self,
+        )
+        return paginator.get_paginated_response(
+            [
+                dict(
+                    answer=a_pk,
+                    choice=choice_labels.get(a_choice, a_choice),
+                    justify_answer=a_justify,
+                )
+                for a_pk, a_choice, a_justify in page
+            ]
+        )
+
 
 class AnswerViewSet(viewsets.ModelViewSet):
     queryset = Answer.objects.all()
@@ -376,7 +1024,7 @@ class AnswerViewSet(viewsets.ModelViewSet):
         Returns:
             Union[models.QuerySet, List[Answer]]: `Answer` subset depending on the requesting `EpicUser` permissions.
         """
-        return self._filter_queryset(Answer)
+        return _filter_submodel_type(self._filter_queryset(Answer), self.request)
 
     def _filter_queryset(
         self, answer_type: Type[Answer]
@@ -10,6 +10,7 @@ For the full list of settings and their values, see
 https://docs.djangoproject.com/en/4.0/ref/settings/
 """
 
+import os
 from pathlib import Path
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
@@ -116,6 +117,48 @@ DATABASES = {
 }
 
 
+# Cache
+# https://docs.djangoproject.com/en/4.0/topics/cache/
+# The (answers) reports are cached in `EPIC_REPORT_CACHE`. Its backend can be set with the `EPIC_CACHE_BACKEND` environment variable,
+# either `locmem` (default, per process), `filesystem` (shared among processes, stored at `EPIC_CACHE_LOCATION`) or a backend dotted path.
+_epic_cache_backends = {
+    "locmem": "django.core.cache.backends.locmem.LocMemCache",
+    "filesystem": "django.core.cache.backends.filebased.FileBasedCache",
+}
+_epic_cache_backend = os.environ.get("EPIC_CACHE_BACKEND", "locmem")
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+    },
+    "epic_reports": {
+        "BACKEND": _epic_cache_backends.get(_epic_cache_backend, _epic_cache_backend),
+        "LOCATION": os.environ.get(
+            "EPIC_CACHE_LOCATION",
+            str(BASE_DIR / ".epic_cache")
+            if _epic_cache_backend == "filesystem"
+            else "epic_reports",
+        ),
+        "TIMEOUT": int(os.environ.get("EPIC_CACHE_TIMEOUT", 24 * 60 * 60)),
+    },
+}
+EPIC_REPORT_CACHE = "epic_reports"
+
+# Seconds clients may keep the domain catalogue (`/api/catalogue/`) before revalidating it with its `ETag`.
+EPIC_CATALOGUE_MAX_AGE = int(os.environ.get("EPIC_CATALOGUE_MAX_AGE", 60 * 60))
+
+# Background report jobs (see the `run_report_jobs` command).
+# Generated reports are kept for `EPIC_REPORT_JOB_RETENTION` seconds, running jobs fail after `EPIC_REPORT_JOB_TIMEOUT` seconds.
+EPIC_REPORT_JOB_RETENTION = int(
+    os.environ.get("EPIC_REPORT_JOB_RETENTION", 24 * 60 * 60)
+)
+EPIC_REPORT_JOB_TIMEOUT = int(os.environ.get("EPIC_REPORT_JOB_TIMEOUT", 60 * 60))
+
+# Processes laying out the documents of a PDF bundle (see `get_pdf_report_bundle`), one per CPU core when not set.
+EPIC_REPORT_BUNDLE_WORKERS = (
+    int(os.environ.get("EPIC_REPORT_BUNDLE_WORKERS", 0)) or None
+)
+
+
 # Password validation
 # https://docs.djangoproject.com/en/4.0/ref/settings/#auth-password-validators
 
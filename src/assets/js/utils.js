@@ -16,6 +16,21 @@ export async function loadQuestions(programId, questionType, token) {
     return await response.json();
 }
 
+export async function loadCatalogue(token) {
+    const options = {
+        method: 'GET',
+        mode: 'cors',
+        headers: {
+            'Accept': 'application/json',
+            'Content-Type': 'application/json',
+            'Authorization': 'Token ' + token,
+        },
+    }
+    let response = await fetch(server + '/api/catalogue/', options);
+    if (response.status !== 200) return {areas: [], agencies: []};
+    return await response.json();
+}
+
 export async function loadProgress(programId, token) {
     const options = {
         method: 'GET',
@@ -35,6 +50,45 @@ export async function loadProgress(programId, token) {
     return progress.progress;
 }
 
+export async function loadProgramsProgress(programIds, token) {
+    const options = {
+        method: 'GET',
+        mode: 'cors',
+        headers: {
+            'Accept': 'application/json',
+            'Content-Type': 'application/json',
+            'Authorization': 'Token ' + token,
+        },
+    }
+    let answer = server + '/api/program/progress/?format=json&program=' + programIds.join(',');
+    let response = await fetch(answer, options);
+    if (response.status !== 200) {
+        return {};
+    }
+    const progress = await response.json();
+    return Object.fromEntries(progress.programs.map(program => [program.id, program.progress]));
+}
+
+export async function loadQuestionnaire(programId, questionType, token) {
+    const options = {
+        method: 'GET',
+        mode: 'cors',
+        headers: {
+            'Accept': 'application/json',
+            'Content-Type': 'application/json',
+            'Authorization': 'Token ' + token,
+        },
+    }
+    let input = server + '/api/program/' + programId + '/questionnaire/?format=json&question_type=' + questionType;
+    let response = await fetch(input, options);
+    if (response.status !== 200) return {questions: {}, answers: []};
+    return await response.json();
+}
+
+export function getQuestionAnswers(questionnaire, questionId) {
+    return questionnaire.answers.filter(answer => answer.question === questionId);
+}
+
 export async function loadAnswer(questionId, token) {
     const options = {
         method: 'GET',
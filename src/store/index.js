@@ -84,8 +84,10 @@ export default new Vuex.Store({
         async updateProgress(context){
             let totalProgress = 0;
             const completedPrograms = new Set();
+            const programsProgress = await util.loadProgramsProgress(
+                [...context.state.programSelection], context.state.token);
             for (let program of context.state.programSelection) {
-                const progress = await util.loadProgress(program, context.state.token);
+                const progress = programsProgress[program] || 0;
                 if (progress === 1) completedPrograms.add(program);
                 totalProgress = totalProgress + progress;
             }